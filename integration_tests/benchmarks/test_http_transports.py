@@ -0,0 +1,72 @@
+"""Compares the HttpTransport implementations using the mock Web API server under tests/mock_web_api_server.
+
+python -m pytest integration_tests/benchmarks/test_http_transports.py -s
+"""
+
+import json
+import logging
+import time
+import unittest
+from http.server import SimpleHTTPRequestHandler
+from typing import Callable, Dict
+
+from slack_sdk import WebClient
+from slack_sdk.http_connection_pool import HttpConnectionPool
+from slack_sdk.http_transport import HttpTransport, InMemoryHttpTransport, UrllibHttpTransport
+from slack_sdk.http_transport.httpx import HttpxHttpTransport
+from slack_sdk.http_transport.urllib3 import Urllib3HttpTransport
+from tests.mock_web_api_server import cleanup_mock_web_api_server, setup_mock_web_api_server
+
+NUM_REQUESTS = 300
+
+
+class KeepAliveHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    default_request_version = "HTTP/1.1"
+    # headers and body are written separately; avoid the delayed ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"ok": True, "args": {}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "application/json;charset=utf-8")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestHttpTransportBenchmarks(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger(__name__)
+        setup_mock_web_api_server(self, KeepAliveHandler)
+
+    def tearDown(self):
+        cleanup_mock_web_api_server(self)
+
+    def test_benchmarks(self):
+        in_memory = InMemoryHttpTransport()
+        in_memory.add_response("api.test", body={"ok": True, "args": {}})
+        transports: Dict[str, Callable[[], HttpTransport]] = {
+            "in-memory": lambda: in_memory,
+            "urllib": lambda: UrllibHttpTransport(),
+            "urllib (HttpConnectionPool)": lambda: UrllibHttpTransport(connection_pool=HttpConnectionPool()),
+            "urllib3": lambda: Urllib3HttpTransport(),
+            "httpx": lambda: HttpxHttpTransport(),
+        }
+        results: Dict[str, float] = {}
+        for name, build_transport in transports.items():
+            transport = build_transport()
+            client = WebClient(token="xoxb-api_test", base_url="http://localhost:8888", transport=transport)
+            client.api_test()  # warm up
+            start = time.perf_counter()
+            for _ in range(NUM_REQUESTS):
+                self.assertTrue(client.api_test()["ok"])
+            results[name] = time.perf_counter() - start
+            transport.close()
+
+        for name, elapsed in results.items():
+            print(f"{name:<30} {NUM_REQUESTS / elapsed:>10.1f} req/s ({elapsed * 1000 / NUM_REQUESTS:.3f} ms/req)")
@@ -0,0 +1,119 @@
+"""Measures how long the builtin Socket Mode client takes to deliver an envelope to a listener,
+and how much CPU time it consumes while no envelope arrives.
+
+python -m pytest integration_tests/benchmarks/test_socket_mode_dispatch.py -s
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import resource
+import socket
+import struct
+import threading
+import time
+import unittest
+from statistics import median
+from typing import List
+
+from slack_sdk.socket_mode.builtin import SocketModeClient
+from slack_sdk.socket_mode.builtin.frame_header import FrameHeader
+from slack_sdk.web import WebClient
+
+NUM_ENVELOPES = 200
+IDLE_SECONDS = 5.0
+
+
+def _text_frame(text: str) -> bytes:
+    payload = text.encode("utf-8")
+    if len(payload) <= 125:
+        header = struct.pack("!BB", 0b10000000 | FrameHeader.OPCODE_TEXT, len(payload))
+    else:
+        header = struct.pack("!BBQ", 0b10000000 | FrameHeader.OPCODE_TEXT, 127, len(payload))
+    return header + payload
+
+
+class _WebSocketServer:
+    """A minimal WebSocket server that sends text frames on demand and discards what the client sends."""
+
+    def __init__(self):
+        self.server_sock = socket.socket()
+        self.server_sock.bind(("127.0.0.1", 0))
+        self.server_sock.listen(1)
+        self.port = self.server_sock.getsockname()[1]
+        self.connected = threading.Event()
+        self.conn: socket.socket = None  # type: ignore[assignment]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        conn, _ = self.server_sock.accept()
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += conn.recv(1024)
+        key = [line.split(b": ")[1] for line in request.split(b"\r\n") if line.lower().startswith(b"sec-websocket-key")][0]
+        accept = base64.b64encode(hashlib.sha1(key + b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11").digest())
+        conn.sendall(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        self.conn = conn
+        self.connected.set()
+        while len(conn.recv(1024)) > 0:
+            pass
+
+    def send(self, text: str):
+        self.conn.sendall(_text_frame(text))
+
+    def close(self):
+        self.server_sock.close()
+
+
+class TestSocketModeDispatchBenchmarks(unittest.TestCase):
+    def test_benchmarks(self):
+        server = _WebSocketServer()
+        client = SocketModeClient(
+            app_token="xapp-A111-222-xyz",
+            web_client=WebClient(),
+            logger=logging.getLogger(__name__),
+            auto_reconnect_enabled=False,
+        )
+        latencies: List[float] = []
+        received = threading.Semaphore(0)
+
+        def listener(client, message, raw_message):
+            latencies.append(time.perf_counter() - message["payload"]["sent_at"])
+            received.release()
+
+        client.message_listeners.append(listener)
+        try:
+            client.wss_uri = f"ws://127.0.0.1:{server.port}/link"
+            client.connect()
+            self.assertTrue(server.connected.wait(5))
+
+            for i in range(NUM_ENVELOPES):
+                envelope = {"type": "events_api", "envelope_id": str(i), "payload": {"sent_at": time.perf_counter()}}
+                server.send(json.dumps(envelope))
+                self.assertTrue(received.acquire(timeout=5))
+                time.sleep(0.002)
+
+            latencies.sort()
+            print(
+                f"envelope to listener: median {median(latencies) * 1000:.3f} ms, "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms, "
+                f"max {latencies[-1] * 1000:.3f} ms"
+            )
+
+            cpu_started, wall_started = time.process_time(), time.perf_counter()
+            switches_started = resource.getrusage(resource.RUSAGE_SELF).ru_nvcsw
+            time.sleep(IDLE_SECONDS)
+            cpu_time = time.process_time() - cpu_started
+            elapsed = time.perf_counter() - wall_started
+            switches = resource.getrusage(resource.RUSAGE_SELF).ru_nvcsw - switches_started
+            print(
+                f"idle: {cpu_time * 1000:.1f} ms CPU time in {elapsed:.1f} s ({cpu_time / elapsed * 100:.2f}% CPU), "
+                f"{switches} voluntary context switches"
+            )
+        finally:
+            client.close()
+            server.close()
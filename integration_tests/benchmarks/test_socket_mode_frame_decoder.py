@@ -0,0 +1,35 @@
+"""Measures how fast the builtin Socket Mode client decodes a large envelope received in small chunks.
+
+python -m pytest integration_tests/benchmarks/test_socket_mode_frame_decoder.py -s
+"""
+
+import struct
+import time
+import unittest
+
+from slack_sdk.socket_mode.builtin.frame_decoder import FrameDecoder
+from slack_sdk.socket_mode.builtin.frame_header import FrameHeader
+
+NUM_MESSAGES = 20
+ENVELOPE_SIZE = 200 * 1024
+
+
+class TestSocketModeFrameDecoderBenchmarks(unittest.TestCase):
+    def test_benchmarks(self):
+        payload = b"x" * ENVELOPE_SIZE
+        frame = struct.pack("!BBQ", 0b10000000 | FrameHeader.OPCODE_TEXT, 127, len(payload)) + payload
+        data = frame * NUM_MESSAGES
+
+        for buffer_size in [64, 1024, 16 * 1024, 64 * 1024]:
+            chunks = [data[i : i + buffer_size] for i in range(0, len(data), buffer_size)]
+            decoder = FrameDecoder()
+            received = 0
+            start = time.perf_counter()
+            for chunk in chunks:
+                received += len(decoder.feed(chunk))
+            elapsed = time.perf_counter() - start
+            self.assertEqual(received, NUM_MESSAGES)
+            print(
+                f"buffer size: {buffer_size:>6} bytes {len(data) / elapsed / 1024 / 1024:>10.1f} MB/s "
+                f"({elapsed * 1000 / NUM_MESSAGES:.3f} ms per {ENVELOPE_SIZE // 1024} KB envelope)"
+            )
@@ -78,6 +78,11 @@ with open(f"{args.path}/slack_sdk/web/client.py", "r") as original:
         " await self._upload_file(",
         async_source,
     )
+    async_source = re.sub(
+        r" self._upload_files_v2\(",
+        " await self._upload_files_v2(",
+        async_source,
+    )
     async_source = re.sub(
         r" self.files_completeUploadExternal\(",
         " await self.files_completeUploadExternal(",
@@ -38,12 +38,36 @@ Here is the list of key modules in this SDK:
 
 """
 
+import importlib
 import logging
 from logging import NullHandler
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    # from .rtm import RTMClient
+    from .web import WebClient
+    from .webhook import WebhookClient
+
+# The modules are imported when the attributes are accessed for the first time (PEP 562),
+# so that `import slack_sdk.signature` and the like do not load the Web API client.
+_lazy_attributes: Dict[str, str] = {
+    "WebClient": ".web",
+    "WebhookClient": ".webhook",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals().keys()) + list(_lazy_attributes.keys()))
 
-# from .rtm import RTMClient
-from .web import WebClient
-from .webhook import WebhookClient
 
 __all__ = [
     "WebClient",
@@ -1,6 +1,6 @@
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
+from slack_sdk.json_codec import get_json_codec
 from slack_sdk.audit_logs.v1.logs import LogsResponse
 
 
@@ -11,8 +11,21 @@ class AuditLogsResponse:
     headers: Dict[str, Any]
     raw_body: Optional[str]
     body: Optional[Dict[str, Any]]
+    _raw_body: Optional[str]
+    _raw_body_bytes: Optional[bytes]
     typed_body: Optional[LogsResponse]
 
+    @property  # type: ignore[no-redef]
+    def raw_body(self) -> Optional[str]:
+        if self._raw_body is None and self._raw_body_bytes is not None:
+            self._raw_body = self._raw_body_bytes.decode("utf-8")
+        return self._raw_body
+
+    @raw_body.setter
+    def raw_body(self, raw_body: Optional[str]) -> None:
+        self._raw_body = raw_body
+        self._raw_body_bytes = None
+
     @property  # type: ignore[no-redef]
     def typed_body(self) -> Optional[LogsResponse]:
         if self.body is None:
@@ -24,11 +37,16 @@ class AuditLogsResponse:
         *,
         url: str,
         status_code: int,
-        raw_body: Optional[str],
+        raw_body: Optional[Union[str, bytes]],
         headers: dict,
     ):
         self.url = url
         self.status_code = status_code
         self.headers = headers
-        self.raw_body = raw_body
-        self.body = json.loads(raw_body) if raw_body is not None and raw_body.startswith("{") else None
+        # UTF-8 bytes are decoded into a str only when raw_body is accessed
+        self._raw_body = raw_body if not isinstance(raw_body, bytes) else None
+        self._raw_body_bytes = raw_body if isinstance(raw_body, bytes) else None
+        if isinstance(raw_body, bytes):
+            self.body = get_json_codec().loads(raw_body) if raw_body.startswith(b"{") else None
+        else:
+            self.body = get_json_codec().loads(raw_body) if raw_body is not None and raw_body.startswith("{") else None
@@ -0,0 +1,340 @@
+"""A thread-safe HTTP/1.1 keep-alive connection pool for the urllib based API clients.
+
+By default, `WebClient`, `WebhookClient`, `AuditLogsClient`, and `SCIMClient` open a new connection
+(a TCP connection and a TLS handshake) for every single request. When you pass an `HttpConnectionPool`
+to these clients, the established connections are kept alive and reused for the following requests
+to the same host. A single pool instance can be safely shared among multiple clients and threads.
+
+    from slack_sdk import WebClient, WebhookClient
+    from slack_sdk.http_connection_pool import HttpConnectionPool
+
+    pool = HttpConnectionPool(max_size=20, idle_timeout=30)
+    client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], connection_pool=pool)
+    webhook = WebhookClient(url=os.environ["SLACK_WEBHOOK_URL"], connection_pool=pool)
+"""
+
+import logging
+import selectors
+import threading
+import time
+from base64 import b64encode
+from collections import deque
+from http.client import HTTPConnection, HTTPResponse, HTTPSConnection, HTTPMessage, RemoteDisconnected
+from io import BytesIO
+from logging import Logger
+from ssl import SSLContext
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlparse
+from urllib.request import Request
+
+from slack_sdk.errors import SlackRequestError
+
+# (scheme, host, port, proxy, ssl context)
+_PoolKey = Tuple[str, str, int, Optional[str], Optional[SSLContext]]
+
+
+class PooledHttpResponse:
+    """An HTTP response returned by `HttpConnectionPool`.
+
+    As the response body is read before the underlying connection is returned to the pool,
+    this class provides the subset of `http.client.HTTPResponse` methods that the API clients use.
+    """
+
+    url: str
+    status: int
+    reason: str
+    headers: HTTPMessage
+
+    def __init__(self, *, url: str, status: int, reason: str, headers: HTTPMessage, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = BytesIO(body)
+
+    @property
+    def code(self) -> int:
+        return self.status
+
+    def getcode(self) -> int:
+        return self.status
+
+    def info(self) -> HTTPMessage:
+        return self.headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._body.read(amt)
+
+    def close(self) -> None:
+        self._body.close()
+
+
+class HttpConnectionPool:
+    max_size: int
+    max_connections_per_host: int
+    idle_timeout: float
+    logger: Logger
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 10,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 60,
+        logger: Optional[Logger] = None,
+    ):
+        """A thread-safe HTTP/1.1 keep-alive connection pool, which is keyed by host and proxy.
+
+        Args:
+            max_size: The maximum number of idle connections to keep in this pool (across all hosts)
+            max_connections_per_host: The maximum number of connections (both in-use and idle) per host.
+                When all of them are in use, the following requests wait for one of them to be released.
+            idle_timeout: The number of seconds after which an unused connection is discarded
+            logger: Custom logger
+        """
+        if max_size < 0:
+            raise SlackRequestError("max_size must be 0 or larger")
+        if max_connections_per_host < 1:
+            raise SlackRequestError("max_connections_per_host must be 1 or larger")
+        self.max_size = max_size
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+
+        self._condition = threading.Condition()
+        self._idle_connections: Dict[_PoolKey, Deque[Tuple[HTTPConnection, float]]] = {}
+        self._num_idle_connections = 0
+        self._num_connections: Dict[_PoolKey, int] = {}
+        self._closed = False
+
+    # -------------------------
+    # public methods
+
+    def open(
+        self,
+        req: Request,
+        *,
+        timeout: float,
+        ssl: Optional[SSLContext] = None,
+        proxy: Optional[str] = None,
+        read_body: Optional[Callable[[HTTPResponse], bytes]] = None,
+    ) -> PooledHttpResponse:
+        """Sends a request using a pooled connection.
+        As with `urllib.request.urlopen()`, this method raises `urllib.error.HTTPError`
+        for non-2xx responses and `urllib.error.URLError` for connection failures.
+
+        Args:
+            req: The request to send
+            timeout: The socket timeout (in seconds)
+            ssl: `ssl.SSLContext` to use for HTTPS connections
+            proxy: Proxy URL (e.g., `localhost:9000`, `http://localhost:9000`)
+            read_body: The function that reads the body from the `http.client.HTTPResponse`
+                right after its headers are received, before the connection is returned to this pool
+                (e.g., to decompress the body while reading it). If absent, the raw body is read as-is.
+
+        Returns:
+            The response, whose body is already fully read
+        """
+        url = req.full_url
+        parsed_url = urlparse(url)
+        scheme = parsed_url.scheme.lower()
+        if scheme not in ("http", "https") or not parsed_url.hostname:
+            raise SlackRequestError(f"Invalid URL detected: {url}")
+        if proxy is not None and not isinstance(proxy, str):
+            raise SlackRequestError(f"Invalid proxy detected: {proxy} must be a str value")
+        host: str = parsed_url.hostname
+        port: int = parsed_url.port or (443 if scheme == "https" else 80)
+        key: _PoolKey = (scheme, host, port, proxy, ssl if scheme == "https" else None)
+
+        headers = {k.title(): v for k, v in req.header_items()}
+        if req.data is not None and "Content-Type" not in headers:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        if proxy is not None and scheme == "http":
+            # Plain HTTP requests are sent to the proxy server with the absolute URL
+            target = url
+            proxy_authorization = _build_proxy_authorization(proxy)
+            if proxy_authorization is not None:
+                headers["Proxy-Authorization"] = proxy_authorization
+        else:
+            target = parsed_url.path or "/"
+            if parsed_url.query:
+                target += f"?{parsed_url.query}"
+
+        # A connection reused from this pool can be closed by the server at any time.
+        # In the case, we do one more try with a new connection.
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                try:
+                    conn.request(req.get_method(), target, body=req.data, headers=headers)
+                except OSError as err:
+                    if reused and isinstance(err, (ConnectionResetError, BrokenPipeError)):
+                        raise _StaleConnectionError() from err
+                    raise URLError(err)
+                try:
+                    http_resp = conn.getresponse()
+                except RemoteDisconnected as err:
+                    if reused:
+                        raise _StaleConnectionError() from err
+                    raise
+                body: bytes = read_body(http_resp) if read_body is not None else http_resp.read()
+            except _StaleConnectionError:
+                self._release(key, conn, reusable=False)
+                self.logger.debug(f"A pooled connection to {host}:{port} was closed by the server. Retrying...")
+                continue
+            except BaseException:
+                self._release(key, conn, reusable=False)
+                raise
+
+            self._release(key, conn, reusable=not http_resp.will_close)
+            if not (200 <= http_resp.status < 300):
+                raise HTTPError(url, http_resp.status, http_resp.reason, http_resp.headers, BytesIO(body))
+            return PooledHttpResponse(
+                url=url,
+                status=http_resp.status,
+                reason=http_resp.reason,
+                headers=http_resp.headers,
+                body=body,
+            )
+
+    def close(self) -> None:
+        """Closes all the idle connections. In-use connections are closed when they are released."""
+        with self._condition:
+            self._closed = True
+            for key, connections in self._idle_connections.items():
+                while connections:
+                    conn, _ = connections.pop()
+                    self._discard(key, conn)
+            self._idle_connections.clear()
+            self._num_idle_connections = 0
+            self._condition.notify_all()
+
+    def num_idle_connections(self) -> int:
+        with self._condition:
+            return self._num_idle_connections
+
+    def __enter__(self) -> "HttpConnectionPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # -------------------------
+    # internals
+
+    def _acquire(self, key: _PoolKey, timeout: float) -> Tuple[HTTPConnection, bool]:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise SlackRequestError("This connection pool is already closed")
+                connections = self._idle_connections.get(key)
+                while connections:
+                    conn, last_used_at = connections.pop()
+                    self._num_idle_connections -= 1
+                    if time.monotonic() - last_used_at > self.idle_timeout or _is_dropped(conn):
+                        self._discard(key, conn)
+                        continue
+                    return conn, True
+                if self._num_connections.get(key, 0) < self.max_connections_per_host:
+                    self._num_connections[key] = self._num_connections.get(key, 0) + 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise URLError(TimeoutError(f"Timed out waiting for an available connection to {key[1]}:{key[2]}"))
+                self._condition.wait(remaining)
+
+        try:
+            return self._new_connection(key, timeout), False
+        except BaseException:
+            with self._condition:
+                self._num_connections[key] -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, key: _PoolKey, conn: HTTPConnection, reusable: bool) -> None:
+        with self._condition:
+            if reusable and not self._closed and self.max_size > 0 and conn.sock is not None:
+                if self._num_idle_connections >= self.max_size:
+                    self._evict_least_recently_used()
+                self._idle_connections.setdefault(key, deque()).append((conn, time.monotonic()))
+                self._num_idle_connections += 1
+            else:
+                self._discard(key, conn)
+            self._condition.notify()
+
+    def _evict_least_recently_used(self) -> None:
+        oldest_key: Optional[_PoolKey] = None
+        oldest_last_used_at: Optional[float] = None
+        for key, connections in self._idle_connections.items():
+            # the leftmost one is the least recently used connection for the key
+            if connections and (oldest_last_used_at is None or connections[0][1] < oldest_last_used_at):
+                oldest_key, oldest_last_used_at = key, connections[0][1]
+        if oldest_key is not None:
+            conn, _ = self._idle_connections[oldest_key].popleft()
+            self._num_idle_connections -= 1
+            self._discard(oldest_key, conn)
+
+    def _discard(self, key: _PoolKey, conn: HTTPConnection) -> None:
+        # this method must be called while holding self._condition
+        self._num_connections[key] = self._num_connections.get(key, 1) - 1
+        if self._num_connections[key] <= 0:
+            self._num_connections.pop(key, None)
+        try:
+            conn.close()
+        except Exception as e:
+            self.logger.debug(f"Failed to close a pooled connection: {e}")
+
+    def _new_connection(self, key: _PoolKey, timeout: float) -> HTTPConnection:
+        scheme, host, port, proxy, ssl = key
+        if self.logger.level <= logging.DEBUG:
+            self.logger.debug(f"Opening a new connection to {scheme}://{host}:{port} (proxy: {proxy is not None})")
+        if proxy is None:
+            if scheme == "https":
+                return HTTPSConnection(host, port, timeout=timeout, context=ssl)
+            return HTTPConnection(host, port, timeout=timeout)
+
+        parsed_proxy = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+        proxy_host: str = parsed_proxy.hostname  # type: ignore[assignment]
+        proxy_port: int = parsed_proxy.port or 80
+        if scheme == "https":
+            conn = HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=ssl)
+            tunnel_headers = {}
+            proxy_authorization = _build_proxy_authorization(proxy)
+            if proxy_authorization is not None:
+                tunnel_headers["Proxy-Authorization"] = proxy_authorization
+            conn.set_tunnel(host, port, headers=tunnel_headers)
+            return conn
+        return HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+
+
+class _StaleConnectionError(Exception):
+    pass
+
+
+def _is_dropped(conn: HTTPConnection) -> bool:
+    # An idle keep-alive connection must not have anything to read.
+    # If the socket is readable, the server has already closed the connection.
+    # select.select() cannot handle file descriptors larger than FD_SETSIZE (1024),
+    # so this function uses the platform's best selector (e.g., epoll, kqueue) instead.
+    sock = conn.sock
+    if sock is None or sock.fileno() < 0:
+        return True
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            return len(selector.select(0)) > 0
+    except OSError:
+        return True
+
+
+def _build_proxy_authorization(proxy: str) -> Optional[str]:
+    parsed_proxy = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+    if parsed_proxy.username is None or parsed_proxy.password is None:
+        return None
+    raw_value = f"{unquote(parsed_proxy.username)}:{unquote(parsed_proxy.password)}"
+    return "Basic " + b64encode(raw_value.encode("utf-8")).decode("ascii")
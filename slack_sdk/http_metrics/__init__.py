@@ -0,0 +1,28 @@
+"""Instrumentation hooks for the HTTP requests that the API clients send.
+
+An `HttpRequestObserver` receives an `HttpAttemptEvent` for each attempt of an HTTP request
+(status code, payload sizes, and where the time went) and an `HttpRetryEvent` each time a retry handler
+has waited before the next attempt. The observers are passed to the clients' `request_observers` argument.
+Socket Mode clients send their HTTP requests (apps.connections.open) through the `web_client` you give them,
+so pass the observers to the `web_client`. The WebSocket connections themselves are not HTTP request attempts;
+no events are emitted for their handshakes and messages.
+
+    from slack_sdk import WebClient
+    from slack_sdk.http_metrics import PrometheusMetricsObserver
+
+    metrics = PrometheusMetricsObserver()
+    client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], request_observers=[metrics])
+    client.chat_postMessage(channel="#random", text="Hi there!")
+    print(metrics.render())
+"""
+
+from .event import HttpAttemptEvent, HttpRetryEvent
+from .observer import HttpRequestObserver
+from .prometheus import PrometheusMetricsObserver
+
+__all__ = [
+    "HttpAttemptEvent",
+    "HttpRetryEvent",
+    "HttpRequestObserver",
+    "PrometheusMetricsObserver",
+]
@@ -0,0 +1,110 @@
+from typing import Optional
+
+
+class HttpAttemptEvent:
+    """A single attempt to send an HTTP request. Retried requests emit one event per attempt."""
+
+    client: str
+    api_method: Optional[str]
+    http_method: str
+    url: str
+    attempt: int  # zero-origin
+    status_code: Optional[int]
+    error: Optional[Exception]
+    request_bytes: Optional[int]
+    response_bytes: Optional[int]
+    duration: float
+    time_to_headers: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        client: str,
+        api_method: Optional[str] = None,
+        http_method: str,
+        url: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+        request_bytes: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        duration: float,
+        time_to_headers: Optional[float] = None,
+    ):
+        """A single attempt to send an HTTP request.
+
+        Args:
+            client: The name of the client class (e.g., "WebClient", "AsyncAuditLogsClient")
+            api_method: The Web API method name (e.g., "chat.postMessage") if the request is a Web API call
+            http_method: HTTP method (e.g., "POST")
+            url: The request URL
+            attempt: The number of the attempt (zero-origin)
+            status_code: HTTP status code. None if no response was received.
+            error: The error that ended this attempt without a response (e.g., a connection error)
+            request_bytes: The size of the request body in bytes, if it is known
+            response_bytes: The size of the response body in bytes, if a response was received
+            duration: Elapsed seconds from sending the request to reading the whole response
+            time_to_headers: Elapsed seconds until the response headers were received
+                (including DNS lookup, connect, TLS handshake, and the server's processing time),
+                if the HTTP client library can tell it
+        """
+        self.client = client
+        self.api_method = api_method
+        self.http_method = http_method
+        self.url = url
+        self.attempt = attempt
+        self.status_code = status_code
+        self.error = error
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+        self.duration = duration
+        self.time_to_headers = time_to_headers
+
+    @property
+    def body_read_duration(self) -> Optional[float]:
+        """Elapsed seconds to read (and decompress) the response body, if time_to_headers is known."""
+        if self.time_to_headers is None:
+            return None
+        return max(self.duration - self.time_to_headers, 0.0)
+
+
+class HttpRetryEvent:
+    """A retry handler's decision to send the same request again after an attempt."""
+
+    client: str
+    api_method: Optional[str]
+    http_method: str
+    url: str
+    attempt: int  # zero-origin
+    retry_handler: str
+    sleep_duration: float
+
+    def __init__(
+        self,
+        *,
+        client: str,
+        api_method: Optional[str] = None,
+        http_method: str,
+        url: str,
+        attempt: int,
+        retry_handler: str,
+        sleep_duration: float,
+    ):
+        """A retry handler's decision to send the same request again.
+
+        Args:
+            client: The name of the client class (e.g., "WebClient", "AsyncAuditLogsClient")
+            api_method: The Web API method name (e.g., "chat.postMessage") if the request is a Web API call
+            http_method: HTTP method (e.g., "POST")
+            url: The request URL
+            attempt: The number of the attempt that is going to be retried (zero-origin)
+            retry_handler: The name of the retry handler class (e.g., "RateLimitErrorRetryHandler")
+            sleep_duration: Elapsed seconds that the retry handler waited before the next attempt
+        """
+        self.client = client
+        self.api_method = api_method
+        self.http_method = http_method
+        self.url = url
+        self.attempt = attempt
+        self.retry_handler = retry_handler
+        self.sleep_duration = sleep_duration
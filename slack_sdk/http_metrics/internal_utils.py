@@ -0,0 +1,111 @@
+import time
+from contextlib import contextmanager
+from logging import Logger
+from typing import Any, Iterator, List, Optional
+
+from slack_sdk.http_retry.state import RetryState
+from .event import HttpAttemptEvent, HttpRetryEvent
+from .observer import HttpRequestObserver
+
+
+class _RequestRecorder:
+    """Measures the attempts of an HTTP request and the retry handlers' waits between them,
+    and then notifies the observers. When there is no observer, this object does nothing.
+    """
+
+    def __init__(
+        self,
+        observers: Optional[List[HttpRequestObserver]],
+        *,
+        logger: Logger,
+        client: str,
+        http_method: str,
+        url: str,
+        api_method: Optional[str] = None,
+        retry_state: Optional[RetryState] = None,
+    ):
+        self.observers = observers or []
+        self.logger = logger
+        self.client = client
+        self.http_method = http_method
+        self.url = url
+        self.api_method = api_method
+        self.retry_state = retry_state
+
+    def attempt(
+        self,
+        *,
+        started: float,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+        request_bytes: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        time_to_headers: Optional[float] = None,
+    ) -> None:
+        """Notifies the observers of an attempt that started at the given `time.perf_counter()` value."""
+        if not self.observers:
+            return
+        event = HttpAttemptEvent(
+            client=self.client,
+            api_method=self.api_method,
+            http_method=self.http_method,
+            url=self.url,
+            attempt=self.retry_state.current_attempt if self.retry_state is not None else 0,
+            status_code=status_code,
+            error=error,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            duration=time.perf_counter() - started,
+            time_to_headers=time_to_headers,
+        )
+        for observer in self.observers:
+            try:
+                observer.on_attempt(event)
+            except Exception as e:
+                self.logger.warning(f"Failed to run an observer ({type(observer).__name__}): {e}")
+
+    @contextmanager
+    def retry(self, handler: Any) -> Iterator[None]:
+        """Measures the retry handler's prepare_for_next_attempt() call in the with statement."""
+        if not self.observers:
+            yield
+            return
+        attempt = self.retry_state.current_attempt if self.retry_state is not None else 0
+        started = time.perf_counter()
+        yield
+        event = HttpRetryEvent(
+            client=self.client,
+            api_method=self.api_method,
+            http_method=self.http_method,
+            url=self.url,
+            attempt=attempt,
+            retry_handler=type(handler).__name__,
+            sleep_duration=time.perf_counter() - started,
+        )
+        for observer in self.observers:
+            try:
+                observer.on_retry(event)
+            except Exception as e:
+                self.logger.warning(f"Failed to run an observer ({type(observer).__name__}): {e}")
+
+
+async def _record_aiohttp_attempt(
+    recorder: _RequestRecorder,
+    *,
+    started: float,
+    time_to_headers: float,
+    response: Any,  # aiohttp.ClientResponse
+) -> None:
+    """Notifies the observers of an attempt whose aiohttp.ClientResponse body has already been read."""
+    if not recorder.observers:
+        return
+    content_length = response.request_info.headers.get("Content-Length")
+    # As the body has been read, this returns the cached data
+    body = await response.read()
+    recorder.attempt(
+        started=started,
+        status_code=response.status,
+        request_bytes=int(content_length) if content_length is not None else None,
+        response_bytes=len(body),
+        time_to_headers=time_to_headers,
+    )
@@ -0,0 +1,17 @@
+from .event import HttpAttemptEvent, HttpRetryEvent
+
+
+class HttpRequestObserver:
+    """HttpRequestObserver interface.
+
+    The API clients call the methods synchronously in the thread (or the event loop) that sends the request,
+    so implementations should return quickly. The errors raised by an observer are logged and ignored.
+    """
+
+    def on_attempt(self, event: HttpAttemptEvent) -> None:
+        """Called when an attempt to send an HTTP request completes, regardless of whether it succeeded."""
+        pass
+
+    def on_retry(self, event: HttpRetryEvent) -> None:
+        """Called when a retry handler has waited for the next attempt of the same request."""
+        pass
@@ -0,0 +1,196 @@
+"""An in-process metrics exporter that renders the Prometheus text exposition format."""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from .event import HttpAttemptEvent, HttpRetryEvent
+from .observer import HttpRequestObserver
+
+DEFAULT_DURATION_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.counts[index] += 1
+
+
+class PrometheusMetricsObserver(HttpRequestObserver):
+    """HttpRequestObserver that aggregates the events into histograms and counters in memory,
+    and renders them in the Prometheus text exposition format.
+
+        from slack_sdk.http_metrics import PrometheusMetricsObserver
+
+        metrics = PrometheusMetricsObserver()
+        client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], request_observers=[metrics])
+
+        # in the handler of your app's /metrics endpoint
+        return Response(metrics.render(), content_type=PrometheusMetricsObserver.CONTENT_TYPE)
+
+    The following metrics are exported:
+
+    * `slack_sdk_http_request_duration_seconds` (histogram; client, api_method, status)
+    * `slack_sdk_http_request_time_to_headers_seconds` (histogram; client, api_method, status)
+    * `slack_sdk_http_request_bytes_total` / `slack_sdk_http_response_bytes_total` (counter; client, api_method)
+    * `slack_sdk_http_retries_total` (counter; client, api_method, retry_handler)
+    * `slack_sdk_http_retry_sleep_seconds` (histogram; client, api_method, retry_handler)
+
+    The status label is the HTTP status code, or "error" if no response was received.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    buckets: Tuple[float, ...]
+    namespace: str
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+        namespace: str = "slack_sdk",
+    ):
+        """HttpRequestObserver that exports Prometheus metrics.
+
+        Args:
+            buckets: The upper bounds (in seconds) of the histogram buckets
+            namespace: The prefix of the metric names
+        """
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._durations: Dict[_Labels, _Histogram] = {}
+        self._times_to_headers: Dict[_Labels, _Histogram] = {}
+        self._request_bytes: Dict[_Labels, int] = {}
+        self._response_bytes: Dict[_Labels, int] = {}
+        self._retries: Dict[_Labels, int] = {}
+        self._retry_sleeps: Dict[_Labels, _Histogram] = {}
+
+    def on_attempt(self, event: HttpAttemptEvent) -> None:
+        api_method = event.api_method or ""
+        status = str(event.status_code) if event.status_code is not None else "error"
+        labels: _Labels = (("client", event.client), ("api_method", api_method), ("status", status))
+        size_labels: _Labels = (("client", event.client), ("api_method", api_method))
+        with self._lock:
+            self._histogram(self._durations, labels).observe(event.duration)
+            if event.time_to_headers is not None:
+                self._histogram(self._times_to_headers, labels).observe(event.time_to_headers)
+            if event.request_bytes is not None:
+                self._request_bytes[size_labels] = self._request_bytes.get(size_labels, 0) + event.request_bytes
+            if event.response_bytes is not None:
+                self._response_bytes[size_labels] = self._response_bytes.get(size_labels, 0) + event.response_bytes
+
+    def on_retry(self, event: HttpRetryEvent) -> None:
+        labels: _Labels = (
+            ("client", event.client),
+            ("api_method", event.api_method or ""),
+            ("retry_handler", event.retry_handler),
+        )
+        with self._lock:
+            self._retries[labels] = self._retries.get(labels, 0) + 1
+            self._histogram(self._retry_sleeps, labels).observe(event.sleep_duration)
+
+    def render(self) -> str:
+        """Returns the current values of the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            self._render_histograms(
+                lines,
+                "http_request_duration_seconds",
+                "Elapsed seconds of each HTTP request attempt",
+                self._durations,
+            )
+            self._render_histograms(
+                lines,
+                "http_request_time_to_headers_seconds",
+                "Elapsed seconds until the response headers were received",
+                self._times_to_headers,
+            )
+            self._render_counters(
+                lines,
+                "http_request_bytes_total",
+                "Total size of the sent request bodies in bytes",
+                self._request_bytes,
+            )
+            self._render_counters(
+                lines,
+                "http_response_bytes_total",
+                "Total size of the received response bodies in bytes",
+                self._response_bytes,
+            )
+            self._render_counters(
+                lines,
+                "http_retries_total",
+                "Total number of retries by the retry handlers",
+                self._retries,
+            )
+            self._render_histograms(
+                lines,
+                "http_retry_sleep_seconds",
+                "Elapsed seconds that the retry handlers waited before the next attempts",
+                self._retry_sleeps,
+            )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _histogram(self, histograms: Dict[_Labels, _Histogram], labels: _Labels) -> _Histogram:
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = _Histogram(self.buckets)
+            histograms[labels] = histogram
+        return histogram
+
+    def _render_histograms(self, lines: List[str], name: str, help: str, histograms: Dict[_Labels, _Histogram]) -> None:
+        if not histograms:
+            return
+        name = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bucket, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', repr(bucket)),))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {repr(histogram.sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+    def _render_counters(self, lines: List[str], name: str, help: str, counters: Dict[_Labels, int]) -> None:
+        if not counters:
+            return
+        name = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(counters.items()):
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+
+
+def _format_labels(labels: _Labels) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels) + "}"
@@ -0,0 +1,26 @@
+"""Pluggable HTTP transports for the urllib based API clients
+(`WebClient`, `WebhookClient`, `AuditLogsClient`, and `SCIMClient`).
+
+The API clients build requests, do retries, and parse responses in the same way regardless of the transport.
+The default transport is `UrllibHttpTransport`. You can switch to another HTTP client library
+such as [urllib3](https://pypi.org/project/urllib3/) (`slack_sdk.http_transport.urllib3`)
+and [httpx](https://pypi.org/project/httpx/) (`slack_sdk.http_transport.httpx`), or implement your own.
+
+    from slack_sdk import WebClient
+    from slack_sdk.http_transport.httpx import HttpxHttpTransport
+
+    client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], transport=HttpxHttpTransport(http2=True))
+"""
+
+from .transport import HttpTransport
+from .request import TransportRequest
+from .response import TransportResponse
+from .builtin_transports import UrllibHttpTransport, InMemoryHttpTransport
+
+__all__ = [
+    "HttpTransport",
+    "TransportRequest",
+    "TransportResponse",
+    "UrllibHttpTransport",
+    "InMemoryHttpTransport",
+]
@@ -0,0 +1,207 @@
+import json
+import threading
+import time
+import urllib
+from collections import deque
+from http.client import HTTPResponse
+from io import BytesIO
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import HTTPSHandler, OpenerDirector, ProxyHandler, Request, urlopen
+
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_connection_pool import HttpConnectionPool, PooledHttpResponse
+from .internal_utils import _build_accept_encoding, _read_body
+from .request import TransportRequest
+from .response import TransportResponse
+from .transport import HttpTransport
+
+
+class UrllibHttpTransport(HttpTransport):
+    """HttpTransport built on top of the Python standard library's urllib.request module.
+    This is the default transport for the urllib based API clients.
+    """
+
+    connection_pool: Optional[HttpConnectionPool]
+    compression: bool
+
+    def __init__(self, *, connection_pool: Optional[HttpConnectionPool] = None, compression: bool = True):
+        """HttpTransport built on top of urllib.request module.
+
+        Args:
+            connection_pool: `HttpConnectionPool` to reuse keep-alive connections.
+                If absent, this transport opens a new connection for each request.
+            compression: True if this transport asks servers to compress response bodies
+                (gzip, deflate, and brotli if the brotli package is installed)
+        """
+        self.connection_pool = connection_pool
+        self.compression = compression
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        # urllib not only opens http:// or https:// URLs, but also ftp:// and file://.
+        # With this it might be possible to open local files on the executing machine
+        # which might be a security risk if the URL to open can be manipulated by an external user.
+        # (BAN-B310)
+        if not request.url.lower().startswith("http"):
+            raise SlackRequestError(f"Invalid URL detected: {request.url}")
+
+        headers = request.headers
+        if self.compression and not any(k.lower() == "accept-encoding" for k in headers):
+            headers = {**headers, "Accept-Encoding": _build_accept_encoding()}
+        req = Request(method=request.method, url=request.url, data=request.body, headers=headers)
+        started = time.perf_counter()
+        # The time when the response headers were received; the pool reads the body before returning the response
+        headers_received: Optional[float] = None
+
+        def read_pooled_body(r: HTTPResponse) -> bytes:
+            nonlocal headers_received
+            headers_received = time.perf_counter()
+            return _read_body(r, r.headers)
+
+        try:
+            resp: Union[HTTPResponse, PooledHttpResponse]
+            if self.connection_pool is not None:
+                # The pool decompresses the body directly from the connection before taking the connection back.
+                # As the Content-Encoding header is removed then, _read_body() below reads the body as-is.
+                resp = self.connection_pool.open(
+                    req,
+                    timeout=request.timeout,
+                    ssl=request.ssl,
+                    proxy=request.proxy,
+                    read_body=read_pooled_body,
+                )
+            else:
+                resp = self._urlopen(req, request)
+            time_to_headers = (headers_received or time.perf_counter()) - started
+            return TransportResponse(
+                status_code=resp.status,
+                reason=resp.reason,
+                headers=resp.headers,
+                body=_read_body(resp, resp.headers),  # read the response body here
+                time_to_headers=time_to_headers,
+            )
+        except HTTPError as e:
+            time_to_headers = (headers_received or time.perf_counter()) - started
+            return TransportResponse(
+                status_code=e.code,
+                reason=str(e.reason),
+                headers=e.headers,  # type: ignore[arg-type]
+                body=_read_body(e, e.headers),
+                time_to_headers=time_to_headers,
+            )
+
+    def send_streaming(self, request: TransportRequest) -> TransportResponse:
+        if not request.url.lower().startswith("http"):
+            raise SlackRequestError(f"Invalid URL detected: {request.url}")
+
+        # As the body is read while the caller consumes it, this method neither asks for compressed bodies
+        # nor holds a pooled connection. The connection is closed when the caller closes the stream.
+        req = Request(method=request.method, url=request.url, data=request.body, headers=request.headers)
+        try:
+            resp = self._urlopen(req, request)
+            return TransportResponse(status_code=resp.status, reason=resp.reason, headers=resp.headers, stream=resp)
+        except HTTPError as e:
+            body = _read_body(e, e.headers)
+            return TransportResponse(
+                status_code=e.code,
+                reason=str(e.reason),
+                headers=e.headers,  # type: ignore[arg-type]
+                body=body,
+                stream=BytesIO(body),
+            )
+
+    @staticmethod
+    def _urlopen(req: Request, request: TransportRequest) -> HTTPResponse:
+        opener: Optional[OpenerDirector] = None
+        if request.proxy is not None:
+            if isinstance(request.proxy, str):
+                opener = urllib.request.build_opener(
+                    ProxyHandler({"http": request.proxy, "https": request.proxy}),
+                    HTTPSHandler(context=request.ssl),
+                )
+            else:
+                raise SlackRequestError(f"Invalid proxy detected: {request.proxy} must be a str value")
+        if opener:
+            return opener.open(req, timeout=request.timeout)
+        return urlopen(req, context=request.ssl, timeout=request.timeout)
+
+    def close(self) -> None:
+        if self.connection_pool is not None:
+            self.connection_pool.close()
+
+
+class InMemoryHttpTransport(HttpTransport):
+    """HttpTransport that never sends requests over the network.
+    This transport is helpful for writing unit tests for your app.
+
+        transport = InMemoryHttpTransport()
+        transport.add_response("chat.postMessage", body={"ok": True, "ts": "111.222"})
+        client = WebClient(token="xoxb-test", transport=transport)
+        client.chat_postMessage(channel="C111", text="Hi there!")
+        assert transport.received_requests[0].url == "https://slack.com/api/chat.postMessage"
+    """
+
+    received_requests: List[TransportRequest]
+    handler: Optional[Callable[[TransportRequest], TransportResponse]]
+
+    def __init__(self, handler: Optional[Callable[[TransportRequest], TransportResponse]] = None):
+        """HttpTransport that never sends requests over the network.
+
+        Args:
+            handler: A function that builds a response for a given request.
+                If absent, the responses registered by `add_response()` are used.
+        """
+        self.handler = handler
+        self.received_requests = []
+        self._responses: Dict[str, Deque[TransportResponse]] = {}
+        self._lock = threading.Lock()
+
+    def add_response(
+        self,
+        path: str,
+        *,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Union[bytes, str, Dict[str, Any]]] = None,
+    ) -> None:
+        """Registers a response for the requests whose URL path ends with the given path.
+        When multiple responses are registered for the same path, they are returned in order.
+        The last one is returned for all the following requests.
+
+        Args:
+            path: The suffix of the URL path (e.g., "chat.postMessage", "/audit/v1/logs")
+            status_code: HTTP status code
+            headers: Response headers
+            body: Response body. A dict value is serialized as a JSON data.
+        """
+        response_headers = {"Content-Type": "application/json;charset=utf-8"}
+        if headers is not None:
+            response_headers.update(headers)
+        body_bytes: bytes
+        if isinstance(body, dict):
+            body_bytes = json.dumps(body).encode("utf-8")
+        elif isinstance(body, str):
+            body_bytes = body.encode("utf-8")
+        else:
+            body_bytes = body if body is not None else b""
+        response = TransportResponse(status_code=status_code, headers=response_headers, body=body_bytes)
+        with self._lock:
+            self._responses.setdefault(path, deque()).append(response)
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        with self._lock:
+            self.received_requests.append(request)
+        if self.handler is not None:
+            return self.handler(request)
+
+        path = urlparse(request.url).path
+        with self._lock:
+            for suffix, responses in self._responses.items():
+                if path.endswith(suffix):
+                    return responses.popleft() if len(responses) > 1 else responses[0]
+        return TransportResponse(
+            status_code=404,
+            headers={"Content-Type": "application/json;charset=utf-8"},
+            body=b'{"ok":false,"error":"unknown_method"}',
+        )
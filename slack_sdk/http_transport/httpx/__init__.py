@@ -0,0 +1,87 @@
+"""httpx based HttpTransport
+
+* https://pypi.org/project/httpx/
+
+To enable HTTP/2, install httpx with the extra (`pip install "httpx[http2]"`) and pass `http2=True`.
+"""
+
+import threading
+from ssl import SSLContext
+from typing import Dict, Optional, Tuple
+from urllib.error import URLError
+
+import httpx
+
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_transport.request import TransportRequest
+from slack_sdk.http_transport.response import TransportResponse
+from slack_sdk.http_transport.transport import HttpTransport
+
+
+class HttpxHttpTransport(HttpTransport):
+    http2: bool
+    limits: httpx.Limits
+
+    def __init__(self, *, http2: bool = False, limits: Optional[httpx.Limits] = None):
+        """httpx based HttpTransport, which reuses keep-alive connections and optionally supports HTTP/2.
+
+        Args:
+            http2: True if HTTP/2 is enabled (requires `httpx[http2]`)
+            limits: `httpx.Limits` for the underlying connection pools
+        """
+        self.http2 = http2
+        self.limits = limits if limits is not None else httpx.Limits()
+        self._clients: Dict[Tuple[Optional[str], Optional[SSLContext]], httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        if not request.url.lower().startswith("http"):
+            raise SlackRequestError(f"Invalid URL detected: {request.url}")
+        client = self._get_client(request.proxy, request.ssl)
+        try:
+            resp = client.request(
+                request.method,
+                request.url,
+                content=request.body,
+                headers=request.headers,
+                timeout=request.timeout,
+            )
+        except httpx.TransportError as e:
+            # Convert the error so that the built-in ConnectionErrorRetryHandler can handle it
+            raise URLError(e) from e
+        return TransportResponse(
+            status_code=resp.status_code,
+            reason=resp.reason_phrase,
+            headers=resp.headers.multi_items(),
+            body=resp.content,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _get_client(self, proxy: Optional[str], ssl: Optional[SSLContext]) -> httpx.Client:
+        key = (proxy, ssl)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                if proxy is not None and not isinstance(proxy, str):
+                    raise SlackRequestError(f"Invalid proxy detected: {proxy} must be a str value")
+                client = httpx.Client(
+                    http2=self.http2,
+                    limits=self.limits,
+                    verify=ssl if ssl is not None else True,
+                    proxy=proxy if proxy is None or "://" in proxy else f"http://{proxy}",
+                    # The API clients handle redirects and proxy env variables by themselves
+                    follow_redirects=False,
+                    trust_env=False,
+                )
+                self._clients[key] = client
+            return client
+
+
+__all__ = [
+    "HttpxHttpTransport",
+]
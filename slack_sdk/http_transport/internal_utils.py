@@ -0,0 +1,120 @@
+import time
+import zlib
+from email.message import Message
+from functools import lru_cache
+from io import BytesIO
+from ssl import SSLContext
+from typing import Any, List, Optional
+from urllib.error import HTTPError
+from urllib.request import Request
+
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder
+from .request import TransportRequest
+from .response import TransportResponse
+from .transport import HttpTransport
+
+
+def _send_urllib_request(
+    transport: HttpTransport,
+    req: Request,
+    *,
+    timeout: float,
+    ssl: Optional[SSLContext] = None,
+    proxy: Optional[str] = None,
+    recorder: Optional[_RequestRecorder] = None,
+) -> TransportResponse:
+    """Sends a urllib.request.Request using the given transport.
+
+    To keep the error handling (including retries) in the API clients compatible with urlopen(),
+    this function raises urllib.error.HTTPError for non-2xx responses.
+    If a recorder is given, the observers are notified of this attempt.
+    """
+    request = TransportRequest.from_urllib_request(req, timeout=timeout, ssl=ssl, proxy=proxy)
+    if recorder is None or not recorder.observers:
+        response = transport.send(request)
+    else:
+        request_bytes = _request_body_size(request)
+        started = time.perf_counter()
+        try:
+            response = transport.send(request)
+        except Exception as e:
+            recorder.attempt(started=started, error=e, request_bytes=request_bytes)
+            raise
+        recorder.attempt(
+            started=started,
+            status_code=response.status_code,
+            request_bytes=request_bytes,
+            response_bytes=len(response.body),
+            time_to_headers=response.time_to_headers,
+        )
+    if not (200 <= response.status_code < 300):
+        raise HTTPError(req.full_url, response.status_code, response.reason, response.headers, BytesIO(response.body))
+    return response
+
+
+def _request_body_size(request: TransportRequest) -> Optional[int]:
+    if request.body is None:
+        return 0
+    if isinstance(request.body, bytes):
+        return len(request.body)
+    # A streamed file upload has its Content-Length header
+    for k, v in request.headers.items():
+        if k.lower() == "content-length":
+            return int(v)
+    return None
+
+
+# The size of each chunk to read from a compressed response body
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _brotli_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def _build_accept_encoding() -> str:
+    return "gzip, deflate, br" if _brotli_available() else "gzip, deflate"
+
+
+def _build_decompressor(content_encoding: str) -> Optional[Any]:
+    if content_encoding in ("gzip", "x-gzip", "deflate"):
+        # This automatically detects either gzip or zlib header
+        return zlib.decompressobj(zlib.MAX_WBITS | 32)
+    if content_encoding == "br" and _brotli_available():
+        import brotli
+
+        return brotli.Decompressor()
+    return None
+
+
+def _read_body(resp: Any, headers: Message) -> bytes:
+    """Reads a response body, decompressing it chunk by chunk if the server compressed it.
+    As the compressed data is never held as a whole, this function does not keep both copies in memory.
+    When the body is decompressed, Content-Encoding and Content-Length headers are removed.
+    """
+    content_encoding = (headers.get("Content-Encoding") or "").strip().lower()
+    decompressor = _build_decompressor(content_encoding) if content_encoding else None
+    if decompressor is None:
+        return resp.read()
+
+    chunks: List[bytes] = []
+    while True:
+        chunk = resp.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        if hasattr(decompressor, "decompress"):
+            chunks.append(decompressor.decompress(chunk))
+        else:
+            # brotli.Decompressor
+            chunks.append(decompressor.process(chunk))
+    if hasattr(decompressor, "flush"):
+        chunks.append(decompressor.flush())
+    del headers["Content-Encoding"]
+    del headers["Content-Length"]
+    return b"".join(chunks)
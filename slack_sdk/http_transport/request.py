@@ -0,0 +1,55 @@
+from ssl import SSLContext
+from typing import Dict, Iterable, Optional, Union
+from urllib.request import Request
+
+
+class TransportRequest:
+    """HTTP request representation passed to HttpTransport"""
+
+    method: str
+    url: str
+    headers: Dict[str, str]
+    # File uploads send an iterable of byte chunks along with the Content-Length header
+    body: Optional[Union[bytes, Iterable[bytes]]]
+    timeout: float
+    ssl: Optional[SSLContext]
+    proxy: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Union[bytes, Iterable[bytes]]] = None,
+        timeout: float = 30,
+        ssl: Optional[SSLContext] = None,
+        proxy: Optional[str] = None,
+    ):
+        self.method = method
+        self.url = url
+        self.headers = headers if headers is not None else {}
+        self.body = body
+        self.timeout = timeout
+        self.ssl = ssl
+        self.proxy = proxy
+
+    @classmethod
+    def from_urllib_request(
+        cls,
+        req: Request,
+        *,
+        timeout: float,
+        ssl: Optional[SSLContext] = None,
+        proxy: Optional[str] = None,
+    ) -> "TransportRequest":
+        return TransportRequest(
+            method=req.get_method(),
+            url=req.full_url,
+            # header values such as Content-Length can be int values
+            headers={k: str(v) for k, v in req.header_items()},
+            body=req.data,  # type: ignore[arg-type]
+            timeout=timeout,
+            ssl=ssl,
+            proxy=proxy,
+        )
@@ -0,0 +1,47 @@
+from http.client import HTTPMessage
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+
+class TransportResponse:
+    """HTTP response representation returned by HttpTransport"""
+
+    status_code: int
+    reason: str
+    headers: HTTPMessage
+    body: bytes
+    # The file-like object (which has read(size) and close()) to read the body that is not read yet.
+    # Only the responses returned by HttpTransport#send_streaming() have it.
+    stream: Optional[Any]
+    # Elapsed seconds until the response headers were received, if the transport measures it.
+    time_to_headers: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: Optional[Union[HTTPMessage, Dict[str, str], Iterable[Tuple[str, str]]]] = None,
+        body: Optional[bytes] = None,
+        reason: str = "",
+        stream: Optional[Any] = None,
+        time_to_headers: Optional[float] = None,
+    ):
+        self.status_code = int(status_code)
+        self.reason = reason
+        self.headers = _to_http_message(headers)
+        self.body = body if body is not None else b""
+        self.stream = stream
+        self.time_to_headers = time_to_headers
+
+
+def _to_http_message(headers: Optional[Union[HTTPMessage, Dict[str, str], Iterable[Tuple[str, str]]]]) -> HTTPMessage:
+    # The API clients rely on the methods that http.client.HTTPMessage has (e.g., get_content_charset())
+    if isinstance(headers, HTTPMessage):
+        return headers
+    message = HTTPMessage()
+    if headers is None:
+        return message
+    items = headers.items() if isinstance(headers, dict) else headers
+    for k, v in items:
+        # this appends a new header rather than overwriting the existing one
+        message[k] = v
+    return message
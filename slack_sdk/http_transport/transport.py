@@ -0,0 +1,35 @@
+"""HttpTransport interface.
+You can pass an HttpTransport to the supported API clients to change the underlying HTTP client library.
+"""
+
+from io import BytesIO
+
+from .request import TransportRequest
+from .response import TransportResponse
+
+
+class HttpTransport:
+    """HttpTransport interface.
+
+    An implementation must return a TransportResponse for any HTTP status code.
+    For connectivity issues, it should raise `urllib.error.URLError` (or its subclass)
+    so that the built-in retry handlers can work in the same way as the default one.
+    """
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        raise NotImplementedError()
+
+    def send_streaming(self, request: TransportRequest) -> TransportResponse:
+        """Sends a request and returns the response whose body is read through `TransportResponse.stream`.
+        The caller must close the stream. This is used for downloading large files.
+
+        The default implementation reads the whole body by `send()`.
+        Implementations can override this method to read the body while the caller consumes it.
+        """
+        response = self.send(request)
+        response.stream = BytesIO(response.body)
+        return response
+
+    def close(self) -> None:
+        """Releases the resources (e.g., connections) that this transport holds."""
+        pass
@@ -0,0 +1,118 @@
+"""urllib3 based HttpTransport
+
+* https://pypi.org/project/urllib3/
+
+"""
+
+import threading
+from ssl import SSLContext
+from typing import Any, Dict, Optional, Tuple
+from urllib.error import URLError
+
+import urllib3
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_transport.request import TransportRequest
+from slack_sdk.http_transport.response import TransportResponse
+from slack_sdk.http_transport.transport import HttpTransport
+
+
+class Urllib3HttpTransport(HttpTransport):
+    num_pools: int
+    maxsize: int
+
+    def __init__(self, *, num_pools: int = 10, maxsize: int = 10):
+        """urllib3 based HttpTransport, which reuses keep-alive connections.
+
+        Args:
+            num_pools: The number of connection pools (one pool per host) to cache
+            maxsize: The maximum number of connections to keep per host
+        """
+        self.num_pools = num_pools
+        self.maxsize = maxsize
+        self._pool_managers: Dict[Tuple[Optional[str], Optional[SSLContext]], urllib3.PoolManager] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        headers = request.headers
+        if not any(k.lower() == "accept-encoding" for k in headers):
+            # urllib3 decompresses the response body by itself
+            headers = {**headers, **urllib3.make_headers(accept_encoding=True)}
+        resp = self._request(request, headers, preload_content=True)
+        return TransportResponse(
+            status_code=resp.status,
+            reason=resp.reason or "",
+            headers=list(resp.headers.items()),
+            body=resp.data,
+        )
+
+    def send_streaming(self, request: TransportRequest) -> TransportResponse:
+        # The underlying connection is released when the caller closes the stream
+        resp = self._request(request, request.headers, preload_content=False)
+        return TransportResponse(
+            status_code=resp.status,
+            reason=resp.reason or "",
+            headers=list(resp.headers.items()),
+            stream=resp,
+        )
+
+    def _request(
+        self,
+        request: TransportRequest,
+        headers: Dict[str, str],
+        *,
+        preload_content: bool,
+    ) -> Any:
+        if not request.url.lower().startswith("http"):
+            raise SlackRequestError(f"Invalid URL detected: {request.url}")
+        pool_manager = self._get_pool_manager(request.proxy, request.ssl)
+        try:
+            return pool_manager.request(
+                request.method,
+                request.url,
+                body=request.body,
+                headers=headers,
+                timeout=urllib3.Timeout(connect=request.timeout, read=request.timeout),
+                # The API clients handle both retries and redirects
+                retries=False,
+                redirect=False,
+                preload_content=preload_content,
+            )
+        except Urllib3HTTPError as e:
+            # Convert the error so that the built-in ConnectionErrorRetryHandler can handle it
+            raise URLError(e) from e
+
+    def close(self) -> None:
+        with self._lock:
+            for pool_manager in self._pool_managers.values():
+                pool_manager.clear()
+            self._pool_managers.clear()
+
+    def _get_pool_manager(self, proxy: Optional[str], ssl: Optional[SSLContext]) -> urllib3.PoolManager:
+        key = (proxy, ssl)
+        with self._lock:
+            pool_manager = self._pool_managers.get(key)
+            if pool_manager is None:
+                if proxy is not None:
+                    if not isinstance(proxy, str):
+                        raise SlackRequestError(f"Invalid proxy detected: {proxy} must be a str value")
+                    proxy_url = proxy if "://" in proxy else f"http://{proxy}"
+                    parsed_proxy = urllib3.util.parse_url(proxy_url)
+                    proxy_headers = urllib3.make_headers(proxy_basic_auth=parsed_proxy.auth) if parsed_proxy.auth else None
+                    pool_manager = urllib3.ProxyManager(
+                        proxy_url,
+                        num_pools=self.num_pools,
+                        maxsize=self.maxsize,
+                        proxy_headers=proxy_headers,
+                        ssl_context=ssl,
+                    )
+                else:
+                    pool_manager = urllib3.PoolManager(num_pools=self.num_pools, maxsize=self.maxsize, ssl_context=ssl)
+                self._pool_managers[key] = pool_manager
+            return pool_manager
+
+
+__all__ = [
+    "Urllib3HttpTransport",
+]
@@ -0,0 +1,57 @@
+"""Process-wide JSON codec for request and response bodies.
+
+The API clients encode and decode JSON data through the codec returned by `get_json_codec()`.
+By default, it uses orjson or msgspec if either is installed, and falls back to the standard library.
+Installing the "json_codec" extra (`pip install "slack_sdk[json_codec]"`) enables this switch.
+
+    from slack_sdk.json_codec import StdlibJsonCodec, set_json_codec
+
+    # Use the standard library regardless of the installed packages
+    set_json_codec(StdlibJsonCodec())
+"""
+
+from typing import Optional
+
+from .codec import JsonCodec, StdlibJsonCodec
+
+_json_codec: Optional[JsonCodec] = None
+
+
+def detect_json_codec() -> JsonCodec:
+    """Returns the fastest available codec in the order of orjson, msgspec, and the standard library."""
+    try:
+        from .orjson import OrjsonJsonCodec
+
+        return OrjsonJsonCodec()
+    except ImportError:
+        pass
+    try:
+        from .msgspec import MsgspecJsonCodec
+
+        return MsgspecJsonCodec()
+    except ImportError:
+        pass
+    return StdlibJsonCodec()
+
+
+def get_json_codec() -> JsonCodec:
+    """Returns the codec used in this process."""
+    global _json_codec
+    if _json_codec is None:
+        _json_codec = detect_json_codec()
+    return _json_codec
+
+
+def set_json_codec(codec: Optional[JsonCodec]) -> None:
+    """Replaces the codec used in this process. Passing None restores the auto-detected one."""
+    global _json_codec
+    _json_codec = codec
+
+
+__all__ = [
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "detect_json_codec",
+    "get_json_codec",
+    "set_json_codec",
+]
@@ -0,0 +1,37 @@
+import json
+from typing import Any, Union
+
+
+class JsonCodec:
+    """Encodes and decodes JSON data.
+
+    The implementations must behave the same as the standard library's `json` module except for the whitespace
+    in the encoded data. When a faster library cannot handle the data (e.g., integers exceeding 64 bits),
+    the implementation should fall back to the standard library. Decoding errors are raised
+    as `json.JSONDecodeError`, so that the existing error handling works as-is.
+    """
+
+    name: str
+
+    def dumps(self, obj: Any) -> str:
+        raise NotImplementedError()
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Encodes the object as UTF-8 JSON bytes, which can be used as an HTTP request body as-is."""
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decodes the JSON data. UTF-8 bytes can be passed without decoding them into a str."""
+        raise NotImplementedError()
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec using the standard library's `json` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
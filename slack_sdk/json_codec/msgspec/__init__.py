@@ -0,0 +1,37 @@
+"""msgspec based JsonCodec
+
+* https://pypi.org/project/msgspec/
+"""
+
+import json
+from typing import Any, Union
+
+import msgspec
+
+from slack_sdk.json_codec.codec import JsonCodec
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """JSON codec using msgspec, which encodes and decodes UTF-8 bytes directly."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError:
+            # If the data is invalid, json.JSONDecodeError is raised here
+            return json.loads(data)
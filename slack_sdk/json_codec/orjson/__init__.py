@@ -0,0 +1,35 @@
+"""orjson based JsonCodec
+
+* https://pypi.org/project/orjson/
+"""
+
+import json
+from typing import Any, Union
+
+import orjson
+
+from slack_sdk.json_codec.codec import JsonCodec
+
+
+class OrjsonJsonCodec(JsonCodec):
+    """JSON codec using orjson, which encodes and decodes UTF-8 bytes directly."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g., non-str dict keys, integers exceeding 64 bits
+            return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # e.g., NaN, integers exceeding 64 bits
+            # If the data is invalid, json.JSONDecodeError is raised here
+            return json.loads(data)
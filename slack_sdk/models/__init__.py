@@ -1,18 +1,41 @@
 """Classes for constructing Slack-specific data structure"""
 
+import importlib
 import logging
-from typing import Union, Dict, Any, Sequence, List
+from typing import TYPE_CHECKING, Union, Dict, Any, Sequence, List
 
-from .basic_objects import BaseObject
-from .basic_objects import EnumValidator
-from .basic_objects import JsonObject
-from .basic_objects import JsonValidator
+if TYPE_CHECKING:
+    from .basic_objects import BaseObject
+    from .basic_objects import EnumValidator
+    from .basic_objects import JsonObject
+    from .basic_objects import JsonValidator
+
+# The submodules are imported when the attributes are accessed for the first time (PEP 562)
+_lazy_attributes: Dict[str, str] = {
+    "BaseObject": ".basic_objects",
+    "EnumValidator": ".basic_objects",
+    "JsonObject": ".basic_objects",
+    "JsonValidator": ".basic_objects",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals().keys()) + list(_lazy_attributes.keys()))
 
 
 # NOTE: used only for legacy components - don't use this for Block Kit
 def extract_json(
-    item_or_items: Union[JsonObject, Sequence[JsonObject]], *format_args
-) -> Union[Dict[Any, Any], List[Dict[Any, Any]], Sequence[JsonObject]]:
+    item_or_items: Union["JsonObject", Sequence["JsonObject"]], *format_args
+) -> Union[Dict[Any, Any], List[Dict[Any, Any]], Sequence["JsonObject"]]:
     """
     Given a sequence (or single item), attempt to call the to_dict() method on each
     item and return a plain list. If item is not the expected type, return it
@@ -23,6 +46,8 @@ def extract_json(
       format_args: Any formatting specifiers to pass into the object's to_dict
             method
     """
+    from .basic_objects import JsonObject
+
     try:
         return [
             elem.to_dict(*format_args) if isinstance(elem, JsonObject) else elem
@@ -7,80 +7,177 @@ To learn more about Block Kit, please check the following resources and tools:
 * https://app.slack.com/block-kit-builder
 """
 
-from .basic_components import (
-    ButtonStyles,
-    ConfirmObject,
-    DynamicSelectElementTypes,
-    FeedbackButtonObject,
-    MarkdownTextObject,
-    Option,
-    OptionGroup,
-    PlainTextObject,
-    RawTextObject,
-    TextObject,
-)
-from .block_elements import (
-    BlockElement,
-    ButtonElement,
-    ChannelMultiSelectElement,
-    ChannelSelectElement,
-    CheckboxesElement,
-    ConversationFilter,
-    ConversationMultiSelectElement,
-    ConversationSelectElement,
-    DatePickerElement,
-    DateTimePickerElement,
-    EmailInputElement,
-    ExternalDataMultiSelectElement,
-    ExternalDataSelectElement,
-    FeedbackButtonsElement,
-    IconButtonElement,
-    ImageElement,
-    InputInteractiveElement,
-    InteractiveElement,
-    LinkButtonElement,
-    NumberInputElement,
-    OverflowMenuElement,
-    PlainTextInputElement,
-    RadioButtonsElement,
-    RichTextElement,
-    RichTextElementParts,
-    RichTextInputElement,
-    RichTextListElement,
-    RichTextPreformattedElement,
-    RichTextQuoteElement,
-    RichTextSectionElement,
-    SelectElement,
-    StaticMultiSelectElement,
-    StaticSelectElement,
-    TimePickerElement,
-    UrlInputElement,
-    UrlSourceElement,
-    UserMultiSelectElement,
-    UserSelectElement,
-)
-from .blocks import (
-    ActionsBlock,
-    AlertBlock,
-    Block,
-    CallBlock,
-    CardBlock,
-    CarouselBlock,
-    ContextActionsBlock,
-    ContextBlock,
-    DividerBlock,
-    FileBlock,
-    HeaderBlock,
-    ImageBlock,
-    InputBlock,
-    MarkdownBlock,
-    PlanBlock,
-    RichTextBlock,
-    SectionBlock,
-    TableBlock,
-    TaskCardBlock,
-    VideoBlock,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .basic_components import (
+        ButtonStyles,
+        ConfirmObject,
+        DynamicSelectElementTypes,
+        FeedbackButtonObject,
+        MarkdownTextObject,
+        Option,
+        OptionGroup,
+        PlainTextObject,
+        RawTextObject,
+        TextObject,
+    )
+    from .block_elements import (
+        BlockElement,
+        ButtonElement,
+        ChannelMultiSelectElement,
+        ChannelSelectElement,
+        CheckboxesElement,
+        ConversationFilter,
+        ConversationMultiSelectElement,
+        ConversationSelectElement,
+        DatePickerElement,
+        DateTimePickerElement,
+        EmailInputElement,
+        ExternalDataMultiSelectElement,
+        ExternalDataSelectElement,
+        FeedbackButtonsElement,
+        IconButtonElement,
+        ImageElement,
+        InputInteractiveElement,
+        InteractiveElement,
+        LinkButtonElement,
+        NumberInputElement,
+        OverflowMenuElement,
+        PlainTextInputElement,
+        RadioButtonsElement,
+        RichTextElement,
+        RichTextElementParts,
+        RichTextInputElement,
+        RichTextListElement,
+        RichTextPreformattedElement,
+        RichTextQuoteElement,
+        RichTextSectionElement,
+        SelectElement,
+        StaticMultiSelectElement,
+        StaticSelectElement,
+        TimePickerElement,
+        UrlInputElement,
+        UrlSourceElement,
+        UserMultiSelectElement,
+        UserSelectElement,
+    )
+    from .blocks import (
+        ActionsBlock,
+        AlertBlock,
+        Block,
+        CallBlock,
+        CardBlock,
+        CarouselBlock,
+        ContextActionsBlock,
+        ContextBlock,
+        DividerBlock,
+        FileBlock,
+        HeaderBlock,
+        ImageBlock,
+        InputBlock,
+        MarkdownBlock,
+        PlanBlock,
+        RichTextBlock,
+        SectionBlock,
+        TableBlock,
+        TaskCardBlock,
+        VideoBlock,
+    )
+
+# The submodules are imported when the attributes are accessed for the first time (PEP 562)
+_lazy_modules: Dict[str, List[str]] = {
+    ".basic_components": [
+        "ButtonStyles",
+        "ConfirmObject",
+        "DynamicSelectElementTypes",
+        "FeedbackButtonObject",
+        "MarkdownTextObject",
+        "Option",
+        "OptionGroup",
+        "PlainTextObject",
+        "RawTextObject",
+        "TextObject",
+    ],
+    ".block_elements": [
+        "BlockElement",
+        "ButtonElement",
+        "ChannelMultiSelectElement",
+        "ChannelSelectElement",
+        "CheckboxesElement",
+        "ConversationFilter",
+        "ConversationMultiSelectElement",
+        "ConversationSelectElement",
+        "DatePickerElement",
+        "DateTimePickerElement",
+        "EmailInputElement",
+        "ExternalDataMultiSelectElement",
+        "ExternalDataSelectElement",
+        "FeedbackButtonsElement",
+        "IconButtonElement",
+        "ImageElement",
+        "InputInteractiveElement",
+        "InteractiveElement",
+        "LinkButtonElement",
+        "NumberInputElement",
+        "OverflowMenuElement",
+        "PlainTextInputElement",
+        "RadioButtonsElement",
+        "RichTextElement",
+        "RichTextElementParts",
+        "RichTextInputElement",
+        "RichTextListElement",
+        "RichTextPreformattedElement",
+        "RichTextQuoteElement",
+        "RichTextSectionElement",
+        "SelectElement",
+        "StaticMultiSelectElement",
+        "StaticSelectElement",
+        "TimePickerElement",
+        "UrlInputElement",
+        "UrlSourceElement",
+        "UserMultiSelectElement",
+        "UserSelectElement",
+    ],
+    ".blocks": [
+        "ActionsBlock",
+        "AlertBlock",
+        "Block",
+        "CallBlock",
+        "CardBlock",
+        "CarouselBlock",
+        "ContextActionsBlock",
+        "ContextBlock",
+        "DividerBlock",
+        "FileBlock",
+        "HeaderBlock",
+        "ImageBlock",
+        "InputBlock",
+        "MarkdownBlock",
+        "PlanBlock",
+        "RichTextBlock",
+        "SectionBlock",
+        "TableBlock",
+        "TaskCardBlock",
+        "VideoBlock",
+    ],
+}
+_lazy_attributes: Dict[str, str] = {name: module for module, names in _lazy_modules.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals().keys()) + list(_lazy_attributes.keys()))
+
 
 __all__ = [
     "ButtonStyles",
@@ -0,0 +1,33 @@
+"""Client-side rate limiting for the Web API clients.
+
+Slack applies rate limits per app per workspace for each API method.
+Refer to https://docs.slack.dev/apis/web-api/rate-limits for details.
+While the retry handlers in `slack_sdk.http_retry` react to 429 responses after the fact,
+a `RateLimiter` delays API calls on the client side before they exceed the limits.
+"""
+
+from .tier import (
+    RateLimitTier,
+    TIER_1,
+    TIER_2,
+    TIER_3,
+    TIER_4,
+    METHOD_TIERS,
+    PER_CHANNEL_METHOD_TIERS,
+    UNTHROTTLED_METHODS,
+)
+from .token_bucket import TokenBucket
+from .rate_limiter import RateLimiter
+
+__all__ = [
+    "RateLimitTier",
+    "TIER_1",
+    "TIER_2",
+    "TIER_3",
+    "TIER_4",
+    "METHOD_TIERS",
+    "PER_CHANNEL_METHOD_TIERS",
+    "UNTHROTTLED_METHODS",
+    "TokenBucket",
+    "RateLimiter",
+]
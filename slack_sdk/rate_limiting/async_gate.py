@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+from logging import Logger
+from typing import Dict, Optional, Tuple
+
+# (workspace key, API method)
+_GateKey = Tuple[str, str]
+
+
+class _GateState:
+    blocked_until: float
+    probing: bool
+    probe_finished: asyncio.Event
+
+    def __init__(self, blocked_until: float):
+        self.blocked_until = blocked_until
+        self.probing = False
+        # The calls waiting for the probe call await this event instead of polling the state
+        self.probe_finished = asyncio.Event()
+
+
+class AsyncRateLimitGate:
+    """A gate that holds the API calls to a rate limited method until its Retry-After duration expires.
+
+    Once a 429 response is received for a pair of a workspace and an API method, the gate for the pair closes.
+    All the calls to the method wait without sending requests. When the gate reopens, only a single call
+    is sent first as a probe. If the probe succeeds, the rest of the calls are released at once.
+    If it gets another 429 response, the gate closes again. This way, a burst of concurrent calls
+    receives a single 429 response instead of one per call.
+
+        from slack_sdk.web.async_client import AsyncWebClient
+        from slack_sdk.rate_limiting.async_gate import AsyncRateLimitGate
+
+        client = AsyncWebClient(token=os.environ["SLACK_BOT_TOKEN"], rate_limit_gate=AsyncRateLimitGate())
+    """
+
+    logger: Logger
+
+    def __init__(self, *, logger: Optional[Logger] = None):
+        """A gate for rate limited API methods.
+
+        Args:
+            logger: Custom logger
+        """
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self._states: Dict[_GateKey, _GateState] = {}
+
+    async def enter(self, *, workspace_key: str, api_method: str) -> bool:
+        """Waits until the gate for the method is open.
+
+        Returns:
+            True if the caller is the probe call. The caller must call `exit()` after the call in the case,
+            even when the call is cancelled (e.g., in a `finally` clause). Otherwise, the other calls wait forever.
+        """
+        key = (workspace_key, api_method)
+        while True:
+            state = self._states.get(key)
+            if state is None:
+                return False
+            now = time.monotonic()
+            if now < state.blocked_until:
+                if self.logger.level <= logging.DEBUG:
+                    self.logger.debug(f"Waiting {state.blocked_until - now:.3f} seconds as {api_method} is rate limited")
+                await asyncio.sleep(state.blocked_until - now)
+            elif not state.probing:
+                state.probing = True
+                state.probe_finished.clear()
+                return True
+            else:
+                await state.probe_finished.wait()
+
+    def exit(
+        self,
+        *,
+        workspace_key: str,
+        api_method: str,
+        probe: bool,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Updates the gate with the result of a call.
+
+        Args:
+            workspace_key: The workspace key
+            api_method: The API method name
+            probe: True if the call was the probe call
+            status_code: The HTTP status code of the response
+                (None if the call failed or was cancelled without a response)
+            retry_after: The Retry-After header value of the 429 response
+        """
+        key = (workspace_key, api_method)
+        if status_code == 429:
+            state = self._states.get(key)
+            blocked_until = time.monotonic() + (retry_after if retry_after is not None else 1)
+            if state is None:
+                self._states[key] = _GateState(blocked_until)
+            else:
+                state.blocked_until = max(state.blocked_until, blocked_until)
+                if probe:
+                    state.probing = False
+                    state.probe_finished.set()
+        elif probe:
+            state = self._states.get(key)
+            if state is not None:
+                if status_code is None:
+                    # Let another call be the next probe
+                    state.probing = False
+                else:
+                    del self._states[key]
+                state.probe_finished.set()
+
+    def is_closed(self, *, workspace_key: str, api_method: str) -> bool:
+        return (workspace_key, api_method) in self._states
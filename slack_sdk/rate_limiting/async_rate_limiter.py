@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from typing import Optional
+
+from .rate_limiter import RateLimiter
+
+
+class AsyncRateLimiter(RateLimiter):
+    """A client-side rate limiter for asyncio-based API clients such as `AsyncWebClient`.
+
+    from slack_sdk.web.async_client import AsyncWebClient
+    from slack_sdk.rate_limiting.async_rate_limiter import AsyncRateLimiter
+
+    client = AsyncWebClient(token=os.environ["SLACK_BOT_TOKEN"], rate_limiter=AsyncRateLimiter())
+    """
+
+    async def acquire_async(
+        self,
+        *,
+        api_method: str,
+        token: Optional[str] = None,
+        team_id: Optional[str] = None,
+        channel: Optional[str] = None,
+    ) -> float:
+        """Waits until the API call can be sent without blocking the event loop.
+
+        Returns:
+            The number of seconds this method waited for
+        """
+        wait_seconds = self.reserve(api_method=api_method, token=token, team_id=team_id, channel=channel)
+        if wait_seconds > 0:
+            if self.logger.level <= logging.DEBUG:
+                self.logger.debug(f"Waiting {wait_seconds:.3f} seconds before calling {api_method} (client-side rate limit)")
+            await asyncio.sleep(wait_seconds)
+        return wait_seconds
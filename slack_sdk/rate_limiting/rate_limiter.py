@@ -0,0 +1,149 @@
+import hashlib
+import logging
+import threading
+import time
+from logging import Logger
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .tier import METHOD_TIERS, PER_CHANNEL_METHOD_TIERS, TIER_3, UNTHROTTLED_METHODS, RateLimitTier
+from .token_bucket import TokenBucket
+
+# (workspace key, API method, channel ID)
+_BucketKey = Tuple[str, str, Optional[str]]
+
+
+class RateLimiter:
+    """A client-side rate limiter, which delays API calls before they hit Slack's rate limits.
+
+    The limits are tracked by token buckets for each pair of a workspace (token and team_id) and an API method.
+    Also, the methods in `per_channel_method_tiers` (e.g., chat.postMessage) are limited per channel.
+    A single instance can be safely shared among multiple clients and threads.
+
+        from slack_sdk import WebClient
+        from slack_sdk.rate_limiting import RateLimiter
+
+        client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], rate_limiter=RateLimiter())
+    """
+
+    method_tiers: Dict[str, RateLimitTier]
+    per_channel_method_tiers: Dict[str, RateLimitTier]
+    unthrottled_methods: FrozenSet[str]
+    default_tier: Optional[RateLimitTier]
+    max_buckets: int
+    logger: Logger
+
+    def __init__(
+        self,
+        *,
+        method_tiers: Optional[Dict[str, RateLimitTier]] = None,
+        per_channel_method_tiers: Optional[Dict[str, RateLimitTier]] = None,
+        unthrottled_methods: Optional[Iterable[str]] = None,
+        default_tier: Optional[RateLimitTier] = TIER_3,
+        max_buckets: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        logger: Optional[Logger] = None,
+    ):
+        """A client-side rate limiter.
+
+        Args:
+            method_tiers: The rate limit tiers for each API method.
+                The given ones are merged with the built-in table (`slack_sdk.rate_limiting.tier.METHOD_TIERS`).
+            per_channel_method_tiers: The rate limits applied to each channel for the API methods
+                (default: 1 request per second per channel for chat.postMessage)
+            unthrottled_methods: The API methods that are never delayed
+                (default: `slack_sdk.rate_limiting.tier.UNTHROTTLED_METHODS`, which has apps.connections.open
+                so that Socket Mode clients can establish all their connections without waiting)
+            default_tier: The tier for the methods that are not listed in method_tiers.
+                If None, such methods are not limited.
+            max_buckets: The number of buckets to hold before discarding the ones no longer in use
+            clock: The function that returns the current monotonic time in seconds
+            logger: Custom logger
+        """
+        self.method_tiers = dict(METHOD_TIERS)
+        if method_tiers is not None:
+            self.method_tiers.update(method_tiers)
+        self.per_channel_method_tiers = (
+            per_channel_method_tiers if per_channel_method_tiers is not None else dict(PER_CHANNEL_METHOD_TIERS)
+        )
+        self.unthrottled_methods = frozenset(unthrottled_methods if unthrottled_methods is not None else UNTHROTTLED_METHODS)
+        self.default_tier = default_tier
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+
+        self._buckets: Dict[_BucketKey, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self,
+        *,
+        api_method: str,
+        token: Optional[str] = None,
+        team_id: Optional[str] = None,
+        channel: Optional[str] = None,
+    ) -> float:
+        """Reserves a slot for an API call and returns the number of seconds to wait before sending it.
+        This method never blocks. Use `acquire()` to wait for the slot.
+
+        Args:
+            api_method: The API method name (e.g., "chat.postMessage")
+            token: The token used for the API call
+            team_id: The workspace ID if the token is an org-wide installation's one
+            channel: The channel ID if the API call has it
+        """
+        if api_method in self.unthrottled_methods:
+            return 0.0
+        workspace_key = _build_workspace_key(token, team_id)
+        limits: List[Tuple[_BucketKey, RateLimitTier]] = []
+        per_channel_tier = self.per_channel_method_tiers.get(api_method)
+        if per_channel_tier is not None and channel is not None:
+            limits.append(((workspace_key, api_method, channel), per_channel_tier))
+        method_tier = self.method_tiers.get(api_method)
+        if method_tier is None and per_channel_tier is None:
+            method_tier = self.default_tier
+        if method_tier is not None:
+            limits.append(((workspace_key, api_method, None), method_tier))
+
+        wait_seconds = 0.0
+        with self._lock:
+            now = self.clock()
+            for key, tier in limits:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if len(self._buckets) >= self.max_buckets:
+                        self._discard_full_buckets(now)
+                    bucket = TokenBucket(rate=tier.requests_per_second, capacity=tier.burst, now=now)
+                    self._buckets[key] = bucket
+                wait_seconds = max(wait_seconds, bucket.reserve(now))
+        return wait_seconds
+
+    def acquire(
+        self,
+        *,
+        api_method: str,
+        token: Optional[str] = None,
+        team_id: Optional[str] = None,
+        channel: Optional[str] = None,
+    ) -> float:
+        """Blocks the current thread until the API call can be sent.
+
+        Returns:
+            The number of seconds this method waited for
+        """
+        wait_seconds = self.reserve(api_method=api_method, token=token, team_id=team_id, channel=channel)
+        if wait_seconds > 0:
+            if self.logger.level <= logging.DEBUG:
+                self.logger.debug(f"Waiting {wait_seconds:.3f} seconds before calling {api_method} (client-side rate limit)")
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    def _discard_full_buckets(self, now: float) -> None:
+        # A full bucket works in the same way as a newly created one
+        for key in [k for k, b in self._buckets.items() if b.is_full(now)]:
+            del self._buckets[key]
+
+
+def _build_workspace_key(token: Optional[str], team_id: Optional[str]) -> str:
+    # Not to hold the raw token value in memory (and persistent stores), use its hash value instead
+    token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16] if token else "-"
+    return f"{token_hash}:{team_id}" if team_id else token_hash
@@ -0,0 +1,9 @@
+"""Rate limit state store, which shares the rate limited states among multiple API clients and processes."""
+
+from .state_store import RateLimitStateStore
+from .memory import InMemoryRateLimitStateStore
+
+__all__ = [
+    "RateLimitStateStore",
+    "InMemoryRateLimitStateStore",
+]
@@ -0,0 +1,14 @@
+from logging import Logger
+from typing import Optional
+
+
+class AsyncRateLimitStateStore:
+    @property
+    def logger(self) -> Logger:
+        raise NotImplementedError()
+
+    async def async_block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+        raise NotImplementedError()
+
+    async def async_find_blocked_until(self, *, workspace_key: str, api_method: str) -> Optional[float]:
+        raise NotImplementedError()
@@ -0,0 +1,47 @@
+import logging
+import threading
+import time
+from logging import Logger
+from typing import Dict, Optional, Tuple
+
+from ..async_state_store import AsyncRateLimitStateStore
+from ..state_store import RateLimitStateStore
+
+
+class InMemoryRateLimitStateStore(RateLimitStateStore, AsyncRateLimitStateStore):
+    """Rate limit state store that works within a single process.
+    A single instance can be safely shared among multiple clients and threads.
+    """
+
+    def __init__(self, *, logger: Logger = logging.getLogger(__name__)):
+        self._logger = logger
+        self._blocked_until: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def logger(self) -> Logger:
+        if self._logger is None:
+            self._logger = logging.getLogger(__name__)
+        return self._logger
+
+    async def async_block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+        return self.block(workspace_key=workspace_key, api_method=api_method, until=until)
+
+    async def async_find_blocked_until(self, *, workspace_key: str, api_method: str) -> Optional[float]:
+        return self.find_blocked_until(workspace_key=workspace_key, api_method=api_method)
+
+    def block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+        key = (workspace_key, api_method)
+        with self._lock:
+            now = time.time()
+            for k in [k for k, v in self._blocked_until.items() if v <= now]:
+                del self._blocked_until[k]
+            if until > self._blocked_until.get(key, 0):
+                self._blocked_until[key] = until
+
+    def find_blocked_until(self, *, workspace_key: str, api_method: str) -> Optional[float]:
+        with self._lock:
+            until = self._blocked_until.get((workspace_key, api_method))
+        if until is None or until <= time.time():
+            return None
+        return until
@@ -0,0 +1,111 @@
+import logging
+import sqlite3
+import time
+from logging import Logger
+from sqlite3 import Connection
+from typing import Optional
+
+from ..async_state_store import AsyncRateLimitStateStore
+from ..state_store import RateLimitStateStore
+
+
+class SQLite3RateLimitStateStore(RateLimitStateStore, AsyncRateLimitStateStore):
+    """Rate limit state store that can be shared among multiple processes on the same host
+    (e.g., the workers of a gunicorn app) via a SQLite3 database file.
+    """
+
+    def __init__(
+        self,
+        *,
+        database: str,
+        timeout: float = 5.0,
+        logger: Logger = logging.getLogger(__name__),
+    ):
+        """Rate limit state store backed by a SQLite3 database.
+
+        Args:
+            database: The path to the database file
+            timeout: The number of seconds to wait for another process to release the database lock
+            logger: Custom logger
+        """
+        self.database = database
+        self.timeout = timeout
+        self.init_called = False
+        self._logger = logger
+
+    @property
+    def logger(self) -> Logger:
+        if self._logger is None:
+            self._logger = logging.getLogger(__name__)
+        return self._logger
+
+    def init(self):
+        try:
+            with sqlite3.connect(database=self.database, timeout=self.timeout) as conn:
+                cur = conn.execute("select count(1) from rate_limit_states;")
+                row_num = cur.fetchone()[0]
+                self.logger.debug(f"{row_num} rate limit states are stored in {self.database}")
+        except Exception:
+            self.create_tables()
+        self.init_called = True
+
+    def connect(self) -> Connection:
+        if not self.init_called:
+            self.init()
+        return sqlite3.connect(database=self.database, timeout=self.timeout)
+
+    def create_tables(self):
+        with sqlite3.connect(database=self.database, timeout=self.timeout) as conn:
+            conn.execute("""
+            create table if not exists rate_limit_states (
+                workspace_key text not null,
+                api_method text not null,
+                blocked_until real not null,
+                primary key (workspace_key, api_method)
+            );
+            """)
+            self.logger.debug(f"Tables have been created (database: {self.database})")
+            conn.commit()
+
+    async def async_block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+        return self.block(workspace_key=workspace_key, api_method=api_method, until=until)
+
+    async def async_find_blocked_until(self, *, workspace_key: str, api_method: str) -> Optional[float]:
+        return self.find_blocked_until(workspace_key=workspace_key, api_method=api_method)
+
+    def block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+        with self.connect() as conn:
+            conn.execute("delete from rate_limit_states where blocked_until <= ?;", [time.time()])
+            # "insert ... on conflict" is not available in the SQLite versions bundled with older Python runtimes
+            conn.execute(
+                """
+                update rate_limit_states set blocked_until = ?
+                where workspace_key = ? and api_method = ? and blocked_until < ?;
+                """,
+                [until, workspace_key, api_method, until],
+            )
+            conn.execute(
+                """
+                insert or ignore into rate_limit_states (workspace_key, api_method, blocked_until) values (?, ?, ?);
+                """,
+                [workspace_key, api_method, until],
+            )
+            self.logger.debug(f"block's upsert result: {[workspace_key, api_method, until]} (database: {self.database})")
+            conn.commit()
+
+    def find_blocked_until(self, *, workspace_key: str, api_method: str) -> Optional[float]:
+        try:
+            with self.connect() as conn:
+                cur = conn.execute(
+                    """
+                    select blocked_until from rate_limit_states
+                    where workspace_key = ? and api_method = ? and blocked_until > ?;
+                    """,
+                    [workspace_key, api_method, time.time()],
+                )
+                row = cur.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            message = f"Failed to find any persistent data for {api_method}: {e}"
+            self.logger.warning(message)
+            return None
@@ -0,0 +1,22 @@
+from logging import Logger
+from typing import Optional
+
+
+class RateLimitStateStore:
+    """Rate limit state store, which records "API method X for workspace Y is blocked until T".
+
+    When a client receives a 429 response, it saves the time until which the method is blocked
+    (calculated from the Retry-After header) in this store. Before sending a request,
+    the clients sharing the same store wait until the time passes.
+    The `until` values are UNIX timestamps so that they can be shared across processes.
+    """
+
+    @property
+    def logger(self) -> Logger:
+        raise NotImplementedError()
+
+    def block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+        raise NotImplementedError()
+
+    def find_blocked_until(self, *, workspace_key: str, api_method: str) -> Optional[float]:
+        raise NotImplementedError()
@@ -0,0 +1,135 @@
+"""Slack Web API rate limit tiers.
+
+Refer to https://docs.slack.dev/apis/web-api/rate-limits for details.
+"""
+
+from typing import Dict, FrozenSet, Optional
+
+
+class RateLimitTier:
+    """A rate limit tier, which is applied to each pair of an app's workspace and an API method."""
+
+    name: str
+    requests_per_minute: float
+    burst: int
+
+    def __init__(self, name: str, requests_per_minute: float, burst: Optional[int] = None):
+        """A rate limit tier.
+
+        Args:
+            name: The name of this tier (e.g., "Tier 2")
+            requests_per_minute: The number of requests allowed per minute
+            burst: The number of requests that can be sent in a row without waiting.
+                The default value is a quarter of requests_per_minute.
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0")
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst if burst is not None else max(1, int(requests_per_minute // 4))
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests_per_minute / 60
+
+    def __repr__(self) -> str:
+        return f"<RateLimitTier {self.name}: {self.requests_per_minute}/min (burst: {self.burst})>"
+
+
+TIER_1 = RateLimitTier("Tier 1", 1)
+TIER_2 = RateLimitTier("Tier 2", 20)
+TIER_3 = RateLimitTier("Tier 3", 50)
+TIER_4 = RateLimitTier("Tier 4", 100)
+
+# chat.postMessage generally allows posting one message per second to a channel
+PER_CHANNEL_POST_MESSAGE = RateLimitTier("1 per second per channel", 60, burst=1)
+
+# The methods with special rate limits (e.g., chat.postMessage) are not listed here
+METHOD_TIERS: Dict[str, RateLimitTier] = {
+    "admin.analytics.getFile": TIER_2,
+    "admin.conversations.search": TIER_2,
+    "admin.users.list": TIER_2,
+    "api.test": TIER_4,
+    "auth.test": TIER_4,
+    "bots.info": TIER_3,
+    "chat.delete": TIER_3,
+    "chat.getPermalink": TIER_4,
+    "chat.meMessage": TIER_3,
+    "chat.postEphemeral": TIER_4,
+    "chat.scheduleMessage": TIER_3,
+    "chat.scheduledMessages.list": TIER_3,
+    "chat.unfurl": TIER_3,
+    "chat.update": TIER_3,
+    "conversations.archive": TIER_2,
+    "conversations.close": TIER_2,
+    "conversations.create": TIER_2,
+    "conversations.history": TIER_3,
+    "conversations.info": TIER_3,
+    "conversations.invite": TIER_3,
+    "conversations.join": TIER_3,
+    "conversations.kick": TIER_3,
+    "conversations.leave": TIER_3,
+    "conversations.list": TIER_2,
+    "conversations.mark": TIER_3,
+    "conversations.members": TIER_4,
+    "conversations.open": TIER_3,
+    "conversations.rename": TIER_2,
+    "conversations.replies": TIER_3,
+    "conversations.setPurpose": TIER_2,
+    "conversations.setTopic": TIER_2,
+    "conversations.unarchive": TIER_2,
+    "dnd.info": TIER_3,
+    "emoji.list": TIER_2,
+    "files.completeUploadExternal": TIER_4,
+    "files.delete": TIER_3,
+    "files.getUploadURLExternal": TIER_4,
+    "files.info": TIER_4,
+    "files.list": TIER_3,
+    "files.upload": TIER_2,
+    "oauth.v2.access": TIER_4,
+    "pins.add": TIER_2,
+    "pins.list": TIER_2,
+    "pins.remove": TIER_2,
+    "reactions.add": TIER_3,
+    "reactions.get": TIER_3,
+    "reactions.list": TIER_2,
+    "reactions.remove": TIER_2,
+    "reminders.add": TIER_2,
+    "reminders.list": TIER_2,
+    "rtm.connect": TIER_1,
+    "search.all": TIER_2,
+    "search.files": TIER_2,
+    "search.messages": TIER_2,
+    "team.accessLogs": TIER_2,
+    "team.billableInfo": TIER_2,
+    "team.info": TIER_3,
+    "usergroups.create": TIER_2,
+    "usergroups.list": TIER_2,
+    "usergroups.update": TIER_2,
+    "usergroups.users.list": TIER_4,
+    "usergroups.users.update": TIER_2,
+    "users.conversations": TIER_3,
+    "users.getPresence": TIER_3,
+    "users.info": TIER_4,
+    "users.list": TIER_2,
+    "users.lookupByEmail": TIER_3,
+    "users.profile.get": TIER_4,
+    "users.profile.set": TIER_3,
+    "users.setPresence": TIER_2,
+    "views.open": TIER_4,
+    "views.publish": TIER_4,
+    "views.push": TIER_4,
+    "views.update": TIER_4,
+}
+
+# The methods that the client-side rate limiter never delays.
+# Socket Mode clients call apps.connections.open to establish and refresh their WebSocket connections.
+# Delaying the calls keeps the app disconnected (e.g., a client with num_connections=10 would need
+# about 10 minutes to come up under a Tier 1 limit). Slack still responds with 429 to excessive calls,
+# and the Socket Mode clients wait for Retry-After in the case.
+UNTHROTTLED_METHODS: FrozenSet[str] = frozenset({"apps.connections.open"})
+
+# The rate limits applied to each pair of a workspace, an API method, and a channel
+PER_CHANNEL_METHOD_TIERS: Dict[str, RateLimitTier] = {
+    "chat.postMessage": PER_CHANNEL_POST_MESSAGE,
+}
@@ -0,0 +1,42 @@
+class TokenBucket:
+    """A token bucket that hands out reservations.
+
+    A reservation always consumes a token, even when the bucket is empty. In that case, the token count
+    goes negative and the caller has to wait until the reserved token is refilled. This way, concurrent
+    callers are served in the order they made reservations. This class is not thread-safe by itself.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float
+
+    def __init__(self, *, rate: float, capacity: float, now: float):
+        """A token bucket, which is full when it's created.
+
+        Args:
+            rate: The number of tokens to refill per second
+            capacity: The maximum number of tokens in this bucket
+            now: The current time in seconds (monotonic)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Consumes a token and returns the number of seconds to wait before using it."""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
@@ -1,5 +1,5 @@
-import json
 import logging
+import time
 from ssl import SSLContext
 from typing import Any, Union, List
 from typing import Dict, Optional
@@ -8,6 +8,7 @@ from urllib.parse import quote
 import aiohttp
 from aiohttp import BasicAuth, ClientSession
 
+from slack_sdk.json_codec import get_json_codec
 from .internal_utils import (
     _build_request_headers,
     _debug_log_response,
@@ -34,6 +35,8 @@ from .user import User
 from .group import Group
 from ...proxy_env_variable_loader import load_http_proxy_from_env
 
+from slack_sdk.http_metrics import HttpRequestObserver
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder, _record_aiohttp_attempt
 from slack_sdk.http_retry.async_handler import AsyncRetryHandler
 from slack_sdk.http_retry.builtin_async_handlers import async_default_handlers
 from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
@@ -55,6 +58,7 @@ class AsyncSCIMClient:
     default_headers: Dict[str, str]
     logger: logging.Logger
     retry_handlers: List[AsyncRetryHandler]
+    request_observers: List[HttpRequestObserver]
 
     def __init__(
         self,
@@ -71,6 +75,7 @@ class AsyncSCIMClient:
         user_agent_suffix: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         retry_handlers: Optional[List[AsyncRetryHandler]] = None,
+        request_observers: Optional[List[HttpRequestObserver]] = None,
     ):
         """API client for SCIM API
         See https://docs.slack.dev/admins/scim-api/ for more details
@@ -89,6 +94,7 @@ class AsyncSCIMClient:
             user_agent_suffix: Suffix for User-Agent header value
             logger: Custom logger
             retry_handlers: Retry handlers
+            request_observers: `HttpRequestObserver`s to receive the timing and retry events of each request attempt
         """
         self.token = token
         self.timeout = timeout
@@ -102,6 +108,7 @@ class AsyncSCIMClient:
         self.default_headers["User-Agent"] = get_user_agent(user_agent_prefix, user_agent_suffix)
         self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.retry_handlers = retry_handlers if retry_handlers is not None else async_default_handlers()
+        self.request_observers = request_observers if request_observers is not None else []
 
         if self.proxy is None or len(self.proxy.strip()) == 0:
             env_variable = load_http_proxy_from_env(self.logger)
@@ -277,7 +284,7 @@ class AsyncSCIMClient:
         if body_params is not None:
             if body_params.get("schemas") is None:
                 body_params["schemas"] = ["urn:scim:schemas:core:1.0"]
-            body_params = json.dumps(body_params)
+            body_params = get_json_codec().dumps(body_params)
         headers["Content-Type"] = "application/json;charset=utf-8"
 
         session: Optional[ClientSession] = None
@@ -308,6 +315,14 @@ class AsyncSCIMClient:
             )
 
             retry_state = RetryState()
+            recorder = _RequestRecorder(
+                self.request_observers,
+                logger=self.logger,
+                client=type(self).__name__,
+                http_method=http_verb,
+                url=url,
+                retry_state=retry_state,
+            )
             counter_for_safety = 0
             while counter_for_safety < 100:
                 counter_for_safety += 1
@@ -324,8 +339,11 @@ class AsyncSCIMClient:
                         f"Sending a request - url: {url}, params: {body_params}, headers: {headers_for_logging}"
                     )
 
+                started = time.perf_counter()
+                attempt_recorded = False
                 try:
                     async with session.request(http_verb, url, **request_kwargs) as res:
+                        time_to_headers = time.perf_counter() - started
                         try:
                             response_body = await res.text()
                             retry_response = RetryHttpResponse(
@@ -340,6 +358,13 @@ class AsyncSCIMClient:
                                 headers=res.headers,
                             )
 
+                        await _record_aiohttp_attempt(
+                            recorder,
+                            started=started,
+                            time_to_headers=time_to_headers,
+                            response=res,
+                        )
+                        attempt_recorded = True
                         if res.status == 429:
                             for handler in self.retry_handlers:
                                 if await handler.can_retry_async(
@@ -352,11 +377,12 @@ class AsyncSCIMClient:
                                             f"A retry handler found: {type(handler).__name__} "
                                             f"for {http_verb} {url} - rate_limited"
                                         )
-                                    await handler.prepare_for_next_attempt_async(
-                                        state=retry_state,
-                                        request=retry_request,
-                                        response=retry_response,
-                                    )
+                                    with recorder.retry(handler):
+                                        await handler.prepare_for_next_attempt_async(
+                                            state=retry_state,
+                                            request=retry_request,
+                                            response=retry_response,
+                                        )
                                     break
 
                         if retry_state.next_attempt_requested is False:
@@ -371,6 +397,8 @@ class AsyncSCIMClient:
 
                 except Exception as e:
                     last_error = e
+                    if not attempt_recorded:
+                        recorder.attempt(started=started, error=e)
                     for handler in self.retry_handlers:
                         if await handler.can_retry_async(
                             state=retry_state,
@@ -382,12 +410,13 @@ class AsyncSCIMClient:
                                 self.logger.info(
                                     f"A retry handler found: {type(handler).__name__} " f"for {http_verb} {url} - {e}"
                                 )
-                            await handler.prepare_for_next_attempt_async(
-                                state=retry_state,
-                                request=retry_request,
-                                response=retry_response,
-                                error=e,
-                            )
+                            with recorder.retry(handler):
+                                await handler.prepare_for_next_attempt_async(
+                                    state=retry_state,
+                                    request=retry_request,
+                                    response=retry_response,
+                                    error=e,
+                                )
                             break
 
                     if retry_state.next_attempt_requested is False:
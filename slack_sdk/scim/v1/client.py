@@ -5,17 +5,15 @@ including Slack.
 Refer to https://docs.slack.dev/tools/python-slack-sdk/scim/ for details.
 """
 
-import json
 import logging
-import urllib
-from http.client import HTTPResponse
 from ssl import SSLContext
 from typing import Dict, Optional, Union, Any, List
 from urllib.error import HTTPError
 from urllib.parse import quote
-from urllib.request import Request, urlopen, OpenerDirector, ProxyHandler, HTTPSHandler
+from urllib.request import Request
 
 from slack_sdk.errors import SlackRequestError
+from slack_sdk.json_codec import get_json_codec
 from .internal_utils import (
     _build_query,
     _build_request_headers,
@@ -47,6 +45,11 @@ from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
 from slack_sdk.http_retry.response import HttpResponse as RetryHttpResponse
 from slack_sdk.http_retry.state import RetryState
 
+from ...http_connection_pool import HttpConnectionPool
+from ...http_metrics import HttpRequestObserver
+from ...http_metrics.internal_utils import _RequestRecorder
+from ...http_transport import HttpTransport, UrllibHttpTransport
+from ...http_transport.internal_utils import _send_urllib_request
 from ...proxy_env_variable_loader import load_http_proxy_from_env
 
 
@@ -61,6 +64,9 @@ class SCIMClient:
     default_headers: Dict[str, str]
     logger: logging.Logger
     retry_handlers: List[RetryHandler]
+    connection_pool: Optional[HttpConnectionPool]
+    transport: HttpTransport
+    request_observers: List[HttpRequestObserver]
 
     def __init__(
         self,
@@ -74,6 +80,9 @@ class SCIMClient:
         user_agent_suffix: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         retry_handlers: Optional[List[RetryHandler]] = None,
+        connection_pool: Optional[HttpConnectionPool] = None,
+        transport: Optional[HttpTransport] = None,
+        request_observers: Optional[List[HttpRequestObserver]] = None,
     ):
         """API client for SCIM API
         See https://docs.slack.dev/admins/scim-api/ for more details
@@ -89,6 +98,9 @@ class SCIMClient:
             user_agent_suffix: Suffix for User-Agent header value
             logger: Custom logger
             retry_handlers: Retry handlers
+            connection_pool: `HttpConnectionPool` to reuse keep-alive connections (shareable among clients)
+            transport: `HttpTransport` to send HTTP requests (default: `UrllibHttpTransport`)
+            request_observers: `HttpRequestObserver`s to receive the timing and retry events of each request attempt
         """
         self.token = token
         self.timeout = timeout
@@ -99,6 +111,9 @@ class SCIMClient:
         self.default_headers["User-Agent"] = get_user_agent(user_agent_prefix, user_agent_suffix)
         self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.retry_handlers = retry_handlers if retry_handlers is not None else default_retry_handlers()
+        self.connection_pool = connection_pool
+        self.transport = transport if transport is not None else UrllibHttpTransport(connection_pool=connection_pool)
+        self.request_observers = request_observers if request_observers is not None else []
 
         if self.proxy is None or len(self.proxy.strip()) == 0:
             env_variable = load_http_proxy_from_env(self.logger)
@@ -276,7 +291,7 @@ class SCIMClient:
         if body is not None:
             if body.get("schemas") is None:
                 body["schemas"] = ["urn:scim:schemas:core:1.0"]
-            body = json.dumps(body)
+            body = get_json_codec().dumps(body)
         headers["Content-Type"] = "application/json;charset=utf-8"
 
         if self.logger.level <= logging.DEBUG:
@@ -295,6 +310,14 @@ class SCIMClient:
         last_error = None
 
         retry_state = RetryState()
+        recorder = _RequestRecorder(
+            self.request_observers,
+            logger=self.logger,
+            client=type(self).__name__,
+            http_method=req.get_method(),
+            url=url,
+            retry_state=retry_state,
+        )
         counter_for_safety = 0
         while counter_for_safety < 100:
             counter_for_safety += 1
@@ -302,7 +325,7 @@ class SCIMClient:
             retry_state.next_attempt_requested = False
 
             try:
-                resp = self._perform_http_request_internal(url, req)
+                resp = self._perform_http_request_internal(url, req, recorder=recorder)
                 # The resp is a 200 OK response
                 return resp
 
@@ -344,12 +367,13 @@ class SCIMClient:
                             self.logger.info(
                                 f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url} - {e}"
                             )
-                        handler.prepare_for_next_attempt(
-                            state=retry_state,
-                            request=retry_request,
-                            response=retry_response,
-                            error=e,
-                        )
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state,
+                                request=retry_request,
+                                response=retry_response,
+                                error=e,
+                            )
                         break
 
                 if retry_state.next_attempt_requested is False:
@@ -372,12 +396,13 @@ class SCIMClient:
                             self.logger.info(
                                 f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url} - {err}"
                             )
-                        handler.prepare_for_next_attempt(
-                            state=retry_state,
-                            request=retry_request,
-                            response=None,
-                            error=err,
-                        )
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state,
+                                request=retry_request,
+                                response=None,
+                                error=err,
+                            )
                         self.logger.info(f"Going to retry the same request: {req.method} {req.full_url}")
                         break
 
@@ -388,32 +413,31 @@ class SCIMClient:
             return resp
         raise last_error
 
-    def _perform_http_request_internal(self, url: str, req: Request) -> SCIMResponse:
-        opener: Optional[OpenerDirector] = None
+    def _perform_http_request_internal(
+        self, url: str, req: Request, recorder: Optional[_RequestRecorder] = None
+    ) -> SCIMResponse:
         # for security (BAN-B310)
-        if url.lower().startswith("http"):
-            if self.proxy is not None:
-                if isinstance(self.proxy, str):
-                    opener = urllib.request.build_opener(
-                        ProxyHandler({"http": self.proxy, "https": self.proxy}),
-                        HTTPSHandler(context=self.ssl),
-                    )
-                else:
-                    raise SlackRequestError(f"Invalid proxy detected: {self.proxy} must be a str value")
-        else:
+        if not url.lower().startswith("http"):
             raise SlackRequestError(f"Invalid URL detected: {url}")
-
-        # NOTE: BAN-B310 is already checked above
-        http_resp: Optional[HTTPResponse] = None
-        if opener:
-            http_resp = opener.open(req, timeout=self.timeout)
-        else:
-            http_resp = urlopen(req, context=self.ssl, timeout=self.timeout)
+        if self.proxy is not None and not isinstance(self.proxy, str):
+            raise SlackRequestError(f"Invalid proxy detected: {self.proxy} must be a str value")
+
+        http_resp = _send_urllib_request(
+            self.transport,
+            req,
+            timeout=self.timeout,
+            ssl=self.ssl,
+            proxy=self.proxy,
+            recorder=recorder,
+        )
         charset: str = http_resp.headers.get_content_charset() or "utf-8"
-        response_body: str = http_resp.read().decode(charset)
+        # The response class decodes UTF-8 JSON data directly from the bytes
+        response_body: Union[str, bytes] = (
+            http_resp.body if charset.lower() in ("utf-8", "utf8") else http_resp.body.decode(charset)
+        )
         resp = SCIMResponse(
             url=url,
-            status_code=http_resp.status,
+            status_code=http_resp.status_code,
             raw_body=response_body,
             headers=http_resp.headers,
         )
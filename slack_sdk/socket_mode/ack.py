@@ -0,0 +1,70 @@
+import time
+from logging import Logger
+from typing import Callable, List, Optional
+
+
+class SocketModeAckEvent:
+    """An events_api envelope that the client acknowledged before running the listeners."""
+
+    envelope_id: str
+    type: str
+    retry_attempt: Optional[int]
+    envelope_age: Optional[float]
+    send_duration: float
+
+    def __init__(
+        self,
+        *,
+        envelope_id: str,
+        type: str,
+        retry_attempt: Optional[int] = None,
+        envelope_age: Optional[float] = None,
+        send_duration: float,
+    ):
+        """An events_api envelope that the client acknowledged before running the listeners.
+
+        Args:
+            envelope_id: The envelope_id of the acknowledged envelope
+            type: The envelope type (e.g., "events_api")
+            retry_attempt: The number of times Slack has already retried delivering the envelope
+            envelope_age: Elapsed seconds from the payload's event_time to the acknowledgement.
+                As event_time is in seconds, this value can be up to one second larger than the actual age.
+                None if the payload has no event_time.
+            send_duration: Elapsed seconds to send the acknowledgement, including waiting for the connection
+        """
+        self.envelope_id = envelope_id
+        self.type = type
+        self.retry_attempt = retry_attempt
+        self.envelope_age = envelope_age
+        self.send_duration = send_duration
+
+
+def _is_ack_first_target(message: dict) -> bool:
+    return message.get("type") == "events_api" and message.get("envelope_id") is not None
+
+
+def _build_ack_event(message: dict, send_duration: float) -> SocketModeAckEvent:
+    envelope_age: Optional[float] = None
+    payload = message.get("payload")
+    event_time = payload.get("event_time") if isinstance(payload, dict) else None
+    if isinstance(event_time, (int, float)):
+        envelope_age = time.time() - event_time
+    return SocketModeAckEvent(
+        envelope_id=message["envelope_id"],
+        type=message["type"],
+        retry_attempt=message.get("retry_attempt"),
+        envelope_age=envelope_age,
+        send_duration=send_duration,
+    )
+
+
+def _notify_ack_listeners(
+    listeners: List[Callable[[SocketModeAckEvent], None]],
+    event: SocketModeAckEvent,
+    logger: Logger,
+) -> None:
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception as e:
+            logger.warning(f"Failed to run an ack listener: {e}")
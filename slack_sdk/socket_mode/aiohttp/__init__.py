@@ -19,11 +19,17 @@ import aiohttp
 from aiohttp import ClientWebSocketResponse, WSMessage, WSMsgType, ClientConnectionError
 
 from slack_sdk.proxy_env_variable_loader import load_http_proxy_from_env
+from slack_sdk.socket_mode.ack import SocketModeAckEvent
 from slack_sdk.socket_mode.async_client import AsyncBaseSocketModeClient
 from slack_sdk.socket_mode.async_listeners import (
     AsyncWebSocketMessageListener,
     AsyncSocketModeRequestListener,
 )
+from slack_sdk.socket_mode.connection_group import (
+    _connect_group_members_async,
+    _share_with_group_member,
+    _validate_num_connections,
+)
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.web.async_client import AsyncWebClient
 
@@ -51,6 +57,8 @@ class SocketModeClient(AsyncBaseSocketModeClient):
     message_receiver: Optional[Future]
     message_processor: Future
 
+    aiohttp_client_session: aiohttp.ClientSession
+
     proxy: Optional[str]
     ping_interval: float
     trace_enabled: bool
@@ -68,6 +76,12 @@ class SocketModeClient(AsyncBaseSocketModeClient):
     on_error_listeners: List[Callable[[WSMessage], Awaitable[None]]]
     on_close_listeners: List[Callable[[WSMessage], Awaitable[None]]]
 
+    ack_first_enabled: bool
+    ack_listeners: List[Callable[[SocketModeAckEvent], None]]
+
+    num_connections: int
+    group_members: List["SocketModeClient"]
+
     def __init__(
         self,
         app_token: str,
@@ -81,6 +95,10 @@ class SocketModeClient(AsyncBaseSocketModeClient):
         on_error_listeners: Optional[List[Callable[[WSMessage], Awaitable[None]]]] = None,
         on_close_listeners: Optional[List[Callable[[WSMessage], Awaitable[None]]]] = None,
         loop: Optional[AbstractEventLoop] = None,
+        ack_first_enabled: bool = False,
+        ack_listeners: Optional[List[Callable[[SocketModeAckEvent], None]]] = None,
+        num_connections: int = 1,
+        _group_owner: Optional["SocketModeClient"] = None,
     ):
         """Socket Mode client
 
@@ -96,7 +114,12 @@ class SocketModeClient(AsyncBaseSocketModeClient):
             on_error_listeners: listener functions for on_error
             on_close_listeners: listener functions for on_close
             loop: an existing asyncio event loop
+            ack_first_enabled: True if the client acknowledges events_api envelopes before running the listeners
+                (default: False)
+            ack_listeners: listener functions receiving the timing of each acknowledgement sent by ack_first_enabled
+            num_connections: the number of WebSocket connections to maintain (default: 1, max: 10)
         """
+        _validate_num_connections(num_connections)
         self.app_token = app_token
         self.logger = logger or logging.getLogger(__name__)
         self.web_client = web_client or AsyncWebClient()
@@ -127,15 +150,41 @@ class SocketModeClient(AsyncBaseSocketModeClient):
         # over the lifetime of your application,
         # it is suggested you use a single session for the lifetime of your application
         # to benefit from connection pooling.
-        self.aiohttp_client_session = aiohttp.ClientSession(loop=loop)
+        # A group member (see slack_sdk.socket_mode.connection_group) uses its owner's session.
+        self._group_owner = _group_owner
+        self.aiohttp_client_session = (
+            _group_owner.aiohttp_client_session if _group_owner is not None else aiohttp.ClientSession(loop=loop)
+        )
 
         self.on_message_listeners = on_message_listeners or []
         self.on_error_listeners = on_error_listeners or []
         self.on_close_listeners = on_close_listeners or []
+        self.ack_first_enabled = ack_first_enabled
+        self.ack_listeners = ack_listeners or []
 
         self.message_receiver = None
         self.message_processor = asyncio.ensure_future(self.process_messages())
 
+        # The other clients maintaining the additional connections, which share the listeners
+        self.num_connections = num_connections
+        self.group_members = []
+        if _group_owner is not None:
+            _share_with_group_member(_group_owner, self)
+        for _ in range(num_connections - 1):
+            member = SocketModeClient(
+                app_token=app_token,
+                logger=self.logger,
+                web_client=self.web_client,
+                proxy=self.proxy,
+                auto_reconnect_enabled=auto_reconnect_enabled,
+                ping_interval=ping_interval,
+                trace_enabled=trace_enabled,
+                loop=loop,
+                ack_first_enabled=ack_first_enabled,
+                _group_owner=self,
+            )
+            self.group_members.append(member)
+
     async def monitor_current_session(self) -> None:
         # In the asyncio runtime, accessing a shared object (self.current_session here) from
         # multiple tasks can cause race conditions and errors.
@@ -408,9 +457,14 @@ class SocketModeClient(AsyncBaseSocketModeClient):
                 self.logger.exception(f"Failed to connect (error: {e}); Retrying...")
                 await asyncio.sleep(self.ping_interval)
 
+        # Once established, each connection in the group reconnects on its own
+        await _connect_group_members_async(self)
+
     async def disconnect(self):
         if self.current_session is not None:
             await self.current_session.close()
+        for member in self.group_members:
+            await member.disconnect()
         session_id = await self.session_id()
         self.logger.info(f"The current session ({session_id}) has been abandoned by disconnect() method call")
 
@@ -444,6 +498,8 @@ class SocketModeClient(AsyncBaseSocketModeClient):
                     self.connect_operation_lock.release()
 
     async def close(self):
+        for member in self.group_members:
+            await member.close()
         self.closed = True
         self.auto_reconnect_enabled = False
         await self.disconnect()
@@ -453,7 +509,8 @@ class SocketModeClient(AsyncBaseSocketModeClient):
             self.current_session_monitor.cancel()
         if self.message_receiver is not None:
             self.message_receiver.cancel()
-        if self.aiohttp_client_session is not None:
+        if self.aiohttp_client_session is not None and self._group_owner is None:
+            # The session is shared with the group members
             await self.aiohttp_client_session.close()
 
     @classmethod
@@ -1,12 +1,19 @@
 import asyncio
-import json
 import logging
+import time
 from asyncio import Queue, Lock
 from asyncio.futures import Future
 from logging import Logger
 from typing import Dict, Union, Any, Optional, List, Callable, Awaitable
 
 from slack_sdk.errors import SlackApiError
+from slack_sdk.json_codec import get_json_codec
+from slack_sdk.socket_mode.ack import (
+    SocketModeAckEvent,
+    _build_ack_event,
+    _is_ack_first_target,
+    _notify_ack_listeners,
+)
 from slack_sdk.socket_mode.async_listeners import (
     AsyncWebSocketMessageListener,
     AsyncSocketModeRequestListener,
@@ -40,6 +47,10 @@ class AsyncBaseSocketModeClient:
         ]
     ]
 
+    # When enabled, events_api envelopes are acknowledged before the listeners are scheduled
+    ack_first_enabled: bool = False
+    ack_listeners: List[Callable[[SocketModeAckEvent], None]]
+
     async def issue_new_wss_url(self) -> str:
         try:
             response = await self.web_client.apps_connections_open(app_token=self.app_token)
@@ -93,9 +104,9 @@ class AsyncBaseSocketModeClient:
 
     async def send_socket_mode_response(self, response: Union[Dict[str, Any], SocketModeResponse]):
         if isinstance(response, SocketModeResponse):
-            await self.send_message(json.dumps(response.to_dict()))
+            await self.send_message(get_json_codec().dumps(response.to_dict()))
         else:
-            await self.send_message(json.dumps(response))
+            await self.send_message(get_json_codec().dumps(response))
 
     async def enqueue_message(self, message: str):
         await self.message_queue.put(message)
@@ -127,9 +138,25 @@ class AsyncBaseSocketModeClient:
         if raw_message is not None:
             message: dict = {}
             if raw_message.startswith("{"):
-                message = json.loads(raw_message)
+                message = get_json_codec().loads(raw_message)
+            if self.ack_first_enabled and _is_ack_first_target(message):
+                await self.send_ack_first(message)
             _: Future[None] = asyncio.ensure_future(self.run_message_listeners(message, raw_message))
 
+    async def send_ack_first(self, message: dict) -> None:
+        """Acknowledges an envelope with an empty response, and then notifies ack_listeners of the timing."""
+        started = time.perf_counter()
+        try:
+            await self.send_socket_mode_response({"envelope_id": message["envelope_id"]})
+        except Exception as e:
+            self.logger.warning(f"Failed to acknowledge an envelope (envelope_id: {message['envelope_id']}, error: {e})")
+            return
+        if self.logger.level <= logging.DEBUG:
+            self.logger.debug(f"Acknowledged an envelope before running listeners (envelope_id: {message['envelope_id']})")
+        if len(self.ack_listeners) > 0:
+            event = _build_ack_event(message, send_duration=time.perf_counter() - started)
+            _notify_ack_listeners(self.ack_listeners, event, self.logger)
+
     async def run_message_listeners(self, message: dict, raw_message: str) -> None:
         session_id = await self.session_id()
         type, envelope_id = message.get("type"), message.get("envelope_id")
@@ -9,10 +9,16 @@ import logging
 from concurrent.futures.thread import ThreadPoolExecutor
 from logging import Logger
 from queue import Queue
-from threading import Lock
+from threading import Event, Lock
 from typing import Union, Optional, List, Callable, Dict
 
+from slack_sdk.socket_mode.ack import SocketModeAckEvent
 from slack_sdk.socket_mode.client import BaseSocketModeClient
+from slack_sdk.socket_mode.connection_group import (
+    _connect_group_members,
+    _share_with_group_member,
+    _validate_num_connections,
+)
 from slack_sdk.socket_mode.listeners import (
     WebSocketMessageListener,
     SocketModeRequestListener,
@@ -48,11 +54,11 @@ class SocketModeClient(BaseSocketModeClient):
     current_session: Optional[Connection]
     current_session_state: ConnectionState
     current_session_runner: IntervalRunner
+    current_session_changed: Event
 
     current_app_monitor: IntervalRunner
     current_app_monitor_started: bool
 
-    message_processor: IntervalRunner
     message_workers: ThreadPoolExecutor
 
     auto_reconnect_enabled: bool
@@ -66,6 +72,12 @@ class SocketModeClient(BaseSocketModeClient):
     on_error_listeners: List[Callable[[Exception], None]]
     on_close_listeners: List[Callable[[int, Optional[str]], None]]
 
+    ack_first_enabled: bool
+    ack_listeners: List[Callable[[SocketModeAckEvent], None]]
+
+    num_connections: int
+    group_members: List["SocketModeClient"]
+
     def __init__(
         self,
         app_token: str,
@@ -83,6 +95,10 @@ class SocketModeClient(BaseSocketModeClient):
         on_message_listeners: Optional[List[Callable[[str], None]]] = None,
         on_error_listeners: Optional[List[Callable[[Exception], None]]] = None,
         on_close_listeners: Optional[List[Callable[[int, Optional[str]], None]]] = None,
+        ack_first_enabled: bool = False,
+        ack_listeners: Optional[List[Callable[[SocketModeAckEvent], None]]] = None,
+        num_connections: int = 1,
+        _group_owner: Optional["SocketModeClient"] = None,
     ):
         """Socket Mode client
 
@@ -102,7 +118,12 @@ class SocketModeClient(BaseSocketModeClient):
             on_message_listeners: listener functions for on_message
             on_error_listeners: listener functions for on_error
             on_close_listeners: listener functions for on_close
+            ack_first_enabled: True if the client acknowledges events_api envelopes before running the listeners
+                (default: False)
+            ack_listeners: listener functions receiving the timing of each acknowledgement sent by ack_first_enabled
+            num_connections: the number of WebSocket connections to maintain (default: 1, max: 10)
         """
+        _validate_num_connections(num_connections)
         self.app_token = app_token
         self.logger = logger or logging.getLogger(__name__)
         self.web_client = web_client or WebClient()
@@ -123,7 +144,9 @@ class SocketModeClient(BaseSocketModeClient):
 
         self.current_session = None
         self.current_session_state = ConnectionState()
-        self.current_session_runner = IntervalRunner(self._run_current_session, 0.1).start()
+        # Set when connect() replaces the current session; the runner waits for it instead of polling
+        self.current_session_changed = Event()
+        self.current_session_runner = IntervalRunner(self._run_current_session, 0).start()
 
         self.current_app_monitor_started = False
         self.current_app_monitor = IntervalRunner(self._monitor_current_session, self.ping_interval)
@@ -131,8 +154,13 @@ class SocketModeClient(BaseSocketModeClient):
         self.closed = False
         self.connect_operation_lock = Lock()
 
-        self.message_processor = IntervalRunner(self.process_messages, 0.001).start()
-        self.message_workers = ThreadPoolExecutor(max_workers=concurrency)
+        # The received messages are handed over to the workers directly on the thread receiving them.
+        # A group member (see slack_sdk.socket_mode.connection_group) uses its owner's workers.
+        self._group_owner = _group_owner
+        self.message_processor = None
+        self.message_workers = (
+            _group_owner.message_workers if _group_owner is not None else ThreadPoolExecutor(max_workers=concurrency)
+        )
 
         self.proxy = proxy
         if self.proxy is None or len(self.proxy.strip()) == 0:
@@ -144,6 +172,31 @@ class SocketModeClient(BaseSocketModeClient):
         self.on_message_listeners = on_message_listeners or []
         self.on_error_listeners = on_error_listeners or []
         self.on_close_listeners = on_close_listeners or []
+        self.ack_first_enabled = ack_first_enabled
+        self.ack_listeners = ack_listeners or []
+
+        # The other clients maintaining the additional connections, which share the listeners and the workers
+        self.num_connections = num_connections
+        self.group_members = []
+        if _group_owner is not None:
+            _share_with_group_member(_group_owner, self)
+        for _ in range(num_connections - 1):
+            member = SocketModeClient(
+                app_token=app_token,
+                logger=self.logger,
+                web_client=self.web_client,
+                auto_reconnect_enabled=auto_reconnect_enabled,
+                trace_enabled=trace_enabled,
+                all_message_trace_enabled=all_message_trace_enabled,
+                ping_pong_trace_enabled=ping_pong_trace_enabled,
+                ping_interval=ping_interval,
+                receive_buffer_size=receive_buffer_size,
+                proxy=self.proxy,
+                proxy_headers=proxy_headers,
+                ack_first_enabled=ack_first_enabled,
+                _group_owner=self,
+            )
+            self.group_members.append(member)
 
     def session_id(self) -> Optional[str]:
         if self.current_session is not None:
@@ -177,13 +230,15 @@ class SocketModeClient(BaseSocketModeClient):
         )
         current_session.connect()
 
-        if old_current_session_state is not None:
-            old_current_session_state.terminated = True
+        # Close the old session first so that the runner never resumes it after its state is terminated
         if old_session is not None:
             old_session.close()
+        if old_current_session_state is not None:
+            old_current_session_state.terminated = True
 
-        self.current_session = current_session
         self.current_session_state = ConnectionState()
+        self.current_session = current_session
+        self.current_session_changed.set()
         self.auto_reconnect_enabled = self.default_auto_reconnect_enabled
 
         if not self.current_app_monitor_started:
@@ -192,9 +247,14 @@ class SocketModeClient(BaseSocketModeClient):
 
         self.logger.info(f"A new session has been established (session id: {self.session_id()})")
 
+        # Once established, each connection in the group reconnects on its own
+        _connect_group_members(self)
+
     def disconnect(self) -> None:
         if self.current_session is not None:
             self.current_session.close()
+        for member in self.group_members:
+            member.disconnect()
 
     def send_message(self, message: str) -> None:
         if self.logger.level <= logging.DEBUG:
@@ -222,19 +282,27 @@ class SocketModeClient(BaseSocketModeClient):
                     raise e
 
     def close(self):
+        for member in self.group_members:
+            member.close()
         self.closed = True
         self.auto_reconnect_enabled = False
         self.disconnect()
+        self.current_session_state.terminated = True
         if self.current_app_monitor.is_alive():
             self.current_app_monitor.shutdown()
-        if self.message_processor.is_alive():
-            self.message_processor.shutdown()
-        self.message_workers.shutdown()
+        if self._group_owner is None:
+            # The workers are shared with the group members
+            self.message_workers.shutdown()
+
+    def enqueue_message(self, message: str):
+        # This client has no message processor draining message_queue,
+        # so the message is handed over to the workers right away
+        self.dispatch_message(message)
 
     def _on_message(self, message: str):
         if self.logger.level <= logging.DEBUG:
             self.logger.debug(f"on_message invoked: (message: {debug_redacted_message_string(message)})")
-        self.enqueue_message(message)
+        self.dispatch_message(message)
         for listener in self.on_message_listeners:
             listener(message)
 
@@ -260,6 +328,8 @@ class SocketModeClient(BaseSocketModeClient):
             listener(code, reason)
 
     def _run_current_session(self):
+        # Clearing the flag before checking the session never misses a session established in between
+        self.current_session_changed.clear()
         if self.current_session is not None and self.current_session.is_active():
             session_id = self.session_id()
             try:
@@ -273,11 +343,14 @@ class SocketModeClient(BaseSocketModeClient):
                     self.logger.exception(error_message)
                 else:
                     self.logger.error(error_message)
+        else:
+            self.current_session_changed.wait()
 
     def _monitor_current_session(self):
         if self.current_app_monitor_started:
             try:
-                self.current_session.check_state()
+                if self.current_session is not None:
+                    self.current_session.check_state()
 
                 if self.auto_reconnect_enabled and (self.current_session is None or not self.current_session.is_active()):
                     self.logger.info(
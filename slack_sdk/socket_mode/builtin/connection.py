@@ -1,3 +1,4 @@
+import selectors
 import socket
 import ssl
 import struct
@@ -9,6 +10,7 @@ from urllib.parse import urlparse
 from uuid import uuid4
 
 from slack_sdk.errors import SlackClientNotConnectedError, SlackClientConfigurationError
+from .frame_decoder import FrameDecoder
 from .frame_header import FrameHeader
 from .internals import (
     _parse_handshake_response,
@@ -19,6 +21,7 @@ from .internals import (
     _build_data_frame_for_sending,
     _parse_text_payload,
     _establish_new_socket_connection,
+    _wait_until_readable,
 )
 
 
@@ -43,6 +46,8 @@ class Connection:
 
     session_id: str
     sock: Optional[ssl.SSLSocket]
+    frame_decoder: FrameDecoder
+    wakeup_sender: Optional[socket.socket]
 
     on_message_listener: Optional[Callable[[str], None]]
     on_error_listener: Optional[Callable[[Exception], None]]
@@ -87,6 +92,10 @@ class Connection:
         # To avoid ssl.SSLError: [SSL: BAD_LENGTH] bad length
         self.sock_receive_lock = Lock()
         self.sock_send_lock = Lock()
+        # Keeps the partially received frames across recv() calls
+        self.frame_decoder = FrameDecoder()
+        # Set while run_until_completion() is waiting for the socket to be readable
+        self.wakeup_sender = None
 
         self.on_message_listener = on_message_listener
         self.on_error_listener = on_error_listener
@@ -150,6 +159,7 @@ class Connection:
                             f" (session id: {self.session_id})"
                         )
                     # set this successfully connected socket
+                    self.frame_decoder = FrameDecoder()
                     self.sock = sock
                     self.ping(f"{self.session_id}:{time.time()}")
                 else:
@@ -192,6 +202,13 @@ class Connection:
                     self.sock = None
                     # After this, all operations using self.sock will be skipped
 
+        wakeup_sender = self.wakeup_sender
+        if wakeup_sender is not None:
+            try:
+                # Wakes up the thread waiting in run_until_completion() for the closed socket to be readable
+                wakeup_sender.send(b"\x00")
+            except OSError:
+                pass
         self.logger.info(f"The connection has been closed (session id: {self.session_id})")
 
     def is_active(self) -> bool:
@@ -299,15 +316,31 @@ class Connection:
         ping_count = 0
         pong_count = 0
         ping_pong_log_summary_size = 1000
+        # Instead of blocking in recv() with the lock held, wait for the socket to be readable.
+        # As a selector does not notice the socket closed by another thread, disconnect() wakes it up.
+        selector = selectors.DefaultSelector()
+        wakeup_receiver, self.wakeup_sender = socket.socketpair()
+        wakeup_receiver.setblocking(False)
+        selector.register(wakeup_receiver, selectors.EVENT_READ)
+        registered_sock: Optional[ssl.SSLSocket] = None
         while not state.terminated:
             try:
-                if self.is_active():
+                sock = self.sock
+                if sock is not None:
+                    if sock is not registered_sock:
+                        if registered_sock is not None:
+                            selector.unregister(registered_sock)
+                        selector.register(sock, selectors.EVENT_READ)
+                        registered_sock = sock
+                    if not _wait_until_readable(selector, sock, wakeup_receiver, self.receive_timeout):
+                        continue
                     received_messages: List[Tuple[Optional[FrameHeader], bytes]] = _receive_messages(
-                        sock=self.sock,  # type: ignore[arg-type]
+                        sock=sock,
                         sock_receive_lock=self.sock_receive_lock,
                         logger=self.logger,
                         receive_buffer_size=self.receive_buffer_size,
                         all_message_trace_enabled=self.all_message_trace_enabled,
+                        frame_decoder=self.frame_decoder,
                     )
                     for message in received_messages:
                         header, data = message
@@ -406,7 +439,8 @@ class Connection:
                             )
                             self.logger.warning(message)
                 else:
-                    time.sleep(0.2)
+                    # disconnect() has closed this connection, which never becomes active again
+                    break
             except socket.timeout:
                 time.sleep(0.01)
             except OSError as e:
@@ -449,4 +483,8 @@ class Connection:
                     else:
                         self.logger.error(error_message)
 
+        selector.close()
+        wakeup_receiver.close()
+        self.wakeup_sender.close()
+        self.wakeup_sender = None
         state.terminated = True
@@ -0,0 +1,147 @@
+import struct
+from typing import List, Optional, Tuple
+
+from .frame_header import FrameHeader
+from .masking import _apply_mask
+
+# 2 bytes + 8 bytes (64-bit payload length) + 4 bytes (mask key)
+_MAX_HEADER_LENGTH = 14
+
+
+class FrameDecoder:
+    """Decodes WebSocket data frames (https://tools.ietf.org/html/rfc6455#section-5.2)
+    from the bytes received from a socket, however the bytes are split into chunks.
+
+    The state of a partially received frame is kept across feed() calls. Each received chunk is copied
+    only once into the payload of the frame it belongs to, so the cost of decoding a large message
+    does not depend on the receive buffer size. Fragmented messages (a text/binary frame followed by
+    continuation frames) are joined into a single message. Control frames (e.g., ping) interleaved
+    in a fragmented message are returned as they arrive.
+    """
+
+    def __init__(self):
+        # the first bytes of a frame whose header is not complete yet
+        self._header_bytes = bytearray()
+        # the frame whose payload is being received
+        self._header: Optional[FrameHeader] = None
+        self._mask_key: Optional[bytes] = None
+        self._payload = bytearray()
+        # the fragmented message that is waiting for its continuation frames
+        self._message_header: Optional[FrameHeader] = None
+        self._message_payload = bytearray()
+
+    @property
+    def has_partial_message(self) -> bool:
+        """True if this decoder holds the bytes of a message that is not complete yet."""
+        return len(self._header_bytes) > 0 or self._header is not None or self._message_header is not None
+
+    def feed(self, data: bytes) -> List[Tuple[Optional[FrameHeader], bytes]]:
+        """Decodes the received bytes and returns the messages completed by them.
+
+        Args:
+            data: The bytes received from the socket
+
+        Returns:
+            A list of (header, payload) tuples. For the line feed that the server sends right after
+            the handshake response, (None, b"\\n") is returned.
+        """
+        messages: List[Tuple[Optional[FrameHeader], bytes]] = []
+        view = memoryview(data)
+        position, end = 0, len(view)
+        while position < end:
+            if self._header is None:
+                if len(self._header_bytes) == 0 and view[position] == 0x0A:
+                    # The "\n" of the last "\r\n" in the handshake response
+                    messages.append((None, b"\n"))
+                    position += 1
+                    continue
+
+                header_end = position + _MAX_HEADER_LENGTH
+                header_bytes = self._header_bytes + view[position:header_end]
+                parsed = _parse_frame_header(header_bytes)
+                if parsed is None:
+                    # As a header is 14 bytes at most, all the given bytes are a part of the header
+                    self._header_bytes = header_bytes
+                    return messages
+                header, mask_key, header_length = parsed
+                position += header_length - len(self._header_bytes)
+                self._header_bytes = bytearray()
+                self._header, self._mask_key = header, mask_key
+                if header.length > 0:
+                    continue
+            else:
+                size = min(self._header.length - len(self._payload), end - position)
+                payload_end = position + size
+                self._payload += view[position:payload_end]
+                position = payload_end
+                if len(self._payload) < self._header.length:
+                    return messages
+
+            self._complete_frame(messages)
+        return messages
+
+    def _complete_frame(self, messages: List[Tuple[Optional[FrameHeader], bytes]]) -> None:
+        header, payload = self._header, self._payload
+        if self._mask_key is not None:
+            payload = bytearray(_apply_mask(payload, self._mask_key))
+        self._header, self._mask_key, self._payload = None, None, bytearray()
+
+        if header.opcode >= FrameHeader.OPCODE_CLOSE:  # type: ignore[union-attr]
+            # Control frames are never fragmented
+            messages.append((header, bytes(payload)))
+        elif header.opcode == FrameHeader.OPCODE_CONTINUATION:  # type: ignore[union-attr]
+            if self._message_header is None:
+                # Unexpected continuation frame; pass it through as it is
+                messages.append((header, bytes(payload)))
+                return
+            self._message_payload += payload
+            if header.fin:  # type: ignore[union-attr]
+                message_header = self._message_header
+                message_header.fin = 0b10000000
+                message_header.length = len(self._message_payload)
+                messages.append((message_header, bytes(self._message_payload)))
+                self._message_header, self._message_payload = None, bytearray()
+        elif header.fin:  # type: ignore[union-attr]
+            messages.append((header, bytes(payload)))
+        else:
+            # The first frame of a fragmented message
+            self._message_header, self._message_payload = header, payload
+
+
+def _parse_frame_header(data: bytearray) -> Optional[Tuple[FrameHeader, Optional[bytes], int]]:
+    """Parses a frame header, and returns (header, mask key, header length) or None if the data is not enough."""
+    if len(data) < 2:
+        return None
+    b1, b2 = data[0], data[1]
+    length: int = b2 & 0b01111111
+    header_length = 2
+    if length == 126:
+        if len(data) < 4:
+            return None
+        length = struct.unpack_from("!H", data, 2)[0]
+        header_length = 4
+    elif length == 127:
+        if len(data) < 10:
+            return None
+        length = struct.unpack_from("!Q", data, 2)[0]
+        header_length = 10
+
+    masked = b2 & 0b10000000
+    mask_key: Optional[bytes] = None
+    if masked:
+        if len(data) < header_length + 4:
+            return None
+        mask_key_end = header_length + 4
+        mask_key = bytes(data[header_length:mask_key_end])
+        header_length = mask_key_end
+
+    header = FrameHeader(
+        fin=b1 & 0b10000000,
+        rsv1=b1 & 0b01000000,
+        rsv2=b1 & 0b00100000,
+        rsv3=b1 & 0b00010000,
+        opcode=b1 & 0b00001111,
+        masked=masked,
+        length=length,
+    )
+    return header, mask_key, header_length
@@ -1,8 +1,7 @@
 import errno
 import hashlib
-import itertools
 import os
-import random
+import selectors
 import socket
 from socket import socket as Socket
 import ssl
@@ -14,7 +13,9 @@ from threading import Lock
 from typing import Tuple, Optional, Union, List, Callable, Dict
 from urllib.parse import urlparse, unquote
 
+from .frame_decoder import FrameDecoder
 from .frame_header import FrameHeader
+from .masking import _apply_mask, _generate_mask_key
 
 
 def _parse_connect_response(sock: Socket) -> Tuple[Optional[int], str]:
@@ -199,6 +200,7 @@ def _receive_messages(
     logger: Logger,
     receive_buffer_size: int = 1024,
     all_message_trace_enabled: bool = False,
+    frame_decoder: Optional[FrameDecoder] = None,
 ) -> List[Tuple[Optional[FrameHeader], bytes]]:
     def receive(specific_buffer_size: Optional[int] = None):
         size = specific_buffer_size if specific_buffer_size is not None else receive_buffer_size
@@ -219,167 +221,63 @@ def _receive_messages(
                     return bytes()
                 raise e
 
-    return _fetch_messages(
-        messages=[],
-        receive=receive,
-        remaining_bytes=None,
-        current_mask_key=None,
-        current_header=None,
-        current_data=bytes(),
-        logger=logger,
-    )
+    if frame_decoder is None:
+        return _fetch_messages(messages=[], receive=receive, logger=logger)
+
+    # As the decoder keeps partially received frames, this returns the messages as soon as some are complete.
+    # Even if the next receive() call times out, the bytes received so far are not lost.
+    while True:
+        received_bytes = receive()
+        if len(received_bytes) == 0:
+            return []
+        messages = frame_decoder.feed(received_bytes)
+        if len(messages) > 0:
+            return messages
+
+
+def _wait_until_readable(
+    selector: selectors.BaseSelector,
+    sock: Union[ssl.SSLSocket, Socket],
+    wakeup_receiver: Socket,
+    timeout: float,
+) -> bool:
+    """Blocks until the socket has bytes to receive, the wakeup receiver gets woken up, or the timeout elapses.
+    Returns True if the socket is readable. The wakeup receiver must be a non-blocking socket.
+    """
+    if isinstance(sock, ssl.SSLSocket) and sock.pending() > 0:
+        # The SSL layer already holds decrypted bytes, which the selector cannot see
+        return True
+    readable = False
+    for key, _ in selector.select(timeout):
+        if key.fileobj is wakeup_receiver:
+            # Consume the wakeup bytes; otherwise, the selector keeps returning immediately
+            try:
+                while wakeup_receiver.recv(1024):
+                    pass
+            except (BlockingIOError, InterruptedError):
+                pass
+        else:
+            readable = True
+    return readable
 
 
 def _fetch_messages(
     messages: List[Tuple[Optional[FrameHeader], bytes]],
-    receive: Callable[[Optional[int]], bytes],  # buffer size
+    receive: Callable[[], bytes],
     logger: Logger,
     remaining_bytes: Optional[bytes] = None,
-    current_mask_key: Optional[str] = None,
-    current_header: Optional[FrameHeader] = None,
-    current_data: Optional[bytes] = None,
 ) -> List[Tuple[Optional[FrameHeader], bytes]]:
-    if remaining_bytes is None:
-        # Fetch more to complete the current message
-        remaining_bytes = receive()  # type: ignore[call-arg]
-
-    if remaining_bytes is None or len(remaining_bytes) == 0:
-        # no more bytes
-        if current_header is not None:
-            _append_message(messages, current_header, current_data)  # type: ignore[arg-type]
-        return messages
-
-    if current_header is None:
-        # new message
-        if len(remaining_bytes) <= 2:
-            remaining_bytes += receive()  # type: ignore[call-arg]
-
-        if remaining_bytes[0] == 10:  # \n
-            if current_data is not None and len(current_data) >= 0:
-                _append_message(messages, current_header, current_data)
-            _append_message(messages, None, remaining_bytes[:1])
-            remaining_bytes = remaining_bytes[1:]
-            if len(remaining_bytes) == 0:
-                return messages
-            else:
-                return _fetch_messages(
-                    messages=messages,
-                    receive=receive,
-                    remaining_bytes=remaining_bytes,
-                    logger=logger,
-                )
-
-        # https://tools.ietf.org/html/rfc6455#section-5.2
-        b1, b2 = remaining_bytes[0], remaining_bytes[1]
-
-        # determine data length and the first index of the data part
-        current_data_length: int = b2 & 0b01111111
-        idx_after_length_part: int = 2
-        if current_data_length == 126:
-            if len(remaining_bytes) < 4:
-                remaining_bytes += receive(1024)
-            current_data_length = struct.unpack("!H", bytes(remaining_bytes[2:4]))[0]
-            idx_after_length_part = 4
-        elif current_data_length == 127:
-            if len(remaining_bytes) < 10:
-                remaining_bytes += receive(1024)
-            current_data_length = struct.unpack("!Q", bytes(remaining_bytes[2:10]))[0]
-            idx_after_length_part = 10
-
-        current_header = FrameHeader(
-            fin=b1 & 0b10000000,
-            rsv1=b1 & 0b01000000,
-            rsv2=b1 & 0b00100000,
-            rsv3=b1 & 0b00010000,
-            opcode=b1 & 0b00001111,
-            masked=b2 & 0b10000000,
-            length=current_data_length,
-        )
-        if current_header.masked > 0:
-            if current_mask_key is None:
-                idx1, idx2 = idx_after_length_part, idx_after_length_part + 4
-                current_mask_key = remaining_bytes[idx1:idx2]  # type: ignore[assignment]
-                idx_after_length_part += 4
-
-        start, end = idx_after_length_part, idx_after_length_part + current_data_length
-        data_to_append = remaining_bytes[start:end]
-
-        current_data = bytes()
-        if current_header.masked > 0:
-            for i in range(data_to_append):  # type: ignore[call-overload]
-                mask = current_mask_key[i % 4]  # type: ignore[index]
-                data_to_append[i] ^= mask  # type: ignore[index]
-            current_data += data_to_append
-        else:
-            current_data += data_to_append
-        if len(current_data) == current_data_length:
-            _append_message(messages, current_header, current_data)
-            remaining_bytes = remaining_bytes[end:]
-            if len(remaining_bytes) > 0:
-                # continue with the remaining data
-                return _fetch_messages(
-                    messages=messages,
-                    receive=receive,
-                    remaining_bytes=remaining_bytes,
-                    logger=logger,
-                )
-            else:
-                return messages
-        elif len(current_data) < current_data_length:
-            # need more bytes to complete this message
-            return _fetch_messages(
-                messages=messages,
-                receive=receive,
-                current_mask_key=current_mask_key,
-                current_header=current_header,
-                current_data=current_data,
-                logger=logger,
-            )
-        else:
-            # This pattern is unexpected but set data with the expected length anyway
-            _append_message(messages, current_header, current_data[:current_data_length])
-            return messages
-
-    # work in progress with the current_header/current_data
-    if current_header is not None:
-        length_needed = current_header.length - len(current_data)  # type: ignore[arg-type]
-        if length_needed > len(remaining_bytes):
-            current_data += remaining_bytes  # type: ignore[operator]
-            # need more bytes to complete this message
-            return _fetch_messages(
-                messages=messages,
-                receive=receive,
-                current_mask_key=current_mask_key,
-                current_header=current_header,
-                current_data=current_data,
-                logger=logger,
-            )
-        else:
-            current_data += remaining_bytes[:length_needed]  # type: ignore[operator]
-            _append_message(messages, current_header, current_data)
-            remaining_bytes = remaining_bytes[length_needed:]
-            if len(remaining_bytes) == 0:
-                return messages
-            else:
-                # continue with the remaining data
-                return _fetch_messages(
-                    messages=messages,
-                    receive=receive,
-                    remaining_bytes=remaining_bytes,
-                    logger=logger,
-                )
-
+    """Receives bytes until the received data ends at the end of a message, and returns the messages in it."""
+    frame_decoder = FrameDecoder()
+    received_bytes = remaining_bytes if remaining_bytes is not None else receive()
+    while received_bytes is not None and len(received_bytes) > 0:
+        messages.extend(frame_decoder.feed(received_bytes))
+        if len(messages) > 0 and not frame_decoder.has_partial_message:
+            break
+        received_bytes = receive()
     return messages
 
 
-def _append_message(
-    messages: List[Tuple[Optional[FrameHeader], bytes]],
-    header: Optional[FrameHeader],
-    data: bytes,
-) -> None:
-    messages.append((header, data))
-
-
 def _build_data_frame_for_sending(
     payload: Union[str, bytes],
     opcode: int,
@@ -388,21 +286,20 @@ def _build_data_frame_for_sending(
     rsv2: int = 0,
     rsv3: int = 0,
     masked: int = 1,
-):
+) -> bytes:
     b1 = fin << 7 | rsv1 << 6 | rsv2 << 5 | rsv3 << 4 | opcode
-    header: bytes = bytes([b1])
 
     original_payload_data: bytes = payload.encode("utf-8") if isinstance(payload, str) else payload
     payload_length = len(original_payload_data)
+    header: bytes
     if payload_length <= 125:
-        b2 = masked << 7 | payload_length
-        header += bytes([b2])
+        header = struct.pack("!BB", b1, masked << 7 | payload_length)
+    elif payload_length <= 0xFFFF:
+        header = struct.pack("!BBH", b1, masked << 7 | 126, payload_length)
     else:
-        b2 = masked << 7 | 126
-        header += struct.pack("!BH", b2, payload_length)
-
-    mask_key: List[int] = random.choices(range(256), k=4)
-    header += bytes(mask_key)
+        header = struct.pack("!BBQ", b1, masked << 7 | 127, payload_length)
 
-    payload_data: bytes = bytes(byte ^ mask for byte, mask in zip(original_payload_data, itertools.cycle(mask_key)))
-    return header + payload_data
+    if not masked:
+        return header + original_payload_data
+    mask_key = _generate_mask_key()
+    return header + mask_key + _apply_mask(original_payload_data, mask_key)
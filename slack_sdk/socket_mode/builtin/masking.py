@@ -0,0 +1,21 @@
+import secrets
+
+
+def _generate_mask_key() -> bytes:
+    # https://tools.ietf.org/html/rfc6455#section-5.3
+    # The masking key needs to be unpredictable; thus, it must be derived from a strong source of entropy
+    return secrets.token_bytes(4)
+
+
+def _apply_mask(data: bytes, mask_key: bytes) -> bytes:
+    """XORs the data with the 4-byte mask key (https://tools.ietf.org/html/rfc6455#section-5.3).
+    As masking and unmasking are the same operation, this function works for both.
+
+    Rather than XORing byte by byte in Python code, this function converts both the data
+    and the repeated mask key into ints, so that the XOR runs over machine words in C.
+    """
+    length = len(data)
+    if length == 0:
+        return b""
+    repeated_key = mask_key * (length // 4) + mask_key[: length % 4]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(repeated_key, "big")).to_bytes(length, "big")
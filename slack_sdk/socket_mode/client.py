@@ -1,13 +1,19 @@
-import json
 import logging
 import time
 from queue import Queue, Empty
 from concurrent.futures.thread import ThreadPoolExecutor
 from logging import Logger
-from threading import Lock
+from threading import Lock, Thread
 from typing import Dict, Union, Any, Optional, List, Callable
 
 from slack_sdk.errors import SlackApiError
+from slack_sdk.json_codec import get_json_codec
+from slack_sdk.socket_mode.ack import (
+    SocketModeAckEvent,
+    _build_ack_event,
+    _is_ack_first_target,
+    _notify_ack_listeners,
+)
 from slack_sdk.socket_mode.interval_runner import IntervalRunner
 from slack_sdk.socket_mode.listeners import (
     WebSocketMessageListener,
@@ -37,9 +43,14 @@ class BaseSocketModeClient:
         ]
     ]
 
-    message_processor: IntervalRunner
+    # None if the client hands the received messages over to message_workers directly
+    message_processor: Optional[IntervalRunner]
     message_workers: ThreadPoolExecutor
 
+    # When enabled, events_api envelopes are acknowledged before they are handed over to message_workers
+    ack_first_enabled: bool = False
+    ack_listeners: List[Callable[[SocketModeAckEvent], None]]
+
     closed: bool
     connect_operation_lock: Lock
 
@@ -91,9 +102,9 @@ class BaseSocketModeClient:
 
     def send_socket_mode_response(self, response: Union[Dict[str, Any], SocketModeResponse]) -> None:
         if isinstance(response, SocketModeResponse):
-            self.send_message(json.dumps(response.to_dict()))
+            self.send_message(get_json_codec().dumps(response.to_dict()))
         else:
-            self.send_message(json.dumps(response))
+            self.send_message(get_json_codec().dumps(response))
 
     def enqueue_message(self, message: str):
         self.message_queue.put(message)
@@ -107,20 +118,43 @@ class BaseSocketModeClient:
                 self.logger.debug(f"A message dequeued (current queue size: {self.message_queue.qsize()})")
 
             if raw_message is not None:
-                message: dict = {}
-                if raw_message.startswith("{"):
-                    message = json.loads(raw_message)
-                if message.get("type") == "disconnect":
-                    self.connect_to_new_endpoint(force=True)
-                else:
-
-                    def _run_message_listeners():
-                        self.run_message_listeners(message, raw_message)
-
-                    self.message_workers.submit(_run_message_listeners)
+                self.dispatch_message(raw_message)
         except Empty:
             pass
 
+    def dispatch_message(self, raw_message: str) -> None:
+        """Hands a received message over to message_workers, or reconnects if it is a disconnect message."""
+        message: dict = {}
+        if raw_message.startswith("{"):
+            message = get_json_codec().loads(raw_message)
+        if message.get("type") == "disconnect":
+            # Reconnecting takes a while, so the thread receiving messages (and the others arriving
+            # on the current connection until the new one is ready) must not be blocked by it.
+            # It does not go through message_workers either, which can be busy running listeners.
+            Thread(target=self.connect_to_new_endpoint, args=(True,), daemon=True).start()
+        else:
+            if self.ack_first_enabled and _is_ack_first_target(message):
+                self.send_ack_first(message)
+
+            def _run_message_listeners():
+                self.run_message_listeners(message, raw_message)
+
+            self.message_workers.submit(_run_message_listeners)
+
+    def send_ack_first(self, message: dict) -> None:
+        """Acknowledges an envelope with an empty response, and then notifies ack_listeners of the timing."""
+        started = time.perf_counter()
+        try:
+            self.send_socket_mode_response({"envelope_id": message["envelope_id"]})
+        except Exception as e:
+            self.logger.warning(f"Failed to acknowledge an envelope (envelope_id: {message['envelope_id']}, error: {e})")
+            return
+        if self.logger.level <= logging.DEBUG:
+            self.logger.debug(f"Acknowledged an envelope before running listeners (envelope_id: {message['envelope_id']})")
+        if len(self.ack_listeners) > 0:
+            event = _build_ack_event(message, send_duration=time.perf_counter() - started)
+            _notify_ack_listeners(self.ack_listeners, event, self.logger)
+
     def run_message_listeners(self, message: dict, raw_message: str) -> None:
         type, envelope_id = message.get("type"), message.get("envelope_id")
         if self.logger.level <= logging.DEBUG:
@@ -0,0 +1,97 @@
+"""A Socket Mode client can maintain multiple WebSocket connections at a time (num_connections).
+The client establishes the additional connections through the other clients of the same class (group members).
+The client creates the members with its own listeners and workers, so all the connections feed the same dispatch pipeline.
+They also share the client's connect_operation_lock, which lets only one connection in the group reconnect
+at a time. While one connection is refreshed, the others keep receiving envelopes.
+
+https://docs.slack.dev/apis/events-api/using-socket-mode/
+"""
+
+import asyncio
+from threading import Thread
+from typing import Any, List, Tuple
+
+from slack_sdk.errors import SlackClientConfigurationError
+
+# Slack allows up to 10 simultaneous Socket Mode connections per app
+MAX_NUM_CONNECTIONS = 10
+
+_SHARED_ATTRIBUTES = (
+    "message_listeners",
+    "socket_mode_request_listeners",
+    "on_open_listeners",
+    "on_message_listeners",
+    "on_error_listeners",
+    "on_close_listeners",
+    "ack_listeners",
+    "connect_operation_lock",
+)
+
+
+def _validate_num_connections(num_connections: int) -> None:
+    if num_connections < 1 or num_connections > MAX_NUM_CONNECTIONS:
+        raise SlackClientConfigurationError(
+            f"num_connections must be between 1 and {MAX_NUM_CONNECTIONS} (given: {num_connections})"
+        )
+
+
+def _share_with_group_member(client: Any, member: Any) -> None:
+    """Makes the group member use the same listener lists and connect_operation_lock as the client."""
+    for name in _SHARED_ATTRIBUTES:
+        if hasattr(client, name):
+            setattr(member, name, getattr(client, name))
+
+
+def _connect_group_members(client: Any) -> None:
+    """Establishes the first connections of the group members that have none, at the same time.
+    A member that fails to connect keeps trying through its monitor if auto reconnect is enabled.
+    Otherwise, the error is raised.
+    """
+    members = [m for m in client.group_members if m.current_session is None]
+    errors: List[Tuple[Any, Exception]] = []
+
+    def connect(member: Any) -> None:
+        try:
+            member.connect()
+        except Exception as e:
+            errors.append((member, e))
+
+    threads = [Thread(target=connect, args=(m,), daemon=True) for m in members]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for member, e in errors:
+        if not member.auto_reconnect_enabled:
+            raise e
+    for member, e in errors:
+        client.logger.warning(f"Failed to establish a connection in the group (error: {e}); Retrying...")
+        if not member.current_app_monitor_started:
+            member.current_app_monitor_started = True
+            member.current_app_monitor.start()
+
+
+async def _connect_group_members_async(client: Any) -> None:
+    """Establishes the first connections of the group members that have none, at the same time.
+    A member that fails to connect keeps trying in the background if auto reconnect is enabled.
+    Otherwise, the error is raised.
+    """
+    members = [m for m in client.group_members if m.current_session is None]
+    results = await asyncio.gather(*[m.connect() for m in members], return_exceptions=True)
+    errors = [(m, r) for m, r in zip(members, results) if isinstance(r, Exception)]
+    for member, e in errors:
+        if not member.auto_reconnect_enabled:
+            raise e
+    for member, e in errors:
+        client.logger.warning(f"Failed to establish a connection in the group (error: {e}); Retrying...")
+        # connect() replaces this task with the monitor for the established session
+        member.current_session_monitor = asyncio.ensure_future(_keep_connecting(member))
+
+
+async def _keep_connecting(member: Any) -> None:
+    while not member.closed and member.current_session is None:
+        await asyncio.sleep(member.ping_interval)
+        try:
+            await member.connect_to_new_endpoint()
+        except Exception as e:
+            member.logger.warning(f"Failed to establish a connection in the group (error: {e}); Retrying...")
@@ -16,7 +16,13 @@ from typing import Callable, List, Optional, Tuple, Union
 import websocket
 from websocket import WebSocketApp, WebSocketException
 
+from slack_sdk.socket_mode.ack import SocketModeAckEvent
 from slack_sdk.socket_mode.client import BaseSocketModeClient
+from slack_sdk.socket_mode.connection_group import (
+    _connect_group_members,
+    _share_with_group_member,
+    _validate_num_connections,
+)
 from slack_sdk.socket_mode.interval_runner import IntervalRunner
 from slack_sdk.socket_mode.listeners import (
     WebSocketMessageListener,
@@ -49,7 +55,7 @@ class SocketModeClient(BaseSocketModeClient):
 
     current_app_monitor: IntervalRunner
     current_app_monitor_started: bool
-    message_processor: IntervalRunner
+    message_processor: Optional[IntervalRunner]
     message_workers: ThreadPoolExecutor
 
     current_session: Optional[WebSocketApp]
@@ -66,6 +72,12 @@ class SocketModeClient(BaseSocketModeClient):
     on_error_listeners: List[Callable[[WebSocketApp, Exception], None]]
     on_close_listeners: List[Callable[[WebSocketApp], None]]
 
+    ack_first_enabled: bool
+    ack_listeners: List[Callable[[SocketModeAckEvent], None]]
+
+    num_connections: int
+    group_members: List["SocketModeClient"]
+
     def __init__(
         self,
         app_token: str,
@@ -83,6 +95,10 @@ class SocketModeClient(BaseSocketModeClient):
         on_message_listeners: Optional[List[Callable[[WebSocketApp, str], None]]] = None,
         on_error_listeners: Optional[List[Callable[[WebSocketApp, Exception], None]]] = None,
         on_close_listeners: Optional[List[Callable[[WebSocketApp], None]]] = None,
+        ack_first_enabled: bool = False,
+        ack_listeners: Optional[List[Callable[[SocketModeAckEvent], None]]] = None,
+        num_connections: int = 1,
+        _group_owner: Optional["SocketModeClient"] = None,
     ):
         """
 
@@ -101,7 +117,12 @@ class SocketModeClient(BaseSocketModeClient):
             on_message_listeners: listener functions for on_message
             on_error_listeners: listener functions for on_error
             on_close_listeners: listener functions for on_close
+            ack_first_enabled: True if the client acknowledges events_api envelopes before running the listeners
+                (default: False)
+            ack_listeners: listener functions receiving the timing of each acknowledgement sent by ack_first_enabled
+            num_connections: the number of WebSocket connections to maintain (default: 1, max: 10)
         """
+        _validate_num_connections(num_connections)
         self.app_token = app_token
         self.logger = logger or logging.getLogger(__name__)
         self.web_client = web_client or WebClient()
@@ -122,8 +143,15 @@ class SocketModeClient(BaseSocketModeClient):
         self.closed = False
         self.connect_operation_lock = Lock()
 
-        self.message_processor = IntervalRunner(self.process_messages, 0.001).start()
-        self.message_workers = ThreadPoolExecutor(max_workers=concurrency)
+        # A group member (see slack_sdk.socket_mode.connection_group) uses its owner's workers.
+        # Instead of running its own message processor, it hands the received messages to them directly.
+        self._group_owner = _group_owner
+        if _group_owner is None:
+            self.message_processor = IntervalRunner(self.process_messages, 0.001).start()
+            self.message_workers = ThreadPoolExecutor(max_workers=concurrency)
+        else:
+            self.message_processor = None
+            self.message_workers = _group_owner.message_workers
 
         # NOTE: only global settings is provided by the library
         websocket.enableTrace(trace_enabled)
@@ -137,6 +165,30 @@ class SocketModeClient(BaseSocketModeClient):
         self.on_message_listeners = on_message_listeners or []
         self.on_error_listeners = on_error_listeners or []
         self.on_close_listeners = on_close_listeners or []
+        self.ack_first_enabled = ack_first_enabled
+        self.ack_listeners = ack_listeners or []
+
+        # The other clients maintaining the additional connections, which share the listeners and the workers
+        self.num_connections = num_connections
+        self.group_members = []
+        if _group_owner is not None:
+            _share_with_group_member(_group_owner, self)
+        for _ in range(num_connections - 1):
+            member = SocketModeClient(
+                app_token=app_token,
+                logger=self.logger,
+                web_client=self.web_client,
+                auto_reconnect_enabled=auto_reconnect_enabled,
+                ping_interval=ping_interval,
+                trace_enabled=trace_enabled,
+                http_proxy_host=http_proxy_host,
+                http_proxy_port=http_proxy_port,
+                http_proxy_auth=http_proxy_auth,
+                proxy_type=proxy_type,
+                ack_first_enabled=ack_first_enabled,
+                _group_owner=self,
+            )
+            self.group_members.append(member)
 
     def is_connected(self) -> bool:
         return self.current_session is not None and self.current_session.sock is not None
@@ -196,9 +248,14 @@ class SocketModeClient(BaseSocketModeClient):
 
         self.logger.info("A new session has been established")
 
+        # Once established, each connection in the group reconnects on its own
+        _connect_group_members(self)
+
     def disconnect(self) -> None:
         if self.current_session is not None:
             self.current_session.close()
+        for member in self.group_members:
+            member.disconnect()
 
     def send_message(self, message: str) -> None:
         if self.logger.level <= logging.DEBUG:
@@ -225,14 +282,26 @@ class SocketModeClient(BaseSocketModeClient):
                     )
                     raise e
 
+    def enqueue_message(self, message: str):
+        if self.message_processor is None:
+            # A group member has no message processor; the message is handed over to the workers right away
+            self.dispatch_message(message)
+        else:
+            super().enqueue_message(message)
+
     def close(self) -> None:
+        for member in self.group_members:
+            member.close()
         self.closed = True
         self.auto_reconnect_enabled = False
         self.disconnect()
         self.current_session_runner.shutdown()
         self.current_app_monitor.shutdown()
-        self.message_processor.shutdown()
-        self.message_workers.shutdown()
+        if self.message_processor is not None:
+            self.message_processor.shutdown()
+        if self._group_owner is None:
+            # The workers are shared with the group members
+            self.message_workers.shutdown()
 
     def _run_current_session(self):
         if self.current_session is not None:
@@ -24,11 +24,17 @@ except ImportError:
     from websockets import WebSocketClientProtocol as ClientConnection  # type: ignore[no-redef, attr-defined]
 
 
+from slack_sdk.socket_mode.ack import SocketModeAckEvent
 from slack_sdk.socket_mode.async_client import AsyncBaseSocketModeClient
 from slack_sdk.socket_mode.async_listeners import (
     AsyncWebSocketMessageListener,
     AsyncSocketModeRequestListener,
 )
+from slack_sdk.socket_mode.connection_group import (
+    _connect_group_members_async,
+    _share_with_group_member,
+    _validate_num_connections,
+)
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.web.async_client import AsyncWebClient
 
@@ -79,6 +85,12 @@ class SocketModeClient(AsyncBaseSocketModeClient):
     closed: bool
     connect_operation_lock: Lock
 
+    ack_first_enabled: bool
+    ack_listeners: List[Callable[[SocketModeAckEvent], None]]
+
+    num_connections: int
+    group_members: List["SocketModeClient"]
+
     def __init__(
         self,
         app_token: str,
@@ -87,6 +99,10 @@ class SocketModeClient(AsyncBaseSocketModeClient):
         auto_reconnect_enabled: bool = True,
         ping_interval: float = 10,
         trace_enabled: bool = False,
+        ack_first_enabled: bool = False,
+        ack_listeners: Optional[List[Callable[[SocketModeAckEvent], None]]] = None,
+        num_connections: int = 1,
+        _group_owner: Optional["SocketModeClient"] = None,
     ):
         """Socket Mode client
 
@@ -97,7 +113,12 @@ class SocketModeClient(AsyncBaseSocketModeClient):
             auto_reconnect_enabled: True if automatic reconnection is enabled (default: True)
             ping_interval: interval for ping-pong with Slack servers (seconds)
             trace_enabled: True if more verbose logs to see what's happening under the hood
+            ack_first_enabled: True if the client acknowledges events_api envelopes before running the listeners
+                (default: False)
+            ack_listeners: listener functions receiving the timing of each acknowledgement sent by ack_first_enabled
+            num_connections: the number of WebSocket connections to maintain (default: 1, max: 10)
         """
+        _validate_num_connections(num_connections)
         self.app_token = app_token
         self.logger = logger or logging.getLogger(__name__)
         self.web_client = web_client or AsyncWebClient()
@@ -111,12 +132,32 @@ class SocketModeClient(AsyncBaseSocketModeClient):
         self.message_queue = Queue()
         self.message_listeners = []
         self.socket_mode_request_listeners = []
+        self.ack_first_enabled = ack_first_enabled
+        self.ack_listeners = ack_listeners or []
         self.current_session = None
         self.current_session_monitor = None
 
         self.message_receiver = None
         self.message_processor = asyncio.ensure_future(self.process_messages())
 
+        # The other clients maintaining the additional connections, which share the listeners
+        self.num_connections = num_connections
+        self.group_members = []
+        if _group_owner is not None:
+            _share_with_group_member(_group_owner, self)
+        for _ in range(num_connections - 1):
+            member = SocketModeClient(
+                app_token=app_token,
+                logger=self.logger,
+                web_client=self.web_client,
+                auto_reconnect_enabled=auto_reconnect_enabled,
+                ping_interval=ping_interval,
+                trace_enabled=trace_enabled,
+                ack_first_enabled=ack_first_enabled,
+                _group_owner=self,
+            )
+            self.group_members.append(member)
+
     async def monitor_current_session(self) -> None:
         # In the asyncio runtime, accessing a shared object (self.current_session here) from
         # multiple tasks can cause race conditions and errors.
@@ -224,9 +265,14 @@ class SocketModeClient(AsyncBaseSocketModeClient):
             old_session_id = self.build_session_id(old_session)
             self.logger.info(f"The old session ({old_session_id}) has been abandoned")
 
+        # Once established, each connection in the group reconnects on its own
+        await _connect_group_members_async(self)
+
     async def disconnect(self):
         if self.current_session is not None:
             await self.current_session.close()
+        for member in self.group_members:
+            await member.disconnect()
 
     async def send_message(self, message: str):
         session = self.current_session
@@ -256,6 +302,8 @@ class SocketModeClient(AsyncBaseSocketModeClient):
                     self.connect_operation_lock.release()
 
     async def close(self):
+        for member in self.group_members:
+            await member.close()
         self.closed = True
         self.auto_reconnect_enabled = False
         await self.disconnect()
@@ -1,10 +1,17 @@
 """The Slack Web API allows you to build applications that interact with Slack
 in more complex ways than the integrations we provide out of the box."""
 
+from .analytics_file import AnalyticsFile
+from .batch import BatchExecutor, BatchResult
 from .client import WebClient
+from .paginator import Paginator
 from .slack_response import SlackResponse
 
 __all__ = [
+    "AnalyticsFile",
+    "BatchExecutor",
+    "BatchResult",
     "WebClient",
+    "Paginator",
     "SlackResponse",
 ]
@@ -0,0 +1,118 @@
+"""Streaming downloads of admin.analytics.getFile files."""
+
+import os
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.json_codec import get_json_codec
+
+# The size of each chunk to read from an analytics file response
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class AnalyticsFile:
+    """A gzip-compressed NDJSON file returned by admin.analytics.getFile, which is read while you consume it.
+
+        with client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            for record in file.records():
+                print(record["user_id"])
+
+        # or, to save the file without loading it into memory
+        with client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            file.save("./member_analytics_2020-09-01.json.gz")
+
+    As org-wide analytics files can be hundreds of MB, neither the compressed data
+    nor the decompressed data is held in memory as a whole. The data can be read only once.
+    """
+
+    api_url: str
+    status_code: int
+    headers: Dict[str, Any]
+
+    def __init__(self, *, api_url: str, status_code: int, headers: Dict[str, Any], stream: Any):
+        self.api_url = api_url
+        self.status_code = status_code
+        self.headers = headers
+        self._stream = stream
+
+    def iter_bytes(self, chunk_size: int = _DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields the gzip-compressed data chunk by chunk."""
+        try:
+            while True:
+                chunk = self._stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            self.close()
+
+    def iter_lines(self, chunk_size: int = _DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields each line of the decompressed NDJSON data."""
+        decoder = _AnalyticsFileDecoder()
+        for chunk in self.iter_bytes(chunk_size):
+            yield from decoder.feed(chunk)
+        yield from decoder.flush()
+
+    def records(self, chunk_size: int = _DOWNLOAD_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yields the analytics records one by one."""
+        loads = get_json_codec().loads
+        for line in self.iter_lines(chunk_size):
+            yield loads(line)
+
+    def save(self, path: Union[str, os.PathLike], *, decompress: bool = False) -> int:
+        """Writes the file to the path, and returns the number of bytes written.
+
+        Args:
+            path: The file path to write the data to
+            decompress: True if the decompressed NDJSON data is written instead of the gzip-compressed data
+        """
+        written = 0
+        with open(path, "wb") as f:
+            if decompress:
+                for line in self.iter_lines():
+                    written += f.write(line) + f.write(b"\n")
+            else:
+                for chunk in self.iter_bytes():
+                    written += f.write(chunk)
+        return written
+
+    def close(self) -> None:
+        """Closes the underlying connection. The data that is not read yet is discarded."""
+        self._stream.close()
+
+    def __enter__(self) -> "AnalyticsFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class _AnalyticsFileDecoder:
+    """Decompresses gzip-compressed NDJSON data chunk by chunk and splits it into lines."""
+
+    def __init__(self):
+        self._decompressor: Any = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # the last line that is not complete yet
+        self._rest: Optional[bytes] = None
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        data = self._decompressor.decompress(chunk)
+        # A gzip file can consist of multiple members
+        while self._decompressor.eof and self._decompressor.unused_data:
+            unused_data = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            data += self._decompressor.decompress(unused_data)
+        if not data:
+            return []
+        if self._rest is not None:
+            data = self._rest + data
+        lines = data.split(b"\n")
+        self._rest = lines.pop()
+        return [line for line in lines if line.strip()]
+
+    def flush(self) -> List[bytes]:
+        if not self._decompressor.eof:
+            raise SlackRequestError("The analytics file ended before the end of its gzip data")
+        rest, self._rest = self._rest, None
+        return [rest] if rest is not None and rest.strip() else []
@@ -0,0 +1,95 @@
+"""Streaming downloads of admin.analytics.getFile files (asyncio version)."""
+
+import os
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+import aiohttp
+
+from slack_sdk.json_codec import get_json_codec
+from .analytics_file import _DOWNLOAD_CHUNK_SIZE, _AnalyticsFileDecoder
+
+
+class AsyncAnalyticsFile:
+    """A gzip-compressed NDJSON file returned by admin.analytics.getFile, which is read while you consume it.
+
+        async with await client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            async for record in file.records():
+                print(record["user_id"])
+
+        # or, to save the file without loading it into memory
+        async with await client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            await file.save("./member_analytics_2020-09-01.json.gz")
+
+    As org-wide analytics files can be hundreds of MB, neither the compressed data
+    nor the decompressed data is held in memory as a whole. The data can be read only once.
+    """
+
+    api_url: str
+    status_code: int
+    headers: Dict[str, Any]
+
+    def __init__(
+        self,
+        *,
+        api_url: str,
+        response: aiohttp.ClientResponse,
+        session_to_close: Optional[aiohttp.ClientSession] = None,
+    ):
+        self.api_url = api_url
+        self.status_code = response.status
+        self.headers = dict(response.headers)
+        self._response = response
+        self._session_to_close = session_to_close
+
+    async def iter_bytes(self, chunk_size: int = _DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yields the gzip-compressed data chunk by chunk."""
+        try:
+            async for chunk in self._response.content.iter_chunked(chunk_size):
+                yield chunk
+        finally:
+            await self.close()
+
+    async def iter_lines(self, chunk_size: int = _DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yields each line of the decompressed NDJSON data."""
+        decoder = _AnalyticsFileDecoder()
+        async for chunk in self.iter_bytes(chunk_size):
+            for line in decoder.feed(chunk):
+                yield line
+        for line in decoder.flush():
+            yield line
+
+    async def records(self, chunk_size: int = _DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """Yields the analytics records one by one."""
+        loads = get_json_codec().loads
+        async for line in self.iter_lines(chunk_size):
+            yield loads(line)
+
+    async def save(self, path: Union[str, os.PathLike], *, decompress: bool = False) -> int:
+        """Writes the file to the path, and returns the number of bytes written.
+
+        Args:
+            path: The file path to write the data to
+            decompress: True if the decompressed NDJSON data is written instead of the gzip-compressed data
+        """
+        written = 0
+        with open(path, "wb") as f:
+            if decompress:
+                async for line in self.iter_lines():
+                    written += f.write(line) + f.write(b"\n")
+            else:
+                async for chunk in self.iter_bytes():
+                    written += f.write(chunk)
+        return written
+
+    async def close(self) -> None:
+        """Closes the underlying connection. The data that is not read yet is discarded."""
+        self._response.close()
+        if self._session_to_close is not None:
+            await self._session_to_close.close()
+            self._session_to_close = None
+
+    async def __aenter__(self) -> "AsyncAnalyticsFile":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
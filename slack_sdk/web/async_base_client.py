@@ -1,27 +1,53 @@
+import asyncio
 import logging
+import time
 from ssl import SSLContext
-from typing import Optional, Union, Dict, Any, List
+from typing import Optional, Union, Dict, Any, Iterable, List
 
 import aiohttp
 from aiohttp import FormData, BasicAuth
 
 from .async_internal_utils import (
     _files_to_data,
+    _record_rate_limit_state_async,
     _request_with_session,
+    _wait_for_rate_limit_state_async,
 )
+from .async_analytics_file import AsyncAnalyticsFile
+from .async_batch import AsyncBatchExecutor
+from .async_paginator import AsyncPaginator
+from .pagination_checkpoint import AsyncPaginationCheckpointStore, PaginationCheckpoint
+from .async_single_flight import AsyncSingleFlight
 from .async_slack_response import AsyncSlackResponse
+from .batch import BatchCall, BatchResult
 from .deprecation import show_deprecation_warning_if_any
 from .file_upload_v2_result import FileUploadV2Result
 from .internal_utils import (
     convert_bool_to_0_or_1,
     _build_req_args,
+    _build_rate_limiter_args,
+    _build_api_call_key,
+    _build_api_call_key_args,
     _get_url,
+    _build_unexpected_body_error_message,
     get_user_agent,
+    _FileUploadBody,
 )
+from .response_cache import ResponseCache
 from ..proxy_env_variable_loader import load_http_proxy_from_env
 
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.json_codec import get_json_codec
+from slack_sdk.http_metrics import HttpRequestObserver
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder
 from slack_sdk.http_retry.builtin_async_handlers import async_default_handlers
 from slack_sdk.http_retry.async_handler import AsyncRetryHandler
+from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
+from slack_sdk.http_retry.response import HttpResponse as RetryHttpResponse
+from slack_sdk.http_retry.state import RetryState
+from slack_sdk.rate_limiting.async_gate import AsyncRateLimitGate
+from slack_sdk.rate_limiting.async_rate_limiter import AsyncRateLimiter
+from slack_sdk.rate_limiting.state_store.async_state_store import AsyncRateLimitStateStore
 
 
 class AsyncBaseClient:
@@ -43,6 +69,12 @@ class AsyncBaseClient:
         team_id: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         retry_handlers: Optional[List[AsyncRetryHandler]] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        rate_limit_state_store: Optional[AsyncRateLimitStateStore] = None,
+        rate_limit_gate: Optional[AsyncRateLimitGate] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        request_observers: Optional[List[HttpRequestObserver]] = None,
     ):
         self.token = None if token is None else token.strip()
         """A string specifying an `xoxp-*` or `xoxb-*` token."""
@@ -82,6 +114,24 @@ class AsyncBaseClient:
             self.default_params["team_id"] = team_id
         self._logger = logger if logger is not None else logging.getLogger(__name__)
         self.retry_handlers = retry_handlers if retry_handlers is not None else async_default_handlers()
+        self.rate_limiter = rate_limiter
+        """An optional `AsyncRateLimiter` to delay API calls before they exceed Slack's rate limits.
+        The same limiter can be shared among multiple clients."""
+        self.rate_limit_state_store = rate_limit_state_store
+        """An optional `AsyncRateLimitStateStore` to share rate limited states (received 429 responses)
+        among multiple clients, tasks, and processes."""
+        self.rate_limit_gate = rate_limit_gate
+        """An optional `AsyncRateLimitGate` to hold all the pending calls to a rate limited method
+        until its Retry-After duration expires."""
+        self.response_cache = response_cache
+        """An optional `ResponseCache` to serve repeated calls to idempotent API methods
+        (e.g., users.info) without sending HTTP requests. Its backend must be an `AsyncResponseCacheBackend`."""
+        self.single_flight = single_flight
+        """An optional `AsyncSingleFlight` to coalesce identical concurrent read API calls
+        into a single HTTP request. The coalesced calls receive the same `AsyncSlackResponse` object,
+        so treat it as read-only."""
+        self.request_observers = request_observers if request_observers is not None else []
+        """`HttpRequestObserver`s to receive the timing and retry events of each HTTP request attempt."""
 
         if self.proxy is None or len(self.proxy.strip()) == 0:
             env_variable = load_http_proxy_from_env(self._logger)
@@ -172,12 +222,293 @@ class AsyncBaseClient:
 
         show_deprecation_warning_if_any(api_method)
 
+        if (self.response_cache is not None or self.single_flight is not None) and files is None:
+            return await self._send_with_response_reuse(
+                api_method=api_method,
+                http_verb=http_verb,
+                api_url=api_url,
+                req_args=req_args,
+            )
         return await self._send(
             http_verb=http_verb,
             api_url=api_url,
             req_args=req_args,
         )
 
+    def paginate(
+        self,
+        api_method: str,
+        *,
+        key: Optional[str] = None,
+        limit: Optional[int] = None,
+        max_items: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: int = 1,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+        checkpoint_store: Optional[AsyncPaginationCheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncPaginator:
+        """Iterates over the items in a cursor-based paginated API method's responses.
+
+        No request is sent until the iteration starts. Each page is released once its items are yielded,
+        so that iterating over millions of items (e.g., exporting a channel's history) runs in constant memory.
+
+            paginator = client.paginate("conversations.history", key="messages", channel="C111", limit=200)
+            async for message in paginator:
+                save(message)
+                # paginator.checkpoint() returns where to resume from
+
+        If a checkpoint store is given, the pagination resumes from the checkpoint saved under the key,
+        saves a checkpoint each time it moves to the next page, and deletes it when all the items are yielded.
+
+            store = FilePaginationCheckpointStore()
+            async for message in client.paginate(
+                "conversations.history", channel="C111", checkpoint_store=store, checkpoint_key="export-C111"
+            ):
+                save(message)
+
+        Args:
+            api_method (str): The target Slack API method. e.g. 'conversations.history'
+            key (str): The key of the items in the response data. e.g. 'messages'
+                If absent, the only list value in the first page is used.
+            limit (int): The maximum number of items in a page
+            max_items (int): The maximum number of items to yield in total
+            cursor (str): The cursor to start the pagination from
+            prefetch (int): The maximum number of pages to fetch ahead while you process the current page
+            checkpoint (PaginationCheckpoint): The checkpoint to resume the pagination from
+            checkpoint_store (AsyncPaginationCheckpointStore): The store to restore and save the checkpoints
+            checkpoint_key (str): The key of the checkpoints in the store. e.g. 'export-C111'
+            **kwargs: The other parameters for the API method. e.g. channel="C111"
+
+        Returns:
+            (AsyncPaginator) The iterator over the items
+        """
+        params = {k: v for k, v in kwargs.items() if v is not None}
+        if limit is not None:
+            params["limit"] = limit
+        if cursor is not None:
+            params["cursor"] = cursor
+        return AsyncPaginator(
+            client=self,
+            api_method=api_method,
+            params=params,
+            item_key=key,
+            prefetch=prefetch,
+            max_items=max_items,
+            checkpoint=checkpoint,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def batch(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = 10,
+        ordered: bool = True,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> AsyncBatchExecutor:
+        """Runs many API calls concurrently and iterates over their results.
+
+        No request is sent until the iteration starts. A failed call does not stop the others;
+        its exception is set to the `error` of the result instead of being raised.
+
+            async for result in client.batch([("chat.postMessage", {"channel": c, "text": "Hi"}) for c in channels]):
+                if not result.ok:
+                    print(result.error)
+
+        Args:
+            calls: Pairs of an API method name and its keyword arguments
+                e.g. [("chat.postMessage", {"channel": "C111", "text": "Hi"})]
+            max_concurrency (int): The maximum number of API calls running at the same time
+            ordered (bool): True if the results are yielded in the same order as the calls.
+                If False, they are yielded as soon as each call completes.
+            rate_limiter (AsyncRateLimiter): The rate limiter for the calls.
+                This cannot be given when the client has its own rate_limiter, which already throttles the calls.
+                If neither exists, a new one with the built-in tiers is used.
+
+        Returns:
+            (AsyncBatchExecutor) The async iterator over the results
+        """
+        return AsyncBatchExecutor(
+            self,
+            calls,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            rate_limiter=rate_limiter,
+        )
+
+    async def gather(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = 10,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> List[BatchResult]:
+        """Runs many API calls concurrently and returns their results in the same order as the calls.
+        Unlike `asyncio.gather()`, a failed call does not raise an exception; check the `error` of its result.
+
+            results = await client.gather([("users.info", {"user": u}) for u in user_ids])
+
+        Args:
+            calls: Pairs of an API method name and its keyword arguments
+                e.g. [("users.info", {"user": "U111"})]
+            max_concurrency (int): The maximum number of API calls running at the same time
+            rate_limiter (AsyncRateLimiter): The rate limiter for the calls.
+                This cannot be given when the client has its own rate_limiter, which already throttles the calls.
+                If neither exists, a new one with the built-in tiers is used.
+
+        Returns:
+            (List[BatchResult]) The results of the calls
+        """
+        return await self.batch(calls, max_concurrency=max_concurrency, rate_limiter=rate_limiter).gather()
+
+    async def admin_analytics_getFile_stream(
+        self,
+        *,
+        type: str,
+        date: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncAnalyticsFile:
+        """Downloads the gzip-compressed NDJSON file from admin.analytics.getFile
+        and returns it as a stream, which yields the analytics records one by one while reading the response.
+        Unlike `admin_analytics_getFile()`, the file is never loaded into memory as a whole.
+        https://docs.slack.dev/reference/methods/admin.analytics.getFile
+
+            async with await client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+                async for record in file.records():
+                    print(record["user_id"])
+
+        Raises:
+            SlackApiError: The API call failed (e.g., file_not_yet_available)
+        """
+        kwargs.update({"type": type})
+        if date is not None:
+            kwargs.update({"date": date})
+        api_url = _get_url(self.base_url, "admin.analytics.getFile")
+        req_args = _build_req_args(
+            token=self.token,
+            http_verb="POST",
+            files=None,  # type: ignore[arg-type]
+            data=None,  # type: ignore[arg-type]
+            default_params=self.default_params,
+            params=kwargs,
+            json=None,  # type: ignore[arg-type]
+            headers=dict(self.headers),
+            auth=None,  # type: ignore[arg-type]
+            ssl=self.ssl,
+            proxy=self.proxy,
+        )
+        rate_limiter_args = _build_rate_limiter_args(self.base_url, api_url, req_args)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(**rate_limiter_args)
+
+        params = convert_bool_to_0_or_1(req_args["params"])
+        retry_request = RetryHttpRequest(method="POST", url=api_url, headers=req_args["headers"], body_params=params)
+        retry_state = RetryState()
+        recorder = _RequestRecorder(
+            self.request_observers,
+            logger=self._logger,
+            client=self.__class__.__name__,
+            http_method="POST",
+            url=api_url,
+            api_method=rate_limiter_args["api_method"],
+            retry_state=retry_state,
+        )
+        session_to_close: Optional[aiohttp.ClientSession] = None
+        if self.session is not None and not self.session.closed:
+            session = self.session
+        else:
+            session = session_to_close = aiohttp.ClientSession()
+        streaming = False
+        try:
+            # The retries, the rate limit state, and the observers work in the same way as the other API calls
+            counter_for_safety = 0
+            while True:
+                counter_for_safety += 1
+                # If this is a retry, the next try started here. We can reset the flag.
+                retry_state.next_attempt_requested = False
+                if self.rate_limit_state_store is not None:
+                    await _wait_for_rate_limit_state_async(self.rate_limit_state_store, rate_limiter_args, self._logger)
+
+                started = time.perf_counter()
+                try:
+                    res = await session.post(
+                        api_url,
+                        data=params,
+                        headers=req_args["headers"],
+                        ssl=req_args["ssl"],
+                        proxy=self.proxy,
+                        # Downloading a large file can take longer than the timeout, so the timeout is applied to each read
+                        timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout),
+                    )
+                except Exception as err:
+                    recorder.attempt(started=started, error=err)
+                    for handler in self.retry_handlers:
+                        if await handler.can_retry_async(state=retry_state, request=retry_request, response=None, error=err):
+                            with recorder.retry(handler):
+                                await handler.prepare_for_next_attempt_async(
+                                    state=retry_state, request=retry_request, response=None, error=err
+                                )
+                            break
+                    if retry_state.next_attempt_requested is False or counter_for_safety >= 100:
+                        raise err
+                    continue
+
+                time_to_headers = time.perf_counter() - started
+                if res.status == 200 and res.content_type == "application/gzip":
+                    # The size of the file is unknown until the caller reads it
+                    recorder.attempt(started=started, status_code=res.status, time_to_headers=time_to_headers)
+                    streaming = True
+                    return AsyncAnalyticsFile(api_url=api_url, response=res, session_to_close=session_to_close)
+
+                # An error response is a small JSON data
+                async with res:
+                    raw_body = await res.read()
+                recorder.attempt(
+                    started=started,
+                    status_code=res.status,
+                    response_bytes=len(raw_body),
+                    time_to_headers=time_to_headers,
+                )
+                if res.status == 429 and self.rate_limit_state_store is not None:
+                    await _record_rate_limit_state_async(self.rate_limit_state_store, rate_limiter_args, res.headers)
+
+                retry_response = RetryHttpResponse(
+                    status_code=res.status,
+                    headers=res.headers,  # type: ignore[arg-type]
+                    data=raw_body,
+                )
+                for handler in self.retry_handlers:
+                    if await handler.can_retry_async(state=retry_state, request=retry_request, response=retry_response):
+                        with recorder.retry(handler):
+                            await handler.prepare_for_next_attempt_async(
+                                state=retry_state, request=retry_request, response=retry_response
+                            )
+                        break
+                if retry_state.next_attempt_requested is False or counter_for_safety >= 100:
+                    break
+        finally:
+            if session_to_close is not None and not streaming:
+                await session_to_close.close()
+
+        try:
+            data = get_json_codec().loads(raw_body)
+        except ValueError:
+            message = _build_unexpected_body_error_message(raw_body.decode("utf-8", "replace"))
+            data = {"ok": False, "error": message}
+        AsyncSlackResponse(
+            client=self,
+            http_verb="POST",
+            api_url=api_url,
+            req_args=req_args,
+            data=data,
+            headers=dict(res.headers),
+            status_code=res.status,
+        ).validate()
+        raise SlackRequestError(f"admin.analytics.getFile did not return a file (status: {res.status})")
+
     async def _send(self, http_verb: str, api_url: str, req_args: dict) -> AsyncSlackResponse:
         """Sends the request out for transmission.
 
@@ -214,11 +545,47 @@ class AsyncBaseClient:
         }
         return AsyncSlackResponse(**{**data, **res}).validate()
 
+    async def _send_with_response_reuse(
+        self, *, api_method: str, http_verb: str, api_url: str, req_args: dict
+    ) -> AsyncSlackResponse:
+        response_cache, single_flight = self.response_cache, self.single_flight
+        key_args = _build_api_call_key_args(api_method, req_args)
+        if response_cache is not None:
+            cached = await response_cache.async_find(**key_args)
+            if cached is not None:
+                return AsyncSlackResponse(
+                    client=self,
+                    http_verb=http_verb,
+                    api_url=api_url,
+                    req_args=req_args,
+                    data=cached["data"],
+                    headers=cached["headers"],
+                    status_code=cached["status_code"],
+                ).validate()
+
+        async def send() -> AsyncSlackResponse:
+            response = await self._send(http_verb=http_verb, api_url=api_url, req_args=req_args)
+            if response_cache is not None:
+                await response_cache.async_save(
+                    **key_args,
+                    data=response.data,
+                    headers=response.headers,
+                    status_code=response.status_code,
+                )
+            return response
+
+        if single_flight is not None and single_flight.is_coalescable(api_method):
+            return await single_flight.do(_build_api_call_key(**key_args), send)
+        return await send()
+
     async def _request(self, *, http_verb, api_url, req_args) -> Dict[str, Any]:
         """Submit the HTTP request with the running session or a new session.
         Returns:
             A dictionary of the response data.
         """
+        rate_limiter_args = _build_rate_limiter_args(self.base_url, api_url, req_args)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(**rate_limiter_args)
         return await _request_with_session(
             current_session=self.session,
             timeout=self.timeout,
@@ -227,27 +594,87 @@ class AsyncBaseClient:
             api_url=api_url,
             req_args=req_args,
             retry_handlers=self.retry_handlers,
+            rate_limit_state_store=self.rate_limit_state_store,
+            rate_limit_gate=self.rate_limit_gate,
+            rate_limiter_args=rate_limiter_args,
+            request_observers=self.request_observers,
+            client_name=type(self).__name__,
+        )
+
+    async def _upload_files_v2(self, *, files: List[Dict[str, Any]], token: Optional[str], max_concurrency: int) -> None:
+        """Runs files.getUploadURLExternal and the upload for each file, processing up to max_concurrency files
+        at the same time. A file's steps are retried on their own, without restarting the other files' uploads.
+        """
+        if max_concurrency < 1:
+            raise SlackRequestError("max_concurrency must be 1 or greater")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def upload(f: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self._upload_file_v2_item(f, token)
+
+        tasks = [asyncio.ensure_future(upload(f)) for f in files]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # When one of the files fails, stop the uploads of the other files
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancelled uploads to finish before the error propagates
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _upload_file_v2_item(self, f: Dict[str, Any], token: Optional[str]) -> None:
+        url_response = await self.files_getUploadURLExternal(  # type: ignore[attr-defined]
+            filename=f.get("filename"),
+            length=f.get("length"),
+            alt_txt=f.get("alt_txt"),
+            snippet_type=f.get("snippet_type"),
+            token=token,
+        )
+        f["file_id"] = url_response.get("file_id")
+        f["upload_url"] = url_response.get("upload_url")
+
+        upload_result = await self._upload_file(
+            url=f["upload_url"],
+            data=f["data"],
+            logger=self._logger,
+            timeout=self.timeout,
+            proxy=self.proxy,
+            ssl=self.ssl,
         )
+        if upload_result.status != 200:
+            message = (
+                "Failed to upload a file "
+                f"(status: {upload_result.status}, body: {upload_result.body}, "
+                f"filename: {f.get('filename')}, title: {f.get('title')})"
+            )
+            raise SlackRequestError(message)
 
     async def _upload_file(
         self,
         *,
         url: str,
-        data: bytes,
+        data: Union[bytes, _FileUploadBody],
         logger: logging.Logger,
         timeout: int,
         proxy: Optional[str],
         ssl: Optional[SSLContext],
     ) -> FileUploadV2Result:
         """Upload a file using the issued upload URL"""
+        headers: Dict[str, str] = {}
+        if isinstance(data, _FileUploadBody):
+            # Without Content-Length, the chunks of the file would be sent with chunked transfer encoding
+            headers["Content-Length"] = str(data.length)
         result = await _request_with_session(
             current_session=self.session,
             timeout=timeout,
             logger=logger,
             http_verb="POST",
             api_url=url,
-            req_args={"data": data, "proxy": proxy, "ssl": ssl},
+            req_args={"data": data, "headers": headers, "proxy": proxy, "ssl": ssl},
             retry_handlers=self.retry_handlers,
+            request_observers=self.request_observers,
+            client_name=type(self).__name__,
         )
         return FileUploadV2Result(
             status=result.get("status_code"),  # type: ignore[arg-type]
@@ -0,0 +1,118 @@
+"""Batch execution of many Web API calls with bounded parallelism (asyncio version)."""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional
+
+from slack_sdk.rate_limiting.async_rate_limiter import AsyncRateLimiter
+from .batch import BatchCall, BatchResult, _build_batch_rate_limiter_args, _find_api_method
+
+
+class AsyncBatchExecutor:
+    """Runs many API calls concurrently, holding at most `max_concurrency` calls in flight.
+
+        async for result in client.batch(
+            [("chat.postMessage", {"channel": c, "text": "Hi there!"}) for c in channel_ids],
+            max_concurrency=10,
+        ):
+            if not result.ok:
+                print(f"Failed to post a message to {result.kwargs['channel']}: {result.error}")
+
+        # or, to receive all the results in the same order as the calls
+        results = await client.gather([("users.info", {"user": u}) for u in user_ids])
+
+    If the client does not have an `AsyncRateLimiter`, the calls are throttled by a rate limiter
+    with the built-in rate limit tiers, so that a large batch does not flood Slack with rate-limited requests.
+    The calls are read from the given iterable lazily, so that a generator of millions of calls works as well.
+    """
+
+    max_concurrency: int
+    ordered: bool
+    rate_limiter: Optional[AsyncRateLimiter]
+
+    def __init__(
+        self,
+        client: Any,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = 10,
+        ordered: bool = True,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ):
+        """Batch executor for an AsyncWebClient.
+
+        Args:
+            client: The AsyncWebClient to send the API calls
+            calls: Pairs of an API method name and its keyword arguments
+                (e.g., ("chat.postMessage", {"channel": "C111", "text": "Hi"}))
+            max_concurrency: The maximum number of API calls running at the same time
+            ordered: True if the results are yielded in the same order as the calls.
+                If False, they are yielded as soon as each call completes.
+            rate_limiter: The rate limiter for the calls in this batch. This cannot be given when the client has
+                its own rate_limiter, which already throttles every call. Otherwise, each call would acquire
+                a slot twice. If neither exists, a new one is created.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be 1 or greater")
+        if rate_limiter is not None and client.rate_limiter is not None:
+            raise ValueError(
+                "rate_limiter cannot be given as the client's rate_limiter already throttles the calls in this batch"
+            )
+        self._client = client
+        self._calls = calls
+        self.max_concurrency = max_concurrency
+        self.ordered = ordered
+        self.rate_limiter = rate_limiter
+        if self.rate_limiter is None and client.rate_limiter is None:
+            self.rate_limiter = AsyncRateLimiter()
+
+    async def gather(self) -> List[BatchResult]:
+        """Runs all the calls and returns the results in the same order as the calls."""
+        results = [result async for result in self]
+        return sorted(results, key=lambda r: r.index) if not self.ordered else results
+
+    async def __aiter__(self) -> AsyncIterator[BatchResult]:
+        calls = enumerate(iter(self._calls))
+        in_flight: Deque["asyncio.Future[BatchResult]"] = deque()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        def submit_next() -> bool:
+            for index, (api_method, kwargs) in calls:
+                in_flight.append(asyncio.ensure_future(self._run(index, api_method, dict(kwargs), semaphore)))
+                return True
+            return False
+
+        try:
+            # Keep twice as many calls as the concurrency scheduled, so that no slot becomes idle
+            while len(in_flight) < self.max_concurrency * 2 and submit_next():
+                pass
+            while len(in_flight) > 0:
+                if self.ordered:
+                    result = await in_flight.popleft()
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    future = done.pop()
+                    in_flight.remove(future)
+                    result = future.result()
+                submit_next()
+                yield result
+        finally:
+            # When the iteration is stopped in the middle, cancel the remaining calls
+            for future in in_flight:
+                future.cancel()
+
+    async def _run(
+        self,
+        index: int,
+        api_method: str,
+        kwargs: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> BatchResult:
+        async with semaphore:
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(**_build_batch_rate_limiter_args(self._client, api_method, kwargs))
+                response = await _find_api_method(self._client, api_method)(**kwargs)
+                return BatchResult(index=index, api_method=api_method, kwargs=kwargs, response=response)
+            except Exception as e:
+                return BatchResult(index=index, api_method=api_method, kwargs=kwargs, error=e)
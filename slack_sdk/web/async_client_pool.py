@@ -0,0 +1,107 @@
+"""A pool of per-token AsyncWebClients for multi-workspace apps."""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from slack_sdk.oauth.installation_store.async_installation_store import AsyncInstallationStore
+from .async_client import AsyncWebClient
+from .client_pool import _copy_client
+
+# (token, team_id)
+_ClientKey = Tuple[str, Optional[str]]
+
+
+class AsyncWebClientPool:
+    """Hands out lightweight per-token `AsyncWebClient`s for multi-workspace (multi-tenant) apps.
+
+    All the clients share the configuration of the given base client, such as the aiohttp session,
+    SSL context, headers (including the User-Agent), retry handlers, rate limiter, and rate limit state store.
+    As building a client only copies the base client's attributes, and the built clients are reused,
+    getting a client costs a dict lookup in most cases.
+
+        from slack_sdk.oauth.installation_store.sqlite3 import SQLite3InstallationStore
+        from slack_sdk.web.async_client_pool import AsyncWebClientPool
+
+        pool = AsyncWebClientPool(
+            AsyncWebClient(rate_limiter=AsyncRateLimiter()),
+            installation_store=SQLite3InstallationStore(database="./slackapp.db", client_id="111.222"),
+        )
+        client = await pool.get_for_installation(enterprise_id=None, team_id="T111")
+        await client.chat_postMessage(channel="C111", text="Hi there!")
+    """
+
+    base_client: AsyncWebClient
+    installation_store: Optional[AsyncInstallationStore]
+    max_clients: int
+
+    def __init__(
+        self,
+        base_client: Optional[AsyncWebClient] = None,
+        *,
+        installation_store: Optional[AsyncInstallationStore] = None,
+        max_clients: int = 1000,
+    ):
+        """A pool of per-token AsyncWebClients.
+
+        Args:
+            base_client: The client whose configuration the clients in this pool share.
+                Its token and team_id are not used. If absent, `AsyncWebClient()` is used.
+            installation_store: The installation store to find the bot tokens for `get_for_installation()`
+            max_clients: The maximum number of clients to keep. The least recently used ones are discarded first.
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be 1 or greater")
+        self.base_client = base_client if base_client is not None else AsyncWebClient()
+        self.installation_store = installation_store
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[_ClientKey, AsyncWebClient]" = OrderedDict()
+
+    def get(self, token: str, *, team_id: Optional[str] = None) -> AsyncWebClient:
+        """Returns the client for the token.
+
+        Args:
+            token: A bot or user token
+            team_id: The workspace ID for org-wide installations' tokens
+        """
+        key: _ClientKey = (token, team_id)
+        client = self._clients.get(key)
+        if client is not None:
+            self._clients.move_to_end(key)
+            return client
+        client = _copy_client(self.base_client, token, team_id)
+        self._clients[key] = client
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    async def get_for_installation(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[AsyncWebClient]:
+        """Returns the client with the bot token of the installation, or None if the app is not installed.
+
+        Args:
+            enterprise_id: The Enterprise Grid org ID
+            team_id: The workspace ID
+            is_enterprise_install: True if the app is installed in the whole org
+        """
+        if self.installation_store is None:
+            raise ValueError("installation_store is required for using get_for_installation()")
+        bot = await self.installation_store.async_find_bot(
+            enterprise_id=enterprise_id,
+            team_id=team_id,
+            is_enterprise_install=is_enterprise_install,
+        )
+        if bot is None:
+            return None
+        return self.get(bot.bot_token, team_id=team_id if is_enterprise_install else None)
+
+    def clear(self) -> None:
+        """Discards all the clients in this pool."""
+        self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
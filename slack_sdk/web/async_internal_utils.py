@@ -1,20 +1,27 @@
 import asyncio
 import json
 import logging
+import time
 from asyncio import AbstractEventLoop
 from logging import Logger
-from typing import Optional, BinaryIO, Dict, Sequence, Union, List, Any
+from typing import Optional, BinaryIO, Dict, Mapping, Sequence, Union, List, Any
 
 import aiohttp
 from aiohttp import ClientSession
 
 from slack_sdk.errors import SlackApiError
-from slack_sdk.web.internal_utils import _build_unexpected_body_error_message
+from slack_sdk.json_codec import get_json_codec
+from slack_sdk.web.internal_utils import _build_unexpected_body_error_message, _parse_retry_after
 
+from slack_sdk.http_metrics import HttpRequestObserver
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder, _record_aiohttp_attempt
 from slack_sdk.http_retry.async_handler import AsyncRetryHandler
 from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
 from slack_sdk.http_retry.response import HttpResponse as RetryHttpResponse
 from slack_sdk.http_retry.state import RetryState
+from slack_sdk.rate_limiting.async_gate import AsyncRateLimitGate
+from slack_sdk.rate_limiting.rate_limiter import _build_workspace_key
+from slack_sdk.rate_limiting.state_store.async_state_store import AsyncRateLimitStateStore
 
 
 def _get_event_loop() -> AbstractEventLoop:
@@ -41,6 +48,43 @@ def _files_to_data(req_args: dict) -> Sequence[BinaryIO]:
     return open_files
 
 
+async def _wait_for_rate_limit_state_async(
+    store: AsyncRateLimitStateStore,
+    rate_limiter_args: Dict[str, Any],
+    logger: Logger,
+) -> None:
+    api_method = rate_limiter_args["api_method"]
+    blocked_until = await store.async_find_blocked_until(
+        workspace_key=_build_workspace_key(rate_limiter_args["token"], rate_limiter_args["team_id"]),
+        api_method=api_method,
+    )
+    if blocked_until is not None:
+        duration = blocked_until - time.time()
+        if duration > 0:
+            if logger.level <= logging.DEBUG:
+                logger.debug(f"Waiting {duration:.3f} seconds as {api_method} is rate limited")
+            await asyncio.sleep(duration)
+
+
+async def _record_rate_limit_state_async(
+    store: AsyncRateLimitStateStore,
+    rate_limiter_args: Dict[str, Any],
+    headers: Mapping[str, Any],
+) -> None:
+    await store.async_block(
+        workspace_key=_build_workspace_key(rate_limiter_args["token"], rate_limiter_args["team_id"]),
+        api_method=rate_limiter_args["api_method"],
+        until=time.time() + _parse_retry_after(headers),
+    )
+
+
+def _build_rate_limit_gate_args(rate_limiter_args: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "workspace_key": _build_workspace_key(rate_limiter_args["token"], rate_limiter_args["team_id"]),
+        "api_method": rate_limiter_args["api_method"],
+    }
+
+
 async def _request_with_session(
     *,
     current_session: Optional[ClientSession],
@@ -51,6 +95,11 @@ async def _request_with_session(
     req_args: dict,
     # set the default to an empty array for legacy clients
     retry_handlers: Optional[List[AsyncRetryHandler]] = None,
+    rate_limit_state_store: Optional[AsyncRateLimitStateStore] = None,
+    rate_limit_gate: Optional[AsyncRateLimitGate] = None,
+    rate_limiter_args: Optional[Dict[str, Any]] = None,
+    request_observers: Optional[List[HttpRequestObserver]] = None,
+    client_name: str = "AsyncWebClient",
 ) -> Dict[str, Any]:
     """Submit the HTTP request with the running session or a new session.
     Returns:
@@ -65,6 +114,7 @@ async def _request_with_session(
         session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=timeout),
             auth=req_args.pop("auth", None),
+            json_serialize=get_json_codec().dumps,
         )
 
     last_error: Optional[Exception] = None
@@ -79,12 +129,26 @@ async def _request_with_session(
         )
 
         retry_state = RetryState()
+        recorder = _RequestRecorder(
+            request_observers,
+            logger=logger,
+            client=client_name,
+            http_method=http_verb,
+            url=api_url,
+            api_method=rate_limiter_args.get("api_method") if rate_limiter_args is not None else None,
+            retry_state=retry_state,
+        )
         counter_for_safety = 0
         while counter_for_safety < 100:
             counter_for_safety += 1
             # If this is a retry, the next try started here. We can reset the flag.
             retry_state.next_attempt_requested = False
             retry_response: Optional[RetryHttpResponse] = None
+            if rate_limit_state_store is not None and rate_limiter_args is not None:
+                await _wait_for_rate_limit_state_async(rate_limit_state_store, rate_limiter_args, logger)
+            probe = False
+            if rate_limit_gate is not None and rate_limiter_args is not None:
+                probe = await rate_limit_gate.enter(**_build_rate_limit_gate_args(rate_limiter_args))
 
             if logger.level <= logging.DEBUG:
 
@@ -106,8 +170,21 @@ async def _request_with_session(
                     f"headers: {headers}"
                 )
 
+            started = time.perf_counter()
+            attempt_recorded = False
             try:
                 async with session.request(http_verb, api_url, **req_args) as res:  # type: ignore[union-attr]
+                    time_to_headers = time.perf_counter() - started
+                    if res.status == 429 and rate_limit_state_store is not None and rate_limiter_args is not None:
+                        await _record_rate_limit_state_async(rate_limit_state_store, rate_limiter_args, res.headers)
+                    if rate_limit_gate is not None and rate_limiter_args is not None:
+                        rate_limit_gate.exit(
+                            **_build_rate_limit_gate_args(rate_limiter_args),
+                            probe=probe,
+                            status_code=res.status,
+                            retry_after=_parse_retry_after(res.headers) if res.status == 429 else None,
+                        )
+                        probe = False
                     data: Union[dict, bytes, str] = {}
                     if res.content_type == "application/gzip":
                         # admin.analytics.getFile
@@ -127,7 +204,7 @@ async def _request_with_session(
                         )
                     else:
                         try:
-                            data = await res.json()
+                            data = await res.json(loads=get_json_codec().loads)
                             retry_response = RetryHttpResponse(
                                 status_code=res.status,
                                 headers=res.headers,  # type: ignore[arg-type]
@@ -161,6 +238,13 @@ async def _request_with_session(
                             f"body: {body}"
                         )
 
+                    await _record_aiohttp_attempt(
+                        recorder,
+                        started=started,
+                        time_to_headers=time_to_headers,
+                        response=res,
+                    )
+                    attempt_recorded = True
                     for handler in retry_handlers:
                         if await handler.can_retry_async(
                             state=retry_state,
@@ -169,11 +253,12 @@ async def _request_with_session(
                         ):
                             if logger.level <= logging.DEBUG:
                                 logger.info(f"A retry handler found: {type(handler).__name__} " f"for {http_verb} {api_url}")
-                            await handler.prepare_for_next_attempt_async(
-                                state=retry_state,
-                                request=retry_request,
-                                response=retry_response,
-                            )
+                            with recorder.retry(handler):
+                                await handler.prepare_for_next_attempt_async(
+                                    state=retry_state,
+                                    request=retry_request,
+                                    response=retry_response,
+                                )
                             break
 
                     if retry_state.next_attempt_requested is False:
@@ -186,6 +271,11 @@ async def _request_with_session(
 
             except Exception as e:
                 last_error = e
+                if not attempt_recorded:
+                    recorder.attempt(started=started, error=e)
+                if probe and rate_limit_gate is not None and rate_limiter_args is not None:
+                    rate_limit_gate.exit(**_build_rate_limit_gate_args(rate_limiter_args), probe=True)
+                    probe = False
                 for handler in retry_handlers:
                     if await handler.can_retry_async(
                         state=retry_state,
@@ -197,16 +287,21 @@ async def _request_with_session(
                             logger.info(
                                 f"A retry handler found: {type(handler).__name__} " f"for {http_verb} {api_url} - {e}"
                             )
-                        await handler.prepare_for_next_attempt_async(
-                            state=retry_state,
-                            request=retry_request,
-                            response=retry_response,
-                            error=e,
-                        )
+                        with recorder.retry(handler):
+                            await handler.prepare_for_next_attempt_async(
+                                state=retry_state,
+                                request=retry_request,
+                                response=retry_response,
+                                error=e,
+                            )
                         break
 
                 if retry_state.next_attempt_requested is False:
                     raise last_error
+            finally:
+                # A cancelled probe call (e.g., by asyncio.wait_for()) must release the probe slot too
+                if probe and rate_limit_gate is not None and rate_limiter_args is not None:
+                    rate_limit_gate.exit(**_build_rate_limit_gate_args(rate_limiter_args), probe=True)
 
         if resp is not None:
             return resp
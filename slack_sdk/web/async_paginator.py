@@ -0,0 +1,233 @@
+"""Item-level iteration over cursor-based paginated Web API responses (asyncio version)."""
+
+import asyncio
+import copy
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from slack_sdk.errors import SlackRequestError
+from .async_slack_response import AsyncSlackResponse
+from .internal_utils import _get_next_cursor, _get_pagination_items_key, _get_pagination_params
+from .pagination_checkpoint import AsyncPaginationCheckpointStore, PaginationCheckpoint
+
+# (the cursor used to fetch the page, the page data)
+_Page = Tuple[Optional[str], Dict[str, Any]]
+
+_END_OF_PAGES = object()
+
+
+class AsyncPaginator:
+    """Iterates over the items (e.g., members, channels, messages) in a paginated API response.
+
+    While you process the items in the current page, the next pages are fetched in a background task.
+    The number of the pages fetched ahead is bounded by `prefetch`.
+
+        response = await client.users_list(limit=200)
+        async for member in AsyncPaginator(response, item_key="members", prefetch=2):
+            print(member["id"])
+
+        # or, using AsyncWebClient#paginate(), which sends the first request when the iteration starts
+        async for message in client.paginate("conversations.history", key="messages", channel="C111", limit=200):
+            print(message["ts"])
+
+    Breaking out of the loop cancels the background task.
+    As each page is released once its items are yielded, the memory usage does not grow with the number of pages.
+    """
+
+    item_key: Optional[str]
+    prefetch: int
+    max_items: Optional[int]
+    cursor: Optional[str]
+    offset: int
+    num_items: int
+
+    def __init__(
+        self,
+        response: Optional[AsyncSlackResponse] = None,
+        *,
+        client: Optional[Any] = None,
+        api_method: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        item_key: Optional[str] = None,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+        checkpoint_store: Optional[AsyncPaginationCheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ):
+        """Item-level iterator over a paginated API response.
+
+        Args:
+            response: The response for the first page. If absent, client and api_method are required.
+            client: The AsyncWebClient to send the request for the first page
+            api_method: The API method name (e.g., "users.list")
+            params: The parameters for the first request (e.g., {"limit": 200, "cursor": "xxx"})
+            item_key: The key of the items in the response data (e.g., "members").
+                If absent, the only list value in the first page is used.
+            prefetch: The maximum number of pages to fetch ahead. 0 disables the background fetching.
+            max_items: The maximum number of items to yield
+            checkpoint: The checkpoint to resume the pagination from
+            checkpoint_store: The store to restore and save the checkpoints of this pagination
+            checkpoint_key: The key of the checkpoints in the store (required if checkpoint_store is given)
+        """
+        if response is None and (client is None or (api_method is None and checkpoint is None)):
+            raise SlackRequestError("Either response or a pair of client and api_method is required")
+        if checkpoint_store is not None and checkpoint_key is None:
+            raise SlackRequestError("checkpoint_key is required for using checkpoint_store")
+        self.item_key = item_key
+        self.prefetch = prefetch
+        self.max_items = max_items
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_key = checkpoint_key
+        self._client: Any = client
+        self._api_method = api_method
+        self._params = params or {}
+        self._http_verb = "POST"
+        self._api_url: str = ""
+        self._req_args: Dict[str, Any] = {}
+        self._first_page: Optional[Dict[str, Any]] = None
+        if response is not None:
+            if isinstance(response.data, bytes):
+                raise ValueError("As the response.data is binary data, this operation is unsupported")
+            self._client = response._client
+            self._api_method = api_method or response.api_url.split("/")[-1]
+            self._params = _get_pagination_params(response.req_args)
+            self._http_verb = response.http_verb
+            self._api_url = response.api_url
+            self._req_args = response.req_args
+            self._first_page = response.data
+
+        self.cursor = self._params.get("cursor")
+        """The cursor used to fetch the page that the current item belongs to (None for the first page)"""
+        self.offset = 0
+        """The number of the items already yielded from the current page"""
+        self.num_items = 0
+        """The total number of the items yielded so far"""
+        self._num_items_to_skip = 0
+        if checkpoint is not None:
+            self._restore(checkpoint)
+
+    def checkpoint(self) -> PaginationCheckpoint:
+        """Returns the checkpoint right after the last yielded item."""
+        return PaginationCheckpoint(
+            api_method=self._api_method,  # type: ignore[arg-type]
+            params={k: v for k, v in self._params.items() if k not in ("cursor", "token")},
+            cursor=self.cursor,
+            offset=self.offset,
+            num_items=self.num_items,
+            item_key=self.item_key,
+        )
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        if self.checkpoint_store is not None and self.num_items == 0:
+            checkpoint = await self.checkpoint_store.async_find(self.checkpoint_key)  # type: ignore[arg-type]
+            if checkpoint is not None:
+                self._restore(checkpoint)
+        if self.max_items is not None and self.num_items >= self.max_items:
+            return
+        async for cursor, data in self.pages():
+            if self.item_key is None:
+                self.item_key = _get_pagination_items_key(data)
+            items: List[Any] = data.get(self.item_key) or []
+            # Not to hold the page data while yielding the items
+            del data
+            skip, self._num_items_to_skip = self._num_items_to_skip, 0
+            self.cursor, self.offset = cursor, skip
+            if skip > 0:
+                items = items[skip:]
+            if self.checkpoint_store is not None:
+                # All the items yielded before this page have been processed
+                await self.checkpoint_store.async_save(self.checkpoint_key, self.checkpoint())  # type: ignore[arg-type]
+            for item in items:
+                self.offset += 1
+                self.num_items += 1
+                yield item
+                if self.max_items is not None and self.num_items >= self.max_items:
+                    if self.checkpoint_store is not None:
+                        await self.checkpoint_store.async_save(
+                            self.checkpoint_key, self.checkpoint()  # type: ignore[arg-type]
+                        )
+                    return
+        if self.checkpoint_store is not None:
+            await self.checkpoint_store.async_delete(self.checkpoint_key)  # type: ignore[arg-type]
+
+    async def pages(self) -> AsyncIterator[_Page]:
+        """Iterates over the pages. Each page is a tuple of the cursor used to fetch it and its data."""
+        first_page = self._first_page if self._first_page is not None else await self._fetch_first_page()
+        if self.prefetch <= 0:
+            yield self.cursor, first_page
+            data = first_page
+            while True:
+                page = await self._fetch_next_page(data)
+                if page is None:
+                    return
+                yield page
+                data = page[1]
+
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch)
+        task = asyncio.ensure_future(self._run_prefetching(first_page, pages))
+        try:
+            yield self.cursor, first_page
+            del first_page
+            while True:
+                page = await pages.get()
+                if page is _END_OF_PAGES:
+                    return
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+        finally:
+            task.cancel()
+
+    def _restore(self, checkpoint: PaginationCheckpoint) -> None:
+        self._api_method = self._api_method or checkpoint.api_method
+        self._params = dict(checkpoint.params, **self._params)
+        self._params.pop("cursor", None)
+        if checkpoint.cursor is not None:
+            self._params["cursor"] = checkpoint.cursor
+        self.item_key = self.item_key or checkpoint.item_key
+        self.cursor = checkpoint.cursor
+        self.offset = checkpoint.offset
+        self.num_items = checkpoint.num_items
+        self._num_items_to_skip = checkpoint.offset
+        # The first page has to be fetched again using the cursor
+        self._first_page = None
+
+    async def _fetch_first_page(self) -> Dict[str, Any]:
+        response = await self._client.api_call(self._api_method, params=dict(self._params))
+        self._http_verb = response.http_verb
+        self._api_url = response.api_url
+        self._req_args = response.req_args
+        return response.data
+
+    async def _run_prefetching(self, data: Dict[str, Any], pages: asyncio.Queue) -> None:
+        try:
+            while True:
+                page = await self._fetch_next_page(data)
+                if page is None:
+                    break
+                await pages.put(page)
+                data = page[1]
+            await pages.put(_END_OF_PAGES)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await pages.put(e)
+
+    async def _fetch_next_page(self, data: Dict[str, Any]) -> Optional[_Page]:
+        cursor = _get_next_cursor(data)
+        if cursor is None:
+            return None
+        # As the underlying client can modify the given args, build a new dict for each request
+        req_args = copy.copy(self._req_args)
+        req_args["params"] = dict(req_args.get("params") or {}, cursor=cursor)
+        response = await self._client._request(http_verb=self._http_verb, api_url=self._api_url, req_args=req_args)
+        AsyncSlackResponse(
+            client=self._client,
+            http_verb=self._http_verb,
+            api_url=self._api_url,
+            req_args=req_args,
+            data=response["data"],
+            headers=response["headers"],
+            status_code=response["status_code"],
+        ).validate()
+        return cursor, response["data"]
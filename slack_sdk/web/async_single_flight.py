@@ -0,0 +1,72 @@
+"""De-duplication of identical concurrent API calls (asyncio version)."""
+
+import asyncio
+import logging
+from logging import Logger
+from typing import Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+from .single_flight import DEFAULT_SINGLE_FLIGHT_METHODS
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlight:
+    """Coalesces identical concurrent API calls so that only one HTTP request is sent.
+
+    While an API call is in flight, the identical calls (the same API method, token, and parameters)
+    made from other tasks wait for it and receive the same `AsyncSlackResponse` (or the same exception)
+    instead of sending their own requests. The API call runs in a separate task, so that cancelling
+    one of the waiting tasks does not affect the others.
+
+    As the `AsyncSlackResponse` is shared among the coalesced calls, it must be treated as read-only.
+    Modifying its `data` or `headers` affects the other callers. Copy the data before modifying it.
+
+        from slack_sdk.web.async_client import AsyncWebClient
+        from slack_sdk.web.async_single_flight import AsyncSingleFlight
+
+        client = AsyncWebClient(token=os.environ["SLACK_BOT_TOKEN"], single_flight=AsyncSingleFlight())
+    """
+
+    methods: Iterable[str]
+    logger: Logger
+
+    def __init__(self, *, methods: Optional[Iterable[str]] = None, logger: Optional[Logger] = None):
+        """Coalesces identical concurrent API calls.
+
+        Args:
+            methods: The API methods to coalesce (default: `DEFAULT_SINGLE_FLIGHT_METHODS`).
+                Only read-only API methods should be given.
+            logger: Custom logger
+        """
+        self.methods = frozenset(methods) if methods is not None else DEFAULT_SINGLE_FLIGHT_METHODS
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self._tasks: Dict[str, asyncio.Future] = {}
+
+    def is_coalescable(self, api_method: str) -> bool:
+        return api_method in self.methods
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Runs the function unless the one with the same key is running. Otherwise, waits for its result.
+
+        Args:
+            key: The key of the API call (built by `_build_api_call_key()`)
+            func: The function that performs the API call
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        elif self.logger.level <= logging.DEBUG:
+            self.logger.debug(f"Waiting for the identical in-flight API call ({key})")
+        return await asyncio.shield(task)
+
+    def num_in_flight_calls(self) -> int:
+        return len(self._tasks)
+
+    def _on_done(self, key: str, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Not to log "Task exception was never retrieved" when all the waiting tasks are cancelled
+            task.exception()
@@ -7,18 +7,27 @@ import io
 import json
 import logging
 import mimetypes
-import urllib
+import time
 import uuid
 import warnings
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from ssl import SSLContext
-from typing import BinaryIO, Dict, List, Any
+from typing import BinaryIO, Dict, Iterable, List, Any
 from typing import Optional, Union
 from urllib.error import HTTPError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen, OpenerDirector, ProxyHandler, HTTPSHandler
+from urllib.request import Request
 
 from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_connection_pool import HttpConnectionPool
+from slack_sdk.http_transport import HttpTransport, TransportRequest, UrllibHttpTransport
+from slack_sdk.http_transport.internal_utils import _send_urllib_request
+from slack_sdk.json_codec import get_json_codec
+from slack_sdk.rate_limiting import RateLimiter
+from slack_sdk.rate_limiting.state_store import RateLimitStateStore
+from .analytics_file import AnalyticsFile
+from .batch import BatchCall, BatchExecutor
 from .deprecation import show_deprecation_warning_if_any
 from .file_upload_v2_result import FileUploadV2Result
 from .internal_utils import (
@@ -26,10 +35,23 @@ from .internal_utils import (
     get_user_agent,
     _get_url,
     _build_req_args,
+    _build_rate_limiter_args,
+    _build_api_call_key,
+    _build_api_call_key_args,
+    _record_rate_limit_state,
+    _wait_for_rate_limit_state,
     _build_unexpected_body_error_message,
     _upload_file_via_v2_url,
+    _JsonBodyRetryHttpResponse,
+    _FileUploadBody,
 )
+from .pagination_checkpoint import PaginationCheckpoint, PaginationCheckpointStore
+from .paginator import Paginator
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
 from .slack_response import SlackResponse
+from slack_sdk.http_metrics import HttpRequestObserver
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder
 from slack_sdk.http_retry import default_retry_handlers
 from slack_sdk.http_retry.handler import RetryHandler
 from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
@@ -55,6 +77,13 @@ class BaseClient:
         team_id: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         retry_handlers: Optional[List[RetryHandler]] = None,
+        connection_pool: Optional[HttpConnectionPool] = None,
+        transport: Optional[HttpTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_state_store: Optional[RateLimitStateStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        request_observers: Optional[List[HttpRequestObserver]] = None,
     ):
         self.token = None if token is None else token.strip()
         """A string specifying an `xoxp-*` or `xoxb-*` token."""
@@ -86,6 +115,25 @@ class BaseClient:
         self._logger = logger if logger is not None else logging.getLogger(__name__)
 
         self.retry_handlers = retry_handlers if retry_handlers is not None else default_retry_handlers()
+        self.connection_pool = connection_pool
+        """An optional `HttpConnectionPool` to reuse keep-alive connections across API calls.
+        The same pool can be shared among multiple clients."""
+        self.transport = transport if transport is not None else UrllibHttpTransport(connection_pool=connection_pool)
+        """`HttpTransport` to send HTTP requests. Default is `UrllibHttpTransport`."""
+        self.rate_limiter = rate_limiter
+        """An optional `RateLimiter` to delay API calls before they exceed Slack's rate limits.
+        The same limiter can be shared among multiple clients."""
+        self.rate_limit_state_store = rate_limit_state_store
+        """An optional `RateLimitStateStore` to share rate limited states (received 429 responses)
+        among multiple clients, threads, and processes."""
+        self.response_cache = response_cache
+        """An optional `ResponseCache` to serve repeated calls to idempotent API methods
+        (e.g., users.info) without sending HTTP requests."""
+        self.single_flight = single_flight
+        """An optional `SingleFlight` to coalesce identical concurrent read API calls into a single HTTP request.
+        The coalesced calls receive the same `SlackResponse` object, so treat it as read-only."""
+        self.request_observers = request_observers if request_observers is not None else []
+        """`HttpRequestObserver`s to receive the timing and retry events of each HTTP request attempt."""
 
         if self.proxy is None or len(self.proxy.strip()) == 0:
             env_variable = load_http_proxy_from_env(self._logger)
@@ -166,8 +214,261 @@ class BaseClient:
         )
 
         show_deprecation_warning_if_any(api_method)
+        if (self.response_cache is not None or self.single_flight is not None) and files is None:
+            return self._sync_send_with_response_reuse(
+                api_method=api_method,
+                http_verb=http_verb,
+                api_url=api_url,
+                req_args=req_args,
+            )
         return self._sync_send(api_url=api_url, req_args=req_args)
 
+    def paginate(
+        self,
+        api_method: str,
+        *,
+        key: Optional[str] = None,
+        limit: Optional[int] = None,
+        max_items: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: int = 1,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+        checkpoint_store: Optional[PaginationCheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs,
+    ) -> Paginator:
+        """Iterates over the items in a cursor-based paginated API method's responses.
+
+        No request is sent until the iteration starts. Each page is released once its items are yielded,
+        so that iterating over millions of items (e.g., exporting a channel's history) runs in constant memory.
+
+            paginator = client.paginate("conversations.history", key="messages", channel="C111", limit=200)
+            for message in paginator:
+                save(message)
+                # paginator.checkpoint() returns where to resume from
+
+        If a checkpoint store is given, the pagination resumes from the checkpoint saved under the key,
+        saves a checkpoint each time it moves to the next page, and deletes it when all the items are yielded.
+
+            store = FilePaginationCheckpointStore()
+            for message in client.paginate(
+                "conversations.history", channel="C111", checkpoint_store=store, checkpoint_key="export-C111"
+            ):
+                save(message)
+
+        Args:
+            api_method (str): The target Slack API method. e.g. 'conversations.history'
+            key (str): The key of the items in the response data. e.g. 'messages'
+                If absent, the only list value in the first page is used.
+            limit (int): The maximum number of items in a page
+            max_items (int): The maximum number of items to yield in total
+            cursor (str): The cursor to start the pagination from
+            prefetch (int): The maximum number of pages to fetch ahead while you process the current page
+            checkpoint (PaginationCheckpoint): The checkpoint to resume the pagination from
+            checkpoint_store (PaginationCheckpointStore): The store to restore and save the checkpoints
+            checkpoint_key (str): The key of the checkpoints in the store. e.g. 'export-C111'
+            **kwargs: The other parameters for the API method. e.g. channel="C111"
+
+        Returns:
+            (Paginator) The iterator over the items
+        """
+        params = {k: v for k, v in kwargs.items() if v is not None}
+        if limit is not None:
+            params["limit"] = limit
+        if cursor is not None:
+            params["cursor"] = cursor
+        return Paginator(
+            client=self,
+            api_method=api_method,
+            params=params,
+            item_key=key,
+            prefetch=prefetch,
+            max_items=max_items,
+            checkpoint=checkpoint,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def batch(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = 10,
+        ordered: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> BatchExecutor:
+        """Runs many API calls in parallel and iterates over their results.
+
+        No request is sent until the iteration starts. A failed call does not stop the others;
+        its exception is set to the `error` of the result instead of being raised.
+
+            results = list(client.batch([("conversations.invite", {"channel": c, "users": "U111"}) for c in channels]))
+            failures = [r for r in results if not r.ok]
+
+        Args:
+            calls: Pairs of an API method name and its keyword arguments
+                e.g. [("chat.postMessage", {"channel": "C111", "text": "Hi"})]
+            max_concurrency (int): The maximum number of API calls running at the same time
+            ordered (bool): True if the results are yielded in the same order as the calls.
+                If False, they are yielded as soon as each call completes.
+            rate_limiter (RateLimiter): The rate limiter for the calls.
+                This cannot be given when the client has its own rate_limiter, which already throttles the calls.
+                If neither exists, a new one with the built-in tiers is used.
+
+        Returns:
+            (BatchExecutor) The iterator over the results
+        """
+        return BatchExecutor(
+            self,
+            calls,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            rate_limiter=rate_limiter,
+        )
+
+    def admin_analytics_getFile_stream(self, *, type: str, date: Optional[str] = None, **kwargs) -> AnalyticsFile:
+        """Downloads the gzip-compressed NDJSON file from admin.analytics.getFile
+        and returns it as a stream, which yields the analytics records one by one while reading the response.
+        Unlike `admin_analytics_getFile()`, the file is never loaded into memory as a whole.
+        https://docs.slack.dev/reference/methods/admin.analytics.getFile
+
+            with client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+                for record in file.records():
+                    print(record["user_id"])
+
+        Raises:
+            SlackApiError: The API call failed (e.g., file_not_yet_available)
+        """
+        kwargs.update({"type": type})
+        if date is not None:
+            kwargs.update({"date": date})
+        api_url = _get_url(self.base_url, "admin.analytics.getFile")
+        req_args = _build_req_args(
+            token=self.token,
+            http_verb="POST",
+            files=None,  # type: ignore[arg-type]
+            data=None,  # type: ignore[arg-type]
+            default_params=self.default_params,
+            params=kwargs,
+            json=None,  # type: ignore[arg-type]
+            headers=dict(self.headers),
+            auth=None,  # type: ignore[arg-type]
+            ssl=self.ssl,
+            proxy=self.proxy,
+        )
+        rate_limiter_args = _build_rate_limiter_args(self.base_url, api_url, req_args)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(**rate_limiter_args)
+
+        body = urlencode(convert_bool_to_0_or_1(req_args["params"])).encode("utf-8")  # type: ignore[arg-type]
+        request = TransportRequest(
+            method="POST",
+            url=api_url,
+            headers=req_args["headers"],
+            body=body,
+            timeout=self.timeout,
+            ssl=self.ssl,
+            proxy=self.proxy,
+        )
+        retry_request = RetryHttpRequest(method="POST", url=api_url, headers=req_args["headers"], data=body)
+        retry_state = RetryState()
+        recorder = _RequestRecorder(
+            self.request_observers,
+            logger=self._logger,
+            client=self.__class__.__name__,
+            http_method="POST",
+            url=api_url,
+            api_method=rate_limiter_args["api_method"],
+            retry_state=retry_state,
+        )
+        # The retries, the rate limit state, and the observers work in the same way as the other API calls
+        counter_for_safety = 0
+        while True:
+            counter_for_safety += 1
+            # If this is a retry, the next try started here. We can reset the flag.
+            retry_state.next_attempt_requested = False
+            if self.rate_limit_state_store is not None:
+                _wait_for_rate_limit_state(self.rate_limit_state_store, rate_limiter_args, self._logger)
+
+            started = time.perf_counter()
+            try:
+                response = self.transport.send_streaming(request)
+            except Exception as err:
+                recorder.attempt(started=started, error=err, request_bytes=len(body))
+                self._logger.error(f"Failed to send a request to Slack API server: {err}")
+                for handler in self.retry_handlers:
+                    if handler.can_retry(state=retry_state, request=retry_request, response=None, error=err):
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state, request=retry_request, response=None, error=err
+                            )
+                        break
+                if retry_state.next_attempt_requested is False or counter_for_safety >= 100:
+                    raise err
+                continue
+
+            time_to_headers = time.perf_counter() - started
+            # A custom transport may return the whole body without a stream
+            stream = response.stream if response.stream is not None else io.BytesIO(response.body)
+            if response.status_code == 200 and response.headers.get_content_type() == "application/gzip":
+                # The size of the file is unknown until the caller reads it
+                recorder.attempt(
+                    started=started,
+                    status_code=response.status_code,
+                    request_bytes=len(body),
+                    time_to_headers=time_to_headers,
+                )
+                return AnalyticsFile(
+                    api_url=api_url,
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    stream=stream,
+                )
+
+            # An error response is a small JSON data
+            try:
+                raw_body = stream.read()
+            finally:
+                stream.close()
+            recorder.attempt(
+                started=started,
+                status_code=response.status_code,
+                request_bytes=len(body),
+                response_bytes=len(raw_body),
+                time_to_headers=time_to_headers,
+            )
+            if response.status_code == 429 and self.rate_limit_state_store is not None:
+                _record_rate_limit_state(self.rate_limit_state_store, rate_limiter_args, dict(response.headers))
+
+            retry_response = RetryHttpResponse(
+                status_code=response.status_code,
+                headers={k: [v] for k, v in response.headers.items()},
+                data=raw_body,
+            )
+            for handler in self.retry_handlers:
+                if handler.can_retry(state=retry_state, request=retry_request, response=retry_response):
+                    with recorder.retry(handler):
+                        handler.prepare_for_next_attempt(state=retry_state, request=retry_request, response=retry_response)
+                    break
+            if retry_state.next_attempt_requested is False or counter_for_safety >= 100:
+                break
+
+        try:
+            data = get_json_codec().loads(raw_body)
+        except ValueError:
+            message = _build_unexpected_body_error_message(raw_body.decode("utf-8", "replace"))
+            data = {"ok": False, "error": message}
+        SlackResponse(
+            client=self,
+            http_verb="POST",
+            api_url=api_url,
+            req_args=req_args,
+            data=data,
+            headers=dict(response.headers),
+            status_code=response.status_code,
+        ).validate()
+        raise SlackRequestError(f"admin.analytics.getFile did not return a file (status: {response.status_code})")
+
     # =================================================================
     # urllib based WebClient
     # =================================================================
@@ -207,6 +508,48 @@ class BaseClient:
             additional_headers=headers,  # type: ignore[arg-type]
         )
 
+    def _sync_send_with_response_reuse(
+        self, *, api_method: str, http_verb: str, api_url: str, req_args: dict
+    ) -> SlackResponse:
+        response_cache, single_flight = self.response_cache, self.single_flight
+        key_args = _build_api_call_key_args(api_method, req_args)
+        if response_cache is not None:
+            cached = response_cache.find(**key_args)
+            if cached is not None:
+                return SlackResponse(
+                    client=self,
+                    http_verb=http_verb,
+                    api_url=api_url,
+                    req_args=req_args,
+                    data=cached["data"],
+                    headers=cached["headers"],
+                    status_code=cached["status_code"],
+                ).validate()
+
+        def send() -> SlackResponse:
+            response = self._sync_send(api_url=api_url, req_args=req_args)
+            # Accessing response.data decodes the body, so the other methods' responses are left as they are
+            if response_cache is not None and (
+                response_cache.is_cacheable(api_method) or api_method in response_cache.invalidation_rules
+            ):
+                response_cache.save(
+                    **key_args,
+                    data=response.data,
+                    headers=response.headers,
+                    status_code=response.status_code,
+                )
+            return response
+
+        def send_shared() -> SlackResponse:
+            response = send()
+            # The waiting threads receive this response too; decode it before handing it over
+            response._decode_raw_body()
+            return response
+
+        if single_flight is not None and single_flight.is_coalescable(api_method):
+            return single_flight.do(_build_api_call_key(**key_args), send_shared)
+        return send()
+
     def _request_for_pagination(self, api_url: str, req_args: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """This method is supposed to be used only for SlackResponse pagination
 
@@ -219,7 +562,7 @@ class BaseClient:
         return {
             "status_code": int(response["status"]),
             "headers": dict(response["headers"]),
-            "data": json.loads(response["body"]),
+            "data": get_json_codec().loads(response["raw_body"] if "raw_body" in response else response["body"]),
         }
 
     def _urllib_api_call(
@@ -307,9 +650,12 @@ class BaseClient:
             response = self._perform_urllib_http_request(url=url, args=request_args)  # type: ignore[arg-type]
             response_body = response.get("body", None)
             response_body_data: Optional[Union[dict, bytes]] = response_body
-            if response_body is not None and not isinstance(response_body, bytes):
+            if "raw_body" in response:
+                # SlackResponse decodes the raw bytes when its data is accessed for the first time
+                response_body_data = None
+            elif response_body is not None and not isinstance(response_body, bytes):
                 try:
-                    response_body_data = json.loads(response["body"])
+                    response_body_data = get_json_codec().loads(response["body"])
                 except json.decoder.JSONDecodeError:
                     message = _build_unexpected_body_error_message(response.get("body", ""))
                     self._logger.error(f"Failed to decode Slack API response: {message}")
@@ -325,9 +671,10 @@ class BaseClient:
                 http_verb="POST",  # you can use POST method for all the Web APIs
                 api_url=url,
                 req_args=request_args,
-                data=response_body_data,  # type: ignore[arg-type]
+                data=response_body_data,
                 headers=dict(response["headers"]),
                 status_code=response["status"],
+                raw_body=response.get("raw_body"),
             ).validate()
         finally:
             for f in files_to_close:
@@ -347,11 +694,16 @@ class BaseClient:
 
         Returns:
             dict {status: int, headers: Headers, body: str}
+            UTF-8 JSON responses also have the undecoded body as raw_body: bytes
         """
+        rate_limiter_args = _build_rate_limiter_args(self.base_url, url, args)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(**rate_limiter_args)
+
         headers = args["headers"]
         body: Optional[Union[bytes, str]] = None
         if args["json"]:
-            body = json.dumps(args["json"])
+            body = get_json_codec().dumps_bytes(args["json"])
             headers["Content-Type"] = "application/json;charset=utf-8"
         elif args["data"]:
             boundary = f"--------------{uuid.uuid4()}"
@@ -400,38 +752,58 @@ class BaseClient:
         last_error = None
 
         retry_state = RetryState()
+        recorder = _RequestRecorder(
+            self.request_observers,
+            logger=self._logger,
+            client=type(self).__name__,
+            http_method="POST",
+            url=url,
+            api_method=rate_limiter_args["api_method"],
+            retry_state=retry_state,
+        )
         counter_for_safety = 0
         while counter_for_safety < 100:
             counter_for_safety += 1
             # If this is a retry, the next try started here. We can reset the flag.
             retry_state.next_attempt_requested = False
+            if self.rate_limit_state_store is not None:
+                _wait_for_rate_limit_state(self.rate_limit_state_store, rate_limiter_args, self._logger)
 
             try:
-                resp = self._perform_urllib_http_request_internal(url, req)
+                resp = self._perform_urllib_http_request_internal(url, req, recorder=recorder)
                 # The resp is a 200 OK response
                 if len(self.retry_handlers) > 0:
                     retry_request = RetryHttpRequest.from_urllib_http_request(req)
-                    body_string = resp["body"] if isinstance(resp["body"], str) else None
-                    body_bytes = body_string.encode("utf-8") if body_string is not None else resp["body"]
-                    if body_string is not None and body_string.startswith("{"):
-                        body = json.loads(body_string)
+                    if "raw_body" in resp:
+                        # The JSON data is decoded only when a retry handler accesses the body
+                        retry_response: RetryHttpResponse = _JsonBodyRetryHttpResponse(
+                            status_code=resp["status"],
+                            headers=resp["headers"],
+                            data=resp["raw_body"],
+                        )
                     else:
-                        body = {}  # type: ignore[assignment]
-                    retry_response = RetryHttpResponse(
-                        status_code=resp["status"],
-                        headers=resp["headers"],
-                        body=body,  # type: ignore[arg-type]
-                        data=body_bytes,
-                    )
+                        body_string = resp["body"] if isinstance(resp["body"], str) else None
+                        body_bytes = body_string.encode("utf-8") if body_string is not None else resp["body"]
+                        if body_string is not None and body_string.startswith("{"):
+                            body = get_json_codec().loads(body_string)
+                        else:
+                            body = {}  # type: ignore[assignment]
+                        retry_response = RetryHttpResponse(
+                            status_code=resp["status"],
+                            headers=resp["headers"],
+                            body=body,  # type: ignore[arg-type]
+                            data=body_bytes,
+                        )
                     for handler in self.retry_handlers:
                         if handler.can_retry(state=retry_state, request=retry_request, response=retry_response):
                             if self._logger.level <= logging.DEBUG:
                                 self._logger.info(
                                     f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url}"
                                 )
-                            handler.prepare_for_next_attempt(
-                                state=retry_state, request=retry_request, response=retry_response
-                            )
+                            with recorder.retry(handler):
+                                handler.prepare_for_next_attempt(
+                                    state=retry_state, request=retry_request, response=retry_response
+                                )
                             break
                 if retry_state.next_attempt_requested is False:
                     return resp
@@ -446,6 +818,8 @@ class BaseClient:
                         response_headers["retry-after"] = response_headers["Retry-After"]
                     if "Retry-After" not in response_headers and "retry-after" in response_headers:
                         response_headers["Retry-After"] = response_headers["retry-after"]
+                    if self.rate_limit_state_store is not None:
+                        _record_rate_limit_state(self.rate_limit_state_store, rate_limiter_args, response_headers)
 
                 # read the response body here
                 charset = e.headers.get_content_charset() or "utf-8"
@@ -470,12 +844,13 @@ class BaseClient:
                             self._logger.info(
                                 f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url} - {e}"
                             )
-                        handler.prepare_for_next_attempt(
-                            state=retry_state,
-                            request=retry_request,
-                            response=retry_response,
-                            error=e,
-                        )
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state,
+                                request=retry_request,
+                                response=retry_response,
+                                error=e,
+                            )
                         break
 
                 if retry_state.next_attempt_requested is False:
@@ -498,12 +873,13 @@ class BaseClient:
                             self._logger.info(
                                 f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url} - {err}"
                             )
-                        handler.prepare_for_next_attempt(
-                            state=retry_state,
-                            request=retry_request,
-                            response=None,
-                            error=err,
-                        )
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state,
+                                request=retry_request,
+                                response=None,
+                                error=err,
+                            )
                         self._logger.info(f"Going to retry the same request: {req.method} {req.full_url}")
                         break
 
@@ -518,48 +894,49 @@ class BaseClient:
         self,
         url: str,
         req: Request,
+        recorder: Optional[_RequestRecorder] = None,
     ) -> Dict[str, Any]:
         # urllib not only opens http:// or https:// URLs, but also ftp:// and file://.
         # With this it might be possible to open local files on the executing machine
         # which might be a security risk if the URL to open can be manipulated by an external user.
         # (BAN-B310)
         if url.lower().startswith("http"):
-            opener: Optional[OpenerDirector] = None
-            if self.proxy is not None:
-                if isinstance(self.proxy, str):
-                    opener = urllib.request.build_opener(
-                        ProxyHandler({"http": self.proxy, "https": self.proxy}),
-                        HTTPSHandler(context=self.ssl),
-                    )
-                else:
-                    raise SlackRequestError(f"Invalid proxy detected: {self.proxy} must be a str value")
+            if self.proxy is not None and not isinstance(self.proxy, str):
+                raise SlackRequestError(f"Invalid proxy detected: {self.proxy} must be a str value")
 
-            if opener:
-                resp = opener.open(req, timeout=self.timeout)
-            else:
-                resp = urlopen(req, context=self.ssl, timeout=self.timeout)
+            resp = _send_urllib_request(
+                self.transport,
+                req,
+                timeout=self.timeout,
+                ssl=self.ssl,
+                proxy=self.proxy,
+                recorder=recorder,
+            )
             if resp.headers.get_content_type() == "application/gzip":
                 # admin.analytics.getFile
-                body: bytes = resp.read()
+                body: bytes = resp.body
                 if self._logger.level <= logging.DEBUG:
                     self._logger.debug(
                         "Received the following response - "
-                        f"status: {resp.code}, "
+                        f"status: {resp.status_code}, "
                         f"headers: {dict(resp.headers)}, "
                         f"body: (binary)"
                     )
-                return {"status": resp.code, "headers": resp.headers, "body": body}
+                return {"status": resp.status_code, "headers": resp.headers, "body": body}
 
             charset = resp.headers.get_content_charset() or "utf-8"
-            decoded_body: str = resp.read().decode(charset)  # read the response body here
             if self._logger.level <= logging.DEBUG:
                 self._logger.debug(
                     "Received the following response - "
-                    f"status: {resp.code}, "
+                    f"status: {resp.status_code}, "
                     f"headers: {dict(resp.headers)}, "
-                    f"body: {decoded_body}"
+                    f"body: {resp.body.decode(charset)}"
                 )
-            return {"status": resp.code, "headers": resp.headers, "body": decoded_body}
+            decoded_body: str = resp.body.decode(charset)
+            if charset.lower() in ("utf-8", "utf8") and resp.body.startswith(b"{"):
+                # The JSON data is decoded directly from the bytes when it's accessed for the first time
+                return {"status": resp.status_code, "headers": resp.headers, "body": decoded_body, "raw_body": resp.body}
+            return {"status": resp.status_code, "headers": resp.headers, "body": decoded_body}
         raise SlackRequestError(f"Invalid URL detected: {url}")
 
     def _build_urllib_request_headers(
@@ -578,29 +955,134 @@ class BaseClient:
             headers.pop("Content-Type", None)
         return headers
 
+    def _upload_files_v2(self, *, files: List[Dict[str, Any]], token: Optional[str], max_concurrency: int) -> None:
+        """Runs files.getUploadURLExternal and the upload for each file, processing up to max_concurrency files
+        at the same time. A file's steps are retried on their own, without restarting the other files' uploads.
+        """
+        if max_concurrency < 1:
+            raise SlackRequestError("max_concurrency must be 1 or greater")
+        if max_concurrency == 1 or len(files) == 1:
+            for f in files:
+                self._upload_file_v2_item(f, token)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(files)),
+            thread_name_prefix="slack-sdk-files-upload",
+        ) as executor:
+            futures = [executor.submit(self._upload_file_v2_item, f, token) for f in files]
+            try:
+                for future in futures:
+                    future.result()
+            finally:
+                # When one of the files fails, skip the files that have not been started yet
+                for future in futures:
+                    future.cancel()
+
+    def _upload_file_v2_item(self, f: Dict[str, Any], token: Optional[str]) -> None:
+        url_response = self.files_getUploadURLExternal(  # type: ignore[attr-defined]
+            filename=f.get("filename"),
+            length=f.get("length"),
+            alt_txt=f.get("alt_txt"),
+            snippet_type=f.get("snippet_type"),
+            token=token,
+        )
+        f["file_id"] = url_response.get("file_id")
+        f["upload_url"] = url_response.get("upload_url")
+
+        upload_result = self._upload_file(
+            url=f["upload_url"],
+            data=f["data"],
+            logger=self._logger,
+            timeout=self.timeout,
+            proxy=self.proxy,
+            ssl=self.ssl,
+        )
+        if upload_result.status != 200:
+            message = (
+                "Failed to upload a file "
+                f"(status: {upload_result.status}, body: {upload_result.body}, "
+                f"filename: {f.get('filename')}, title: {f.get('title')})"
+            )
+            raise SlackRequestError(message)
+
     def _upload_file(
         self,
         *,
         url: str,
-        data: bytes,
+        data: Union[bytes, _FileUploadBody],
         logger: logging.Logger,
         timeout: int,
         proxy: Optional[str],
         ssl: Optional[SSLContext],
     ) -> FileUploadV2Result:
         """Upload a file using the issued upload URL"""
-        result = _upload_file_via_v2_url(
-            url=url,
-            data=data,
+        retry_state = RetryState()
+        recorder = _RequestRecorder(
+            self.request_observers,
             logger=logger,
-            timeout=timeout,
-            proxy=proxy,
-            ssl=ssl,
-        )
-        return FileUploadV2Result(
-            status=result.get("status"),  # type: ignore[arg-type]
-            body=result.get("body"),  # type: ignore[arg-type]
+            client=type(self).__name__,
+            http_method="POST",
+            url=url,
+            retry_state=retry_state,
         )
+        error: Optional[Exception] = None
+        result_on_error: Optional[FileUploadV2Result] = None
+        counter_for_safety = 0
+        while counter_for_safety < 100:
+            counter_for_safety += 1
+            # If this is a retry, the next try started here. We can reset the flag.
+            retry_state.next_attempt_requested = False
+            retry_response: Optional[RetryHttpResponse] = None
+            try:
+                result = _upload_file_via_v2_url(
+                    url=url,
+                    data=data,
+                    logger=logger,
+                    timeout=timeout,
+                    proxy=proxy,
+                    ssl=ssl,
+                    transport=self.transport,
+                    recorder=recorder,
+                )
+                return FileUploadV2Result(
+                    status=result.get("status"),  # type: ignore[arg-type]
+                    body=result.get("body"),  # type: ignore[arg-type]
+                )
+            except HTTPError as e:
+                charset = e.headers.get_content_charset() or "utf-8"
+                response_body = e.read().decode(charset)
+                error = e
+                retry_response = RetryHttpResponse(
+                    status_code=e.code,
+                    headers={k: [v] for k, v in e.headers.items()},
+                    data=response_body.encode("utf-8"),
+                )
+                result_on_error = FileUploadV2Result(status=e.code, body=response_body)
+            except Exception as err:
+                error = err
+                result_on_error = None
+
+            # As the file data can be sent again, only this file's upload is retried
+            retry_request = RetryHttpRequest(method="POST", url=url, headers={})
+            for handler in self.retry_handlers:
+                if handler.can_retry(state=retry_state, request=retry_request, response=retry_response, error=error):
+                    if logger.level <= logging.DEBUG:
+                        logger.info(f"A retry handler found: {type(handler).__name__} for POST {url} - {error}")
+                    with recorder.retry(handler):
+                        handler.prepare_for_next_attempt(
+                            state=retry_state,
+                            request=retry_request,
+                            response=retry_response,
+                            error=error,
+                        )
+                    break
+            if retry_state.next_attempt_requested is False:
+                break
+
+        if result_on_error is not None:
+            return result_on_error
+        raise error  # type: ignore[misc]
 
     # =================================================================
 
@@ -0,0 +1,175 @@
+"""Batch execution of many Web API calls with bounded parallelism."""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from slack_sdk.rate_limiting import RateLimiter
+from .slack_response import SlackResponse
+
+# (API method, keyword arguments)
+BatchCall = Tuple[str, Dict[str, Any]]
+
+
+class BatchResult:
+    """The result of an API call in a batch.
+    Either response or error is set. A failed call does not stop the other calls in the batch.
+    """
+
+    index: int
+    api_method: str
+    kwargs: Dict[str, Any]
+    response: Optional[SlackResponse]
+    error: Optional[Exception]
+
+    def __init__(
+        self,
+        *,
+        index: int,
+        api_method: str,
+        kwargs: Dict[str, Any],
+        response: Optional[Any] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.index = index
+        self.api_method = api_method
+        self.kwargs = kwargs
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error: {self.error!r}"
+        return f"<slack_sdk.web.batch.BatchResult: #{self.index} {self.api_method} ({status})>"
+
+
+class BatchExecutor:
+    """Runs many API calls in worker threads, holding at most `max_concurrency` calls in flight.
+
+        results = client.batch(
+            [("chat.postMessage", {"channel": c, "text": "Hi there!"}) for c in channel_ids],
+            max_concurrency=10,
+        )
+        for result in results:
+            if not result.ok:
+                print(f"Failed to post a message to {result.kwargs['channel']}: {result.error}")
+
+    If the client does not have a `RateLimiter`, the calls are throttled by a rate limiter
+    with the built-in rate limit tiers, so that a large batch does not flood Slack with rate-limited requests.
+    The calls are read from the given iterable lazily, so that a generator of millions of calls works as well.
+    """
+
+    max_concurrency: int
+    ordered: bool
+    rate_limiter: Optional[RateLimiter]
+
+    def __init__(
+        self,
+        client: Any,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = 10,
+        ordered: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Batch executor for a WebClient.
+
+        Args:
+            client: The WebClient to send the API calls
+            calls: Pairs of an API method name and its keyword arguments
+                (e.g., ("chat.postMessage", {"channel": "C111", "text": "Hi"}))
+            max_concurrency: The maximum number of API calls running at the same time
+            ordered: True if the results are yielded in the same order as the calls.
+                If False, they are yielded as soon as each call completes.
+            rate_limiter: The rate limiter for the calls in this batch. This cannot be given when the client has
+                its own rate_limiter, which already throttles every call. Otherwise, each call would acquire
+                a slot twice. If neither exists, a new one is created.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be 1 or greater")
+        if rate_limiter is not None and client.rate_limiter is not None:
+            raise ValueError(
+                "rate_limiter cannot be given as the client's rate_limiter already throttles the calls in this batch"
+            )
+        self._client = client
+        self._calls = calls
+        self.max_concurrency = max_concurrency
+        self.ordered = ordered
+        self.rate_limiter = rate_limiter
+        if self.rate_limiter is None and client.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        calls = enumerate(iter(self._calls))
+        in_flight: Deque[Future] = deque()
+        not_done: Set[Future] = set()
+        stopped = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="slack-sdk-batch") as executor:
+
+            def submit_next() -> bool:
+                for index, (api_method, kwargs) in calls:
+                    future = executor.submit(self._run, index, api_method, dict(kwargs), stopped)
+                    in_flight.append(future)
+                    not_done.add(future)
+                    return True
+                return False
+
+            try:
+                # Keep twice as many calls as the workers queued, so that no worker becomes idle
+                while len(in_flight) < self.max_concurrency * 2 and submit_next():
+                    pass
+                while len(in_flight) > 0:
+                    if self.ordered:
+                        future = in_flight.popleft()
+                        not_done.discard(future)
+                        result: BatchResult = future.result()
+                    else:
+                        done, _ = wait(not_done, return_when=FIRST_COMPLETED)
+                        future = done.pop()
+                        not_done.discard(future)
+                        in_flight.remove(future)
+                        result = future.result()
+                    submit_next()
+                    yield result
+            finally:
+                # When the iteration is stopped in the middle, skip the remaining calls
+                stopped.set()
+                for future in in_flight:
+                    future.cancel()
+
+    def _run(self, index: int, api_method: str, kwargs: Dict[str, Any], stopped: threading.Event) -> BatchResult:
+        try:
+            if stopped.is_set():
+                raise RuntimeError("The batch execution has been stopped")
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(**_build_batch_rate_limiter_args(self._client, api_method, kwargs))
+            response = _find_api_method(self._client, api_method)(**kwargs)
+            return BatchResult(index=index, api_method=api_method, kwargs=kwargs, response=response)
+        except Exception as e:
+            return BatchResult(index=index, api_method=api_method, kwargs=kwargs, error=e)
+
+
+def _find_api_method(client: Any, api_method: str) -> Callable[..., Any]:
+    # Use the dedicated method (e.g., chat_postMessage) if it exists, as it converts some of the arguments
+    method = getattr(client, api_method.replace(".", "_"), None)
+    if callable(method):
+        return method
+
+    def call(**kwargs):
+        return client.api_call(api_method, params=kwargs)
+
+    return call
+
+
+def _build_batch_rate_limiter_args(client: Any, api_method: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    channel = kwargs.get("channel")
+    return {
+        "api_method": api_method,
+        "token": kwargs.get("token") or client.token,
+        "team_id": kwargs.get("team_id") or client.default_params.get("team_id"),
+        "channel": str(channel) if channel is not None else None,
+    }
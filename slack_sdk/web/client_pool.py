@@ -0,0 +1,128 @@
+"""A pool of per-token WebClients for multi-workspace apps."""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from slack_sdk.oauth.installation_store.installation_store import InstallationStore
+from .client import WebClient
+
+# (token, team_id)
+_ClientKey = Tuple[str, Optional[str]]
+
+
+class WebClientPool:
+    """Hands out lightweight per-token `WebClient`s for multi-workspace (multi-tenant) apps.
+
+    All the clients share the configuration of the given base client, such as the transport
+    (and its keep-alive connections), SSL context, headers (including the User-Agent),
+    retry handlers, rate limiter, and rate limit state store. As building a client only copies
+    the base client's attributes, and the built clients are reused, getting a client costs
+    a dict lookup in most cases. A single pool can be safely shared among multiple threads.
+
+        from slack_sdk.http_connection_pool import HttpConnectionPool
+        from slack_sdk.oauth.installation_store import FileInstallationStore
+        from slack_sdk.oauth.installation_store.cacheable_installation_store import CacheableInstallationStore
+        from slack_sdk.web.client_pool import WebClientPool
+
+        pool = WebClientPool(
+            WebClient(connection_pool=HttpConnectionPool(), rate_limiter=RateLimiter()),
+            installation_store=CacheableInstallationStore(FileInstallationStore()),
+        )
+        client = pool.get_for_installation(enterprise_id=None, team_id="T111")
+        client.chat_postMessage(channel="C111", text="Hi there!")
+
+    To resolve the clients in microseconds, wrap your installation store with `CacheableInstallationStore`.
+    """
+
+    base_client: WebClient
+    installation_store: Optional[InstallationStore]
+    max_clients: int
+
+    def __init__(
+        self,
+        base_client: Optional[WebClient] = None,
+        *,
+        installation_store: Optional[InstallationStore] = None,
+        max_clients: int = 1000,
+    ):
+        """A pool of per-token WebClients.
+
+        Args:
+            base_client: The client whose configuration the clients in this pool share.
+                Its token and team_id are not used. If absent, `WebClient()` is used.
+            installation_store: The installation store to find the bot tokens for `get_for_installation()`
+            max_clients: The maximum number of clients to keep. The least recently used ones are discarded first.
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be 1 or greater")
+        self.base_client = base_client if base_client is not None else WebClient()
+        self.installation_store = installation_store
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[_ClientKey, WebClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str, *, team_id: Optional[str] = None) -> WebClient:
+        """Returns the client for the token.
+
+        Args:
+            token: A bot or user token
+            team_id: The workspace ID for org-wide installations' tokens
+        """
+        key: _ClientKey = (token, team_id)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            client = _copy_client(self.base_client, token, team_id)
+            self._clients[key] = client
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+    def get_for_installation(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[WebClient]:
+        """Returns the client with the bot token of the installation, or None if the app is not installed.
+
+        Args:
+            enterprise_id: The Enterprise Grid org ID
+            team_id: The workspace ID
+            is_enterprise_install: True if the app is installed in the whole org
+        """
+        if self.installation_store is None:
+            raise ValueError("installation_store is required for using get_for_installation()")
+        bot = self.installation_store.find_bot(
+            enterprise_id=enterprise_id,
+            team_id=team_id,
+            is_enterprise_install=is_enterprise_install,
+        )
+        if bot is None:
+            return None
+        return self.get(bot.bot_token, team_id=team_id if is_enterprise_install else None)
+
+    def clear(self) -> None:
+        """Discards all the clients in this pool."""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def _copy_client(base_client, token: str, team_id: Optional[str]):
+    # A shallow copy shares the transport, SSL context, headers, retry handlers, and so on with the base client
+    client = copy.copy(base_client)
+    client.token = token.strip()
+    client.default_params = dict(base_client.default_params)
+    if team_id is not None:
+        client.default_params["team_id"] = team_id
+    else:
+        client.default_params.pop("team_id", None)
+    return client
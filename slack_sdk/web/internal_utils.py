@@ -1,24 +1,34 @@
+import hashlib
 import json
 import logging
 import os
 import platform
 import sys
-import urllib
+import threading
+import time
 import warnings
-from asyncio import Future
-from http.client import HTTPResponse
-from io import IOBase
+from io import IOBase, TextIOBase
 from ssl import SSLContext
-from typing import Any, Dict, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, Mapping, Optional, Sequence, Union
 from urllib.parse import urljoin
-from urllib.request import HTTPSHandler, OpenerDirector, ProxyHandler, Request, urlopen
+from urllib.request import Request
 
 from slack_sdk import version
 from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_transport import HttpTransport, UrllibHttpTransport
+from slack_sdk.http_retry.response import HttpResponse as RetryHttpResponse
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder
+from slack_sdk.http_transport.internal_utils import _send_urllib_request
+from slack_sdk.json_codec import get_json_codec
 from slack_sdk.models.attachments import Attachment
 from slack_sdk.models.blocks import Block
 from slack_sdk.models.messages.chunk import Chunk
 from slack_sdk.models.metadata import EntityMetadata, EventAndEntityMetadata, Metadata
+from slack_sdk.rate_limiting.rate_limiter import _build_workspace_key
+from slack_sdk.rate_limiting.state_store import RateLimitStateStore
+
+if TYPE_CHECKING:
+    from asyncio import Future
 
 
 def convert_bool_to_0_or_1(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -123,6 +133,103 @@ def _get_headers(
     return final_headers
 
 
+def _build_rate_limiter_args(base_url: str, api_url: str, req_args: dict) -> Dict[str, Any]:
+    """Extracts the arguments for `RateLimiter#acquire()` from an API request.
+
+    Args:
+        base_url: The base Slack URL (e.g., 'https://slack.com/api/')
+        api_url: The absolute API URL (e.g., 'https://slack.com/api/chat.postMessage')
+        req_args: The request arguments, which have "headers", "params", "data", and "json"
+    """
+    api_method = api_url.replace(base_url, "", 1) if api_url.startswith(base_url) else api_url.rsplit("/", 1)[-1]
+    api_method = api_method.split("?", 1)[0]
+
+    token: Optional[str] = None
+    authorization = (req_args.get("headers") or {}).get("Authorization")
+    if isinstance(authorization, str) and authorization.startswith("Bearer "):
+        token = authorization.split(" ", 1)[1]
+
+    def find_param(name: str) -> Optional[str]:
+        for key in ["json", "params", "data"]:
+            values = req_args.get(key)
+            if isinstance(values, dict) and values.get(name) is not None:
+                return str(values[name])
+        return None
+
+    return {
+        "api_method": api_method,
+        "token": token,
+        "team_id": find_param("team_id"),
+        "channel": find_param("channel"),
+    }
+
+
+def _build_api_call_key_args(api_method: str, req_args: dict) -> Dict[str, Any]:
+    """Extracts the API method, token, and parameters, which identify an API call, from an API request.
+    The result can be passed to `_build_api_call_key()`, `ResponseCache#find()`, and `ResponseCache#save()`.
+    """
+    token: Optional[str] = None
+    authorization = (req_args.get("headers") or {}).get("Authorization")
+    if isinstance(authorization, str) and authorization.startswith("Bearer "):
+        token = authorization.split(" ", 1)[1]
+    params: Dict[str, Any] = {}
+    for key in ["json", "params", "data"]:
+        values = req_args.get(key)
+        if isinstance(values, dict):
+            params.update(values)
+    return {"api_method": api_method, "token": token, "params": params}
+
+
+def _build_api_call_key(*, api_method: str, token: Optional[str], params: Optional[Dict[str, Any]] = None) -> str:
+    """Builds the key that identifies an API call in the form of "{api_method}:{token hash}:{params hash}".
+    The calls with the same key are supposed to return the same response.
+    """
+    workspace_key = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+    params_key = hashlib.sha256(json.dumps(params or {}, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{api_method}:{workspace_key}:{params_key[:32]}"
+
+
+def _parse_retry_after(headers: Mapping[str, Any]) -> float:
+    for k, v in headers.items():
+        if k.lower() == "retry-after":
+            try:
+                return float(v[0] if isinstance(v, list) else v)
+            except ValueError:
+                break
+    # This situation usually does not arise. Just in case.
+    return 1.0
+
+
+def _wait_for_rate_limit_state(
+    store: RateLimitStateStore,
+    rate_limiter_args: Dict[str, Any],
+    logger: logging.Logger,
+) -> None:
+    api_method = rate_limiter_args["api_method"]
+    blocked_until = store.find_blocked_until(
+        workspace_key=_build_workspace_key(rate_limiter_args["token"], rate_limiter_args["team_id"]),
+        api_method=api_method,
+    )
+    if blocked_until is not None:
+        duration = blocked_until - time.time()
+        if duration > 0:
+            if logger.level <= logging.DEBUG:
+                logger.debug(f"Waiting {duration:.3f} seconds as {api_method} is rate limited")
+            time.sleep(duration)
+
+
+def _record_rate_limit_state(
+    store: RateLimitStateStore,
+    rate_limiter_args: Dict[str, Any],
+    headers: Mapping[str, Any],
+) -> None:
+    store.block(
+        workspace_key=_build_workspace_key(rate_limiter_args["token"], rate_limiter_args["team_id"]),
+        api_method=rate_limiter_args["api_method"],
+        until=time.time() + _parse_retry_after(headers),
+    )
+
+
 def _set_default_params(target: dict, default_params: dict) -> None:
     for name, value in default_params.items():
         if name not in target:
@@ -257,6 +364,31 @@ def _next_cursor_is_present(data) -> bool:
     return present
 
 
+def _get_next_cursor(data: dict) -> Optional[str]:
+    """Returns the non-empty 'next_cursor' in the response data if it exists."""
+    if not _next_cursor_is_present(data):
+        return None
+    return data.get("response_metadata", {}).get("next_cursor") or data.get("next_cursor")
+
+
+def _get_pagination_items_key(data: dict) -> str:
+    """Finds the key of the items in a paginated response data (e.g., "members" for users.list)."""
+    keys = [k for k, v in data.items() if isinstance(v, list) and k not in ("warnings", "response_metadata")]
+    if len(keys) != 1:
+        raise SlackRequestError(f"Failed to detect the key of the items in the response (candidates: {keys})")
+    return keys[0]
+
+
+def _get_pagination_params(req_args: Dict[str, Any]) -> Dict[str, Any]:
+    """Extracts the API method parameters from the request args of a paginated response, excluding the token."""
+    params: Dict[str, Any] = {}
+    for key in ("params", "data"):
+        if isinstance(req_args.get(key), dict):
+            params.update(req_args[key])
+    params.pop("token", None)
+    return params
+
+
 def _to_0_or_1_if_bool(v: Any) -> Union[Any, str]:
     if isinstance(v, bool):
         return "1" if v else "0"
@@ -322,6 +454,28 @@ def _build_unexpected_body_error_message(body: str) -> str:
     return message
 
 
+class _JsonBodyRetryHttpResponse(RetryHttpResponse):
+    """HttpResponse for retry handlers, which decodes the UTF-8 JSON data only when its body is accessed"""
+
+    _body: Optional[Dict[str, Any]]
+
+    def __init__(self, *, status_code: int, headers: Dict[str, Any], data: bytes):
+        super().__init__(status_code=status_code, headers=headers, data=data)
+
+    @property
+    def body(self) -> Optional[Dict[str, Any]]:
+        if self._body is None and self.data is not None:
+            try:
+                self._body = get_json_codec().loads(self.data)
+            except ValueError:
+                self._body = {}
+        return self._body
+
+    @body.setter
+    def body(self, body: Optional[Dict[str, Any]]) -> None:
+        self._body = body
+
+
 def _remove_none_values(d: dict) -> dict:
     # To avoid having null values in JSON (Slack API does not work with null in many situations)
     #
@@ -333,20 +487,138 @@ def _remove_none_values(d: dict) -> dict:
     return {k: v for k, v in d.items() if v is not None}
 
 
-def _to_v2_file_upload_item(upload_file: Dict[str, Any]) -> Dict[str, Optional[Any]]:
+# The size of each chunk to read from a file while uploading it.
+# As a file is sent chunk by chunk, an upload holds at most this size of the file in memory.
+_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+class _FileUploadBody:
+    """The request body of a file upload, which reads the file chunk by chunk while sending it.
+    Each iteration starts from the beginning of the file, so that the same body can be sent again.
+    """
+
+    source: Union[str, os.PathLike, IOBase, bytes]
+    length: int
+    filename: str
+    progress_callback: Optional[Callable[[str, int, int], None]]
+    chunk_size: int
+
+    def __init__(
+        self,
+        *,
+        source: Union[str, os.PathLike, IOBase, bytes],
+        length: int,
+        filename: str,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        chunk_size: int = _UPLOAD_CHUNK_SIZE,
+    ):
+        self.source = source
+        self.length = length
+        self.filename = filename
+        self.progress_callback = progress_callback
+        self.chunk_size = chunk_size
+        # the position where the content starts in the given file object
+        self._start = source.tell() if isinstance(source, IOBase) else 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        self._report(sent)
+        for chunk in self._read_chunks():
+            yield chunk
+            sent += len(chunk)
+            self._report(sent)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import asyncio  # only async clients iterate this way
+
+        loop = asyncio.get_running_loop()
+        chunks = self._read_chunks()
+        sent = 0
+        self._report(sent)
+        while True:
+            # Read the file in a worker thread so as not to block the event loop
+            chunk = await loop.run_in_executor(None, next, chunks, None) if self._needs_io() else next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+            sent += len(chunk)
+            self._report(sent)
+
+    def _needs_io(self) -> bool:
+        return not isinstance(self.source, bytes)
+
+    def _read_chunks(self) -> Iterator[bytes]:
+        if isinstance(self.source, bytes):
+            view = memoryview(self.source)
+            for offset in range(0, self.length, self.chunk_size):
+                chunk_end = offset + self.chunk_size
+                yield view[offset:chunk_end]  # type: ignore[misc]
+            return
+
+        if isinstance(self.source, IOBase):
+            readable: Any = self.source
+            readable.seek(self._start)
+        else:
+            readable = open(os.fsencode(self.source), "rb")
+        try:
+            remaining = self.length
+            while remaining > 0:
+                chunk = readable.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    raise SlackRequestError(f"The file {self.filename} has been truncated while uploading it")
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            if readable is not self.source:
+                readable.close()
+
+    def _report(self, sent: int) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(self.filename, sent, self.length)
+
+
+def _serialize_progress_callback(
+    progress_callback: Optional[Callable[[str, int, int], None]],
+) -> Optional[Callable[[str, int, int], None]]:
+    """Wraps files_upload_v2's progress_callback so that its calls never overlap,
+    even when the files are uploaded in parallel worker threads."""
+    if progress_callback is None:
+        return None
+    lock = threading.Lock()
+
+    def serialized_progress_callback(filename: str, sent: int, total: int) -> None:
+        with lock:
+            progress_callback(filename, sent, total)
+
+    return serialized_progress_callback
+
+
+def _to_v2_file_upload_item(
+    upload_file: Dict[str, Any],
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+) -> Dict[str, Optional[Any]]:
     file = upload_file.get("file")
     content = upload_file.get("content")
     data: Optional[bytes] = None
+    # a file to read chunk by chunk while uploading it, instead of loading it into memory
+    source: Optional[Union[str, os.PathLike, IOBase]] = None
+    length = 0
     if file is not None:
         if isinstance(file, (str, os.PathLike)):  # filepath
-            with open(os.fsencode(file), "rb") as readable:
-                data = readable.read()
+            source = file
+            length = os.path.getsize(os.fsencode(file))
         elif isinstance(file, bytes):
             data = file
         elif isinstance(file, IOBase):
-            data = file.read()
-            if isinstance(data, str):
-                data = data.encode()
+            if not isinstance(file, TextIOBase) and file.seekable():
+                source = file
+                start = file.tell()
+                length = file.seek(0, os.SEEK_END) - start
+                file.seek(start)
+            else:
+                data = file.read()
+                if isinstance(data, str):
+                    data = data.encode()
         else:
             raise SlackRequestError("file parameter must be any of filepath, bytes, and io.IOBase")
     elif content is not None:
@@ -365,8 +637,16 @@ def _to_v2_file_upload_item(upload_file: Dict[str, Any]) -> Dict[str, Optional[A
         else:
             filename = "Uploaded file"
 
+    body: Optional[Union[bytes, _FileUploadBody]] = data
+    if source is not None:
+        body = _FileUploadBody(source=source, length=length, filename=filename, progress_callback=progress_callback)
+    elif data is not None:
+        length = len(data)
+        if progress_callback is not None:
+            body = _FileUploadBody(source=data, length=length, filename=filename, progress_callback=progress_callback)
+
     title = upload_file.get("title")
-    if data is None:
+    if body is None:
         raise SlackRequestError(f"File content not found for filename: {filename}, title: {title}")
 
     if title is None:
@@ -374,8 +654,8 @@ def _to_v2_file_upload_item(upload_file: Dict[str, Any]) -> Dict[str, Optional[A
 
     return {
         "filename": filename,
-        "data": data,
-        "length": len(data),
+        "data": body,
+        "length": length,
         "title": title,
         "alt_txt": upload_file.get("alt_txt"),
         "highlight_type": upload_file.get("highlight_type"),
@@ -385,52 +665,55 @@ def _to_v2_file_upload_item(upload_file: Dict[str, Any]) -> Dict[str, Optional[A
 
 def _upload_file_via_v2_url(
     url: str,
-    data: bytes,
+    data: Union[bytes, _FileUploadBody],
     timeout: int,
     logger: logging.Logger,
     proxy: Optional[str] = None,
     ssl: Optional[SSLContext] = None,
+    transport: Optional[HttpTransport] = None,
+    recorder: Optional[_RequestRecorder] = None,
 ) -> Dict[str, Any]:
-    opener: Optional[OpenerDirector] = None
-    if proxy is not None:
-        if isinstance(proxy, str):
-            opener = urllib.request.build_opener(
-                ProxyHandler({"http": proxy, "https": proxy}),
-                HTTPSHandler(context=ssl),
-            )
-        else:
-            raise SlackRequestError(f"Invalid proxy detected: {proxy} must be a str value")
+    if proxy is not None and not isinstance(proxy, str):
+        raise SlackRequestError(f"Invalid proxy detected: {proxy} must be a str value")
 
     if logger.level <= logging.DEBUG:
         logger.debug(f"Sending a request: POST {url}")
 
-    resp: Optional[HTTPResponse] = None
-    req: Request = Request(method="POST", url=url, data=data, headers={})
-    if opener:
-        resp = opener.open(req, timeout=timeout)
-    else:
-        resp = urlopen(req, context=ssl, timeout=timeout)
+    headers: Dict[str, str] = {}
+    if isinstance(data, _FileUploadBody):
+        # Without Content-Length, the chunks of the file would be sent with chunked transfer encoding
+        headers["Content-Length"] = str(data.length)
+    req: Request = Request(method="POST", url=url, data=data, headers=headers)
+    resp = _send_urllib_request(
+        transport if transport is not None else UrllibHttpTransport(),
+        req,
+        timeout=timeout,
+        ssl=ssl,
+        proxy=proxy,
+        recorder=recorder,
+    )
 
     charset = resp.headers.get_content_charset() or "utf-8"
-    # read the response body here
-    body: str = resp.read().decode(charset)
+    body: str = resp.body.decode(charset)
     if logger.level <= logging.DEBUG:
         message = (
             "Received the following response - "
-            f"status: {resp.status}, "
+            f"status: {resp.status_code}, "
             f"headers: {dict(resp.headers)}, "
             f"body: {body}"
         )
         logger.debug(message)
 
-    return {"status": resp.status, "headers": resp.headers, "body": body}
+    return {"status": resp.status_code, "headers": resp.headers, "body": body}
 
 
 def _validate_for_legacy_client(
-    response: Union["SlackResponse", Future],  # type: ignore[name-defined] # noqa: F821
+    response: Union["SlackResponse", "Future"],  # type: ignore[name-defined] # noqa: F821
 ) -> None:
     # Only LegacyWebClient can return this union type
-    if isinstance(response, Future):
+    # As a Future can exist only when asyncio is already imported, this check does not import asyncio
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None and isinstance(response, asyncio.Future):
         message = (
             "Sorry! This SDK does not support run_async=True option for this API calls. "
             "Please migrate to AsyncWebClient, which is a new and stable way to go."
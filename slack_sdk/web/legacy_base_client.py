@@ -36,6 +36,8 @@ from .internal_utils import (
     _build_req_args,
     _build_unexpected_body_error_message,
     _upload_file_via_v2_url,
+    _validate_for_legacy_client,
+    _FileUploadBody,
 )
 from .legacy_slack_response import LegacySlackResponse as SlackResponse
 from ..proxy_env_variable_loader import load_http_proxy_from_env
@@ -531,11 +533,41 @@ class LegacyBaseClient:
             headers.pop("Content-Type", None)
         return headers
 
+    def _upload_files_v2(self, *, files: List[Dict[str, Any]], token: Optional[str], max_concurrency: int) -> None:
+        # This legacy client processes the files one by one regardless of max_concurrency
+        for f in files:
+            url_response = self.files_getUploadURLExternal(  # type: ignore[attr-defined]
+                filename=f.get("filename"),
+                length=f.get("length"),
+                alt_txt=f.get("alt_txt"),
+                snippet_type=f.get("snippet_type"),
+                token=token,
+            )
+            _validate_for_legacy_client(url_response)
+            f["file_id"] = url_response.get("file_id")
+            f["upload_url"] = url_response.get("upload_url")
+
+            upload_result = self._upload_file(
+                url=f["upload_url"],
+                data=f["data"],
+                logger=self._logger,
+                timeout=self.timeout,
+                proxy=self.proxy,
+                ssl=self.ssl,
+            )
+            if upload_result.status != 200:
+                message = (
+                    "Failed to upload a file "
+                    f"(status: {upload_result.status}, body: {upload_result.body}, "
+                    f"filename: {f.get('filename')}, title: {f.get('title')})"
+                )
+                raise SlackRequestError(message)
+
     def _upload_file(
         self,
         *,
         url: str,
-        data: bytes,
+        data: Union[bytes, _FileUploadBody],
         logger: logging.Logger,
         timeout: int,
         proxy: Optional[str],
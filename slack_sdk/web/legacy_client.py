@@ -16,7 +16,7 @@ import json
 import os
 import warnings
 from io import IOBase
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import slack_sdk.errors as e
 from slack_sdk.models.messages.chunk import Chunk
@@ -30,9 +30,9 @@ from .internal_utils import (
     _parse_web_class_objects,
     _print_files_upload_v2_suggestion,
     _remove_none_values,
+    _serialize_progress_callback,
     _to_v2_file_upload_item,
     _update_call_participants,
-    _validate_for_legacy_client,
     _warn_if_message_text_content_is_missing,
 )
 
@@ -3972,6 +3972,8 @@ class LegacyWebClient(LegacyBaseClient):
         initial_comment: Optional[str] = None,
         thread_ts: Optional[str] = None,
         request_file_info: bool = True,  # since v3.23, this flag is no longer necessary
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        max_concurrency: int = 5,
         **kwargs,
     ) -> Union[Future, SlackResponse]:
         """This wrapper method provides an easy way to upload files using the following endpoints:
@@ -3983,6 +3985,15 @@ class LegacyWebClient(LegacyBaseClient):
         - step3: https://docs.slack.dev/reference/methods/files.completeUploadExternal
             and https://docs.slack.dev/reference/methods/files.info
 
+        Files given as file paths or seekable binary file objects are read and sent chunk by chunk,
+        so that uploading a large file does not load the whole file into memory.
+        To track the uploads, pass `progress_callback`, which receives the filename,
+        the number of bytes sent so far, and the total number of bytes of each file.
+        When multiple files are uploaded at the same time, the calls for the files are interleaved,
+        but they never run concurrently.
+
+        When uploading multiple files, up to `max_concurrency` files go through step1 and step2 at the same time.
+        A failed step of a file is retried on its own by the client's retry handlers.
         """
         if file is None and content is None and file_uploads is None:
             raise e.SlackRequestError("Any of file, content, and file_uploads must be specified.")
@@ -3995,11 +4006,12 @@ class LegacyWebClient(LegacyBaseClient):
         if filetype is not None:
             warnings.warn("The filetype parameter is no longer supported. Please remove it from the arguments.")
 
-        # step1: files.getUploadURLExternal per file
+        # The files can be uploaded at the same time, and each of them reports its progress
+        progress_callback = _serialize_progress_callback(progress_callback)
         files: List[Dict[str, Any]] = []
         if file_uploads is not None:
             for f in file_uploads:
-                files.append(_to_v2_file_upload_item(f))
+                files.append(_to_v2_file_upload_item(f, progress_callback))
         else:
             f = _to_v2_file_upload_item(
                 {
@@ -4010,40 +4022,14 @@ class LegacyWebClient(LegacyBaseClient):
                     "alt_txt": alt_txt,
                     "highlight_type": highlight_type,
                     "snippet_type": snippet_type,
-                }
+                },
+                progress_callback,
             )
             files.append(f)
 
-        for f in files:
-            url_response = self.files_getUploadURLExternal(
-                filename=f.get("filename"),  # type: ignore[arg-type]
-                length=f.get("length"),  # type: ignore[arg-type]
-                alt_txt=f.get("alt_txt"),
-                snippet_type=f.get("snippet_type"),
-                token=kwargs.get("token"),
-            )
-            _validate_for_legacy_client(url_response)
-            f["file_id"] = url_response.get("file_id")  # type: ignore[union-attr, unused-ignore]
-            f["upload_url"] = url_response.get("upload_url")  # type: ignore[union-attr, unused-ignore]
-
-        # step2: "https://files.slack.com/upload/v1/..." per file
-        for f in files:
-            upload_result = self._upload_file(
-                url=f["upload_url"],
-                data=f["data"],
-                logger=self._logger,
-                timeout=self.timeout,
-                proxy=self.proxy,
-                ssl=self.ssl,
-            )
-            if upload_result.status != 200:
-                status = upload_result.status
-                body = upload_result.body
-                message = (
-                    "Failed to upload a file "
-                    f"(status: {status}, body: {body}, filename: {f.get('filename')}, title: {f.get('title')})"
-                )
-                raise e.SlackRequestError(message)
+        # step1 and step2 per file: files.getUploadURLExternal and then "https://files.slack.com/upload/v1/..."
+        # Up to max_concurrency files are processed at the same time
+        self._upload_files_v2(files=files, token=kwargs.get("token"), max_concurrency=max_concurrency)
 
         # step3: files.completeUploadExternal with all the sets of (file_id + title)
         completion = self.files_completeUploadExternal(
@@ -0,0 +1,15 @@
+"""Pagination checkpoints, which let long-running paginations (e.g., exporting a channel's history)
+resume from where they stopped instead of fetching all the pages again.
+"""
+
+from .checkpoint import PaginationCheckpoint
+from .checkpoint_store import PaginationCheckpointStore
+from .async_checkpoint_store import AsyncPaginationCheckpointStore
+from .file import FilePaginationCheckpointStore
+
+__all__ = [
+    "PaginationCheckpoint",
+    "PaginationCheckpointStore",
+    "AsyncPaginationCheckpointStore",
+    "FilePaginationCheckpointStore",
+]
@@ -0,0 +1,19 @@
+from logging import Logger
+from typing import Optional
+
+from .checkpoint import PaginationCheckpoint
+
+
+class AsyncPaginationCheckpointStore:
+    @property
+    def logger(self) -> Logger:
+        raise NotImplementedError()
+
+    async def async_save(self, key: str, checkpoint: PaginationCheckpoint) -> None:
+        raise NotImplementedError()
+
+    async def async_find(self, key: str) -> Optional[PaginationCheckpoint]:
+        raise NotImplementedError()
+
+    async def async_delete(self, key: str) -> None:
+        raise NotImplementedError()
@@ -0,0 +1,68 @@
+from typing import Any, Dict, Optional
+
+
+class PaginationCheckpoint:
+    """A serializable position in a cursor-based pagination.
+
+    A checkpoint consists of the API method and its parameters, the cursor of the page,
+    and the number of the items already processed in the page. As the cursor is the one used to fetch the page,
+    resuming from a checkpoint sends the same request again and skips the first `offset` items in the page.
+    """
+
+    api_method: str
+    params: Dict[str, Any]
+    cursor: Optional[str]
+    offset: int
+    num_items: int
+    item_key: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        api_method: str,
+        params: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        num_items: int = 0,
+        item_key: Optional[str] = None,
+    ):
+        """A position in a cursor-based pagination.
+
+        Args:
+            api_method: The API method name (e.g., "conversations.history")
+            params: The parameters for the API method except the cursor and the token
+            cursor: The cursor used to fetch the page (None for the first page)
+            offset: The number of the items already processed in the page
+            num_items: The total number of the items processed so far
+            item_key: The key of the items in the response data (e.g., "messages")
+        """
+        self.api_method = api_method
+        self.params = params or {}
+        self.cursor = cursor
+        self.offset = offset
+        self.num_items = num_items
+        self.item_key = item_key
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "api_method": self.api_method,
+            "params": self.params,
+            "cursor": self.cursor,
+            "offset": self.offset,
+            "num_items": self.num_items,
+            "item_key": self.item_key,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PaginationCheckpoint":
+        return PaginationCheckpoint(
+            api_method=d["api_method"],
+            params=d.get("params"),
+            cursor=d.get("cursor"),
+            offset=d.get("offset", 0),
+            num_items=d.get("num_items", 0),
+            item_key=d.get("item_key"),
+        )
+
+    def __repr__(self):
+        return f"<slack_sdk.web.pagination_checkpoint.{self.__class__.__name__}: {self.to_dict()}>"
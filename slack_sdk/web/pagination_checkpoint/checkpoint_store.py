@@ -0,0 +1,26 @@
+from logging import Logger
+from typing import Optional
+
+from .checkpoint import PaginationCheckpoint
+
+
+class PaginationCheckpointStore:
+    """Pagination checkpoint store, which persists the positions of long-running paginations.
+
+    When a `Paginator` is given a store and a key, it restores the checkpoint saved under the key
+    before sending the first request, saves a new one each time it starts yielding the items in a page,
+    and deletes it once all the pages are processed.
+    """
+
+    @property
+    def logger(self) -> Logger:
+        raise NotImplementedError()
+
+    def save(self, key: str, checkpoint: PaginationCheckpoint) -> None:
+        raise NotImplementedError()
+
+    def find(self, key: str) -> Optional[PaginationCheckpoint]:
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError()
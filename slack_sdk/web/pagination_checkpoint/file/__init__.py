@@ -0,0 +1,73 @@
+import json
+import logging
+import os
+from logging import Logger
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import quote
+
+from ..async_checkpoint_store import AsyncPaginationCheckpointStore
+from ..checkpoint import PaginationCheckpoint
+from ..checkpoint_store import PaginationCheckpointStore
+
+
+class FilePaginationCheckpointStore(PaginationCheckpointStore, AsyncPaginationCheckpointStore):
+    """Pagination checkpoint store that saves each checkpoint as a JSON file in the base directory.
+    As a checkpoint is written to a temporary file and then renamed, a crash while saving never corrupts it.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_dir: str = str(Path.home()) + "/.slack-sdk-pagination-checkpoints",
+        logger: Logger = logging.getLogger(__name__),
+    ):
+        self.base_dir = base_dir
+        self._logger = logger
+
+    @property
+    def logger(self) -> Logger:
+        if self._logger is None:
+            self._logger = logging.getLogger(__name__)
+        return self._logger
+
+    async def async_save(self, key: str, checkpoint: PaginationCheckpoint) -> None:
+        return self.save(key, checkpoint)
+
+    async def async_find(self, key: str) -> Optional[PaginationCheckpoint]:
+        return self.find(key)
+
+    async def async_delete(self, key: str) -> None:
+        return self.delete(key)
+
+    def save(self, key: str, checkpoint: PaginationCheckpoint) -> None:
+        self._mkdir(self.base_dir)
+        filepath = self._filepath(key)
+        with open(f"{filepath}.tmp", "w") as f:
+            f.write(json.dumps(checkpoint.to_dict()))
+        os.replace(f"{filepath}.tmp", filepath)
+
+    def find(self, key: str) -> Optional[PaginationCheckpoint]:
+        filepath = self._filepath(key)
+        try:
+            with open(filepath) as f:
+                return PaginationCheckpoint.from_dict(json.loads(f.read()))
+        except FileNotFoundError as e:
+            message = f"Failed to find a pagination checkpoint for key: {key} - {e}"
+            self.logger.debug(message)
+            return None
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._filepath(key))
+        except FileNotFoundError:
+            pass
+
+    def _filepath(self, key: str) -> str:
+        return f"{self.base_dir}/{quote(key, safe='')}.json"
+
+    @staticmethod
+    def _mkdir(path: Union[str, Path]):
+        if isinstance(path, str):
+            path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
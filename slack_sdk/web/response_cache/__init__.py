@@ -0,0 +1,17 @@
+"""Read-through cache of Web API responses, which serves repeated calls to idempotent API methods
+(e.g., users.info, conversations.info) without sending HTTP requests.
+"""
+
+from .response_cache import ResponseCache, DEFAULT_METHOD_TTLS, DEFAULT_INVALIDATION_RULES
+from .backend import ResponseCacheBackend
+from .async_backend import AsyncResponseCacheBackend
+from .memory import InMemoryResponseCacheBackend
+
+__all__ = [
+    "ResponseCache",
+    "DEFAULT_METHOD_TTLS",
+    "DEFAULT_INVALIDATION_RULES",
+    "ResponseCacheBackend",
+    "AsyncResponseCacheBackend",
+    "InMemoryResponseCacheBackend",
+]
@@ -0,0 +1,20 @@
+from logging import Logger
+from typing import Optional
+
+
+class AsyncResponseCacheBackend:
+    @property
+    def logger(self) -> Logger:
+        raise NotImplementedError()
+
+    async def async_get(self, key: str) -> Optional[str]:
+        raise NotImplementedError()
+
+    async def async_set(self, key: str, value: str, ttl_seconds: float) -> None:
+        raise NotImplementedError()
+
+    async def async_delete(self, key: str) -> None:
+        raise NotImplementedError()
+
+    async def async_delete_by_prefix(self, prefix: str) -> None:
+        raise NotImplementedError()
@@ -0,0 +1,26 @@
+from logging import Logger
+from typing import Optional
+
+
+class ResponseCacheBackend:
+    """The storage of `ResponseCache`, which holds serialized API responses until their TTLs expire.
+
+    Implement this interface to share the cached responses among processes
+    using an external data store such as Redis or Memcached.
+    """
+
+    @property
+    def logger(self) -> Logger:
+        raise NotImplementedError()
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError()
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError()
+
+    def delete_by_prefix(self, prefix: str) -> None:
+        raise NotImplementedError()
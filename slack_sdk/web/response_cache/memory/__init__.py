@@ -0,0 +1,71 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from logging import Logger
+from typing import Optional, Tuple
+
+from ..async_backend import AsyncResponseCacheBackend
+from ..backend import ResponseCacheBackend
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend, AsyncResponseCacheBackend):
+    """Response cache backend that works within a single process.
+    When the number of the entries exceeds max_size, the least recently used ones are evicted.
+    A single instance can be safely shared among multiple clients and threads.
+    """
+
+    def __init__(self, *, max_size: int = 10000, logger: Logger = logging.getLogger(__name__)):
+        self.max_size = max_size
+        self._logger = logger
+        # key -> (expiration time, value)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def logger(self) -> Logger:
+        if self._logger is None:
+            self._logger = logging.getLogger(__name__)
+        return self._logger
+
+    async def async_get(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def async_set(self, key: str, value: str, ttl_seconds: float) -> None:
+        return self.set(key, value, ttl_seconds)
+
+    async def async_delete(self, key: str) -> None:
+        return self.delete(key)
+
+    async def async_delete_by_prefix(self, prefix: str) -> None:
+        return self.delete_by_prefix(prefix)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_by_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,196 @@
+import json
+import logging
+from logging import Logger
+from typing import Any, Dict, List, Optional, Union
+
+from ..internal_utils import _build_api_call_key
+from .async_backend import AsyncResponseCacheBackend
+from .backend import ResponseCacheBackend
+from .memory import InMemoryResponseCacheBackend
+
+# API method name -> TTL in seconds
+DEFAULT_METHOD_TTLS: Dict[str, float] = {
+    "bots.info": 3600,
+    "conversations.info": 60,
+    "emoji.list": 3600,
+    "team.info": 3600,
+    "users.info": 300,
+}
+
+# API method name -> the cached API methods that a successful call to the method makes stale
+DEFAULT_INVALIDATION_RULES: Dict[str, List[str]] = {
+    "admin.emoji.add": ["emoji.list"],
+    "admin.emoji.addAlias": ["emoji.list"],
+    "admin.emoji.remove": ["emoji.list"],
+    "admin.emoji.rename": ["emoji.list"],
+    "conversations.archive": ["conversations.info"],
+    "conversations.rename": ["conversations.info"],
+    "conversations.setPurpose": ["conversations.info"],
+    "conversations.setTopic": ["conversations.info"],
+    "conversations.unarchive": ["conversations.info"],
+    "users.profile.set": ["users.info"],
+}
+
+
+class ResponseCache:
+    """An opt-in read-through cache of Web API responses.
+
+    Only the successful responses from the API methods in `method_ttls` are cached.
+    A cache hit is served without sending any HTTP request. The cache keys consist of the API method name,
+    a hash of the token, and a hash of the parameters, so that the responses are never shared among workspaces.
+
+        from slack_sdk import WebClient
+        from slack_sdk.web.response_cache import ResponseCache
+
+        cache = ResponseCache(method_ttls={"users.info": 600, "conversations.info": 60})
+        client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], response_cache=cache)
+        client.users_info(user="U111")  # sends a request
+        client.users_info(user="U111")  # served from the cache
+        cache.invalidate(api_method="users.info", token=client.token, params={"user": "U111"})
+    """
+
+    method_ttls: Dict[str, float]
+    invalidation_rules: Dict[str, List[str]]
+    backend: Union[ResponseCacheBackend, AsyncResponseCacheBackend]
+    logger: Logger
+
+    def __init__(
+        self,
+        *,
+        method_ttls: Optional[Dict[str, float]] = None,
+        invalidation_rules: Optional[Dict[str, List[str]]] = None,
+        backend: Optional[Union[ResponseCacheBackend, AsyncResponseCacheBackend]] = None,
+        max_size: int = 10000,
+        logger: Optional[Logger] = None,
+    ):
+        """A read-through cache of Web API responses.
+
+        Args:
+            method_ttls: The TTLs (in seconds) of the cacheable API methods (default: `DEFAULT_METHOD_TTLS`)
+            invalidation_rules: The API methods whose successful calls invalidate the cached responses
+                of other API methods (default: `DEFAULT_INVALIDATION_RULES`)
+            backend: The storage of the cached responses (default: `InMemoryResponseCacheBackend`).
+                `AsyncWebClient` requires an `AsyncResponseCacheBackend`.
+            max_size: The maximum number of the cached responses in the default in-memory backend
+            logger: Custom logger
+        """
+        self.method_ttls = method_ttls if method_ttls is not None else dict(DEFAULT_METHOD_TTLS)
+        self.invalidation_rules = invalidation_rules if invalidation_rules is not None else dict(DEFAULT_INVALIDATION_RULES)
+        self.backend = backend if backend is not None else InMemoryResponseCacheBackend(max_size=max_size)
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self._backend: Any = self.backend
+
+    def is_cacheable(self, api_method: str) -> bool:
+        return api_method in self.method_ttls
+
+    def build_key(self, *, api_method: str, token: Optional[str], params: Optional[Dict[str, Any]] = None) -> str:
+        return _build_api_call_key(api_method=api_method, token=token, params=params)
+
+    # -------------------------
+
+    def find(self, *, api_method: str, token: Optional[str], params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Returns the cached response (a dict with "data", "headers", and "status_code") if it exists."""
+        if not self.is_cacheable(api_method):
+            return None
+        value = self._backend.get(self.build_key(api_method=api_method, token=token, params=params))
+        return self._to_response(api_method, value)
+
+    def save(
+        self,
+        *,
+        api_method: str,
+        token: Optional[str],
+        params: Dict[str, Any],
+        data: Any,
+        headers: Dict[str, Any],
+        status_code: int,
+    ) -> None:
+        """Caches the response if the API method is cacheable and the response is successful.
+        Also, invalidates the cached responses that the API call makes stale.
+        """
+        if self.is_cacheable(api_method):
+            if status_code == 200 and isinstance(data, dict) and data.get("ok", False):
+                key = self.build_key(api_method=api_method, token=token, params=params)
+                value = json.dumps({"data": data, "headers": dict(headers), "status_code": status_code})
+                self._backend.set(key, value, self.method_ttls[api_method])
+        elif api_method in self.invalidation_rules and isinstance(data, dict) and data.get("ok", False):
+            for stale_method in self.invalidation_rules[api_method]:
+                self.invalidate(api_method=stale_method)
+
+    def invalidate(
+        self,
+        *,
+        api_method: Optional[str] = None,
+        token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Deletes the cached responses.
+
+        Args:
+            api_method: The API method name. If absent, all the cached responses are deleted.
+            token: The token used for the API call. If absent, the responses for all the tokens are deleted.
+            params: The parameters of the API call. If absent, the responses for all the parameters are deleted.
+        """
+        if api_method is not None and token is not None and params is not None:
+            self._backend.delete(self.build_key(api_method=api_method, token=token, params=params))
+        else:
+            self._backend.delete_by_prefix(self._build_prefix(api_method, token))
+
+    # -------------------------
+
+    async def async_find(self, *, api_method: str, token: Optional[str], params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not self.is_cacheable(api_method):
+            return None
+        value = await self._backend.async_get(self.build_key(api_method=api_method, token=token, params=params))
+        return self._to_response(api_method, value)
+
+    async def async_save(
+        self,
+        *,
+        api_method: str,
+        token: Optional[str],
+        params: Dict[str, Any],
+        data: Any,
+        headers: Dict[str, Any],
+        status_code: int,
+    ) -> None:
+        if self.is_cacheable(api_method):
+            if status_code == 200 and isinstance(data, dict) and data.get("ok", False):
+                key = self.build_key(api_method=api_method, token=token, params=params)
+                value = json.dumps({"data": data, "headers": dict(headers), "status_code": status_code})
+                await self._backend.async_set(key, value, self.method_ttls[api_method])
+        elif api_method in self.invalidation_rules and isinstance(data, dict) and data.get("ok", False):
+            for stale_method in self.invalidation_rules[api_method]:
+                await self.async_invalidate(api_method=stale_method)
+
+    async def async_invalidate(
+        self,
+        *,
+        api_method: Optional[str] = None,
+        token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if api_method is not None and token is not None and params is not None:
+            await self._backend.async_delete(self.build_key(api_method=api_method, token=token, params=params))
+        else:
+            await self._backend.async_delete_by_prefix(self._build_prefix(api_method, token))
+
+    # -------------------------
+
+    @staticmethod
+    def _build_prefix(api_method: Optional[str], token: Optional[str]) -> str:
+        if api_method is None:
+            return ""
+        if token is None:
+            return f"{api_method}:"
+        # "{api_method}:{token hash}:"
+        return _build_api_call_key(api_method=api_method, token=token).rsplit(":", 1)[0] + ":"
+
+    def _to_response(self, api_method: str, value: Optional[str]) -> Optional[Dict[str, Any]]:
+        if value is None:
+            if self.logger.level <= logging.DEBUG:
+                self.logger.debug(f"Response cache miss: {api_method}")
+            return None
+        if self.logger.level <= logging.DEBUG:
+            self.logger.debug(f"Response cache hit: {api_method}")
+        return json.loads(value)
@@ -0,0 +1,100 @@
+"""De-duplication of identical concurrent API calls."""
+
+import logging
+import threading
+from logging import Logger
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# The read-only API methods whose identical concurrent calls are coalesced by default
+DEFAULT_SINGLE_FLIGHT_METHODS = frozenset(
+    [
+        "auth.test",
+        "bots.info",
+        "conversations.info",
+        "emoji.list",
+        "team.info",
+        "usergroups.list",
+        "users.info",
+        "users.lookupByEmail",
+        "users.profile.get",
+    ]
+)
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent API calls so that only one HTTP request is sent.
+
+    While an API call is in flight, the identical calls (the same API method, token, and parameters)
+    made from other threads wait for it and receive the same `SlackResponse` (or the same exception)
+    instead of sending their own requests.
+
+    As the `SlackResponse` is shared among the coalesced calls, it must be treated as read-only.
+    Modifying its `data` or `headers` affects the other callers. Copy the data before modifying it.
+
+        from slack_sdk import WebClient
+        from slack_sdk.web.single_flight import SingleFlight
+
+        client = WebClient(token=os.environ["SLACK_BOT_TOKEN"], single_flight=SingleFlight())
+    """
+
+    methods: Iterable[str]
+    logger: Logger
+
+    def __init__(self, *, methods: Optional[Iterable[str]] = None, logger: Optional[Logger] = None):
+        """Coalesces identical concurrent API calls.
+
+        Args:
+            methods: The API methods to coalesce (default: `DEFAULT_SINGLE_FLIGHT_METHODS`).
+                Only read-only API methods should be given.
+            logger: Custom logger
+        """
+        self.methods = frozenset(methods) if methods is not None else DEFAULT_SINGLE_FLIGHT_METHODS
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._lock = threading.Lock()
+
+    def is_coalescable(self, api_method: str) -> bool:
+        return api_method in self.methods
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """Runs the function unless the one with the same key is running. Otherwise, waits for its result.
+
+        Args:
+            key: The key of the API call (built by `_build_api_call_key()`)
+            func: The function that performs the API call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+        if not leader:
+            if self.logger.level <= logging.DEBUG:
+                self.logger.debug(f"Waiting for the identical in-flight API call ({key})")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def num_in_flight_calls(self) -> int:
+        return len(self._calls)
@@ -1,13 +1,18 @@
 """A Python module for interacting and consuming responses from Slack."""
 
 import logging
+import threading
 from typing import Any, Optional, TypeVar, Union, overload
 
 import slack_sdk.errors as e
-from .internal_utils import _next_cursor_is_present
+from slack_sdk.json_codec import get_json_codec
+from .internal_utils import _next_cursor_is_present, _build_unexpected_body_error_message
 
 T = TypeVar("T")
 
+# Serializes the lazy decoding of the responses shared among threads (e.g., by SingleFlight)
+_decode_lock = threading.Lock()
+
 
 class SlackResponse:
     """An iterable container of response data.
@@ -60,9 +65,10 @@ class SlackResponse:
         http_verb: str,
         api_url: str,
         req_args: dict,
-        data: Union[dict, bytes],  # data can be binary data
+        data: Optional[Union[dict, bytes]],  # data can be binary data
         headers: dict,
         status_code: int,
+        raw_body: Optional[bytes] = None,  # UTF-8 JSON data, which is decoded when data is accessed for the first time
     ):
         self.http_verb = http_verb
         self.api_url = api_url
@@ -71,10 +77,41 @@ class SlackResponse:
         self.headers = headers
         self.status_code = status_code
         self._initial_data = data
+        self._raw_body = raw_body if data is None else None
         self._iteration = None  # for __iter__ & __next__
         self._client = client
         self._logger = logging.getLogger(__name__)
 
+    @property
+    def data(self) -> Optional[Union[dict, bytes]]:
+        if self._raw_body is not None:
+            self._decode_raw_body()
+        return self._data
+
+    @data.setter
+    def data(self, data: Optional[Union[dict, bytes]]) -> None:
+        self._data = data
+        self._raw_body = None
+
+    def _decode_raw_body(self) -> None:
+        if self._raw_body is None:
+            return
+        with _decode_lock:
+            raw_body = self._raw_body
+            if raw_body is None:
+                # Another thread has already decoded it
+                return
+            try:
+                data = get_json_codec().loads(raw_body)
+            except ValueError:
+                message = _build_unexpected_body_error_message(raw_body.decode("utf-8", "replace"))
+                self._logger.error(f"Failed to decode Slack API response: {message}")
+                data = {"ok": False, "error": message}
+            self._data = data
+            self._initial_data = data
+            # Clear the raw body last, as the other threads read _data without the lock once it is None
+            self._raw_body = None
+
     def __str__(self):
         """Return the Response data if object is converted to a string."""
         if isinstance(self.data, bytes):
@@ -112,6 +149,7 @@ class SlackResponse:
             (SlackResponse) self
         """
         self._iteration = 0
+        self._decode_raw_body()
         self.data = self._initial_data
         return self
 
@@ -189,6 +227,15 @@ class SlackResponse:
         Raises:
             SlackApiError: The request to the Slack API failed.
         """
+        raw_body = self._raw_body
+        if (
+            self.status_code == 200
+            and raw_body is not None
+            and raw_body.startswith(b'{"ok":true')
+            and raw_body.endswith(b"}")
+        ):
+            # Slack API responses start with the "ok" property, so a full parse is unnecessary here
+            return self
         if self.status_code == 200 and self.data and (isinstance(self.data, bytes) or self.data.get("ok", False)):
             return self
         msg = f"The request to the Slack API failed. (url: {self.api_url})"
@@ -1,11 +1,12 @@
-import json
 import logging
+import time
 from ssl import SSLContext
 from typing import Dict, Union, Optional, Any, Sequence, List
 
 import aiohttp
 from aiohttp import BasicAuth, ClientSession
 
+from slack_sdk.json_codec import get_json_codec
 from slack_sdk.models.attachments import Attachment
 from slack_sdk.models.blocks import Block
 from .internal_utils import (
@@ -17,6 +18,8 @@ from .internal_utils import (
 from .webhook_response import WebhookResponse
 from ..proxy_env_variable_loader import load_http_proxy_from_env
 
+from slack_sdk.http_metrics import HttpRequestObserver
+from slack_sdk.http_metrics.internal_utils import _RequestRecorder, _record_aiohttp_attempt
 from slack_sdk.http_retry.async_handler import AsyncRetryHandler
 from slack_sdk.http_retry.builtin_async_handlers import async_default_handlers
 from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
@@ -35,6 +38,7 @@ class AsyncWebhookClient:
     default_headers: Dict[str, str]
     logger: logging.Logger
     retry_handlers: List[AsyncRetryHandler]
+    request_observers: List[HttpRequestObserver]
 
     def __init__(
         self,
@@ -50,6 +54,7 @@ class AsyncWebhookClient:
         user_agent_suffix: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         retry_handlers: Optional[List[AsyncRetryHandler]] = None,
+        request_observers: Optional[List[HttpRequestObserver]] = None,
     ):
         """API client for Incoming Webhooks and `response_url`
 
@@ -67,6 +72,8 @@ class AsyncWebhookClient:
             user_agent_prefix: Prefix for User-Agent header value
             user_agent_suffix: Suffix for User-Agent header value
             logger: Custom logger
+            retry_handlers: Retry handlers
+            request_observers: `HttpRequestObserver`s to receive the timing and retry events of each request attempt
         """
         self.url = url
         self.timeout = timeout
@@ -79,6 +86,7 @@ class AsyncWebhookClient:
         self.default_headers["User-Agent"] = get_user_agent(user_agent_prefix, user_agent_suffix)
         self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.retry_handlers = retry_handlers if retry_handlers is not None else async_default_handlers()
+        self.request_observers = request_observers if request_observers is not None else []
 
         if self.proxy is None or len(self.proxy.strip()) == 0:
             env_variable = load_http_proxy_from_env(self.logger)
@@ -149,7 +157,7 @@ class AsyncWebhookClient:
         )
 
     async def _perform_http_request(self, *, body: Dict[str, Any], headers: Dict[str, str]) -> WebhookResponse:
-        str_body: str = json.dumps(body)
+        str_body: str = get_json_codec().dumps(body)
         headers["Content-Type"] = "application/json;charset=utf-8"
 
         session: Optional[ClientSession] = None
@@ -180,6 +188,14 @@ class AsyncWebhookClient:
             )
 
             retry_state = RetryState()
+            recorder = _RequestRecorder(
+                self.request_observers,
+                logger=self.logger,
+                client=type(self).__name__,
+                http_method="POST",
+                url=self.url,
+                retry_state=retry_state,
+            )
             counter_for_safety = 0
             while counter_for_safety < 100:
                 counter_for_safety += 1
@@ -191,8 +207,11 @@ class AsyncWebhookClient:
                 if self.logger.level <= logging.DEBUG:
                     self.logger.debug(f"Sending a request - url: {self.url}, body: {str_body}, headers: {headers}")
 
+                started = time.perf_counter()
+                attempt_recorded = False
                 try:
                     async with session.request("POST", self.url, **request_kwargs) as res:  # type: ignore[arg-type, union-attr] # noqa: E501
+                        time_to_headers = time.perf_counter() - started
                         try:
                             response_body = await res.text()
                             retry_response = RetryHttpResponse(
@@ -207,6 +226,13 @@ class AsyncWebhookClient:
                                 headers=res.headers,  # type: ignore[arg-type]
                             )
 
+                        await _record_aiohttp_attempt(
+                            recorder,
+                            started=started,
+                            time_to_headers=time_to_headers,
+                            response=res,
+                        )
+                        attempt_recorded = True
                         if res.status == 429:
                             for handler in self.retry_handlers:
                                 if await handler.can_retry_async(
@@ -219,11 +245,12 @@ class AsyncWebhookClient:
                                             f"A retry handler found: {type(handler).__name__} "
                                             f"for POST {self.url} - rate_limited"
                                         )
-                                    await handler.prepare_for_next_attempt_async(
-                                        state=retry_state,
-                                        request=retry_request,
-                                        response=retry_response,
-                                    )
+                                    with recorder.retry(handler):
+                                        await handler.prepare_for_next_attempt_async(
+                                            state=retry_state,
+                                            request=retry_request,
+                                            response=retry_response,
+                                        )
                                     break
 
                         if retry_state.next_attempt_requested is False:
@@ -238,6 +265,8 @@ class AsyncWebhookClient:
 
                 except Exception as e:
                     last_error = e
+                    if not attempt_recorded:
+                        recorder.attempt(started=started, error=e)
                     for handler in self.retry_handlers:
                         if await handler.can_retry_async(
                             state=retry_state,
@@ -249,12 +278,13 @@ class AsyncWebhookClient:
                                 self.logger.info(
                                     f"A retry handler found: {type(handler).__name__} " f"for POST {self.url} - {e}"
                                 )
-                            await handler.prepare_for_next_attempt_async(
-                                state=retry_state,
-                                request=retry_request,
-                                response=retry_response,
-                                error=e,
-                            )
+                            with recorder.retry(handler):
+                                await handler.prepare_for_next_attempt_async(
+                                    state=retry_state,
+                                    request=retry_request,
+                                    response=retry_response,
+                                    error=e,
+                                )
                             break
 
                     if retry_state.next_attempt_requested is False:
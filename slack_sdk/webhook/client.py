@@ -1,13 +1,11 @@
-import json
 import logging
-import urllib
-from http.client import HTTPResponse
 from ssl import SSLContext
 from typing import Dict, Union, Sequence, Optional, List, Any
 from urllib.error import HTTPError
-from urllib.request import Request, urlopen, OpenerDirector, ProxyHandler, HTTPSHandler
+from urllib.request import Request
 
 from slack_sdk.errors import SlackRequestError
+from slack_sdk.json_codec import get_json_codec
 from slack_sdk.models.attachments import Attachment
 from slack_sdk.models.blocks import Block
 from .internal_utils import (
@@ -22,6 +20,11 @@ from slack_sdk.http_retry.handler import RetryHandler
 from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
 from slack_sdk.http_retry.response import HttpResponse as RetryHttpResponse
 from slack_sdk.http_retry.state import RetryState
+from ..http_connection_pool import HttpConnectionPool
+from ..http_metrics import HttpRequestObserver
+from ..http_metrics.internal_utils import _RequestRecorder
+from ..http_transport import HttpTransport, UrllibHttpTransport
+from ..http_transport.internal_utils import _send_urllib_request
 from ..proxy_env_variable_loader import load_http_proxy_from_env
 
 
@@ -33,6 +36,9 @@ class WebhookClient:
     default_headers: Dict[str, str]
     logger: logging.Logger
     retry_handlers: List[RetryHandler]
+    connection_pool: Optional[HttpConnectionPool]
+    transport: HttpTransport
+    request_observers: List[HttpRequestObserver]
 
     def __init__(
         self,
@@ -45,6 +51,9 @@ class WebhookClient:
         user_agent_suffix: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         retry_handlers: Optional[List[RetryHandler]] = None,
+        connection_pool: Optional[HttpConnectionPool] = None,
+        transport: Optional[HttpTransport] = None,
+        request_observers: Optional[List[HttpRequestObserver]] = None,
     ):
         """API client for Incoming Webhooks and `response_url`
 
@@ -60,6 +69,9 @@ class WebhookClient:
             user_agent_suffix: Suffix for User-Agent header value
             logger: Custom logger
             retry_handlers: Retry handlers
+            connection_pool: `HttpConnectionPool` to reuse keep-alive connections (shareable among clients)
+            transport: `HttpTransport` to send HTTP requests (default: `UrllibHttpTransport`)
+            request_observers: `HttpRequestObserver`s to receive the timing and retry events of each request attempt
         """
         self.url = url
         self.timeout = timeout
@@ -69,6 +81,9 @@ class WebhookClient:
         self.default_headers["User-Agent"] = get_user_agent(user_agent_prefix, user_agent_suffix)
         self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.retry_handlers = retry_handlers if retry_handlers is not None else default_retry_handlers()
+        self.connection_pool = connection_pool
+        self.transport = transport if transport is not None else UrllibHttpTransport(connection_pool=connection_pool)
+        self.request_observers = request_observers if request_observers is not None else []
 
         if self.proxy is None or len(self.proxy.strip()) == 0:
             env_variable = load_http_proxy_from_env(self.logger)
@@ -140,7 +155,7 @@ class WebhookClient:
         )
 
     def _perform_http_request(self, *, body: Dict[str, Any], headers: Dict[str, str]) -> WebhookResponse:
-        raw_body = json.dumps(body)
+        raw_body = get_json_codec().dumps(body)
         headers["Content-Type"] = "application/json;charset=utf-8"
 
         if self.logger.level <= logging.DEBUG:
@@ -154,6 +169,14 @@ class WebhookClient:
         last_error = Exception("undefined internal error")
 
         retry_state = RetryState()
+        recorder = _RequestRecorder(
+            self.request_observers,
+            logger=self.logger,
+            client=type(self).__name__,
+            http_method=req.get_method(),
+            url=url,
+            retry_state=retry_state,
+        )
         counter_for_safety = 0
         while counter_for_safety < 100:
             counter_for_safety += 1
@@ -161,7 +184,7 @@ class WebhookClient:
             retry_state.next_attempt_requested = False
 
             try:
-                resp = self._perform_http_request_internal(url, req)
+                resp = self._perform_http_request_internal(url, req, recorder=recorder)
                 # The resp is a 200 OK response
                 return resp
 
@@ -203,12 +226,13 @@ class WebhookClient:
                             self.logger.info(
                                 f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url} - {e}"
                             )
-                        handler.prepare_for_next_attempt(
-                            state=retry_state,
-                            request=retry_request,
-                            response=retry_response,
-                            error=e,
-                        )
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state,
+                                request=retry_request,
+                                response=retry_response,
+                                error=e,
+                            )
                         break
 
                 if retry_state.next_attempt_requested is False:
@@ -231,12 +255,13 @@ class WebhookClient:
                             self.logger.info(
                                 f"A retry handler found: {type(handler).__name__} for {req.method} {req.full_url} - {err}"
                             )
-                        handler.prepare_for_next_attempt(
-                            state=retry_state,
-                            request=retry_request,
-                            response=None,
-                            error=err,
-                        )
+                        with recorder.retry(handler):
+                            handler.prepare_for_next_attempt(
+                                state=retry_state,
+                                request=retry_request,
+                                response=None,
+                                error=err,
+                            )
                         self.logger.info(f"Going to retry the same request: {req.method} {req.full_url}")
                         break
 
@@ -247,31 +272,26 @@ class WebhookClient:
             return resp
         raise last_error
 
-    def _perform_http_request_internal(self, url: str, req: Request):
-        opener: Optional[OpenerDirector] = None
+    def _perform_http_request_internal(self, url: str, req: Request, recorder: Optional[_RequestRecorder] = None):
         # for security (BAN-B310)
-        if url.lower().startswith("http"):
-            if self.proxy is not None:
-                if isinstance(self.proxy, str):
-                    opener = urllib.request.build_opener(
-                        ProxyHandler({"http": self.proxy, "https": self.proxy}),
-                        HTTPSHandler(context=self.ssl),
-                    )
-                else:
-                    raise SlackRequestError(f"Invalid proxy detected: {self.proxy} must be a str value")
-        else:
+        if not url.lower().startswith("http"):
             raise SlackRequestError(f"Invalid URL detected: {url}")
+        if self.proxy is not None and not isinstance(self.proxy, str):
+            raise SlackRequestError(f"Invalid proxy detected: {self.proxy} must be a str value")
 
-        http_resp: Optional[HTTPResponse] = None
-        if opener:
-            http_resp = opener.open(req, timeout=self.timeout)
-        else:
-            http_resp = urlopen(req, context=self.ssl, timeout=self.timeout)
+        http_resp = _send_urllib_request(
+            self.transport,
+            req,
+            timeout=self.timeout,
+            ssl=self.ssl,
+            proxy=self.proxy,
+            recorder=recorder,
+        )
         charset: str = http_resp.headers.get_content_charset() or "utf-8"
-        response_body: str = http_resp.read().decode(charset)
+        response_body: str = http_resp.body.decode(charset)
         resp = WebhookResponse(
             url=url,
-            status_code=http_resp.status,
+            status_code=http_resp.status_code,
             body=response_body,
             headers=http_resp.headers,  # type: ignore[arg-type]
         )
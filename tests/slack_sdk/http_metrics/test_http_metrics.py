@@ -0,0 +1,145 @@
+import unittest
+from typing import List
+from urllib.error import URLError
+
+from slack_sdk import WebClient
+from slack_sdk.audit_logs import AuditLogsClient
+from slack_sdk.http_metrics import HttpAttemptEvent, HttpRequestObserver, HttpRetryEvent, PrometheusMetricsObserver
+from slack_sdk.http_retry import ConnectionErrorRetryHandler, RateLimitErrorRetryHandler
+from slack_sdk.http_retry.builtin_interval_calculators import FixedValueRetryIntervalCalculator
+from slack_sdk.http_transport import InMemoryHttpTransport, TransportRequest, TransportResponse
+from slack_sdk.webhook import WebhookClient
+
+
+class RecordingObserver(HttpRequestObserver):
+    def __init__(self):
+        self.attempts: List[HttpAttemptEvent] = []
+        self.retries: List[HttpRetryEvent] = []
+
+    def on_attempt(self, event: HttpAttemptEvent) -> None:
+        self.attempts.append(event)
+
+    def on_retry(self, event: HttpRetryEvent) -> None:
+        self.retries.append(event)
+
+
+class BrokenObserver(HttpRequestObserver):
+    def on_attempt(self, event: HttpAttemptEvent) -> None:
+        raise ValueError("broken")
+
+
+def flaky_transport(failures: int) -> InMemoryHttpTransport:
+    count = {"value": 0}
+
+    def handler(request: TransportRequest) -> TransportResponse:
+        count["value"] += 1
+        if count["value"] <= failures:
+            raise URLError("Connection reset by peer")
+        return TransportResponse(
+            status_code=200,
+            headers={"Content-Type": "application/json;charset=utf-8"},
+            body=b'{"ok":true}',
+        )
+
+    return InMemoryHttpTransport(handler)
+
+
+class TestHttpMetrics(unittest.TestCase):
+    def test_web_client(self):
+        observer = RecordingObserver()
+        client = WebClient(
+            token="xoxb-test",
+            transport=flaky_transport(failures=1),
+            retry_handlers=[ConnectionErrorRetryHandler(interval_calculator=FixedValueRetryIntervalCalculator(0.01))],
+            request_observers=[observer],
+        )
+        client.chat_postMessage(channel="C111", text="Hi there!")
+
+        self.assertEqual([(e.attempt, e.status_code) for e in observer.attempts], [(0, None), (1, 200)])
+        failed, succeeded = observer.attempts
+        self.assertEqual(failed.client, "WebClient")
+        self.assertEqual(failed.api_method, "chat.postMessage")
+        self.assertEqual(failed.http_method, "POST")
+        self.assertIsInstance(failed.error, URLError)
+        self.assertIsNone(failed.response_bytes)
+        self.assertGreater(succeeded.request_bytes, 0)
+        self.assertEqual(succeeded.response_bytes, len(b'{"ok":true}'))
+        self.assertGreaterEqual(succeeded.duration, 0)
+
+        self.assertEqual(len(observer.retries), 1)
+        retry = observer.retries[0]
+        self.assertEqual(retry.attempt, 0)
+        self.assertEqual(retry.retry_handler, "ConnectionErrorRetryHandler")
+        self.assertGreaterEqual(retry.sleep_duration, 0.01)
+
+    def test_rate_limited_webhook(self):
+        transport = InMemoryHttpTransport()
+        transport.add_response("/T111/B111/XXX", status_code=429, headers={"Retry-After": "0"}, body="rate_limited")
+        transport.add_response("/T111/B111/XXX", body="ok")
+        observer = RecordingObserver()
+        client = WebhookClient(
+            url="https://hooks.slack.com/services/T111/B111/XXX",
+            transport=transport,
+            retry_handlers=[RateLimitErrorRetryHandler()],
+            request_observers=[observer],
+        )
+        self.assertEqual(client.send(text="Hi there!").status_code, 200)
+
+        self.assertEqual([e.status_code for e in observer.attempts], [429, 200])
+        self.assertEqual([e.client for e in observer.attempts], ["WebhookClient", "WebhookClient"])
+        self.assertEqual([e.retry_handler for e in observer.retries], ["RateLimitErrorRetryHandler"])
+
+    def test_audit_logs_client(self):
+        transport = InMemoryHttpTransport()
+        transport.add_response("/audit/v1/schemas", body={"schemas": []})
+        observer = RecordingObserver()
+        client = AuditLogsClient(token="xoxp-test", transport=transport, request_observers=[observer])
+        client.schemas()
+
+        self.assertEqual(len(observer.attempts), 1)
+        self.assertEqual(observer.attempts[0].http_method, "GET")
+        self.assertEqual(observer.attempts[0].request_bytes, 0)
+
+    def test_observer_errors_are_ignored(self):
+        transport = InMemoryHttpTransport()
+        transport.add_response("auth.test", body={"ok": True})
+        client = WebClient(token="xoxb-test", transport=transport, request_observers=[BrokenObserver()])
+        self.assertTrue(client.auth_test()["ok"])
+
+
+class TestPrometheusMetricsObserver(unittest.TestCase):
+    def test_render(self):
+        metrics = PrometheusMetricsObserver(buckets=[0.1, 1.0])
+        client = WebClient(
+            token="xoxb-test",
+            transport=flaky_transport(failures=1),
+            retry_handlers=[ConnectionErrorRetryHandler(interval_calculator=FixedValueRetryIntervalCalculator(0))],
+            request_observers=[metrics],
+        )
+        client.auth_test()
+        client.auth_test()
+        text = metrics.render()
+
+        labels = 'client="WebClient",api_method="auth.test"'
+        self.assertIn(f'slack_sdk_http_request_duration_seconds_count{{{labels},status="200"}} 2\n', text)
+        self.assertIn(f'slack_sdk_http_request_duration_seconds_bucket{{{labels},status="200",le="+Inf"}} 2\n', text)
+        self.assertIn(f'slack_sdk_http_request_duration_seconds_count{{{labels},status="error"}} 1\n', text)
+        self.assertIn(f"slack_sdk_http_response_bytes_total{{{labels}}} 22\n", text)
+        self.assertIn(f'slack_sdk_http_retries_total{{{labels},retry_handler="ConnectionErrorRetryHandler"}} 1\n', text)
+        self.assertIn("# TYPE slack_sdk_http_retry_sleep_seconds histogram\n", text)
+
+    def test_buckets(self):
+        metrics = PrometheusMetricsObserver(buckets=[0.1, 1.0])
+        for duration in [0.05, 0.1, 0.5, 3.0]:
+            metrics.on_attempt(
+                HttpAttemptEvent(client="C", http_method="POST", url="https://x", attempt=0, duration=duration)
+            )
+        text = metrics.render()
+        name, labels = "slack_sdk_http_request_duration_seconds", 'client="C",api_method="",status="error"'
+        self.assertIn(f'{name}_bucket{{{labels},le="0.1"}} 2\n', text)
+        self.assertIn(f'{name}_bucket{{{labels},le="1.0"}} 3\n', text)
+        self.assertIn(f'{name}_bucket{{{labels},le="+Inf"}} 4\n', text)
+        self.assertIn(f"{name}_sum{{{labels}}} 3.65\n", text)
+
+    def test_empty(self):
+        self.assertEqual(PrometheusMetricsObserver().render(), "")
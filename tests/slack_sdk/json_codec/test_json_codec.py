@@ -0,0 +1,77 @@
+import json
+import unittest
+
+from slack_sdk import WebClient
+from slack_sdk.http_transport import InMemoryHttpTransport
+from slack_sdk.json_codec import JsonCodec, StdlibJsonCodec, detect_json_codec, get_json_codec, set_json_codec
+
+
+def available_codecs():
+    codecs = [StdlibJsonCodec()]
+    try:
+        from slack_sdk.json_codec.orjson import OrjsonJsonCodec
+
+        codecs.append(OrjsonJsonCodec())
+    except ImportError:
+        pass
+    try:
+        from slack_sdk.json_codec.msgspec import MsgspecJsonCodec
+
+        codecs.append(MsgspecJsonCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+class CountingJsonCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.num_loads = 0
+        self.loaded_types = []
+
+    def loads(self, data):
+        self.num_loads += 1
+        self.loaded_types.append(type(data))
+        return super().loads(data)
+
+
+class TestJsonCodec(unittest.TestCase):
+    def tearDown(self):
+        set_json_codec(None)
+
+    def test_codecs(self):
+        data = {"ok": True, "text": "こんにちは :wave:", "n": 123, "f": 1.5, "list": [None, False, {"a": "b"}]}
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.loads(codec.dumps(data)), data)
+                self.assertEqual(codec.loads(codec.dumps_bytes(data)), data)
+                self.assertEqual(codec.loads(json.dumps(data).encode("utf-8")), data)
+
+    def test_compatibility_with_stdlib(self):
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                # values that some fast libraries do not support
+                self.assertEqual(codec.loads(codec.dumps({"n": 2**70})), {"n": 2**70})
+                self.assertEqual(codec.loads(codec.dumps({1: "a"})), {"1": "a"})
+                with self.assertRaises(json.JSONDecodeError):
+                    codec.loads(b"<html></html>")
+                with self.assertRaises(TypeError):
+                    codec.dumps({"object": object()})
+
+    def test_get_and_set(self):
+        self.assertEqual(type(get_json_codec()), type(detect_json_codec()))
+        codec = StdlibJsonCodec()
+        set_json_codec(codec)
+        self.assertIs(get_json_codec(), codec)
+        set_json_codec(None)
+        self.assertIsInstance(get_json_codec(), JsonCodec)
+
+    def test_web_client_decodes_bytes(self):
+        codec = CountingJsonCodec()
+        set_json_codec(codec)
+        transport = InMemoryHttpTransport()
+        transport.add_response("auth.test", body={"ok": True, "user_id": "U111"})
+        response = WebClient(token="xoxb-test", transport=transport).auth_test()
+        self.assertEqual(response["user_id"], "U111")
+        # decoded only once, directly from the bytes
+        self.assertEqual(codec.num_loads, 1)
+        self.assertEqual(codec.loaded_types, [bytes])
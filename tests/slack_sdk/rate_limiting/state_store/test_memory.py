@@ -0,0 +1,25 @@
+import time
+import unittest
+
+from slack_sdk.rate_limiting.state_store import InMemoryRateLimitStateStore
+
+
+class TestInMemory(unittest.TestCase):
+    def test_block(self):
+        store = InMemoryRateLimitStateStore()
+        self.assertIsNone(store.find_blocked_until(workspace_key="W1", api_method="users.list"))
+
+        until = time.time() + 10
+        store.block(workspace_key="W1", api_method="users.list", until=until)
+        self.assertEqual(store.find_blocked_until(workspace_key="W1", api_method="users.list"), until)
+        self.assertIsNone(store.find_blocked_until(workspace_key="W1", api_method="users.info"))
+        self.assertIsNone(store.find_blocked_until(workspace_key="W2", api_method="users.list"))
+
+        # a shorter block does not overwrite the existing one
+        store.block(workspace_key="W1", api_method="users.list", until=until - 5)
+        self.assertEqual(store.find_blocked_until(workspace_key="W1", api_method="users.list"), until)
+
+    def test_expiration(self):
+        store = InMemoryRateLimitStateStore()
+        store.block(workspace_key="W1", api_method="users.list", until=time.time() - 1)
+        self.assertIsNone(store.find_blocked_until(workspace_key="W1", api_method="users.list"))
@@ -0,0 +1,37 @@
+import time
+import unittest
+
+from slack_sdk.rate_limiting.state_store.sqlite3 import SQLite3RateLimitStateStore
+
+
+class TestSQLite3(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLite3RateLimitStateStore(database="logs/rate_limit_states.db")
+        with self.store.connect() as conn:
+            conn.execute("delete from rate_limit_states;")
+            conn.commit()
+
+    def test_block(self):
+        store = self.store
+        self.assertIsNone(store.find_blocked_until(workspace_key="W1", api_method="users.list"))
+
+        until = time.time() + 10
+        store.block(workspace_key="W1", api_method="users.list", until=until)
+        self.assertEqual(store.find_blocked_until(workspace_key="W1", api_method="users.list"), until)
+        self.assertIsNone(store.find_blocked_until(workspace_key="W1", api_method="users.info"))
+
+        store.block(workspace_key="W1", api_method="users.list", until=until - 5)
+        self.assertEqual(store.find_blocked_until(workspace_key="W1", api_method="users.list"), until)
+        store.block(workspace_key="W1", api_method="users.list", until=until + 5)
+        self.assertEqual(store.find_blocked_until(workspace_key="W1", api_method="users.list"), until + 5)
+
+    def test_shared_among_instances(self):
+        # Another process uses its own instance with the same database file
+        another_store = SQLite3RateLimitStateStore(database="logs/rate_limit_states.db")
+        until = time.time() + 10
+        self.store.block(workspace_key="W1", api_method="conversations.history", until=until)
+        self.assertEqual(another_store.find_blocked_until(workspace_key="W1", api_method="conversations.history"), until)
+
+    def test_expiration(self):
+        self.store.block(workspace_key="W1", api_method="users.list", until=time.time() - 1)
+        self.assertIsNone(self.store.find_blocked_until(workspace_key="W1", api_method="users.list"))
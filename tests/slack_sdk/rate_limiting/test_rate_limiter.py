@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+
+from slack_sdk import WebClient
+from slack_sdk.http_transport import InMemoryHttpTransport
+from slack_sdk.rate_limiting import TIER_1, TIER_2, RateLimiter, RateLimitTier, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_reservations(self):
+        bucket = TokenBucket(rate=1, capacity=2, now=0)
+        self.assertEqual(bucket.reserve(0), 0)
+        self.assertEqual(bucket.reserve(0), 0)
+        self.assertEqual(bucket.reserve(0), 1)
+        self.assertEqual(bucket.reserve(0), 2)
+        self.assertEqual(bucket.reserve(10), 0)
+        self.assertFalse(bucket.is_full(10))
+        self.assertTrue(bucket.is_full(11))
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_tiers(self):
+        self.assertEqual(TIER_1.burst, 1)
+        self.assertEqual(TIER_2.burst, 5)
+        self.assertEqual(RateLimitTier("custom", 600, burst=3).requests_per_second, 10)
+        with self.assertRaises(ValueError):
+            RateLimitTier("invalid", 0)
+
+    def test_method_tiers(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        # conversations.list is a Tier 2 method: 20 requests per minute with a burst of 5
+        waits = [limiter.reserve(api_method="conversations.list", token="xoxb-1") for _ in range(7)]
+        self.assertEqual(waits[:5], [0, 0, 0, 0, 0])
+        self.assertAlmostEqual(waits[5], 3)
+        self.assertAlmostEqual(waits[6], 6)
+        # other methods and workspaces have their own buckets
+        self.assertEqual(limiter.reserve(api_method="users.list", token="xoxb-1"), 0)
+        self.assertEqual(limiter.reserve(api_method="conversations.list", token="xoxb-2"), 0)
+        self.assertEqual(limiter.reserve(api_method="conversations.list", token="xoxb-1", team_id="T2"), 0)
+        clock.now += 9
+        self.assertEqual(limiter.reserve(api_method="conversations.list", token="xoxb-1"), 0)
+
+    def test_per_channel_limits(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        self.assertEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-1", channel="C1"), 0)
+        self.assertAlmostEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-1", channel="C1"), 1)
+        self.assertEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-1", channel="C2"), 0)
+        # no workspace-wide limit for chat.postMessage
+        self.assertEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-1"), 0)
+        self.assertEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-1"), 0)
+
+    def test_default_tier(self):
+        clock = FakeClock()
+        limiter = RateLimiter(default_tier=None, method_tiers={"foo.bar": TIER_1}, clock=clock)
+        for _ in range(10):
+            self.assertEqual(limiter.reserve(api_method="unknown.method", token="xoxb-1"), 0)
+        self.assertEqual(limiter.reserve(api_method="foo.bar", token="xoxb-1"), 0)
+        self.assertAlmostEqual(limiter.reserve(api_method="foo.bar", token="xoxb-1"), 60)
+
+    def test_unthrottled_methods(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        # Socket Mode clients establish all their connections without waiting
+        for _ in range(10):
+            self.assertEqual(limiter.reserve(api_method="apps.connections.open", token="xapp-1"), 0)
+        limiter = RateLimiter(unthrottled_methods=[], method_tiers={"apps.connections.open": TIER_1}, clock=clock)
+        self.assertEqual(limiter.reserve(api_method="apps.connections.open", token="xapp-1"), 0)
+        self.assertAlmostEqual(limiter.reserve(api_method="apps.connections.open", token="xapp-1"), 60)
+
+    def test_max_buckets(self):
+        clock = FakeClock()
+        limiter = RateLimiter(max_buckets=2, clock=clock)
+        limiter.reserve(api_method="users.info", token="xoxb-1")
+        limiter.reserve(api_method="users.info", token="xoxb-2")
+        clock.now += 10
+        limiter.reserve(api_method="users.info", token="xoxb-3")
+        self.assertEqual(len(limiter._buckets), 1)
+
+    def test_acquire_from_multiple_threads(self):
+        limiter = RateLimiter(per_channel_method_tiers={"chat.postMessage": RateLimitTier("fast", 600, burst=1)})
+        started_at = time.monotonic()
+        threads = [
+            threading.Thread(
+                target=limiter.acquire,
+                kwargs={"api_method": "chat.postMessage", "token": "xoxb-1", "channel": "C1"},
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 10 requests per second: the last one waits for 0.3 seconds
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.3)
+
+
+class TestWebClientWithRateLimiter(unittest.TestCase):
+    def test_api_calls(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        transport = InMemoryHttpTransport()
+        transport.add_response("chat.postMessage", body={"ok": True})
+        client = WebClient(token="xoxb-test", transport=transport, rate_limiter=limiter)
+        client.chat_postMessage(channel="C111", text="Hi there!")
+        self.assertAlmostEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-test", channel="C111"), 1)
+        self.assertEqual(limiter.reserve(api_method="chat.postMessage", token="xoxb-test", channel="C222"), 0)
+
+    def test_pagination(self):
+        clock = FakeClock()
+        limiter = RateLimiter(method_tiers={"users.list": RateLimitTier("custom", 60, burst=10)}, clock=clock)
+        transport = InMemoryHttpTransport()
+        transport.add_response("users.list", body={"ok": True, "members": [], "response_metadata": {"next_cursor": "1"}})
+        transport.add_response("users.list", body={"ok": True, "members": [], "response_metadata": {"next_cursor": "2"}})
+        transport.add_response("users.list", body={"ok": True, "members": []})
+        client = WebClient(token="xoxb-test", team_id="T111", transport=transport, rate_limiter=limiter)
+        self.assertEqual(len(list(client.users_list(limit=1))), 3)
+        # 3 of the 10 tokens are already consumed
+        waits = [limiter.reserve(api_method="users.list", token="xoxb-test", team_id="T111") for _ in range(8)]
+        self.assertEqual(waits[:7], [0] * 7)
+        self.assertAlmostEqual(waits[7], 1)
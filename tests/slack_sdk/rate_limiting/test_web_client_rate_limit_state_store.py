@@ -0,0 +1,35 @@
+import time
+import unittest
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_transport import InMemoryHttpTransport
+from slack_sdk.rate_limiting.rate_limiter import _build_workspace_key
+from slack_sdk.rate_limiting.state_store import InMemoryRateLimitStateStore
+
+
+class TestWebClientWithRateLimitStateStore(unittest.TestCase):
+    def test_shared_rate_limited_state(self):
+        store = InMemoryRateLimitStateStore()
+        transport = InMemoryHttpTransport()
+        transport.add_response("users.list", status_code=429, headers={"Retry-After": "0.3"}, body={"ok": False})
+        transport.add_response("users.list", body={"ok": True, "members": []})
+        client = WebClient(token="xoxb-test", transport=transport, rate_limit_state_store=store, retry_handlers=[])
+        another_client = WebClient(token="xoxb-test", transport=transport, rate_limit_state_store=store)
+
+        with self.assertRaises(SlackApiError):
+            client.users_list()
+        self.assertIsNotNone(
+            store.find_blocked_until(workspace_key=_build_workspace_key("xoxb-test", None), api_method="users.list")
+        )
+
+        # The other methods and workspaces are not affected
+        transport.add_response("users.info", body={"ok": True})
+        started_at = time.time()
+        another_client.users_info(user="U111")
+        WebClient(token="xoxb-another", transport=transport, rate_limit_state_store=store).users_list()
+        self.assertLess(time.time() - started_at, 0.2)
+
+        started_at = time.time()
+        self.assertTrue(another_client.users_list()["ok"])
+        self.assertGreaterEqual(time.time() - started_at, 0.2)
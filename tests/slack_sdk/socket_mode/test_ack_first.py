@@ -0,0 +1,84 @@
+import json
+import logging
+import time
+import unittest
+from concurrent.futures.thread import ThreadPoolExecutor
+
+from slack_sdk.socket_mode.client import BaseSocketModeClient
+
+
+def _envelope(type: str, envelope_id: str = "1d-111", **payload) -> str:
+    return json.dumps({"type": type, "envelope_id": envelope_id, "payload": payload})
+
+
+class TestAckFirst(unittest.TestCase):
+    logger = logging.getLogger(__name__)
+
+    def setUp(self):
+        self.sent_messages = []
+        self.acked_before_listener = []
+        self.ack_events = []
+
+        client = BaseSocketModeClient.__new__(BaseSocketModeClient)
+        client.logger = self.logger
+        client.message_workers = ThreadPoolExecutor(max_workers=1)
+        client.message_listeners = [self.listener]
+        client.socket_mode_request_listeners = []
+        client.send_message = self.sent_messages.append
+        client.ack_first_enabled = True
+        client.ack_listeners = [self.ack_events.append]
+        self.client = client
+
+    def tearDown(self):
+        self.client.message_workers.shutdown()
+
+    def listener(self, client, message, raw_message):
+        self.acked_before_listener.append(len(self.sent_messages) > 0)
+
+    def test_events_api_envelopes_are_acknowledged_before_listeners(self):
+        self.client.dispatch_message(_envelope("events_api", event_time=int(time.time())))
+        self.client.message_workers.shutdown()
+
+        self.assertEqual([json.loads(m) for m in self.sent_messages], [{"envelope_id": "1d-111"}])
+        self.assertEqual(self.acked_before_listener, [True])
+        self.assertEqual(len(self.ack_events), 1)
+        event = self.ack_events[0]
+        self.assertEqual(event.envelope_id, "1d-111")
+        self.assertEqual(event.type, "events_api")
+        self.assertGreaterEqual(event.envelope_age, 0)
+        self.assertLess(event.envelope_age, 5)
+        self.assertGreaterEqual(event.send_duration, 0)
+
+    def test_other_envelopes_are_left_to_listeners(self):
+        self.client.dispatch_message(_envelope("interactive"))
+        self.client.dispatch_message(_envelope("slash_commands"))
+        self.client.message_workers.shutdown()
+
+        self.assertEqual(self.sent_messages, [])
+        self.assertEqual(self.acked_before_listener, [False, False])
+        self.assertEqual(self.ack_events, [])
+
+    def test_disabled(self):
+        self.client.ack_first_enabled = False
+        self.client.dispatch_message(_envelope("events_api"))
+        self.client.message_workers.shutdown()
+
+        self.assertEqual(self.sent_messages, [])
+        self.assertEqual(self.acked_before_listener, [False])
+
+    def test_ack_failure_does_not_stop_listeners(self):
+        def send_message(message: str):
+            raise ConnectionError("closed")
+
+        self.client.send_message = send_message
+        self.client.dispatch_message(_envelope("events_api"))
+        self.client.message_workers.shutdown()
+
+        self.assertEqual(self.acked_before_listener, [False])
+        self.assertEqual(self.ack_events, [])
+
+    def test_envelope_age_without_event_time(self):
+        self.client.dispatch_message(_envelope("events_api", retry_attempt=0))
+        self.client.message_workers.shutdown()
+
+        self.assertIsNone(self.ack_events[0].envelope_age)
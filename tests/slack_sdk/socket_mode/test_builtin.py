@@ -4,7 +4,7 @@ import ssl
 import time
 import unittest
 from unittest.mock import sentinel
-from threading import Thread
+from threading import Event, Thread
 
 from slack_sdk import WebClient
 from slack_sdk.socket_mode import SocketModeClient
@@ -82,6 +82,20 @@ class TestBuiltin(unittest.TestCase):
         )
         client.process_message()
 
+    def test_enqueue_message_runs_the_listeners(self):
+        client = SocketModeClient(
+            app_token="xapp-A111-222-xyz",
+            web_client=self.web_client,
+        )
+        received = Event()
+        client.message_listeners.append(lambda client, message, raw_message: received.set())
+        try:
+            client.enqueue_message('{"type":"hello"}')
+            self.assertTrue(received.wait(timeout=1))
+            self.assertEqual(client.message_queue.qsize(), 0)
+        finally:
+            client.close()
+
     def test_client_with_ssl(self):
         self.web_client.ssl = sentinel.ssl_context
         client = SocketModeClient(
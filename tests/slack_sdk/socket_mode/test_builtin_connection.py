@@ -0,0 +1,102 @@
+import logging
+import selectors
+import socket
+import struct
+import time
+import unittest
+from threading import Thread
+
+from slack_sdk.socket_mode.builtin.connection import Connection, ConnectionState
+from slack_sdk.socket_mode.builtin.frame_header import FrameHeader
+from slack_sdk.socket_mode.builtin.internals import _wait_until_readable
+
+
+def _text_frame(text: str) -> bytes:
+    payload = text.encode("utf-8")
+    return struct.pack("!BB", 0b10000000 | FrameHeader.OPCODE_TEXT, len(payload)) + payload
+
+
+class TestBuiltinConnection(unittest.TestCase):
+    logger = logging.getLogger(__name__)
+
+    def setUp(self):
+        self.client_sock, self.server_sock = socket.socketpair()
+        self.messages = []
+        self.conn = Connection(
+            url="ws://localhost:3011/link",
+            logger=self.logger,
+            receive_timeout=30,
+            on_message_listener=self.messages.append,
+        )
+        self.conn.sock = self.client_sock  # type: ignore[assignment]
+        self.state = ConnectionState()
+        self.thread = Thread(target=self.conn.run_until_completion, args=(self.state,), daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.state.terminated = True
+        self.conn.disconnect()
+        self.thread.join(timeout=5)
+        self.server_sock.close()
+
+    def wait_for_messages(self, count: int):
+        deadline = time.time() + 5
+        while len(self.messages) < count and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_messages_are_received_when_the_socket_becomes_readable(self):
+        self.server_sock.sendall(_text_frame("hello"))
+        self.wait_for_messages(1)
+        self.server_sock.sendall(_text_frame("world"))
+        self.wait_for_messages(2)
+        self.assertEqual(self.messages, ["hello", "world"])
+
+    def test_disconnect_wakes_up_the_waiting_thread(self):
+        self.server_sock.sendall(_text_frame("hello"))
+        self.wait_for_messages(1)
+
+        started = time.time()
+        self.state.terminated = True
+        self.conn.disconnect()
+        self.thread.join(timeout=5)
+        self.assertFalse(self.thread.is_alive())
+        # Much less than the receive_timeout
+        self.assertLess(time.time() - started, 1)
+        self.assertIsNone(self.conn.wakeup_sender)
+
+    def test_disconnect_finishes_the_runner(self):
+        started = time.time()
+        # The runner does not wait for the state to be terminated, as the closed connection never works again
+        self.conn.disconnect()
+        self.thread.join(timeout=5)
+        self.assertFalse(self.thread.is_alive())
+        self.assertLess(time.time() - started, 1)
+        self.assertTrue(self.state.terminated)
+
+
+class TestWaitUntilReadable(unittest.TestCase):
+    def setUp(self):
+        self.sock, self.peer = socket.socketpair()
+        self.wakeup_receiver, self.wakeup_sender = socket.socketpair()
+        self.wakeup_receiver.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.sock, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_receiver, selectors.EVENT_READ)
+
+    def tearDown(self):
+        self.selector.close()
+        for s in [self.sock, self.peer, self.wakeup_receiver, self.wakeup_sender]:
+            s.close()
+
+    def test_readable(self):
+        self.peer.sendall(b"hello")
+        self.assertTrue(_wait_until_readable(self.selector, self.sock, self.wakeup_receiver, 1))
+
+    def test_wakeups_are_consumed(self):
+        self.wakeup_sender.send(b"\x00")
+        self.wakeup_sender.send(b"\x00")
+        self.assertFalse(_wait_until_readable(self.selector, self.sock, self.wakeup_receiver, 1))
+        # The consumed wakeups no longer make the selector return immediately
+        started = time.time()
+        self.assertFalse(_wait_until_readable(self.selector, self.sock, self.wakeup_receiver, 0.2))
+        self.assertGreaterEqual(time.time() - started, 0.15)
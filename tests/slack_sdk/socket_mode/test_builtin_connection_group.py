@@ -0,0 +1,283 @@
+import base64
+import hashlib
+import json
+import logging
+import socket
+import struct
+import threading
+import time
+import unittest
+from concurrent.futures.thread import ThreadPoolExecutor
+from unittest.mock import patch
+
+from slack_sdk.errors import SlackApiError, SlackClientConfigurationError
+from slack_sdk.http_transport import InMemoryHttpTransport
+from slack_sdk.rate_limiting import RateLimiter
+from slack_sdk.socket_mode.builtin import SocketModeClient
+from slack_sdk.socket_mode.builtin.frame_decoder import FrameDecoder
+from slack_sdk.socket_mode.builtin.frame_header import FrameHeader
+from slack_sdk.web import WebClient
+
+
+def _text_frame(text: str) -> bytes:
+    payload = text.encode("utf-8")
+    return struct.pack("!BB", 0b10000000 | FrameHeader.OPCODE_TEXT, len(payload)) + payload
+
+
+class _WebSocketServer:
+    """Accepts WebSocket connections and keeps the text frames each connection sends."""
+
+    def __init__(self):
+        self.server_sock = socket.socket()
+        self.server_sock.bind(("127.0.0.1", 0))
+        self.server_sock.listen(10)
+        self.url = f"ws://127.0.0.1:{self.server_sock.getsockname()[1]}/link"
+        self.connections = []
+        self.received_texts = {}
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server_sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += conn.recv(1024)
+        key = [line.split(b": ")[1] for line in request.split(b"\r\n") if line.lower().startswith(b"sec-websocket-key")][0]
+        accept = base64.b64encode(hashlib.sha1(key + b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11").digest())
+        conn.sendall(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        self.received_texts[conn] = []
+        self.connections.append(conn)
+        decoder = FrameDecoder()
+        try:
+            data = conn.recv(1024)
+            while len(data) > 0:
+                for header, payload in decoder.feed(data):
+                    if header is not None and header.opcode == FrameHeader.OPCODE_TEXT:
+                        self.received_texts[conn].append(payload.decode("utf-8"))
+                data = conn.recv(1024)
+        except OSError:
+            pass
+
+    def close(self):
+        self.server_sock.close()
+        for conn in self.connections:
+            conn.close()
+
+
+def _wait_until(condition, timeout: float = 5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+class TestBuiltinConnectionGroup(unittest.TestCase):
+    logger = logging.getLogger(__name__)
+
+    def setUp(self):
+        self.server = _WebSocketServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_num_connections_validation(self):
+        with self.assertRaises(SlackClientConfigurationError):
+            SocketModeClient(app_token="xapp-A111-222-xyz", num_connections=0)
+        with self.assertRaises(SlackClientConfigurationError):
+            SocketModeClient(app_token="xapp-A111-222-xyz", num_connections=11)
+
+    def test_group_members_use_the_owners_workers(self):
+        with patch("slack_sdk.socket_mode.builtin.client.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+            client = SocketModeClient(app_token="xapp-A111-222-xyz", logger=self.logger, num_connections=3)
+        try:
+            self.assertEqual(executor.call_count, 1)
+            member = client.group_members[0]
+            self.assertEqual(member.group_members, [])
+            # Closing a member does not stop the workers that the group shares
+            member.close()
+            self.assertEqual(client.message_workers.submit(lambda: "ok").result(timeout=5), "ok")
+        finally:
+            client.close()
+
+    def test_group_members_connect_at_the_same_time(self):
+        def issue_new_wss_url(client):
+            time.sleep(0.5)
+            return self.server.url
+
+        with patch.object(SocketModeClient, "issue_new_wss_url", autospec=True, side_effect=issue_new_wss_url):
+            client = SocketModeClient(
+                app_token="xapp-A111-222-xyz",
+                web_client=WebClient(),
+                logger=self.logger,
+                auto_reconnect_enabled=False,
+                num_connections=5,
+            )
+            try:
+                started = time.time()
+                client.connect()
+                # One call for the owner and then the four members' calls in parallel
+                self.assertLess(time.time() - started, 1.5)
+                self.assertTrue(all(member.is_connected() for member in client.group_members))
+            finally:
+                client.close()
+
+    def test_failed_group_members_keep_connecting(self):
+        calls = []
+        lock = threading.Lock()
+
+        def issue_new_wss_url(client):
+            with lock:
+                calls.append(client)
+                if len(calls) == 2:
+                    raise SlackApiError("The request to the Slack API failed.", {"ok": False, "error": "internal_error"})
+            return self.server.url
+
+        with patch.object(SocketModeClient, "issue_new_wss_url", autospec=True, side_effect=issue_new_wss_url):
+            client = SocketModeClient(
+                app_token="xapp-A111-222-xyz",
+                web_client=WebClient(),
+                logger=self.logger,
+                ping_interval=0.1,
+                num_connections=2,
+            )
+            try:
+                client.connect()
+                member = client.group_members[0]
+                self.assertFalse(member.is_connected())
+                _wait_until(member.is_connected)
+                self.assertTrue(member.is_connected())
+                self.assertEqual(len(self.server.connections), 2)
+            finally:
+                client.close()
+
+    def test_failed_group_members_without_auto_reconnect(self):
+        def issue_new_wss_url(client):
+            if client.group_members == []:
+                raise SlackApiError("The request to the Slack API failed.", {"ok": False, "error": "internal_error"})
+            return self.server.url
+
+        with patch.object(SocketModeClient, "issue_new_wss_url", autospec=True, side_effect=issue_new_wss_url):
+            client = SocketModeClient(
+                app_token="xapp-A111-222-xyz",
+                web_client=WebClient(),
+                logger=self.logger,
+                auto_reconnect_enabled=False,
+                num_connections=3,
+            )
+            try:
+                with self.assertRaises(SlackApiError):
+                    client.connect()
+                self.assertTrue(client.is_connected())
+                self.assertFalse(any(member.is_connected() for member in client.group_members))
+            finally:
+                client.close()
+
+    def test_all_connections_feed_the_same_listeners(self):
+        with patch.object(SocketModeClient, "issue_new_wss_url", return_value=self.server.url):
+            client = SocketModeClient(
+                app_token="xapp-A111-222-xyz",
+                web_client=WebClient(),
+                logger=self.logger,
+                auto_reconnect_enabled=False,
+                ack_first_enabled=True,
+                num_connections=3,
+            )
+            received = []
+            client.message_listeners.append(lambda c, message, raw_message: received.append(message["envelope_id"]))
+            try:
+                self.assertEqual(len(client.group_members), 2)
+                for member in client.group_members:
+                    self.assertIs(member.message_listeners, client.message_listeners)
+                    self.assertIs(member.message_workers, client.message_workers)
+                    self.assertIs(member.connect_operation_lock, client.connect_operation_lock)
+
+                client.connect()
+                _wait_until(lambda: len(self.server.connections) == 3)
+                self.assertTrue(client.is_connected())
+                self.assertTrue(all(member.is_connected() for member in client.group_members))
+
+                for i, conn in enumerate(self.server.connections):
+                    envelope = {"type": "events_api", "envelope_id": f"e-{i}", "payload": {}}
+                    conn.sendall(_text_frame(json.dumps(envelope)))
+                _wait_until(lambda: len(received) == 3)
+                self.assertEqual(sorted(received), ["e-0", "e-1", "e-2"])
+
+                # Each envelope is acknowledged through the connection that delivered it
+                _wait_until(lambda: all(len(self.server.received_texts[c]) == 1 for c in self.server.connections))
+                for i, conn in enumerate(self.server.connections):
+                    self.assertEqual(
+                        [json.loads(t) for t in self.server.received_texts[conn]],
+                        [{"envelope_id": f"e-{i}"}],
+                    )
+            finally:
+                client.close()
+
+            self.assertFalse(client.is_connected())
+            self.assertFalse(any(member.is_connected() for member in client.group_members))
+
+    def test_rate_limiter_does_not_delay_connections(self):
+        transport = InMemoryHttpTransport()
+        transport.add_response("apps.connections.open", body={"ok": True, "url": self.server.url})
+        client = SocketModeClient(
+            app_token="xapp-A111-222-xyz",
+            web_client=WebClient(transport=transport, rate_limiter=RateLimiter()),
+            logger=self.logger,
+            auto_reconnect_enabled=False,
+            num_connections=10,
+        )
+        try:
+            started = time.time()
+            client.connect()
+            _wait_until(lambda: len(self.server.connections) == 10)
+            # A Tier 1 limit would make this take about 10 minutes
+            self.assertLess(time.time() - started, 5)
+            self.assertEqual(len(self.server.connections), 10)
+            self.assertTrue(all(member.is_connected() for member in client.group_members))
+        finally:
+            client.close()
+
+    def test_refresh_replaces_only_the_requested_connection(self):
+        with patch.object(SocketModeClient, "issue_new_wss_url", return_value=self.server.url):
+            client = SocketModeClient(
+                app_token="xapp-A111-222-xyz",
+                web_client=WebClient(),
+                logger=self.logger,
+                auto_reconnect_enabled=False,
+                num_connections=2,
+            )
+            received = []
+            client.message_listeners.append(lambda c, message, raw_message: received.append(message["envelope_id"]))
+            try:
+                client.connect()
+                _wait_until(lambda: len(self.server.connections) == 2)
+                session_ids = {client.session_id(), client.group_members[0].session_id()}
+
+                refreshed, kept = self.server.connections
+                refreshed.sendall(_text_frame(json.dumps({"type": "disconnect", "reason": "refresh_requested"})))
+
+                def current_session_ids():
+                    return {client.session_id(), client.group_members[0].session_id()}
+
+                _wait_until(lambda: current_session_ids() != session_ids)
+                _wait_until(lambda: len(self.server.connections) == 3)
+                self.assertEqual(len(session_ids & current_session_ids()), 1)
+                self.assertTrue(client.is_connected())
+                self.assertTrue(client.group_members[0].is_connected())
+
+                # The connection not asked to refresh kept working
+                kept.sendall(_text_frame(json.dumps({"type": "events_api", "envelope_id": "e-1", "payload": {}})))
+                self.server.connections[2].sendall(
+                    _text_frame(json.dumps({"type": "events_api", "envelope_id": "e-2", "payload": {}}))
+                )
+                _wait_until(lambda: len(received) == 2)
+                self.assertEqual(sorted(received), ["e-1", "e-2"])
+            finally:
+                client.close()
@@ -0,0 +1,130 @@
+import logging
+import random
+import socket
+import struct
+import unittest
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from slack_sdk.socket_mode.builtin.frame_decoder import FrameDecoder
+from slack_sdk.socket_mode.builtin.frame_header import FrameHeader
+from slack_sdk.socket_mode.builtin.internals import _receive_messages
+
+
+def build_frame(payload: bytes, opcode: int = FrameHeader.OPCODE_TEXT, fin: bool = True, mask_key: bytes = b"") -> bytes:
+    b1 = (0b10000000 if fin else 0) | opcode
+    masked = 0b10000000 if mask_key else 0
+    length = len(payload)
+    if length <= 125:
+        header = struct.pack("!BB", b1, masked | length)
+    elif length <= 0xFFFF:
+        header = struct.pack("!BBH", b1, masked | 126, length)
+    else:
+        header = struct.pack("!BBQ", b1, masked | 127, length)
+    if mask_key:
+        payload = bytes(b ^ mask_key[i % 4] for i, b in enumerate(payload))
+    return header + mask_key + payload
+
+
+def decode_in_chunks(data: bytes, split_points: List[int]) -> List[Tuple[Optional[int], bytes]]:
+    decoder = FrameDecoder()
+    messages = []
+    start = 0
+    for end in sorted(split_points) + [len(data)]:
+        for header, payload in decoder.feed(data[start:end]):
+            messages.append((header.opcode if header is not None else None, payload))
+        start = end
+    assert not decoder.has_partial_message
+    return messages
+
+
+class FakeSocket:
+    def __init__(self, chunks: List[object]):
+        self.chunks = chunks
+
+    def recv(self, size: int) -> bytes:
+        chunk = self.chunks.pop(0) if self.chunks else b""
+        if isinstance(chunk, Exception):
+            raise chunk
+        return chunk  # type: ignore[return-value]
+
+
+class TestBuiltinFrameDecoder(unittest.TestCase):
+    logger = logging.getLogger(__name__)
+
+    def setUp(self):
+        envelope = b'{"envelope_id":"1","type":"interactive","payload":{"view":"' + b"x" * 200_000 + b'"}}'
+        self.stream = (
+            b"\n"
+            + build_frame(b"foo")
+            + build_frame(b"", opcode=FrameHeader.OPCODE_PING)
+            + build_frame(b"a" * 126)
+            + build_frame(envelope)
+            + build_frame(b"masked", mask_key=b"\x01\x02\x03\x04")
+            # a fragmented message with a ping in the middle of it
+            + build_frame(b"frag", fin=False)
+            + build_frame(b"1234", opcode=FrameHeader.OPCODE_PING)
+            + build_frame(b"ment", opcode=FrameHeader.OPCODE_CONTINUATION, fin=False)
+            + build_frame(b"ed", opcode=FrameHeader.OPCODE_CONTINUATION)
+            + build_frame(b"\x03\xe8bye", opcode=FrameHeader.OPCODE_CLOSE)
+        )
+        self.expected = [
+            (None, b"\n"),
+            (FrameHeader.OPCODE_TEXT, b"foo"),
+            (FrameHeader.OPCODE_PING, b""),
+            (FrameHeader.OPCODE_TEXT, b"a" * 126),
+            (FrameHeader.OPCODE_TEXT, envelope),
+            (FrameHeader.OPCODE_TEXT, b"masked"),
+            (FrameHeader.OPCODE_PING, b"1234"),
+            (FrameHeader.OPCODE_TEXT, b"fragmented"),
+            (FrameHeader.OPCODE_CLOSE, b"\x03\xe8bye"),
+        ]
+
+    def test_whole_data(self):
+        self.assertEqual(decode_in_chunks(self.stream, []), self.expected)
+
+    def test_byte_by_byte(self):
+        self.assertEqual(decode_in_chunks(self.stream, list(range(1, len(self.stream)))), self.expected)
+
+    def test_random_frame_boundaries(self):
+        rand = random.Random(42)
+        for _ in range(200):
+            split_points = rand.sample(range(1, len(self.stream)), rand.randint(1, 300))
+            self.assertEqual(decode_in_chunks(self.stream, split_points), self.expected)
+
+    def test_header_boundaries(self):
+        # Split the data at every position in the first bytes of each frame
+        frame = build_frame(b"y" * 70_000, mask_key=b"\xff\x00\xff\x00")
+        data = frame + frame
+        for i in range(1, 20):
+            for offset in (0, len(frame)):
+                self.assertEqual(
+                    decode_in_chunks(data, [offset + i] if offset + i < len(data) else []),
+                    [(FrameHeader.OPCODE_TEXT, b"y" * 70_000)] * 2,
+                )
+
+    def test_fragmented_message_header(self):
+        decoder = FrameDecoder()
+        messages = decoder.feed(build_frame(b"ab", fin=False) + build_frame(b"c", opcode=FrameHeader.OPCODE_CONTINUATION))
+        self.assertEqual(len(messages), 1)
+        header, payload = messages[0]
+        self.assertEqual((header.opcode, header.fin > 0, header.length), (FrameHeader.OPCODE_TEXT, True, 3))
+        self.assertEqual(payload, b"abc")
+
+    def test_receive_messages_keeps_partial_frames(self):
+        frame = build_frame(b"z" * 3000)
+        sock = FakeSocket([build_frame(b"foo") + frame[:1000], socket.timeout(), frame[1000:]])
+        decoder = FrameDecoder()
+
+        def receive():
+            return _receive_messages(
+                sock=sock,  # type: ignore[arg-type]
+                sock_receive_lock=Lock(),
+                logger=self.logger,
+                frame_decoder=decoder,
+            )
+
+        self.assertEqual([m[1] for m in receive()], [b"foo"])
+        with self.assertRaises(socket.timeout):
+            receive()
+        self.assertEqual([m[1] for m in receive()], [b"z" * 3000])
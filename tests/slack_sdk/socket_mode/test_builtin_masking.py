@@ -0,0 +1,39 @@
+import os
+import unittest
+
+from slack_sdk.socket_mode.builtin.frame_decoder import FrameDecoder
+from slack_sdk.socket_mode.builtin.frame_header import FrameHeader
+from slack_sdk.socket_mode.builtin.internals import _build_data_frame_for_sending
+from slack_sdk.socket_mode.builtin.masking import _apply_mask, _generate_mask_key
+
+
+class TestBuiltinMasking(unittest.TestCase):
+    def test_apply_mask(self):
+        mask_key = b"\x12\x34\xab\xff"
+        for length in list(range(0, 10)) + [125, 126, 1000, 65537]:
+            data = os.urandom(length)
+            expected = bytes(b ^ mask_key[i % 4] for i, b in enumerate(data))
+            self.assertEqual(_apply_mask(data, mask_key), expected)
+            self.assertEqual(_apply_mask(expected, mask_key), data)
+
+    def test_leading_zero_bytes(self):
+        self.assertEqual(_apply_mask(b"\x00\x00\x00\x00\x01", b"\x00\x00\x00\x00"), b"\x00\x00\x00\x00\x01")
+
+    def test_generate_mask_key(self):
+        keys = {_generate_mask_key() for _ in range(100)}
+        self.assertTrue(all(len(k) == 4 for k in keys))
+        self.assertGreater(len(keys), 1)
+
+    def test_build_data_frame_for_sending(self):
+        for length in [0, 125, 126, 65535, 65536, 200_000]:
+            payload = os.urandom(length)
+            frame = _build_data_frame_for_sending(payload, FrameHeader.OPCODE_BINARY)
+            messages = FrameDecoder().feed(frame)
+            self.assertEqual(len(messages), 1)
+            header, data = messages[0]
+            self.assertTrue(header.masked)
+            self.assertEqual(header.length, length)
+            self.assertEqual(data, payload)
+
+        frame = _build_data_frame_for_sending("hello!", FrameHeader.OPCODE_TEXT, masked=0)
+        self.assertEqual(frame, b"\x81\x06hello!")
@@ -21,8 +21,6 @@ from tests.slack_sdk.socket_mode.mock_socket_mode_server import (
 from tests.slack_sdk.socket_mode.mock_web_api_handler import MockHandler
 from tests.mock_web_api_server import setup_mock_web_api_server, cleanup_mock_web_api_server
 
-import sys
-
 
 class TestInteractionsBuiltin(unittest.TestCase):
     logger = logging.getLogger(__name__)
@@ -47,77 +45,63 @@ class TestInteractionsBuiltin(unittest.TestCase):
             pass
 
     def test_interactions(self):
-        default_recursion_limit = sys.getrecursionlimit()  # will restore later
-        # This built-in WebSocket client internally has recursive method calls of _fetch_messages method.
-        # In this test, the method calls can result in the following error when giving a quite small buffer size.
-        # RecursionError: maximum recursion depth exceeded while calling a Python object
-        # (the default recursion depth in Python is 1500)
-        # Since the default buffer size is set to 1024, and it's enough to prevent the same situation happening,
-        # we believe that the same situation never happens in the production usage.
-        sys.setrecursionlimit(10000)
+        buffer_size_list = [1024, 9000, 35, 49] + list([randint(16, 128) for _ in range(10)])
+        for buffer_size in buffer_size_list:
+            self.reset_server_state()
 
-        try:
-            buffer_size_list = [1024, 9000, 35, 49] + list([randint(16, 128) for _ in range(10)])
-            for buffer_size in buffer_size_list:
-                self.reset_server_state()
-
-                received_messages = []
-                received_socket_mode_requests = []
-
-                def message_handler(message):
-                    self.logger.info(f"Raw Message: {message}")
-                    time.sleep(randint(50, 200) / 1000)
-                    received_messages.append(message)
-
-                def socket_mode_request_handler(client: BaseSocketModeClient, request: SocketModeRequest):
-                    self.logger.info(f"Socket Mode Request: {request}")
-                    time.sleep(randint(50, 200) / 1000)
-                    received_socket_mode_requests.append(request)
-
-                self.logger.info(f"Started testing with buffer size: {buffer_size}")
-                client = SocketModeClient(
-                    app_token="xapp-A111-222-xyz",
-                    web_client=self.web_client,
-                    on_message_listeners=[message_handler],
-                    receive_buffer_size=buffer_size,
-                    auto_reconnect_enabled=False,
-                    trace_enabled=True,
-                )
-                try:
-                    client.socket_mode_request_listeners.append(socket_mode_request_handler)
-                    client.wss_uri = "ws://0.0.0.0:3011/link"
-                    client.connect()
-                    self.assertTrue(client.is_connected())
-                    time.sleep(2)  # wait for the message receiver
-
-                    repeat = 2
-                    for _ in range(repeat):
-                        client.send_message("foo")
-                        client.send_message("bar")
-                        client.send_message("baz")
-                    self.assertTrue(client.is_connected())
-
-                    expected = socket_mode_envelopes + [socket_mode_hello_message] + ["foo", "bar", "baz"] * repeat
-                    expected.sort()
-
-                    count = 0
-                    while count < 5 and len(received_messages) < len(expected):
-                        time.sleep(0.1)
-                        self.logger.debug(f"Received messages: {len(received_messages)}")
-                        count += 0.1
-
-                    received_messages.sort()
-                    self.assertEqual(len(received_messages), len(expected))
-                    self.assertEqual(received_messages, expected)
-
-                    self.assertEqual(len(socket_mode_envelopes), len(received_socket_mode_requests))
-                finally:
-                    client.close()
-                self.logger.info(f"Passed with buffer size: {buffer_size}")
+            received_messages = []
+            received_socket_mode_requests = []
 
-        finally:
-            # Restore the default value
-            sys.setrecursionlimit(default_recursion_limit)
+            def message_handler(message):
+                self.logger.info(f"Raw Message: {message}")
+                time.sleep(randint(50, 200) / 1000)
+                received_messages.append(message)
+
+            def socket_mode_request_handler(client: BaseSocketModeClient, request: SocketModeRequest):
+                self.logger.info(f"Socket Mode Request: {request}")
+                time.sleep(randint(50, 200) / 1000)
+                received_socket_mode_requests.append(request)
+
+            self.logger.info(f"Started testing with buffer size: {buffer_size}")
+            client = SocketModeClient(
+                app_token="xapp-A111-222-xyz",
+                web_client=self.web_client,
+                on_message_listeners=[message_handler],
+                receive_buffer_size=buffer_size,
+                auto_reconnect_enabled=False,
+                trace_enabled=True,
+            )
+            try:
+                client.socket_mode_request_listeners.append(socket_mode_request_handler)
+                client.wss_uri = "ws://0.0.0.0:3011/link"
+                client.connect()
+                self.assertTrue(client.is_connected())
+                time.sleep(2)  # wait for the message receiver
+
+                repeat = 2
+                for _ in range(repeat):
+                    client.send_message("foo")
+                    client.send_message("bar")
+                    client.send_message("baz")
+                self.assertTrue(client.is_connected())
+
+                expected = socket_mode_envelopes + [socket_mode_hello_message] + ["foo", "bar", "baz"] * repeat
+                expected.sort()
+
+                count = 0
+                while count < 5 and len(received_messages) < len(expected):
+                    time.sleep(0.1)
+                    self.logger.debug(f"Received messages: {len(received_messages)}")
+                    count += 0.1
+
+                received_messages.sort()
+                self.assertEqual(len(received_messages), len(expected))
+                self.assertEqual(received_messages, expected)
+
+                self.assertEqual(len(socket_mode_envelopes), len(received_socket_mode_requests))
+            finally:
+                client.close()
+            self.logger.info(f"Passed with buffer size: {buffer_size}")
 
         self.logger.info(f"Passed with buffer size: {buffer_size_list}")
 
@@ -1,6 +1,8 @@
 import logging
 import ssl
+import threading
 import unittest
+from concurrent.futures.thread import ThreadPoolExecutor
 from threading import Lock
 from unittest.mock import MagicMock, patch
 
@@ -34,6 +36,33 @@ class TestSocketModeClient(unittest.TestCase):
         self.assertTrue(acquired)
         client.connect_operation_lock.release()
 
+    def test_dispatch_message_reconnects_outside_the_receiving_thread(self):
+        client = BaseSocketModeClient.__new__(BaseSocketModeClient)
+        client.logger = self.logger
+        client.message_workers = ThreadPoolExecutor(max_workers=1)
+        # All the workers are busy running listeners
+        listeners_running = threading.Event()
+        client.message_workers.submit(listeners_running.wait)
+        reconnecting_threads = []
+        reconnected = threading.Event()
+
+        def connect_to_new_endpoint(force: bool = False):
+            reconnecting_threads.append((threading.current_thread(), force))
+            reconnected.set()
+
+        client.connect_to_new_endpoint = connect_to_new_endpoint
+        try:
+            client.dispatch_message('{"type":"disconnect","reason":"refresh_requested"}')
+            self.assertTrue(reconnected.wait(timeout=1))
+        finally:
+            listeners_running.set()
+            client.message_workers.shutdown()
+
+        self.assertEqual(len(reconnecting_threads), 1)
+        thread, force = reconnecting_threads[0]
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertTrue(force)
+
     def test_parse_handshake_response_preserves_colons_in_header_values(self):
         lines = [
             "HTTP/1.1 101 Switching Protocols",
@@ -1,4 +1,5 @@
 import unittest
+from threading import Event
 
 from slack_sdk.socket_mode.websocket_client import SocketModeClient
 
@@ -17,3 +18,27 @@ class TestWebSocketClientLibrary(unittest.TestCase):
             self.assertFalse(client.is_connected())
         finally:
             client.close()
+
+    def test_init_close_with_num_connections(self):
+        client = SocketModeClient(app_token="xapp-A111-222-xyz", num_connections=3)
+        try:
+            self.assertEqual(len(client.group_members), 2)
+            for member in client.group_members:
+                self.assertIs(member.message_workers, client.message_workers)
+                self.assertIs(member.socket_mode_request_listeners, client.socket_mode_request_listeners)
+                self.assertIsNone(member.message_processor)
+                self.assertEqual(member.group_members, [])
+        finally:
+            client.close()
+        self.assertTrue(all(member.closed for member in client.group_members))
+
+    def test_group_members_dispatch_enqueued_messages(self):
+        client = SocketModeClient(app_token="xapp-A111-222-xyz", num_connections=2)
+        received = Event()
+        client.message_listeners.append(lambda client, message, raw_message: received.set())
+        try:
+            client.group_members[0].enqueue_message('{"type":"hello"}')
+            self.assertTrue(received.wait(timeout=1))
+            self.assertEqual(client.group_members[0].message_queue.qsize(), 0)
+        finally:
+            client.close()
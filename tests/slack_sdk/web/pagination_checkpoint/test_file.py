@@ -0,0 +1,45 @@
+import tempfile
+import unittest
+
+from slack_sdk.web.pagination_checkpoint import FilePaginationCheckpointStore, PaginationCheckpoint
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestFile(unittest.TestCase):
+    def setUp(self):
+        self.base_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.base_dir.cleanup()
+
+    def test_save_find_delete(self):
+        store = FilePaginationCheckpointStore(base_dir=self.base_dir.name)
+        self.assertIsNone(store.find("export/C111"))
+        checkpoint = PaginationCheckpoint(
+            api_method="conversations.history",
+            params={"channel": "C111", "limit": 200},
+            cursor="bmV4dF90czoxNTEyMDg1ODYxMDAwNTQz",
+            offset=3,
+            num_items=203,
+            item_key="messages",
+        )
+        store.save("export/C111", checkpoint)
+        found = store.find("export/C111")
+        self.assertEqual(found.to_dict(), checkpoint.to_dict())
+
+        checkpoint.offset = 4
+        store.save("export/C111", checkpoint)
+        self.assertEqual(store.find("export/C111").offset, 4)
+
+        store.delete("export/C111")
+        self.assertIsNone(store.find("export/C111"))
+        # deleting a missing checkpoint is a no-op
+        store.delete("export/C111")
+
+    @async_test
+    async def test_async(self):
+        store = FilePaginationCheckpointStore(base_dir=self.base_dir.name)
+        await store.async_save("k", PaginationCheckpoint(api_method="users.list", cursor="xxx"))
+        self.assertEqual((await store.async_find("k")).cursor, "xxx")
+        await store.async_delete("k")
+        self.assertIsNone(await store.async_find("k"))
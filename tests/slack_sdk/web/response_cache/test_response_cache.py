@@ -0,0 +1,91 @@
+import time
+import unittest
+
+from slack_sdk.web.response_cache import InMemoryResponseCacheBackend, ResponseCache
+from tests.slack_sdk_async.helpers import async_test
+
+
+def save(cache: ResponseCache, api_method: str, token: str, params: dict, data: dict):
+    cache.save(api_method=api_method, token=token, params=params, data=data, headers={}, status_code=200)
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_find_and_save(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+        save(cache, "users.info", "xoxb-1", {"user": "U1"}, {"ok": True, "user": {"id": "U1"}})
+        cached = cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"})
+        self.assertEqual(cached["data"]["user"]["id"], "U1")
+        self.assertEqual(cached["status_code"], 200)
+        # The responses are never shared among tokens and parameters
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-2", params={"user": "U1"}))
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U2"}))
+
+    def test_not_cacheable(self):
+        cache = ResponseCache(method_ttls={"users.info": 60})
+        save(cache, "conversations.info", "xoxb-1", {"channel": "C1"}, {"ok": True})
+        self.assertIsNone(cache.find(api_method="conversations.info", token="xoxb-1", params={"channel": "C1"}))
+        save(cache, "users.info", "xoxb-1", {"user": "U1"}, {"ok": False, "error": "user_not_found"})
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+
+    def test_ttl(self):
+        cache = ResponseCache(method_ttls={"users.info": 0.1})
+        save(cache, "users.info", "xoxb-1", {"user": "U1"}, {"ok": True})
+        self.assertIsNotNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+        time.sleep(0.15)
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        for token in ["xoxb-1", "xoxb-2"]:
+            for user in ["U1", "U2"]:
+                save(cache, "users.info", token, {"user": user}, {"ok": True})
+            save(cache, "team.info", token, {}, {"ok": True})
+
+        def cached(api_method: str, token: str, params: dict) -> bool:
+            return cache.find(api_method=api_method, token=token, params=params) is not None
+
+        cache.invalidate(api_method="users.info", token="xoxb-1", params={"user": "U1"})
+        self.assertFalse(cached("users.info", "xoxb-1", {"user": "U1"}))
+        self.assertTrue(cached("users.info", "xoxb-1", {"user": "U2"}))
+
+        cache.invalidate(api_method="users.info", token="xoxb-1")
+        self.assertFalse(cached("users.info", "xoxb-1", {"user": "U2"}))
+        self.assertTrue(cached("users.info", "xoxb-2", {"user": "U1"}))
+
+        cache.invalidate(api_method="users.info")
+        self.assertFalse(cached("users.info", "xoxb-2", {"user": "U1"}))
+        self.assertTrue(cached("team.info", "xoxb-2", {}))
+
+        cache.invalidate()
+        self.assertFalse(cached("team.info", "xoxb-2", {}))
+
+    def test_invalidation_rules(self):
+        cache = ResponseCache()
+        save(cache, "users.info", "xoxb-1", {"user": "U1"}, {"ok": True})
+        save(cache, "users.profile.set", "xoxp-1", {"user": "U1"}, {"ok": False, "error": "not_allowed"})
+        self.assertIsNotNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+        save(cache, "users.profile.set", "xoxp-1", {"user": "U1"}, {"ok": True})
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+
+    def test_lru(self):
+        backend = InMemoryResponseCacheBackend(max_size=2)
+        cache = ResponseCache(backend=backend)
+        save(cache, "users.info", "xoxb-1", {"user": "U1"}, {"ok": True})
+        save(cache, "users.info", "xoxb-1", {"user": "U2"}, {"ok": True})
+        cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"})
+        save(cache, "users.info", "xoxb-1", {"user": "U3"}, {"ok": True})
+        self.assertEqual(len(backend), 2)
+        # U2 is the least recently used one
+        self.assertIsNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U2"}))
+        self.assertIsNotNone(cache.find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+
+    @async_test
+    async def test_async(self):
+        cache = ResponseCache()
+        await cache.async_save(
+            api_method="users.info", token="xoxb-1", params={"user": "U1"}, data={"ok": True}, headers={}, status_code=200
+        )
+        self.assertIsNotNone(await cache.async_find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
+        await cache.async_invalidate(api_method="users.info")
+        self.assertIsNone(await cache.async_find(api_method="users.info", token="xoxb-1", params={"user": "U1"}))
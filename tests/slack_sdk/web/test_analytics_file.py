@@ -0,0 +1,158 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError, SlackRequestError
+from slack_sdk.http_metrics import HttpRequestObserver
+from slack_sdk.http_retry import RateLimitErrorRetryHandler
+from slack_sdk.http_transport import InMemoryHttpTransport, TransportRequest, TransportResponse
+from slack_sdk.rate_limiting.state_store import InMemoryRateLimitStateStore
+from slack_sdk.web.analytics_file import _AnalyticsFileDecoder
+
+records = [{"enterprise_id": "E111", "user_id": f"W{i}", "is_active": i % 2 == 0} for i in range(5000)]
+ndjson = "\n".join(json.dumps(r) for r in records).encode("utf-8")
+compressed = gzip.compress(ndjson)
+
+
+class AnalyticsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        params = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8"))
+        if params.get("date") == ["2020-09-01"]:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/gzip")
+            self.send_header("Content-Length", str(len(compressed)))
+            self.end_headers()
+            self.wfile.write(compressed)
+        else:
+            body = b'{"ok":false,"error":"file_not_yet_available"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+
+class TestAnalyticsFile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("localhost", 0), AnalyticsHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.client = WebClient(token="xoxp-test", base_url=f"http://localhost:{self.server.server_address[1]}/api/")
+
+    def test_records(self):
+        with self.client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            self.assertEqual(file.status_code, 200)
+            self.assertEqual(list(file.records(chunk_size=1024)), records)
+
+    def test_save(self):
+        with tempfile.TemporaryDirectory() as dir:
+            path = os.path.join(dir, "member.json.gz")
+            with self.client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+                self.assertEqual(file.save(path), len(compressed))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), compressed)
+
+            path = os.path.join(dir, "member.json")
+            with self.client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+                file.save(path, decompress=True)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), ndjson + b"\n")
+
+    def test_errors(self):
+        with self.assertRaises(SlackApiError) as cm:
+            self.client.admin_analytics_getFile_stream(type="member", date="2020-09-02")
+        self.assertEqual(cm.exception.response["error"], "file_not_yet_available")
+
+    def test_custom_transport(self):
+        def handler(request: TransportRequest) -> TransportResponse:
+            return TransportResponse(status_code=200, headers={"Content-Type": "application/gzip"}, body=compressed)
+
+        client = WebClient(token="xoxp-test", transport=InMemoryHttpTransport(handler))
+        with client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            self.assertEqual(list(file.records()), records)
+
+    def test_rate_limited(self):
+        def handler(request: TransportRequest) -> TransportResponse:
+            if len(transport.received_requests) == 1:
+                return TransportResponse(
+                    status_code=429,
+                    headers={"Content-Type": "application/json", "Retry-After": "0"},
+                    body=b'{"ok":false,"error":"ratelimited"}',
+                )
+            return TransportResponse(status_code=200, headers={"Content-Type": "application/gzip"}, body=compressed)
+
+        class Observer(HttpRequestObserver):
+            def __init__(self):
+                self.attempts = []
+                self.retries = []
+
+            def on_attempt(self, event):
+                self.attempts.append(event)
+
+            def on_retry(self, event):
+                self.retries.append(event)
+
+        class StateStore(InMemoryRateLimitStateStore):
+            blocked_methods = []
+
+            def block(self, *, workspace_key: str, api_method: str, until: float) -> None:
+                self.blocked_methods.append(api_method)
+                super().block(workspace_key=workspace_key, api_method=api_method, until=until)
+
+        transport = InMemoryHttpTransport(handler)
+        observer = Observer()
+        store = StateStore()
+        client = WebClient(
+            token="xoxp-test",
+            transport=transport,
+            retry_handlers=[RateLimitErrorRetryHandler(max_retry_count=1)],
+            rate_limit_state_store=store,
+            request_observers=[observer],
+        )
+        with client.admin_analytics_getFile_stream(type="member", date="2020-09-01") as file:
+            self.assertEqual(list(file.records()), records)
+        self.assertEqual(len(transport.received_requests), 2)
+        self.assertEqual(store.blocked_methods, ["admin.analytics.getFile"])
+        self.assertEqual([(e.attempt, e.status_code) for e in observer.attempts], [(0, 429), (1, 200)])
+        self.assertEqual([e.retry_handler for e in observer.retries], ["RateLimitErrorRetryHandler"])
+
+        # Without the retry handler, the error is raised
+        transport.received_requests.clear()
+        client.retry_handlers = []
+        with self.assertRaises(SlackApiError) as cm:
+            client.admin_analytics_getFile_stream(type="member", date="2020-09-01")
+        self.assertEqual(cm.exception.response.status_code, 429)
+        self.assertEqual(cm.exception.response["error"], "ratelimited")
+
+
+class TestAnalyticsFileDecoder(unittest.TestCase):
+    def test_lines_across_chunks(self):
+        data = gzip.compress(b'{"a":1}\n{"a":2}\n') + gzip.compress(b'{"a":3}')
+        decoder = _AnalyticsFileDecoder()
+        lines = []
+        for i in range(0, len(data), 7):
+            lines.extend(decoder.feed(data[i : i + 7]))
+        lines.extend(decoder.flush())
+        self.assertEqual(lines, [b'{"a":1}', b'{"a":2}', b'{"a":3}'])
+
+    def test_truncated_data(self):
+        decoder = _AnalyticsFileDecoder()
+        decoder.feed(compressed[:100])
+        with self.assertRaises(SlackRequestError):
+            decoder.flush()
@@ -0,0 +1,95 @@
+import json
+import threading
+import time
+import unittest
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_transport import InMemoryHttpTransport, TransportRequest, TransportResponse
+from slack_sdk.rate_limiting import RateLimiter, RateLimitTier
+from slack_sdk.web import BatchResult
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.num_running = 0
+        self.max_running = 0
+
+    def build_client(self, delay: float = 0.0, **kwargs) -> WebClient:
+        def handler(request: TransportRequest) -> TransportResponse:
+            with self.lock:
+                self.num_running += 1
+                self.max_running = max(self.max_running, self.num_running)
+            try:
+                body = json.loads(request.body)
+                time.sleep(delay * body.get("delay", 1))
+                if body["channel"] == "C_invalid":
+                    data = {"ok": False, "error": "channel_not_found"}
+                else:
+                    data = {"ok": True, "channel": body["channel"], "ts": "111.222"}
+                return TransportResponse(status_code=200, body=json.dumps(data).encode("utf-8"))
+            finally:
+                with self.lock:
+                    self.num_running -= 1
+
+        return WebClient(token="xoxb-test", transport=InMemoryHttpTransport(handler), **kwargs)
+
+    def test_ordered_results(self):
+        client = self.build_client(delay=0.01)
+        channels = [f"C{i}" for i in range(20)] + ["C_invalid"]
+        results = list(client.batch([("chat.postMessage", {"channel": c, "text": "Hi"}) for c in channels]))
+        self.assertEqual([r.index for r in results], list(range(21)))
+        self.assertTrue(all(isinstance(r, BatchResult) for r in results))
+        self.assertEqual([r.response["channel"] for r in results[:20]], channels[:20])
+        # partial failures are collected instead of raised
+        self.assertFalse(results[20].ok)
+        self.assertIsInstance(results[20].error, SlackApiError)
+        self.assertEqual(results[20].kwargs["channel"], "C_invalid")
+
+    def test_bounded_parallelism(self):
+        client = self.build_client(delay=0.02)
+        calls = (("chat.postMessage", {"channel": f"C{i}", "text": "Hi"}) for i in range(20))
+        results = list(client.batch(calls, max_concurrency=4))
+        self.assertTrue(all(r.ok for r in results))
+        self.assertLessEqual(self.max_running, 4)
+        self.assertGreater(self.max_running, 1)
+
+    def test_unordered_results(self):
+        client = self.build_client(delay=0.02)
+        calls = [("chat.postMessage", {"channel": f"C{i}", "text": "Hi", "delay": 5 if i == 0 else 0}) for i in range(4)]
+        results = list(client.batch(calls, max_concurrency=4, ordered=False))
+        self.assertEqual(sorted(r.index for r in results), [0, 1, 2, 3])
+        # the slowest call comes last
+        self.assertEqual(results[-1].index, 0)
+
+    def test_rate_limiter(self):
+        client = self.build_client()
+        tier = RateLimitTier("test", requests_per_minute=600, burst=2)
+        rate_limiter = RateLimiter(method_tiers={"chat.postMessage": tier})
+        start = time.time()
+        calls = [("chat.postMessage", {"channel": f"C{i}", "text": "Hi"}) for i in range(4)]
+        results = list(client.batch(calls, rate_limiter=rate_limiter))
+        self.assertTrue(all(r.ok for r in results))
+        # 2 calls in a burst, and then 10 calls per second
+        self.assertGreaterEqual(time.time() - start, 0.15)
+
+    def test_rate_limiter_of_both_client_and_batch(self):
+        client = self.build_client(rate_limiter=RateLimiter())
+        calls = [("chat.postMessage", {"channel": "C1", "text": "Hi"})]
+        # Each call would acquire a slot from both rate limiters
+        with self.assertRaises(ValueError):
+            client.batch(calls, rate_limiter=RateLimiter())
+        # The client's rate limiter throttles the calls
+        batch = client.batch(calls)
+        self.assertIsNone(batch.rate_limiter)
+        self.assertTrue(all(r.ok for r in batch))
+
+    def test_break(self):
+        client = self.build_client(delay=0.01)
+        calls = [("chat.postMessage", {"channel": f"C{i}", "text": "Hi"}) for i in range(100)]
+        for result in client.batch(calls, max_concurrency=2):
+            self.assertTrue(result.ok)
+            break
+        sent = len(client.transport.received_requests)
+        self.assertLess(sent, 100)
@@ -0,0 +1,69 @@
+import tempfile
+import time
+import unittest
+
+from slack_sdk import WebClient
+from slack_sdk.http_transport import InMemoryHttpTransport
+from slack_sdk.oauth.installation_store import Bot, FileInstallationStore
+from slack_sdk.web.client_pool import WebClientPool
+
+
+class TestWebClientPool(unittest.TestCase):
+    def setUp(self):
+        self.transport = InMemoryHttpTransport()
+        self.transport.add_response("auth.test", body={"ok": True})
+        self.base_client = WebClient(transport=self.transport, headers={"X-Custom": "foo"})
+
+    def test_get(self):
+        pool = WebClientPool(self.base_client)
+        client = pool.get("xoxb-111")
+        self.assertIs(pool.get("xoxb-111"), client)
+        self.assertIsNot(pool.get("xoxb-222"), client)
+        self.assertIs(client.transport, self.base_client.transport)
+        self.assertIs(client.retry_handlers, self.base_client.retry_handlers)
+        self.assertIsNone(self.base_client.token)
+
+        client.auth_test()
+        pool.get("xoxb-222").auth_test()
+        requests = self.transport.received_requests
+        self.assertEqual(requests[0].headers["Authorization"], "Bearer xoxb-111")
+        self.assertEqual(requests[1].headers["Authorization"], "Bearer xoxb-222")
+        self.assertEqual({k.lower(): v for k, v in requests[1].headers.items()}["x-custom"], "foo")
+
+    def test_org_wide_installation_tokens(self):
+        pool = WebClientPool(self.base_client)
+        client = pool.get("xoxb-111", team_id="T111")
+        self.assertEqual(client.default_params, {"team_id": "T111"})
+        self.assertEqual(pool.get("xoxb-111").default_params, {})
+        self.assertEqual(self.base_client.default_params, {})
+
+    def test_max_clients(self):
+        pool = WebClientPool(self.base_client, max_clients=2)
+        client = pool.get("xoxb-111")
+        pool.get("xoxb-222")
+        pool.get("xoxb-111")
+        pool.get("xoxb-333")
+        self.assertEqual(len(pool), 2)
+        # the least recently used one is discarded
+        self.assertIs(pool.get("xoxb-111"), client)
+
+    def test_get_for_installation(self):
+        store = FileInstallationStore(base_dir=tempfile.mkdtemp(), client_id="111.222")
+        store.save_bot(
+            Bot(
+                enterprise_id="E111",
+                team_id="T111",
+                bot_token="xoxb-111",
+                bot_id="B111",
+                bot_user_id="U111",
+                installed_at=time.time(),
+            )
+        )
+        pool = WebClientPool(self.base_client, installation_store=store)
+        client = pool.get_for_installation(enterprise_id="E111", team_id="T111")
+        self.assertEqual(client.token, "xoxb-111")
+        self.assertIs(pool.get_for_installation(enterprise_id="E111", team_id="T111"), client)
+        self.assertIsNone(pool.get_for_installation(enterprise_id="E111", team_id="T222"))
+
+        with self.assertRaises(ValueError):
+            WebClientPool(self.base_client).get_for_installation(enterprise_id=None, team_id="T111")
@@ -144,6 +144,9 @@ class TestInternalUtils(unittest.TestCase):
         filepath = "tests/slack_sdk/web/test_internal_utils.py"
         upload_item_str = _to_v2_file_upload_item({"file": filepath})
         upload_item_path = _to_v2_file_upload_item({"file": Path(filepath)})
+        # The file content is read while uploading it, so compare the content to be sent
+        data_str, data_path = upload_item_str.pop("data"), upload_item_path.pop("data")
+        assert b"".join(data_path) == b"".join(data_str) == Path(filepath).read_bytes()
         assert upload_item_path == upload_item_str
         assert upload_item_str.get("filename") == "test_internal_utils.py"
 
@@ -0,0 +1,219 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError, SlackRequestError
+from slack_sdk.http_transport import InMemoryHttpTransport, TransportRequest, TransportResponse
+from slack_sdk.web import Paginator
+from slack_sdk.web.pagination_checkpoint import FilePaginationCheckpointStore, PaginationCheckpoint
+
+
+def build_users_list_handler(num_pages: int, page_size: int = 2, delay: float = 0.0):
+    def handler(request: TransportRequest) -> TransportResponse:
+        time.sleep(delay)
+        params = parse_qs(request.body.decode("utf-8")) if request.body else {}
+        page = int(params["cursor"][0]) if "cursor" in params else 0
+        if page >= num_pages:
+            body = {"ok": False, "error": "invalid_cursor"}
+        else:
+            next_cursor = str(page + 1) if page + 1 < num_pages else ""
+            members = [{"id": f"U{page}{i}"} for i in range(page_size)]
+            body = {"ok": True, "members": members, "response_metadata": {"next_cursor": next_cursor}}
+        return TransportResponse(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            body=json.dumps(body).encode("utf-8"),
+        )
+
+    return handler
+
+
+class TestPaginator(unittest.TestCase):
+    def test_items(self):
+        for prefetch in [0, 1, 3]:
+            transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+            client = WebClient(token="xoxb-test", transport=transport)
+            members = list(Paginator(client.users_list(limit=2), prefetch=prefetch))
+            self.assertEqual([m["id"] for m in members], ["U00", "U01", "U10", "U11", "U20", "U21"])
+            self.assertEqual(len(transport.received_requests), 3)
+
+    def test_pages(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+        client = WebClient(token="xoxb-test", transport=transport)
+        cursors = [cursor for cursor, _ in Paginator(client.users_list(limit=2)).pages()]
+        self.assertEqual(cursors, [None, "1", "2"])
+
+    def test_prefetching(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=4, delay=0.1))
+        client = WebClient(token="xoxb-test", transport=transport)
+        response = client.users_list(limit=2)
+        started_at = time.monotonic()
+        for _ in Paginator(response, item_key="members", prefetch=1):
+            # processing the items takes as long as fetching a page
+            time.sleep(0.05)
+        # 3 pages x (0.1 sec fetching) + 8 items x (0.05 sec processing) without prefetching
+        self.assertLess(time.monotonic() - started_at, 0.6)
+
+    def test_bounded_look_ahead(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=10))
+        client = WebClient(token="xoxb-test", transport=transport)
+        iterator = iter(Paginator(client.users_list(limit=2), prefetch=2))
+        next(iterator)
+        time.sleep(0.3)
+        # the first page + 2 prefetched pages + 1 page waiting to be queued
+        self.assertLessEqual(len(transport.received_requests), 4)
+        iterator.close()
+
+    def test_break(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=100))
+        client = WebClient(token="xoxb-test", transport=transport)
+        num_threads = threading.active_count()
+        for member in Paginator(client.users_list(limit=2), prefetch=1):
+            if member["id"] == "U10":
+                break
+        time.sleep(0.3)
+        self.assertLessEqual(threading.active_count(), num_threads)
+        self.assertLess(len(transport.received_requests), 10)
+
+    def test_errors(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=2))
+        client = WebClient(token="xoxb-test", transport=transport)
+        response = client.users_list(limit=2)
+        response.data["response_metadata"]["next_cursor"] = "5"
+        with self.assertRaises(SlackApiError) as cm:
+            list(Paginator(response))
+        self.assertEqual(cm.exception.response["error"], "invalid_cursor")
+
+        transport = InMemoryHttpTransport()
+        transport.add_response("conversations.list", body={"ok": True, "channels": [], "members": []})
+        response = WebClient(token="xoxb-test", transport=transport).conversations_list()
+        with self.assertRaises(SlackRequestError):
+            list(Paginator(response))
+        self.assertEqual(list(Paginator(response, item_key="channels")), [])
+
+    def test_paginate(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+        client = WebClient(token="xoxb-test", transport=transport)
+        paginator = client.paginate("users.list", key="members", limit=2)
+        # No request is sent until the iteration starts
+        self.assertEqual(len(transport.received_requests), 0)
+        self.assertEqual([m["id"] for m in paginator], ["U00", "U01", "U10", "U11", "U20", "U21"])
+        self.assertEqual(parse_qs(transport.received_requests[0].body.decode("utf-8"))["limit"], ["2"])
+        self.assertEqual(paginator.num_items, 6)
+
+    def test_paginate_max_items(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=100))
+        client = WebClient(token="xoxb-test", transport=transport)
+        members = list(client.paginate("users.list", limit=2, max_items=3, prefetch=0))
+        self.assertEqual([m["id"] for m in members], ["U00", "U01", "U10"])
+        self.assertEqual(len(transport.received_requests), 2)
+
+    def test_paginate_cursor_and_offset(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+        client = WebClient(token="xoxb-test", transport=transport)
+        paginator = client.paginate("users.list", limit=2)
+        positions = [(paginator.cursor, paginator.offset) for _ in paginator]
+        self.assertEqual(positions, [(None, 1), (None, 2), ("1", 1), ("1", 2), ("2", 1), ("2", 2)])
+
+        # resuming from the cursor
+        members = list(client.paginate("users.list", limit=2, cursor="2"))
+        self.assertEqual([m["id"] for m in members], ["U20", "U21"])
+
+    def test_paginate_errors(self):
+        with self.assertRaises(SlackRequestError):
+            Paginator()
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=1))
+        client = WebClient(token="xoxb-test", transport=transport)
+        with self.assertRaises(SlackApiError):
+            list(client.paginate("users.list", cursor="5"))
+
+    def test_checkpoint(self):
+        transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+        client = WebClient(token="xoxb-test", transport=transport)
+        paginator = client.paginate("users.list", limit=2)
+        iterator = iter(paginator)
+        for _ in range(3):
+            next(iterator)
+        iterator.close()
+        checkpoint = PaginationCheckpoint.from_dict(json.loads(json.dumps(paginator.checkpoint().to_dict())))
+        self.assertEqual(
+            checkpoint.to_dict(),
+            {
+                "api_method": "users.list",
+                "params": {"limit": 2},
+                "cursor": "1",
+                "offset": 1,
+                "num_items": 3,
+                "item_key": "members",
+            },
+        )
+
+        transport.received_requests.clear()
+        paginator = Paginator(client=client, checkpoint=checkpoint)
+        self.assertEqual([m["id"] for m in paginator], ["U11", "U20", "U21"])
+        self.assertEqual(paginator.num_items, 6)
+        # resumed from the page of the checkpoint
+        self.assertEqual(parse_qs(transport.received_requests[0].body.decode("utf-8"))["cursor"], ["1"])
+
+        # checkpoints taken from a Paginator built with a response work too
+        paginator = Paginator(client.users_list(limit=2))
+        self.assertEqual(paginator.checkpoint().api_method, "users.list")
+        self.assertEqual(paginator.checkpoint().params, {"limit": 2})
+
+    def test_checkpoint_store(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            store = FilePaginationCheckpointStore(base_dir=base_dir)
+            transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+            client = WebClient(token="xoxb-test", transport=transport)
+
+            members = []
+            with self.assertRaises(RuntimeError):
+                for member in client.paginate("users.list", limit=2, checkpoint_store=store, checkpoint_key="k"):
+                    if member["id"] == "U11":
+                        raise RuntimeError("interrupted")
+                    members.append(member["id"])
+            # Saved when starting the second page
+            self.assertEqual(store.find("k").cursor, "1")
+            self.assertEqual(store.find("k").offset, 0)
+
+            transport.received_requests.clear()
+            for member in client.paginate("users.list", limit=2, checkpoint_store=store, checkpoint_key="k"):
+                members.append(member["id"])
+            self.assertEqual(members, ["U00", "U01", "U10", "U10", "U11", "U20", "U21"])
+            self.assertEqual(len(transport.received_requests), 2)
+            # Deleted after the completion
+            self.assertIsNone(store.find("k"))
+
+            with self.assertRaises(SlackRequestError):
+                client.paginate("users.list", checkpoint_store=store)
+
+    def test_checkpoint_store_never_saves_tokens(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            store = FilePaginationCheckpointStore(base_dir=base_dir)
+            transport = InMemoryHttpTransport(build_users_list_handler(num_pages=3))
+            client = WebClient(transport=transport)
+
+            paginator = client.paginate(
+                "users.list", token="xoxb-secret", limit=2, checkpoint_store=store, checkpoint_key="k"
+            )
+            iterator = iter(paginator)
+            for _ in range(3):
+                next(iterator)
+            self.assertNotIn("token", paginator.checkpoint().params)
+            self.assertNotIn("token", store.find("k").params)
+            for path in Path(base_dir).rglob("*"):
+                if path.is_file():
+                    self.assertNotIn("xoxb-secret", path.read_text())
+            iterator.close()
+
+            # The token given when resuming is used for the following requests
+            transport.received_requests.clear()
+            members = list(client.paginate("users.list", token="xoxb-secret", checkpoint_store=store, checkpoint_key="k"))
+            self.assertEqual([m["id"] for m in members], ["U10", "U11", "U20", "U21"])
+            for request in transport.received_requests:
+                self.assertEqual(request.headers["Authorization"], "Bearer xoxb-secret")
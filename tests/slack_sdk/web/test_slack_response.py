@@ -1,9 +1,19 @@
+import threading
+import time
 import unittest
 
+from slack_sdk.errors import SlackApiError
+from slack_sdk.json_codec import StdlibJsonCodec, set_json_codec
 from slack_sdk.web import WebClient
 from slack_sdk.web.slack_response import SlackResponse
 
 
+class SlowJsonCodec(StdlibJsonCodec):
+    def loads(self, data):
+        time.sleep(0.05)
+        return super().loads(data)
+
+
 class TestSlackResponse(unittest.TestCase):
     def setUp(self):
         pass
@@ -57,3 +67,80 @@ class TestSlackResponse(unittest.TestCase):
         )
         self.assertTrue("ok" in response)
         self.assertTrue("foo" not in response)
+
+    def test_lazy_decoding(self):
+        response = SlackResponse(
+            client=WebClient(token="xoxb-dummy"),
+            http_verb="POST",
+            api_url="http://localhost:3000/api.test",
+            req_args={},
+            data=None,
+            headers={},
+            status_code=200,
+            raw_body=b'{"ok":true,"args":{"hello":"world"}}',
+        )
+        # validate() does not decode the whole body
+        self.assertIs(response.validate(), response)
+        self.assertIsNotNone(response._raw_body)
+        self.assertEqual(response["args"], {"hello": "world"})
+        self.assertIsNone(response._raw_body)
+        self.assertEqual([page["args"] for page in response], [{"hello": "world"}])
+
+    def test_lazy_decoding_errors(self):
+        response = SlackResponse(
+            client=WebClient(token="xoxb-dummy"),
+            http_verb="POST",
+            api_url="http://localhost:3000/api.test",
+            req_args={},
+            data=None,
+            headers={},
+            status_code=200,
+            raw_body=b'{"ok":false,"error":"invalid_auth"}',
+        )
+        with self.assertRaises(SlackApiError):
+            response.validate()
+        self.assertEqual(response["error"], "invalid_auth")
+
+        response = SlackResponse(
+            client=WebClient(token="xoxb-dummy"),
+            http_verb="POST",
+            api_url="http://localhost:3000/api.test",
+            req_args={},
+            data=None,
+            headers={},
+            status_code=200,
+            raw_body=b"{<html></html>",
+        )
+        with self.assertRaises(SlackApiError):
+            response.validate()
+        self.assertFalse(response["ok"])
+
+    def test_lazy_decoding_from_multiple_threads(self):
+        set_json_codec(SlowJsonCodec())
+        try:
+            response = SlackResponse(
+                client=WebClient(token="xoxb-dummy"),
+                http_verb="POST",
+                api_url="http://localhost:3000/api.test",
+                req_args={},
+                data=None,
+                headers={},
+                status_code=200,
+                raw_body=b'{"ok":true,"args":{"hello":"world"}}',
+            ).validate()
+            barrier = threading.Barrier(10)
+            results = []
+
+            def read():
+                barrier.wait()
+                # The other threads access the response while the first one is decoding it
+                results.append((response["ok"], response.get("args"), response.data is not None))
+
+            threads = [threading.Thread(target=read) for _ in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(results, [(True, {"hello": "world"}, True)] * 10)
+        finally:
+            set_json_codec(None)
@@ -1,3 +1,4 @@
+import json
 import re
 import socket
 import unittest
@@ -235,3 +236,18 @@ class TestWebClient(unittest.TestCase):
     def test_base_url_preserves_trailing_slash_issue_15141(self):
         client = WebClient(base_url="http://localhost:8888/")
         self.assertEqual(client.base_url, "http://localhost:8888/")
+
+    def test_perform_urllib_http_request_returns_the_body(self):
+        bodies = []
+
+        class BodyRecordingClient(WebClient):
+            def _perform_urllib_http_request(self, *, url, args):
+                response = super()._perform_urllib_http_request(url=url, args=args)
+                bodies.append(response["body"])
+                return response
+
+        client = BodyRecordingClient(token="xoxb-api_test", base_url="http://localhost:8888")
+        resp = client.api_test(msg="bye")
+        self.assertEqual("bye", resp["args"]["msg"])
+        self.assertEqual(len(bodies), 1)
+        self.assertTrue(json.loads(bodies[0])["ok"])
@@ -0,0 +1,233 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO, StringIO
+from typing import List, Tuple
+from urllib.error import URLError
+from urllib.parse import parse_qs, urlparse
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_retry import ConnectionErrorRetryHandler
+from slack_sdk.http_retry.builtin_interval_calculators import FixedValueRetryIntervalCalculator
+from slack_sdk.http_transport import InMemoryHttpTransport, TransportRequest, TransportResponse, UrllibHttpTransport
+from slack_sdk.web.internal_utils import _UPLOAD_CHUNK_SIZE, _FileUploadBody, _to_v2_file_upload_item
+from tests.helpers import async_test
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+    received: List[Tuple[dict, bytes]] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        UploadHandler.received.append((dict(self.headers), body))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.end_headers()
+        self.wfile.write(b"OK - 1")
+
+
+class TestWebClientFilesUploadV2(unittest.TestCase):
+    def setUp(self):
+        self.file = tempfile.NamedTemporaryFile(suffix=".log", delete=False)
+        self.content = os.urandom(_UPLOAD_CHUNK_SIZE * 2 + 123)
+        self.file.write(self.content)
+        self.file.close()
+
+    def tearDown(self):
+        os.unlink(self.file.name)
+
+    def build_transport(self, upload_url: str, upload_handler) -> InMemoryHttpTransport:
+        def handler(request: TransportRequest) -> TransportResponse:
+            path = urlparse(request.url).path
+            if path.endswith("files.getUploadURLExternal"):
+                filename = parse_qs(request.body.decode("utf-8"))["filename"][0]  # type: ignore[union-attr]
+                body = json.dumps({"ok": True, "file_id": f"F-{filename}", "upload_url": f"{upload_url}?{filename}"})
+            elif path.endswith("files.completeUploadExternal"):
+                files = json.loads(parse_qs(request.body.decode("utf-8"))["files"][0])  # type: ignore[union-attr]
+                body = json.dumps({"ok": True, "files": [{"id": f["id"]} for f in files]})
+            else:
+                return upload_handler(request)
+            headers = {"Content-Type": "application/json;charset=utf-8"}
+            return TransportResponse(status_code=200, headers=headers, body=body.encode("utf-8"))
+
+        return InMemoryHttpTransport(handler)
+
+    def test_file_path_is_sent_chunk_by_chunk(self):
+        chunks: List[bytes] = []
+
+        def upload(request: TransportRequest) -> TransportResponse:
+            self.assertEqual(request.headers["Content-length"], str(len(self.content)))
+            chunks.extend(request.body)  # type: ignore[arg-type]
+            return TransportResponse(status_code=200, headers={}, body=b"OK - 1")
+
+        progress: List[Tuple[str, int, int]] = []
+        client = WebClient(token="xoxb-test", transport=self.build_transport("https://files.slack.com/upload/v1/x", upload))
+        response = client.files_upload_v2(
+            file=self.file.name,
+            channel="C111",
+            progress_callback=lambda *args: progress.append(args),
+        )
+        self.assertEqual(response["file"]["id"], f"F-{os.path.basename(self.file.name)}")
+        self.assertEqual(b"".join(chunks), self.content)
+        self.assertEqual(max(len(c) for c in chunks), _UPLOAD_CHUNK_SIZE)
+
+        filename = os.path.basename(self.file.name)
+        total = len(self.content)
+        self.assertEqual(
+            progress,
+            [
+                (filename, 0, total),
+                (filename, _UPLOAD_CHUNK_SIZE, total),
+                (filename, _UPLOAD_CHUNK_SIZE * 2, total),
+                (filename, total, total),
+            ],
+        )
+
+    def test_file_is_sent_with_content_length(self):
+        server = HTTPServer(("localhost", 0), UploadHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            UploadHandler.received = []
+            upload_url = f"http://localhost:{server.server_address[1]}/upload/v1/x"
+            client = WebClient(token="xoxb-test", transport=self.build_transport(upload_url, UrllibHttpTransport().send))
+            with open(self.file.name, "rb") as f:
+                f.seek(100)
+                client.files_upload_v2(file=f, filename="foo.log", channel="C111")
+
+            self.assertEqual(len(UploadHandler.received), 1)
+            headers, body = UploadHandler.received[0]
+            self.assertEqual(body, self.content[100:])
+            self.assertEqual(headers["Content-Length"], str(len(self.content) - 100))
+            self.assertNotIn("Transfer-Encoding", headers)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_multiple_files_are_uploaded_concurrently(self):
+        # All the three uploads must be in flight at the same time to pass this barrier
+        barrier = threading.Barrier(3, timeout=5)
+
+        def upload(request: TransportRequest) -> TransportResponse:
+            barrier.wait()
+            return TransportResponse(status_code=200, headers={}, body=b"OK - 1")
+
+        client = WebClient(token="xoxb-test", transport=self.build_transport("https://files.slack.com/upload/v1/x", upload))
+        response = client.files_upload_v2(
+            file_uploads=[{"content": f"file {i}", "filename": f"{i}.txt"} for i in range(3)],
+            channel="C111",
+            max_concurrency=3,
+        )
+        # The files are completed in the given order
+        self.assertEqual([f["id"] for f in response["files"]], ["F-0.txt", "F-1.txt", "F-2.txt"])
+
+    def test_progress_callback_calls_never_overlap(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def upload(request: TransportRequest) -> TransportResponse:
+            barrier.wait()
+            b"".join(request.body)  # type: ignore[arg-type]
+            return TransportResponse(status_code=200, headers={}, body=b"OK - 1")
+
+        in_callback = threading.Lock()
+        overlaps: List[str] = []
+        progress: List[Tuple[str, int, int]] = []
+
+        def progress_callback(filename: str, sent: int, total: int):
+            if not in_callback.acquire(blocking=False):
+                overlaps.append(filename)
+                return
+            try:
+                time.sleep(0.01)
+                progress.append((filename, sent, total))
+            finally:
+                in_callback.release()
+
+        client = WebClient(token="xoxb-test", transport=self.build_transport("https://files.slack.com/upload/v1/x", upload))
+        client.files_upload_v2(
+            file_uploads=[{"content": f"file {i}", "filename": f"{i}.txt"} for i in range(3)],
+            channel="C111",
+            max_concurrency=3,
+            progress_callback=progress_callback,
+        )
+        self.assertEqual(overlaps, [])
+        self.assertEqual(sorted(progress), [(f"{i}.txt", sent, 6) for i in range(3) for sent in (0, 6)])
+
+    def test_failed_upload_is_retried_per_file(self):
+        uploads: List[str] = []
+        lock = threading.Lock()
+
+        def upload(request: TransportRequest) -> TransportResponse:
+            filename = urlparse(request.url).query
+            with lock:
+                uploads.append(filename)
+                if uploads.count(filename) == 1 and filename == "1.txt":
+                    raise URLError("Connection reset by peer")
+            return TransportResponse(status_code=200, headers={}, body=b"OK - 1")
+
+        client = WebClient(
+            token="xoxb-test",
+            transport=self.build_transport("https://files.slack.com/upload/v1/x", upload),
+            retry_handlers=[ConnectionErrorRetryHandler(interval_calculator=FixedValueRetryIntervalCalculator(0))],
+        )
+        response = client.files_upload_v2(
+            file_uploads=[{"content": f"file {i}", "filename": f"{i}.txt"} for i in range(3)],
+            channel="C111",
+        )
+        self.assertEqual(len(response["files"]), 3)
+        self.assertEqual(sorted(uploads), ["0.txt", "1.txt", "1.txt", "2.txt"])
+
+    def test_failed_upload_stops_the_upload(self):
+        def upload(request: TransportRequest) -> TransportResponse:
+            return TransportResponse(status_code=500, headers={}, body=b"error")
+
+        client = WebClient(token="xoxb-test", transport=self.build_transport("https://files.slack.com/upload/v1/x", upload))
+        with self.assertRaises(SlackRequestError):
+            client.files_upload_v2(file_uploads=[{"content": f"file {i}", "filename": f"{i}.txt"} for i in range(3)])
+
+    def test_upload_items(self):
+        item = _to_v2_file_upload_item({"file": self.file.name})
+        self.assertIsInstance(item["data"], _FileUploadBody)
+        self.assertEqual(item["length"], len(self.content))
+
+        # Non-seekable or text data is read as before
+        item = _to_v2_file_upload_item({"file": StringIO("hello")})
+        self.assertEqual(item["data"], b"hello")
+        item = _to_v2_file_upload_item({"content": "hello"})
+        self.assertEqual(item["data"], b"hello")
+
+        progress: List[Tuple[str, int, int]] = []
+        item = _to_v2_file_upload_item({"content": "hello", "filename": "a.txt"}, lambda *args: progress.append(args))
+        self.assertEqual(b"".join(item["data"]), b"hello")  # type: ignore[arg-type]
+        self.assertEqual(progress, [("a.txt", 0, 5), ("a.txt", 5, 5)])
+
+    def test_body_can_be_sent_again(self):
+        body = _FileUploadBody(source=BytesIO(b"abcdefg"), length=7, filename="a.txt", chunk_size=3)
+        self.assertEqual(list(body), [b"abc", b"def", b"g"])
+        self.assertEqual(list(body), [b"abc", b"def", b"g"])
+
+    def test_truncated_file(self):
+        body = _FileUploadBody(source=self.file.name, length=len(self.content) + 1, filename="a.log")
+        with self.assertRaises(SlackRequestError):
+            list(body)
+
+    @async_test
+    async def test_async_iteration(self):
+        progress: List[Tuple[str, int, int]] = []
+        body = _FileUploadBody(
+            source=self.file.name,
+            length=len(self.content),
+            filename="a.log",
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        self.assertEqual(b"".join([chunk async for chunk in body]), self.content)
+        self.assertEqual(progress[-1], ("a.log", len(self.content), len(self.content)))
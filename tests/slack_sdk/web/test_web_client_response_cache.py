@@ -0,0 +1,66 @@
+import unittest
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_transport import InMemoryHttpTransport
+from slack_sdk.web.response_cache import ResponseCache
+
+
+class TestWebClientResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.transport = InMemoryHttpTransport()
+        self.transport.add_response("users.info", body={"ok": True, "user": {"id": "U111"}})
+        self.transport.add_response("users.profile.set", body={"ok": True, "profile": {}})
+        self.transport.add_response("chat.postMessage", body={"ok": True, "ts": "111.222"})
+        self.transport.add_response("conversations.info", body={"ok": False, "error": "channel_not_found"})
+
+    def test_cache_hits(self):
+        client = WebClient(token="xoxb-test", transport=self.transport, response_cache=ResponseCache())
+        for _ in range(3):
+            response = client.users_info(user="U111")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["user"]["id"], "U111")
+        self.assertEqual(len(self.transport.received_requests), 1)
+
+        client.users_info(user="U222")
+        self.assertEqual(len(self.transport.received_requests), 2)
+
+        # Not cacheable
+        client.chat_postMessage(channel="C111", text="Hi!")
+        client.chat_postMessage(channel="C111", text="Hi!")
+        self.assertEqual(len(self.transport.received_requests), 4)
+
+    def test_errors_are_not_cached(self):
+        client = WebClient(token="xoxb-test", transport=self.transport, response_cache=ResponseCache())
+        for _ in range(2):
+            with self.assertRaises(SlackApiError):
+                client.conversations_info(channel="C111")
+        self.assertEqual(len(self.transport.received_requests), 2)
+
+    def test_invalidation(self):
+        cache = ResponseCache()
+        client = WebClient(token="xoxb-test", transport=self.transport, response_cache=cache)
+        client.users_info(user="U111")
+        cache.invalidate(api_method="users.info", token=client.token, params={"user": "U111"})
+        client.users_info(user="U111")
+        self.assertEqual(len(self.transport.received_requests), 2)
+
+        client.users_profile_set(user="U111", name="display_name", value="foo")
+        client.users_info(user="U111")
+        self.assertEqual(len(self.transport.received_requests), 4)
+
+    def test_shared_among_clients(self):
+        cache = ResponseCache()
+        WebClient(token="xoxb-test", transport=self.transport, response_cache=cache).users_info(user="U111")
+        WebClient(token="xoxb-test", transport=self.transport, response_cache=cache).users_info(user="U111")
+        WebClient(token="xoxb-another", transport=self.transport, response_cache=cache).users_info(user="U111")
+        self.assertEqual(len(self.transport.received_requests), 2)
+
+    def test_other_responses_are_not_decoded(self):
+        transport = InMemoryHttpTransport()
+        transport.add_response("chat.postMessage", body=b'{"ok":true,"ts":"111.222"}')
+        client = WebClient(token="xoxb-test", transport=transport, response_cache=ResponseCache())
+        response = client.chat_postMessage(channel="C111", text="Hi!")
+        # Neither caching nor invalidation needs the data
+        self.assertIsNotNone(response._raw_body)
+        self.assertEqual(response["ts"], "111.222")
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_transport import InMemoryHttpTransport, TransportRequest, TransportResponse
+from slack_sdk.web.single_flight import SingleFlight
+
+
+class TestWebClientSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.num_requests = 0
+
+        def handler(request: TransportRequest) -> TransportResponse:
+            with self.lock:
+                self.num_requests += 1
+            time.sleep(0.2)
+            if request.url.endswith("/conversations.info"):
+                body = {"ok": False, "error": "channel_not_found"}
+            else:
+                body = {"ok": True}
+            return TransportResponse(status_code=200, headers={}, body=json.dumps(body).encode("utf-8"))
+
+        self.transport = InMemoryHttpTransport(handler)
+
+    def test_coalescing(self):
+        client = WebClient(token="xoxb-test", transport=self.transport, single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(executor.map(lambda _: client.users_info(user="U111"), range(10)))
+        self.assertEqual(self.num_requests, 1)
+        self.assertTrue(all(r is responses[0] for r in responses))
+        self.assertEqual(client.single_flight.num_in_flight_calls(), 0)
+
+        # Calls made after the completion send a new request
+        client.users_info(user="U111")
+        self.assertEqual(self.num_requests, 2)
+
+    def test_different_args(self):
+        client = WebClient(token="xoxb-test", transport=self.transport, single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(lambda i: client.users_info(user=f"U{i % 2}"), range(10)))
+        self.assertEqual(self.num_requests, 2)
+
+    def test_not_coalescable(self):
+        client = WebClient(token="xoxb-test", transport=self.transport, single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: client.chat_postMessage(channel="C111", text="Hi!"), range(3)))
+        self.assertEqual(self.num_requests, 3)
+
+    def test_errors(self):
+        client = WebClient(token="xoxb-test", transport=self.transport, single_flight=SingleFlight())
+
+        def call(_):
+            try:
+                client.conversations_info(channel="C111")
+            except SlackApiError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            errors = list(executor.map(call, range(5)))
+        self.assertEqual(self.num_requests, 1)
+        self.assertTrue(all(isinstance(e, SlackApiError) for e in errors))
+        self.assertEqual(client.single_flight.num_in_flight_calls(), 0)
+
+    def test_waiters_read_the_shared_response_at_the_same_time(self):
+        def handler(request: TransportRequest) -> TransportResponse:
+            time.sleep(0.2)
+            # validate() does not decode this body
+            return TransportResponse(status_code=200, headers={}, body=b'{"ok":true}')
+
+        transport = InMemoryHttpTransport(handler)
+        client = WebClient(token="xoxb-test", transport=transport, single_flight=SingleFlight())
+        started = threading.Barrier(10)
+
+        def call(_):
+            started.wait()
+            response = client.users_info(user="U111")
+            # The shared response is already decoded when the threads receive it
+            decoded = response._raw_body is None
+            # All the threads read the shared response right after receiving it
+            return decoded, response["ok"], response.get("ok"), response.data
+
+        for _ in range(5):
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                results = list(executor.map(call, range(10)))
+            self.assertEqual(results, [(True, True, True, {"ok": True})] * 10)
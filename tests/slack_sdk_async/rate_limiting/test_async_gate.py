@@ -0,0 +1,169 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import SimpleHTTPRequestHandler
+
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_sdk.rate_limiting.async_gate import AsyncRateLimitGate
+from slack_sdk.rate_limiting.rate_limiter import _build_workspace_key
+from slack_sdk.web.async_client import AsyncWebClient
+from tests.mock_web_api_server import cleanup_mock_web_api_server_async, setup_mock_web_api_server_async
+from tests.slack_sdk_async.helpers import async_test
+
+
+class RateLimitedHandler(SimpleHTTPRequestHandler):
+    """Returns 429 for the first request and all the requests within 1 second after it"""
+
+    lock = threading.Lock()
+    blocked_until = None
+    status_codes = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        cls = RateLimitedHandler
+        with cls.lock:
+            now = time.time()
+            if cls.blocked_until is None:
+                cls.blocked_until = now + 1
+            status = 429 if now < cls.blocked_until else 200
+            cls.status_codes.append(status)
+        self.send_response(status)
+        self.send_header("content-type", "application/json;charset=utf-8")
+        if status == 429:
+            self.send_header("retry-after", "1")
+        self.send_header("connection", "close")
+        self.end_headers()
+        self.wfile.write(json.dumps({"ok": status == 200}).encode("utf-8"))
+
+
+class SlowHandler(SimpleHTTPRequestHandler):
+    """Responds after 0.5 seconds"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(0.5)
+        self.send_response(200)
+        self.send_header("content-type", "application/json;charset=utf-8")
+        self.send_header("connection", "close")
+        self.end_headers()
+        self.wfile.write(b'{"ok":true}')
+
+
+class TestAsyncRateLimitGate(unittest.TestCase):
+    @async_test
+    async def test_gate(self):
+        gate = AsyncRateLimitGate()
+        key = {"workspace_key": "W1", "api_method": "users.list"}
+        self.assertFalse(await gate.enter(**key))
+        gate.exit(**key, probe=False, status_code=429, retry_after=0.1)
+        self.assertTrue(gate.is_closed(**key))
+        self.assertFalse(gate.is_closed(workspace_key="W1", api_method="users.info"))
+
+        started_at = time.monotonic()
+        self.assertTrue(await gate.enter(**key))
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.1)
+
+        async def enter_and_exit():
+            probe = await gate.enter(**key)
+            gate.exit(**key, probe=probe, status_code=200)
+            return probe
+
+        # the other calls wait for the probe call
+        others = asyncio.ensure_future(asyncio.gather(*[enter_and_exit() for _ in range(3)]))
+        await asyncio.sleep(0.05)
+        self.assertFalse(others.done())
+        gate.exit(**key, probe=True, status_code=200)
+        self.assertEqual(await others, [False, False, False])
+        self.assertFalse(gate.is_closed(**key))
+
+    @async_test
+    async def test_probe_failures(self):
+        gate = AsyncRateLimitGate()
+        key = {"workspace_key": "W1", "api_method": "users.list"}
+        gate.exit(**key, probe=False, status_code=429, retry_after=0)
+        self.assertTrue(await gate.enter(**key))
+        # connection error: the next call becomes the probe
+        gate.exit(**key, probe=True)
+        self.assertTrue(await gate.enter(**key))
+        # rate limited again
+        gate.exit(**key, probe=True, status_code=429, retry_after=0.1)
+        started_at = time.monotonic()
+        self.assertTrue(await gate.enter(**key))
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.1)
+
+    @async_test
+    async def test_waiters_wake_up_when_the_probe_call_completes(self):
+        gate = AsyncRateLimitGate()
+        key = {"workspace_key": "W1", "api_method": "users.list"}
+        gate.exit(**key, probe=False, status_code=429, retry_after=0)
+        self.assertTrue(await gate.enter(**key))
+        waiter = asyncio.ensure_future(gate.enter(**key))
+        await asyncio.sleep(0.05)
+        self.assertFalse(waiter.done())
+        gate.exit(**key, probe=True, status_code=200)
+        self.assertFalse(await asyncio.wait_for(waiter, timeout=0.1))
+
+    @async_test
+    async def test_cancelled_waiters(self):
+        gate = AsyncRateLimitGate()
+        key = {"workspace_key": "W1", "api_method": "users.list"}
+        gate.exit(**key, probe=False, status_code=429, retry_after=0)
+        self.assertTrue(await gate.enter(**key))
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(gate.enter(**key), timeout=0.05)
+        # a cancelled probe call releases the slot without a status code
+        gate.exit(**key, probe=True)
+        self.assertTrue(await asyncio.wait_for(gate.enter(**key), timeout=0.1))
+
+
+class TestAsyncWebClientWithRateLimitGate(unittest.TestCase):
+    def setUp(self):
+        RateLimitedHandler.blocked_until = None
+        RateLimitedHandler.status_codes = []
+        setup_mock_web_api_server_async(self, RateLimitedHandler)
+
+    def tearDown(self):
+        cleanup_mock_web_api_server_async(self)
+
+    @async_test
+    async def test_single_429_per_burst(self):
+        client = AsyncWebClient(
+            token="xoxb-api_test",
+            base_url="http://localhost:8888",
+            retry_handlers=[AsyncRateLimitErrorRetryHandler(max_retry_count=3)],
+            rate_limit_gate=AsyncRateLimitGate(),
+        )
+        first = asyncio.ensure_future(client.api_test())
+        await asyncio.sleep(0.1)
+        responses = await asyncio.gather(first, *[client.api_test() for _ in range(5)])
+        self.assertTrue(all(r["ok"] for r in responses))
+        self.assertEqual(RateLimitedHandler.status_codes.count(429), 1)
+
+
+class TestAsyncWebClientWithRateLimitGateAndCancellation(unittest.TestCase):
+    def setUp(self):
+        setup_mock_web_api_server_async(self, SlowHandler)
+
+    def tearDown(self):
+        cleanup_mock_web_api_server_async(self)
+
+    @async_test
+    async def test_cancelled_probe_call(self):
+        gate = AsyncRateLimitGate()
+        client = AsyncWebClient(token="xoxb-api_test", base_url="http://localhost:8888", rate_limit_gate=gate)
+        key = {"workspace_key": _build_workspace_key("xoxb-api_test", None), "api_method": "api.test"}
+        gate.exit(**key, probe=False, status_code=429, retry_after=0)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.api_test(), timeout=0.1)
+        # the cancelled call was the probe; the next call must not wait for it forever
+        response = await asyncio.wait_for(client.api_test(), timeout=3)
+        self.assertTrue(response["ok"])
+        self.assertFalse(gate.is_closed(**key))
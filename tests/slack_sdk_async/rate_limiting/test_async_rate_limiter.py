@@ -0,0 +1,35 @@
+import asyncio
+import time
+import unittest
+
+from slack_sdk.rate_limiting import RateLimitTier
+from slack_sdk.rate_limiting.async_rate_limiter import AsyncRateLimiter
+from slack_sdk.web.async_client import AsyncWebClient
+from tests.mock_web_api_server import cleanup_mock_web_api_server_async, setup_mock_web_api_server_async
+from tests.slack_sdk.web.mock_web_api_handler import MockHandler
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncRateLimiter(unittest.TestCase):
+    def setUp(self):
+        setup_mock_web_api_server_async(self, MockHandler)
+
+    def tearDown(self):
+        cleanup_mock_web_api_server_async(self)
+
+    @async_test
+    async def test_acquire_async(self):
+        limiter = AsyncRateLimiter(method_tiers={"api.test": RateLimitTier("fast", 600, burst=2)})
+        started_at = time.monotonic()
+        waits = await asyncio.gather(*[limiter.acquire_async(api_method="api.test", token="xoxb-1") for _ in range(4)])
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.2)
+
+    @async_test
+    async def test_api_calls(self):
+        limiter = AsyncRateLimiter(method_tiers={"api.test": RateLimitTier("fast", 600, burst=1)})
+        client = AsyncWebClient(token="xoxb-api_test", base_url="http://localhost:8888", rate_limiter=limiter)
+        started_at = time.monotonic()
+        responses = await asyncio.gather(*[client.api_test() for _ in range(3)])
+        self.assertTrue(all(r["ok"] for r in responses))
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.2)
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import logging
+import time
+import unittest
+
+from slack_sdk.socket_mode.async_client import AsyncBaseSocketModeClient
+from tests.helpers import async_test
+
+
+def _envelope(type: str, envelope_id: str = "1d-111", **payload) -> str:
+    return json.dumps({"type": type, "envelope_id": envelope_id, "payload": payload})
+
+
+class TestAsyncAckFirst(unittest.TestCase):
+    logger = logging.getLogger(__name__)
+
+    def build_client(self) -> AsyncBaseSocketModeClient:
+        self.sent_messages = []
+        self.acked_before_listener = []
+        self.ack_events = []
+
+        async def send_message(message: str):
+            self.sent_messages.append(message)
+
+        async def listener(client, message, raw_message):
+            self.acked_before_listener.append(len(self.sent_messages) > 0)
+
+        client = AsyncBaseSocketModeClient.__new__(AsyncBaseSocketModeClient)
+        client.logger = self.logger
+        client.message_queue = asyncio.Queue()
+        client.message_listeners = [listener]
+        client.socket_mode_request_listeners = []
+        client.send_message = send_message
+        client.ack_first_enabled = True
+        client.ack_listeners = [self.ack_events.append]
+        return client
+
+    @async_test
+    async def test_events_api_envelopes_are_acknowledged_before_listeners(self):
+        client = self.build_client()
+        await client.message_queue.put(_envelope("events_api", event_time=int(time.time())))
+        await client.message_queue.put(_envelope("interactive", envelope_id="1d-222"))
+        await client.process_message()
+        await client.process_message()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual([json.loads(m) for m in self.sent_messages], [{"envelope_id": "1d-111"}])
+        self.assertEqual(self.acked_before_listener, [True, True])
+        self.assertEqual([e.envelope_id for e in self.ack_events], ["1d-111"])
+        self.assertGreaterEqual(self.ack_events[0].envelope_age, 0)
+
+    @async_test
+    async def test_disabled(self):
+        client = self.build_client()
+        client.ack_first_enabled = False
+        await client.message_queue.put(_envelope("events_api"))
+        await client.process_message()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.sent_messages, [])
+        self.assertEqual(self.acked_before_listener, [False])
@@ -26,6 +26,22 @@ class TestAiohttp(unittest.TestCase):
         finally:
             await client.close()
 
+    @async_test
+    async def test_init_close_with_num_connections(self):
+        client = SocketModeClient(
+            app_token="xapp-A111-222-xyz",
+            web_client=self.web_client,
+            num_connections=3,
+        )
+        try:
+            self.assertEqual(len(client.group_members), 2)
+            for member in client.group_members:
+                self.assertIs(member.socket_mode_request_listeners, client.socket_mode_request_listeners)
+                self.assertEqual(member.group_members, [])
+        finally:
+            await client.close()
+        self.assertTrue(all(member.closed for member in client.group_members))
+
     @async_test
     async def test_issue_new_wss_url(self):
         client = SocketModeClient(
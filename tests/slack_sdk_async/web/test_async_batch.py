@@ -0,0 +1,78 @@
+import asyncio
+import json
+import unittest
+
+from aiohttp import web
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.rate_limiting.async_rate_limiter import AsyncRateLimiter
+from slack_sdk.web.async_client import AsyncWebClient
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncBatch(unittest.TestCase):
+    async def start_server(self):
+        self.num_running = 0
+        self.max_running = 0
+
+        async def chat_post_message(request: web.Request) -> web.Response:
+            self.num_running += 1
+            self.max_running = max(self.max_running, self.num_running)
+            try:
+                body = await request.json()
+                await asyncio.sleep(0.01 * body.get("delay", 1))
+                if body["channel"] == "C_invalid":
+                    data = {"ok": False, "error": "channel_not_found"}
+                else:
+                    data = {"ok": True, "channel": body["channel"], "ts": "111.222"}
+                return web.Response(text=json.dumps(data), content_type="application/json")
+            finally:
+                self.num_running -= 1
+
+        app = web.Application()
+        app.router.add_post("/chat.postMessage", chat_post_message)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "localhost", 8888)
+        await site.start()
+        return AsyncWebClient(token="xoxb-test", base_url="http://localhost:8888/")
+
+    @async_test
+    async def test_gather(self):
+        client = await self.start_server()
+        try:
+            channels = [f"C{i}" for i in range(20)] + ["C_invalid"]
+            results = await client.gather(
+                [("chat.postMessage", {"channel": c, "text": "Hi"}) for c in channels],
+                max_concurrency=4,
+            )
+            self.assertEqual([r.index for r in results], list(range(21)))
+            self.assertEqual([r.response["channel"] for r in results[:20]], channels[:20])
+            # partial failures are collected instead of raised
+            self.assertFalse(results[20].ok)
+            self.assertIsInstance(results[20].error, SlackApiError)
+            self.assertLessEqual(self.max_running, 4)
+        finally:
+            await self.runner.cleanup()
+
+    @async_test
+    async def test_unordered_results(self):
+        client = await self.start_server()
+        try:
+            calls = [
+                ("chat.postMessage", {"channel": f"C{i}", "text": "Hi", "delay": 10 if i == 0 else 1}) for i in range(4)
+            ]
+            results = [r async for r in client.batch(calls, max_concurrency=4, ordered=False)]
+            self.assertEqual(sorted(r.index for r in results), [0, 1, 2, 3])
+            # the slowest call comes last
+            self.assertEqual(results[-1].index, 0)
+        finally:
+            await self.runner.cleanup()
+
+    def test_rate_limiter_of_both_client_and_batch(self):
+        client = AsyncWebClient(token="xoxb-test", rate_limiter=AsyncRateLimiter())
+        calls = [("chat.postMessage", {"channel": "C1", "text": "Hi"})]
+        # Each call would acquire a slot from both rate limiters
+        with self.assertRaises(ValueError):
+            client.batch(calls, rate_limiter=AsyncRateLimiter())
+        self.assertIsNone(client.batch(calls).rate_limiter)
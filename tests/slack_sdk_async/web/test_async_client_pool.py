@@ -0,0 +1,39 @@
+import tempfile
+import time
+import unittest
+
+from slack_sdk.oauth.installation_store import Bot, FileInstallationStore
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_client_pool import AsyncWebClientPool
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncWebClientPool(unittest.TestCase):
+    def test_get(self):
+        base_client = AsyncWebClient(headers={"X-Custom": "foo"})
+        pool = AsyncWebClientPool(base_client, max_clients=2)
+        client = pool.get("xoxb-111")
+        self.assertEqual(client.token, "xoxb-111")
+        self.assertIs(pool.get("xoxb-111"), client)
+        self.assertIs(client.headers, base_client.headers)
+        self.assertEqual(pool.get("xoxb-111", team_id="T111").default_params, {"team_id": "T111"})
+        pool.get("xoxb-222")
+        self.assertEqual(len(pool), 2)
+
+    @async_test
+    async def test_get_for_installation(self):
+        store = FileInstallationStore(base_dir=tempfile.mkdtemp(), client_id="111.222")
+        await store.async_save_bot(
+            Bot(
+                enterprise_id="E111",
+                team_id="T111",
+                bot_token="xoxb-111",
+                bot_id="B111",
+                bot_user_id="U111",
+                installed_at=time.time(),
+            )
+        )
+        pool = AsyncWebClientPool(installation_store=store)
+        client = await pool.get_for_installation(enterprise_id="E111", team_id="T111")
+        self.assertEqual(client.token, "xoxb-111")
+        self.assertIsNone(await pool.get_for_installation(enterprise_id="E111", team_id="T222"))
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from typing import Optional
+
+from aiohttp import web
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_paginator import AsyncPaginator
+from slack_sdk.web.pagination_checkpoint import FilePaginationCheckpointStore
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncPaginator(unittest.TestCase):
+    async def start_server(self, num_pages: int, delay: float = 0.0):
+        self.received_cursors = []
+
+        async def users_list(request: web.Request) -> web.Response:
+            await asyncio.sleep(delay)
+            # AsyncWebClient sends users.list requests as GET requests
+            cursor: Optional[str] = request.query.get("cursor")
+            self.received_cursors.append(cursor)
+            page = int(cursor) if cursor else 0
+            if page >= num_pages:
+                return web.json_response({"ok": False, "error": "invalid_cursor"})
+            next_cursor = str(page + 1) if page + 1 < num_pages else ""
+            members = [{"id": f"U{page}{i}"} for i in range(2)]
+            body = {"ok": True, "members": members, "response_metadata": {"next_cursor": next_cursor}}
+            return web.Response(text=json.dumps(body), content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/users.list", users_list)
+        # AsyncWebClient#paginate() sends POST requests with the query string
+        app.router.add_post("/users.list", users_list)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "localhost", 8888)
+        await site.start()
+        return AsyncWebClient(token="xoxb-test", base_url="http://localhost:8888/")
+
+    @async_test
+    async def test_items(self):
+        client = await self.start_server(num_pages=3)
+        try:
+            for prefetch in [0, 2]:
+                members = [m async for m in AsyncPaginator(await client.users_list(limit=2), prefetch=prefetch)]
+                self.assertEqual([m["id"] for m in members], ["U00", "U01", "U10", "U11", "U20", "U21"])
+            pages = [cursor async for cursor, _ in AsyncPaginator(await client.users_list(limit=2)).pages()]
+            self.assertEqual(pages, [None, "1", "2"])
+        finally:
+            await self.runner.cleanup()
+
+    @async_test
+    async def test_prefetching(self):
+        client = await self.start_server(num_pages=4, delay=0.1)
+        try:
+            response = await client.users_list(limit=2)
+            started_at = time.monotonic()
+            async for _ in AsyncPaginator(response, item_key="members", prefetch=1):
+                await asyncio.sleep(0.05)
+            self.assertLess(time.monotonic() - started_at, 0.6)
+        finally:
+            await self.runner.cleanup()
+
+    @async_test
+    async def test_errors(self):
+        client = await self.start_server(num_pages=2)
+        try:
+            response = await client.users_list(limit=2)
+            response.data["response_metadata"]["next_cursor"] = "5"
+            with self.assertRaises(SlackApiError):
+                async for _ in AsyncPaginator(response):
+                    pass
+        finally:
+            await self.runner.cleanup()
+
+    @async_test
+    async def test_paginate(self):
+        client = await self.start_server(num_pages=3)
+        try:
+            paginator = client.paginate("users.list", key="members", limit=2)
+            self.assertEqual(self.received_cursors, [])
+            positions = []
+            async for _ in paginator:
+                positions.append((paginator.cursor, paginator.offset))
+            self.assertEqual(positions, [(None, 1), (None, 2), ("1", 1), ("1", 2), ("2", 1), ("2", 2)])
+
+            members = [m async for m in client.paginate("users.list", limit=2, max_items=3, prefetch=0)]
+            self.assertEqual([m["id"] for m in members], ["U00", "U01", "U10"])
+
+            members = [m async for m in client.paginate("users.list", limit=2, cursor="2")]
+            self.assertEqual([m["id"] for m in members], ["U20", "U21"])
+        finally:
+            await self.runner.cleanup()
+
+    @async_test
+    async def test_checkpoint_store(self):
+        client = await self.start_server(num_pages=3)
+        try:
+            with tempfile.TemporaryDirectory() as base_dir:
+                store = FilePaginationCheckpointStore(base_dir=base_dir)
+                paginator = client.paginate("users.list", limit=2, max_items=3, checkpoint_store=store, checkpoint_key="k")
+                members = [m["id"] async for m in paginator]
+                self.assertEqual(members, ["U00", "U01", "U10"])
+                self.assertEqual((await store.async_find("k")).to_dict(), paginator.checkpoint().to_dict())
+
+                self.received_cursors.clear()
+                paginator = AsyncPaginator(client=client, checkpoint=paginator.checkpoint())
+                members = [m["id"] async for m in paginator]
+                self.assertEqual(members, ["U11", "U20", "U21"])
+                self.assertEqual(self.received_cursors, ["1", "2"])
+
+                paginator = client.paginate("users.list", limit=2, checkpoint_store=store, checkpoint_key="k")
+                members = [m["id"] async for m in paginator]
+                self.assertEqual(members, ["U11", "U20", "U21"])
+                self.assertIsNone(await store.async_find("k"))
+        finally:
+            await self.runner.cleanup()
@@ -0,0 +1,27 @@
+import asyncio
+import unittest
+
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.web.async_client import AsyncWebClient
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncWebClientFilesUploadV2(unittest.TestCase):
+    @async_test
+    async def test_failed_upload_waits_for_the_cancelled_ones(self):
+        finished = []
+
+        class FailingClient(AsyncWebClient):
+            async def _upload_file_v2_item(self, f, token):
+                try:
+                    if f["title"] == "failing":
+                        raise SlackRequestError("Failed to upload a file")
+                    await asyncio.sleep(10)
+                finally:
+                    finished.append(f["title"])
+
+        client = FailingClient(token="xoxb-api_test")
+        files = [{"title": "slow"}, {"title": "failing"}, {"title": "another slow"}]
+        with self.assertRaises(SlackRequestError):
+            await client._upload_files_v2(files=files, token=None, max_concurrency=3)
+        self.assertEqual(sorted(finished), ["another slow", "failing", "slow"])
@@ -0,0 +1,42 @@
+import unittest
+
+from aiohttp import web
+
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.response_cache import ResponseCache
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncWebClientResponseCache(unittest.TestCase):
+    async def start_server(self) -> AsyncWebClient:
+        self.num_requests = 0
+
+        async def users_info(request: web.Request) -> web.Response:
+            self.num_requests += 1
+            return web.json_response({"ok": True, "user": {"id": request.query.get("user")}})
+
+        app = web.Application()
+        app.router.add_get("/users.info", users_info)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "localhost", 8888)
+        await site.start()
+        return AsyncWebClient(token="xoxb-test", base_url="http://localhost:8888/", response_cache=ResponseCache())
+
+    @async_test
+    async def test_cache_hits(self):
+        client = await self.start_server()
+        try:
+            for _ in range(3):
+                response = await client.users_info(user="U111")
+                self.assertEqual(response["user"]["id"], "U111")
+            self.assertEqual(self.num_requests, 1)
+
+            await client.users_info(user="U222")
+            self.assertEqual(self.num_requests, 2)
+
+            await client.response_cache.async_invalidate(api_method="users.info")
+            await client.users_info(user="U111")
+            self.assertEqual(self.num_requests, 3)
+        finally:
+            await self.runner.cleanup()
@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_single_flight import AsyncSingleFlight
+from tests.slack_sdk_async.helpers import async_test
+
+
+class TestAsyncWebClientSingleFlight(unittest.TestCase):
+    async def start_server(self) -> AsyncWebClient:
+        self.num_requests = 0
+
+        async def users_info(request: web.Request) -> web.Response:
+            self.num_requests += 1
+            await asyncio.sleep(0.2)
+            if request.query.get("user") == "U000":
+                return web.json_response({"ok": False, "error": "user_not_found"})
+            return web.json_response({"ok": True, "user": {"id": request.query.get("user")}})
+
+        app = web.Application()
+        app.router.add_get("/users.info", users_info)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "localhost", 8888)
+        await site.start()
+        return AsyncWebClient(token="xoxb-test", base_url="http://localhost:8888/", single_flight=AsyncSingleFlight())
+
+    @async_test
+    async def test_coalescing(self):
+        client = await self.start_server()
+        try:
+            responses = await asyncio.gather(*[client.users_info(user="U111") for _ in range(10)])
+            self.assertEqual(self.num_requests, 1)
+            self.assertTrue(all(r is responses[0] for r in responses))
+
+            await asyncio.gather(*[client.users_info(user=f"U{i % 2}") for i in range(10)])
+            self.assertEqual(self.num_requests, 3)
+
+            results = await asyncio.gather(*[client.users_info(user="U000") for _ in range(3)], return_exceptions=True)
+            self.assertEqual(self.num_requests, 4)
+            self.assertTrue(all(isinstance(e, SlackApiError) for e in results))
+            self.assertEqual(client.single_flight.num_in_flight_calls(), 0)
+        finally:
+            await self.runner.cleanup()
+
+    @async_test
+    async def test_cancellation(self):
+        client = await self.start_server()
+        try:
+            first = asyncio.ensure_future(client.users_info(user="U111"))
+            await asyncio.sleep(0.05)
+            second = asyncio.ensure_future(client.users_info(user="U111"))
+            await asyncio.sleep(0.05)
+            # Cancelling the task that started the API call does not affect the others
+            first.cancel()
+            response = await second
+            self.assertEqual(response["user"]["id"], "U111")
+            self.assertEqual(self.num_requests, 1)
+        finally:
+            await self.runner.cleanup()
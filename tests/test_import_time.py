@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+# The total self time (in microseconds) of the slack_sdk modules loaded by `import slack_sdk.signature`
+IMPORT_TIME_BUDGET_US = 20_000
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+
+def parse_import_times(stderr: str) -> Dict[str, int]:
+    # import time: self [us] | cumulative | imported package
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    def test_lazy_loading(self):
+        result = run_python(
+            "import sys, slack_sdk, slack_sdk.signature, slack_sdk.models.blocks; "
+            "print(','.join(m for m in sys.modules if m.startswith('slack_sdk')))"
+        )
+        modules = result.stdout.strip().split(",")
+        self.assertNotIn("slack_sdk.web", modules)
+        self.assertNotIn("slack_sdk.webhook", modules)
+        self.assertNotIn("slack_sdk.models.blocks.block_elements", modules)
+
+    def test_lazy_attributes(self):
+        result = run_python(
+            "import slack_sdk, slack_sdk.models.blocks as blocks; "
+            "print(slack_sdk.WebClient.__module__, blocks.SectionBlock.__module__, 'WebClient' in dir(slack_sdk))"
+        )
+        self.assertEqual(result.stdout.split(), ["slack_sdk.web.client", "slack_sdk.models.blocks.blocks", "True"])
+        with self.assertRaises(AttributeError):
+            import slack_sdk
+
+            slack_sdk.UnknownClient
+
+    def test_import_time_budget(self):
+        result = run_python("import slack_sdk.signature")
+        times = parse_import_times(result.stderr)
+        total = sum(t for name, t in times.items() if name == "slack_sdk" or name.startswith("slack_sdk."))
+        self.assertLess(total, IMPORT_TIME_BUDGET_US, f"import slack_sdk.signature took {total} us: {times}")